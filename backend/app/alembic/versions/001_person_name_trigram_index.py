@@ -0,0 +1,72 @@
+"""trigram indexes on person names
+
+Revision ID: 001_person_name_trgm
+Revises: 000_initial
+Create Date: 2026-10-16
+
+Opt-in support for PERSON_NAME_SEARCH_MODE="trigram". Installs the pg_trgm
+extension when the server provides it and adds GIN indexes on the lower-cased
+first and last names used by fuzzy name search.
+
+If pg_trgm is not available, or the migration role may not create it, the
+indexes are skipped and name search keeps scoring candidates in Python.
+"""
+import logging
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '001_person_name_trgm'
+down_revision = '000_initial'
+branch_labels = None
+depends_on = None
+
+logger = logging.getLogger('alembic.runtime.migration')
+
+
+def _install_pg_trgm() -> bool:
+    """Create pg_trgm if possible and return whether it is installed."""
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return False
+
+    available = bind.execute(
+        sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+    ).first()
+    if available is None:
+        logger.warning('pg_trgm is not available, skipping person name trigram indexes')
+        return False
+
+    try:
+        with bind.begin_nested():
+            bind.execute(sa.text('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
+    except sa.exc.DBAPIError as e:
+        logger.warning(f'Could not create pg_trgm ({e}), skipping person name trigram indexes')
+        return False
+
+    return True
+
+
+def upgrade() -> None:
+    if not _install_pg_trgm():
+        return
+
+    op.create_index(
+        'ix_person_first_name_trgm',
+        'person',
+        [sa.text('lower(first_name) gin_trgm_ops')],
+        postgresql_using='gin',
+    )
+    op.create_index(
+        'ix_person_last_name_trgm',
+        'person',
+        [sa.text('lower(last_name) gin_trgm_ops')],
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    # The extension is left installed; other objects may depend on it
+    op.execute('DROP INDEX IF EXISTS ix_person_last_name_trgm')
+    op.execute('DROP INDEX IF EXISTS ix_person_first_name_trgm')
@@ -0,0 +1,61 @@
+"""discovery suggestion tables
+
+Revision ID: 002_discovery_suggestion
+Revises: 001_person_name_trgm
+Create Date: 2026-10-16
+
+Precomputed family member discovery results, maintained by the discovery
+suggestion worker when DISCOVERY_SUGGESTIONS_ENABLED is set. A person's rows
+are only served while discovery_suggestion_state has a row for the person.
+
+Also indexes person_relationship.related_person_id, used to find the persons
+affected by a relationship change.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '002_discovery_suggestion'
+down_revision = '001_person_name_trgm'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # ── discovery_suggestion ──
+    op.create_table(
+        'discovery_suggestion',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
+        sa.Column('person_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('suggested_person_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('position', sa.Integer(), nullable=False),
+        sa.Column('inferred_relationship_type', sa.String(50), nullable=False),
+        sa.Column('connection_path', sa.String(), nullable=False),
+        sa.Column('proximity_score', sa.Integer(), nullable=False),
+        sa.Column('relationship_priority', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['person_id'], ['person.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['suggested_person_id'], ['person.id'], ondelete='CASCADE'),
+    )
+    # Serves a person's suggestions in order with a single index range scan
+    op.create_index('idx_discovery_suggestion_person_position', 'discovery_suggestion', ['person_id', 'position'], unique=True)
+    op.create_index('idx_discovery_suggestion_suggested_person', 'discovery_suggestion', ['suggested_person_id'])
+
+    # ── discovery_suggestion_state ──
+    op.create_table(
+        'discovery_suggestion_state',
+        sa.Column('person_id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('refreshed_at', sa.DateTime(), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP')),
+        sa.ForeignKeyConstraint(['person_id'], ['person.id'], ondelete='CASCADE'),
+    )
+
+    # Finds the persons whose suggestions read a changed person's relationships
+    op.create_index('ix_person_relationship_related_person_id', 'person_relationship', ['related_person_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_person_relationship_related_person_id', table_name='person_relationship')
+    op.drop_table('discovery_suggestion_state')
+    op.drop_index('idx_discovery_suggestion_suggested_person', table_name='discovery_suggestion')
+    op.drop_index('idx_discovery_suggestion_person_position', table_name='discovery_suggestion')
+    op.drop_table('discovery_suggestion')
@@ -0,0 +1,63 @@
+"""unique non-aggregated profile view pairs
+
+Revision ID: 003_profile_view_pair_unique
+Revises: 002_discovery_suggestion
+Create Date: 2026-10-16
+
+Buffered profile view tracking (PROFILE_VIEW_BUFFER_ENABLED) writes view
+increments with INSERT ... ON CONFLICT DO UPDATE, which needs a unique index
+on the non-aggregated (viewer, viewed) pairs. Duplicate non-aggregated rows
+are merged into the oldest row of each pair first, keeping totals unchanged.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '003_profile_view_pair_unique'
+down_revision = '002_discovery_suggestion'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Keep the oldest row of each pair with the pair's summed views
+    op.execute("""
+        UPDATE profile_view_tracking AS t
+        SET view_count = d.total_views, last_viewed_at = d.last_viewed_at
+        FROM (
+            SELECT id,
+                   row_number() OVER pair AS rn,
+                   sum(view_count) OVER pair_all AS total_views,
+                   max(last_viewed_at) OVER pair_all AS last_viewed_at
+            FROM profile_view_tracking
+            WHERE is_aggregated = false
+            WINDOW pair AS (PARTITION BY viewer_person_id, viewed_person_id ORDER BY created_at, id),
+                   pair_all AS (PARTITION BY viewer_person_id, viewed_person_id)
+        ) AS d
+        WHERE t.id = d.id AND d.rn = 1
+    """)
+    op.execute("""
+        DELETE FROM profile_view_tracking AS t
+        USING (
+            SELECT id,
+                   row_number() OVER (
+                       PARTITION BY viewer_person_id, viewed_person_id
+                       ORDER BY created_at, id
+                   ) AS rn
+            FROM profile_view_tracking
+            WHERE is_aggregated = false
+        ) AS d
+        WHERE t.id = d.id AND d.rn > 1
+    """)
+
+    op.create_index(
+        'uq_profile_view_tracking_pair_non_aggregated',
+        'profile_view_tracking',
+        ['viewer_person_id', 'viewed_person_id'],
+        unique=True,
+        postgresql_where=sa.text('is_aggregated = false'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_profile_view_tracking_pair_non_aggregated', table_name='profile_view_tracking')
@@ -0,0 +1,59 @@
+"""profile view roll-up
+
+Revision ID: 004_profile_view_rollup
+Revises: 003_profile_view_pair_unique
+Create Date: 2026-10-16
+
+Supports rolling up old non-aggregated profile views into one aggregated row
+per viewed person and month (python -m app.rollup_profile_views). Aggregated
+rows have no viewer and record their month in period_start.
+
+Also replaces the viewed person index with one covering view_count, so view
+totals are summed with index-only scans, and adds a partial index on the
+non-aggregated rows' last_viewed_at for the roll-up scan.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '004_profile_view_rollup'
+down_revision = '003_profile_view_pair_unique'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('profile_view_tracking', sa.Column('period_start', sa.Date(), nullable=True))
+    op.alter_column('profile_view_tracking', 'viewer_person_id', nullable=True)
+
+    op.create_index(
+        'uq_profile_view_tracking_aggregate_period',
+        'profile_view_tracking',
+        ['viewed_person_id', 'period_start'],
+        unique=True,
+        postgresql_where=sa.text('is_aggregated = true'),
+    )
+    op.create_index(
+        'ix_profile_view_tracking_viewed_views',
+        'profile_view_tracking',
+        ['viewed_person_id'],
+        postgresql_include=['view_count'],
+    )
+    op.drop_index('idx_profile_view_tracking_viewed_person', table_name='profile_view_tracking')
+    op.create_index(
+        'ix_profile_view_tracking_rollup',
+        'profile_view_tracking',
+        ['last_viewed_at'],
+        postgresql_where=sa.text('is_aggregated = false'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_profile_view_tracking_rollup', table_name='profile_view_tracking')
+    op.create_index('idx_profile_view_tracking_viewed_person', 'profile_view_tracking', ['viewed_person_id'])
+    op.drop_index('ix_profile_view_tracking_viewed_views', table_name='profile_view_tracking')
+    op.drop_index('uq_profile_view_tracking_aggregate_period', table_name='profile_view_tracking')
+    # Aggregated rows have no viewer and cannot be expanded back
+    op.execute('DELETE FROM profile_view_tracking WHERE is_aggregated = true')
+    op.alter_column('profile_view_tracking', 'viewer_person_id', nullable=False)
+    op.drop_column('profile_view_tracking', 'period_start')
@@ -0,0 +1,66 @@
+"""reference data change counters
+
+Revision ID: 005_reference_data_version
+Revises: 004_profile_view_rollup
+Create Date: 2026-10-16
+
+Per-table change counters for the address and religion reference tables,
+incremented by statement-level triggers. The metadata list endpoints derive
+their cached responses and ETags from these counters.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '005_reference_data_version'
+down_revision = '004_profile_view_rollup'
+branch_labels = None
+depends_on = None
+
+REFERENCE_TABLES = (
+    'address_country',
+    'address_state',
+    'address_district',
+    'address_sub_district',
+    'address_locality',
+    'religion',
+    'religion_category',
+    'religion_sub_category',
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        'reference_data_version',
+        sa.Column('table_name', sa.String(63), primary_key=True),
+        sa.Column('version', sa.BigInteger(), nullable=False, server_default='0'),
+    )
+    op.execute(
+        "INSERT INTO reference_data_version (table_name) VALUES "
+        + ", ".join(f"('{table}')" for table in REFERENCE_TABLES)
+    )
+
+    op.execute("""
+        CREATE FUNCTION bump_reference_data_version() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO reference_data_version (table_name, version)
+            VALUES (TG_TABLE_NAME, 1)
+            ON CONFLICT (table_name)
+            DO UPDATE SET version = reference_data_version.version + 1;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table in REFERENCE_TABLES:
+        op.execute(f"""
+            CREATE TRIGGER trg_{table}_reference_data_version
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_reference_data_version()
+        """)
+
+
+def downgrade() -> None:
+    for table in REFERENCE_TABLES:
+        op.execute(f"DROP TRIGGER trg_{table}_reference_data_version ON {table}")
+    op.execute("DROP FUNCTION bump_reference_data_version()")
+    op.drop_table('reference_data_version')
@@ -1,10 +1,11 @@
 import uuid
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 
 from app.api.deps import SessionDep, get_current_active_admin
 from app.schemas.address import (
+    AddressTreePublic,
     CountryCreate,
     CountryDetailPublic,
     CountryUpdate,
@@ -22,12 +23,18 @@ from app.schemas.address import (
     SubDistrictUpdate,
 )
 from app.services.address import (
+    AddressTreeService,
     CountryService,
     DistrictService,
     LocalityService,
     StateService,
     SubDistrictService,
 )
+from app.services.address.address_tree_service import (
+    ADDRESS_LEVEL_TABLES,
+    ADDRESS_LEVELS,
+)
+from app.services.reference_data_cache import reference_data_response
 from app.utils.logging_decorator import log_route
 
 router = APIRouter(
@@ -44,14 +51,21 @@ router = APIRouter(
 
 @router.get("/countries")
 @log_route
-def get_countries(session: SessionDep) -> Any:
+def get_countries(request: Request, session: SessionDep) -> Any:
     """
     Get list of countries for dropdown options.
     Public endpoint - no authentication required.
+    Supports conditional GET with ETag / If-None-Match.
     """
-    country_service = CountryService(session)
-    countries = country_service.get_countries()
-    return countries
+
+    def load() -> Any:
+        country_service = CountryService(session)
+        countries = country_service.get_countries()
+        return countries
+
+    return reference_data_response(
+        request, session, "address:countries", ("address_country",), load
+    )
 
 
 @router.get("/countries/{country_id}", response_model=CountryDetailPublic)
@@ -165,24 +179,37 @@ def delete_country(session: SessionDep, country_id: uuid.UUID) -> Any:
 
 @router.get("/country/{country_id}/states")
 @log_route
-def get_states_by_country(session: SessionDep, country_id: uuid.UUID) -> Any:
+def get_states_by_country(
+    request: Request, session: SessionDep, country_id: uuid.UUID
+) -> Any:
     """
     Get list of states for a specific country.
     Public endpoint - no authentication required.
+    Supports conditional GET with ETag / If-None-Match.
     """
-    # Verify country exists
-    country_service = CountryService(session)
-    country = country_service.get_country_by_id(country_id)
-    if not country:
-        raise HTTPException(
-            status_code=404,
-            detail="Country not found",
-        )
 
-    # Get states for the country
-    state_service = StateService(session)
-    states = state_service.get_states_by_country(country_id)
-    return states
+    def load() -> Any:
+        # Verify country exists
+        country_service = CountryService(session)
+        country = country_service.get_country_by_id(country_id)
+        if not country:
+            raise HTTPException(
+                status_code=404,
+                detail="Country not found",
+            )
+
+        # Get states for the country
+        state_service = StateService(session)
+        states = state_service.get_states_by_country(country_id)
+        return states
+
+    return reference_data_response(
+        request,
+        session,
+        f"address:states:{country_id}",
+        ("address_country", "address_state"),
+        load,
+    )
 
 
 @router.get("/states/{state_id}", response_model=StateDetailPublic)
@@ -307,24 +334,37 @@ def delete_state(session: SessionDep, state_id: uuid.UUID) -> Any:
 
 @router.get("/state/{state_id}/districts")
 @log_route
-def get_districts_by_state(session: SessionDep, state_id: uuid.UUID) -> Any:
+def get_districts_by_state(
+    request: Request, session: SessionDep, state_id: uuid.UUID
+) -> Any:
     """
     Get list of districts for a specific state.
     Public endpoint - no authentication required.
+    Supports conditional GET with ETag / If-None-Match.
     """
-    # Verify state exists
-    state_service = StateService(session)
-    state = state_service.get_state_by_id(state_id)
-    if not state:
-        raise HTTPException(
-            status_code=404,
-            detail="State not found",
-        )
 
-    # Get districts for the state
-    district_service = DistrictService(session)
-    districts = district_service.get_districts_by_state(state_id)
-    return districts
+    def load() -> Any:
+        # Verify state exists
+        state_service = StateService(session)
+        state = state_service.get_state_by_id(state_id)
+        if not state:
+            raise HTTPException(
+                status_code=404,
+                detail="State not found",
+            )
+
+        # Get districts for the state
+        district_service = DistrictService(session)
+        districts = district_service.get_districts_by_state(state_id)
+        return districts
+
+    return reference_data_response(
+        request,
+        session,
+        f"address:districts:{state_id}",
+        ("address_state", "address_district"),
+        load,
+    )
 
 
 @router.get("/districts/{district_id}", response_model=DistrictDetailPublic)
@@ -451,24 +491,37 @@ def delete_district(session: SessionDep, district_id: uuid.UUID) -> Any:
 
 @router.get("/district/{district_id}/sub-districts")
 @log_route
-def get_sub_districts_by_district(session: SessionDep, district_id: uuid.UUID) -> Any:
+def get_sub_districts_by_district(
+    request: Request, session: SessionDep, district_id: uuid.UUID
+) -> Any:
     """
     Get list of sub-districts (tehsils/counties) for a specific district.
     Public endpoint - no authentication required.
+    Supports conditional GET with ETag / If-None-Match.
     """
-    # Verify district exists
-    district_service = DistrictService(session)
-    district = district_service.get_district_by_id(district_id)
-    if not district:
-        raise HTTPException(
-            status_code=404,
-            detail="District not found",
-        )
 
-    # Get sub-districts for the district
-    sub_district_service = SubDistrictService(session)
-    sub_districts = sub_district_service.get_sub_districts_by_district(district_id)
-    return sub_districts
+    def load() -> Any:
+        # Verify district exists
+        district_service = DistrictService(session)
+        district = district_service.get_district_by_id(district_id)
+        if not district:
+            raise HTTPException(
+                status_code=404,
+                detail="District not found",
+            )
+
+        # Get sub-districts for the district
+        sub_district_service = SubDistrictService(session)
+        sub_districts = sub_district_service.get_sub_districts_by_district(district_id)
+        return sub_districts
+
+    return reference_data_response(
+        request,
+        session,
+        f"address:sub-districts:{district_id}",
+        ("address_district", "address_sub_district"),
+        load,
+    )
 
 
 @router.get("/sub-districts/{sub_district_id}", response_model=SubDistrictDetailPublic)
@@ -600,25 +653,36 @@ def delete_sub_district(session: SessionDep, sub_district_id: uuid.UUID) -> Any:
 @router.get("/sub-district/{sub_district_id}/localities")
 @log_route
 def get_localities_by_sub_district(
-    session: SessionDep, sub_district_id: uuid.UUID
+    request: Request, session: SessionDep, sub_district_id: uuid.UUID
 ) -> Any:
     """
     Get list of localities (villages) for a specific sub-district.
     Public endpoint - no authentication required.
+    Supports conditional GET with ETag / If-None-Match.
     """
-    # Verify sub-district exists
-    sub_district_service = SubDistrictService(session)
-    sub_district = sub_district_service.get_sub_district_by_id(sub_district_id)
-    if not sub_district:
-        raise HTTPException(
-            status_code=404,
-            detail="Sub-district not found",
-        )
 
-    # Get localities for the sub-district
-    locality_service = LocalityService(session)
-    localities = locality_service.get_localities_by_sub_district(sub_district_id)
-    return localities
+    def load() -> Any:
+        # Verify sub-district exists
+        sub_district_service = SubDistrictService(session)
+        sub_district = sub_district_service.get_sub_district_by_id(sub_district_id)
+        if not sub_district:
+            raise HTTPException(
+                status_code=404,
+                detail="Sub-district not found",
+            )
+
+        # Get localities for the sub-district
+        locality_service = LocalityService(session)
+        localities = locality_service.get_localities_by_sub_district(sub_district_id)
+        return localities
+
+    return reference_data_response(
+        request,
+        session,
+        f"address:localities:{sub_district_id}",
+        ("address_sub_district", "address_locality"),
+        load,
+    )
 
 
 @router.get("/localities/{locality_id}", response_model=LocalityDetailPublic)
@@ -740,3 +804,81 @@ def delete_locality(session: SessionDep, locality_id: uuid.UUID) -> Any:
 
     locality_service.delete_locality(locality)
     return {"message": "Locality deleted successfully"}
+
+
+# ============================================================================
+# Address Tree Endpoints
+# ============================================================================
+
+
+@router.get("/country/{country_id}/tree", response_model=AddressTreePublic)
+@log_route
+def get_country_tree(
+    request: Request, session: SessionDep, country_id: uuid.UUID
+) -> Any:
+    """
+    Get a country with all its states, districts, sub-districts and localities.
+    Public endpoint - no authentication required.
+    Supports conditional GET with ETag / If-None-Match.
+    """
+    return _address_tree_response(request, session, "country", country_id)
+
+
+@router.get("/state/{state_id}/tree", response_model=AddressTreePublic)
+@log_route
+def get_state_tree(request: Request, session: SessionDep, state_id: uuid.UUID) -> Any:
+    """
+    Get a state with all its districts, sub-districts and localities.
+    Public endpoint - no authentication required.
+    Supports conditional GET with ETag / If-None-Match.
+    """
+    return _address_tree_response(request, session, "state", state_id)
+
+
+@router.get("/district/{district_id}/tree", response_model=AddressTreePublic)
+@log_route
+def get_district_tree(
+    request: Request, session: SessionDep, district_id: uuid.UUID
+) -> Any:
+    """
+    Get a district with all its sub-districts and localities.
+    Public endpoint - no authentication required.
+    Supports conditional GET with ETag / If-None-Match.
+    """
+    return _address_tree_response(request, session, "district", district_id)
+
+
+@router.get("/sub-district/{sub_district_id}/tree", response_model=AddressTreePublic)
+@log_route
+def get_sub_district_tree(
+    request: Request, session: SessionDep, sub_district_id: uuid.UUID
+) -> Any:
+    """
+    Get a sub-district with all its localities.
+    Public endpoint - no authentication required.
+    Supports conditional GET with ETag / If-None-Match.
+    """
+    return _address_tree_response(request, session, "sub_district", sub_district_id)
+
+
+def _address_tree_response(
+    request: Request, session: SessionDep, level: str, root_id: uuid.UUID
+) -> Any:
+    """Serve the subtree of an address entry from the reference data cache."""
+
+    def load() -> Any:
+        tree = AddressTreeService(session).get_tree(level, root_id)
+        if not tree:
+            raise HTTPException(
+                status_code=404,
+                detail=f"{level.replace('_', '-').capitalize()} not found",
+            )
+        return tree
+
+    tables = [
+        ADDRESS_LEVEL_TABLES[tree_level]
+        for tree_level in ADDRESS_LEVELS[ADDRESS_LEVELS.index(level) :]
+    ]
+    return reference_data_response(
+        request, session, f"address:tree:{level}:{root_id}", tables, load
+    )
@@ -2,7 +2,7 @@
 
 import logging
 import uuid
-from typing import Any
+from typing import Any, Literal
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile
 
@@ -38,8 +38,8 @@ from app.schemas.person import (
 )
 from app.services.image_upload_service import ImageUploadService
 from app.services.person import (
+    DiscoverySuggestionService,
     PersonAddressService,
-    PersonDiscoveryService,
     PersonMatchingService,
     PersonMetadataService,
     PersonProfessionService,
@@ -831,12 +831,22 @@ def delete_my_metadata(session: SessionDep, current_user: CurrentUser) -> Any:
 
 @router.get("/my-contributions", response_model=list[PersonContributionPublic])
 @log_route
-def get_my_contributions(session: SessionDep, current_user: CurrentUser) -> Any:
+def get_my_contributions(
+    session: SessionDep,
+    current_user: CurrentUser,
+    sort_by: Literal["views", "created_at"] = "views",
+    skip: int = 0,
+    limit: int | None = None,
+) -> Any:
     """
-    Get all persons created by the current user with view statistics.
+    Get persons created by the current user with view statistics.
+
+    Sorted by most viewed (default) or newest first; pass limit to page.
     """
     person_service = PersonService(session)
-    contributions = person_service.get_my_contributions(current_user.id)
+    contributions = person_service.get_my_contributions(
+        current_user.id, sort_by=sort_by, skip=skip, limit=limit
+    )
 
     logger.info(
         f"Retrieved {len(contributions)} contributions for user {current_user.email}"
@@ -926,14 +936,17 @@ def discover_family_members(
 ) -> Any:
     """
     Discover potential family member connections for the current user.
+
+    Served from precomputed suggestions when DISCOVERY_SUGGESTIONS_ENABLED
+    is set and they are up to date.
     """
     logger.info(
         f"Discovery request from user {current_user.email} (ID: {current_user.id})"
     )
 
     try:
-        discovery_service = PersonDiscoveryService(session)
-        discoveries = discovery_service.discover_family_members(current_user.id)
+        discovery_service = DiscoverySuggestionService(session)
+        discoveries = discovery_service.get_suggestions(current_user.id)
 
         logger.info(
             f"Found {len(discoveries)} potential connections for user {current_user.email}"
@@ -1450,8 +1463,8 @@ def discover_person_family_members(
     validate_person_access(person, current_user)
 
     try:
-        discovery_service = PersonDiscoveryService(session)
-        discoveries = discovery_service.discover_family_members(
+        discovery_service = DiscoverySuggestionService(session)
+        discoveries = discovery_service.get_suggestions(
             current_user_id=current_user.id, person_id=person_id
         )
 
@@ -32,7 +32,9 @@ def search_persons(
     - Demographics (gender, birth year range)
     - Name (fuzzy matching with 40% threshold)
 
-    Results are paginated with skip/limit parameters.
+    Results are paginated with skip/limit parameters, or with cursors: set
+    use_cursor on the first request and pass the returned next_cursor to
+    fetch the following page.
 
     **Request Body:**
     - country_id, state_id, district_id, sub_district_id: Required address filters
@@ -44,12 +46,15 @@ def search_persons(
     - first_name, last_name: Optional name filters (fuzzy matching)
     - skip: Number of records to skip (default: 0)
     - limit: Maximum records to return (default: 20, max: 100)
+    - use_cursor: Return next_cursor for cursor pagination (default: false)
+    - cursor: next_cursor from the previous page; skip is ignored
 
     **Response:**
     - results: List of matching persons
     - total: Total count of matching persons (for pagination UI)
     - skip: Number of records skipped
     - limit: Maximum records per page
+    - next_cursor: Cursor for the next page, null on the last page
 
     _Requirements: 10.1, 10.2_
     """
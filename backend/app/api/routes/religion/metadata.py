@@ -3,7 +3,7 @@
 import uuid
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 
 from app.api.deps import SessionDep, get_current_active_admin
 from app.schemas.religion import (
@@ -17,6 +17,7 @@ from app.schemas.religion import (
     ReligionSubCategoryUpdate,
     ReligionUpdate,
 )
+from app.services.reference_data_cache import reference_data_response
 from app.services.religion import (
     ReligionCategoryService,
     ReligionService,
@@ -38,14 +39,21 @@ router = APIRouter(
 
 @router.get("/religions")
 @log_route
-def get_religions(session: SessionDep) -> Any:
+def get_religions(request: Request, session: SessionDep) -> Any:
     """
     Get list of religions for dropdown options.
     Public endpoint - no authentication required.
+    Supports conditional GET with ETag / If-None-Match.
     """
-    religion_service = ReligionService(session)
-    religions = religion_service.get_religions()
-    return religions
+
+    def load() -> Any:
+        religion_service = ReligionService(session)
+        religions = religion_service.get_religions()
+        return religions
+
+    return reference_data_response(
+        request, session, "religion:religions", ("religion",), load
+    )
 
 
 @router.get("/religions/{religion_id}", response_model=ReligionDetailPublic)
@@ -161,24 +169,37 @@ def delete_religion(session: SessionDep, religion_id: uuid.UUID) -> Any:
 
 @router.get("/religion/{religion_id}/categories")
 @log_route
-def get_categories_by_religion(session: SessionDep, religion_id: uuid.UUID) -> Any:
+def get_categories_by_religion(
+    request: Request, session: SessionDep, religion_id: uuid.UUID
+) -> Any:
     """
     Get list of categories for a specific religion.
     Public endpoint - no authentication required.
+    Supports conditional GET with ETag / If-None-Match.
     """
-    # Verify religion exists
-    religion_service = ReligionService(session)
-    religion = religion_service.get_religion_by_id(religion_id)
-    if not religion:
-        raise HTTPException(
-            status_code=404,
-            detail="Religion not found",
-        )
 
-    # Get categories for the religion
-    category_service = ReligionCategoryService(session)
-    categories = category_service.get_categories_by_religion(religion_id)
-    return categories
+    def load() -> Any:
+        # Verify religion exists
+        religion_service = ReligionService(session)
+        religion = religion_service.get_religion_by_id(religion_id)
+        if not religion:
+            raise HTTPException(
+                status_code=404,
+                detail="Religion not found",
+            )
+
+        # Get categories for the religion
+        category_service = ReligionCategoryService(session)
+        categories = category_service.get_categories_by_religion(religion_id)
+        return categories
+
+    return reference_data_response(
+        request,
+        session,
+        f"religion:categories:{religion_id}",
+        ("religion", "religion_category"),
+        load,
+    )
 
 
 @router.get("/categories/{category_id}", response_model=ReligionCategoryDetailPublic)
@@ -305,24 +326,39 @@ def delete_category(session: SessionDep, category_id: uuid.UUID) -> Any:
 
 @router.get("/category/{category_id}/sub-categories")
 @log_route
-def get_sub_categories_by_category(session: SessionDep, category_id: uuid.UUID) -> Any:
+def get_sub_categories_by_category(
+    request: Request, session: SessionDep, category_id: uuid.UUID
+) -> Any:
     """
     Get list of sub-categories for a specific category.
     Public endpoint - no authentication required.
+    Supports conditional GET with ETag / If-None-Match.
     """
-    # Verify category exists
-    category_service = ReligionCategoryService(session)
-    category = category_service.get_category_by_id(category_id)
-    if not category:
-        raise HTTPException(
-            status_code=404,
-            detail="Category not found",
-        )
 
-    # Get sub-categories for the category
-    sub_category_service = ReligionSubCategoryService(session)
-    sub_categories = sub_category_service.get_sub_categories_by_category(category_id)
-    return sub_categories
+    def load() -> Any:
+        # Verify category exists
+        category_service = ReligionCategoryService(session)
+        category = category_service.get_category_by_id(category_id)
+        if not category:
+            raise HTTPException(
+                status_code=404,
+                detail="Category not found",
+            )
+
+        # Get sub-categories for the category
+        sub_category_service = ReligionSubCategoryService(session)
+        sub_categories = sub_category_service.get_sub_categories_by_category(
+            category_id
+        )
+        return sub_categories
+
+    return reference_data_response(
+        request,
+        session,
+        f"religion:sub-categories:{category_id}",
+        ("religion_category", "religion_sub_category"),
+        load,
+    )
 
 
 @router.get(
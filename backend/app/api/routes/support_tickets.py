@@ -147,42 +147,10 @@ def get_all_support_tickets_admin(
     Get all support tickets with filters (admin only).
     """
     support_ticket_service = SupportTicketService(session)
-    tickets, count = support_ticket_service.get_all_support_tickets_admin(
+    tickets, _ = support_ticket_service.get_all_support_tickets_admin(
         status=status, issue_type=issue_type, skip=skip, limit=limit
     )
-
-    # Enrich tickets with user information
-    result = []
-    for ticket in tickets:
-        # Get user who created the ticket
-        user = session.get(User, ticket.user_id)
-        user_email = user.email if user else "Unknown"
-        user_full_name = user.full_name if user else None
-
-        # Get user who resolved the ticket (if applicable)
-        resolved_by_email = None
-        if ticket.resolved_by_user_id:
-            resolved_by_user = session.get(User, ticket.resolved_by_user_id)
-            resolved_by_email = resolved_by_user.email if resolved_by_user else None
-
-        ticket_with_user = SupportTicketPublicWithUser(
-            id=ticket.id,
-            user_id=ticket.user_id,
-            issue_type=ticket.issue_type,
-            title=ticket.title,
-            description=ticket.description,
-            status=ticket.status,
-            resolved_by_user_id=ticket.resolved_by_user_id,
-            resolved_at=ticket.resolved_at,
-            created_at=ticket.created_at,
-            updated_at=ticket.updated_at,
-            user_email=user_email,
-            user_full_name=user_full_name,
-            resolved_by_email=resolved_by_email,
-        )
-        result.append(ticket_with_user)
-
-    return result
+    return tickets
 
 
 @router.patch("/{support_ticket_id}/resolve", response_model=SupportTicketPublic)
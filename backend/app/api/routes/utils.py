@@ -32,6 +32,23 @@ async def health_check() -> bool:
     return True
 
 
+@router.get(
+    "/cache/stats",
+    dependencies=[Depends(get_current_active_admin)],
+)
+def get_cache_stats() -> dict[str, int]:
+    """
+    Get cache counters (superuser only).
+
+    Returns hit, miss, eviction and expiration counters since process start,
+    and the current number of entries and estimated bytes.
+
+    Returns:
+        Dictionary of cache counters
+    """
+    return get_cache_manager().stats()
+
+
 @router.delete(
     "/cache/{cache_key:path}",
     dependencies=[Depends(get_current_active_admin)],
@@ -45,13 +62,13 @@ def delete_cache_key(cache_key: str) -> Message:
     Useful for debugging or forcing cache refresh.
 
     Args:
-        cache_key: The cache key to delete (e.g., "discovery:discover_family_members:user-id")
+        cache_key: The cache key to delete (e.g., "discovery:discover_family_members:user-id:None")
 
     Returns:
         Success message
 
     Example:
-        DELETE /api/v1/utils/cache/discovery:discover_family_members:123e4567-e89b-12d3-a456-426614174000
+        DELETE /api/v1/utils/cache/discovery:discover_family_members:123e4567-e89b-12d3-a456-426614174000:None
     """
     cache_manager = get_cache_manager()
     cache_manager.delete(cache_key)
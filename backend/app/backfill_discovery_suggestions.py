@@ -0,0 +1,50 @@
+"""Backfill precomputed discovery suggestions for existing persons.
+
+Usage:
+    python -m app.backfill_discovery_suggestions [--batch-size N] [--missing-only]
+"""
+
+import argparse
+import logging
+
+from sqlmodel import Session
+
+from app.core.db import engine
+from app.services.person.discovery_suggestion_service import (
+    REFRESH_CHUNK_SIZE,
+    DiscoverySuggestionService,
+)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def backfill(batch_size: int, missing_only: bool) -> int:
+    with Session(engine) as session:
+        return DiscoverySuggestionService(session).backfill(
+            batch_size=batch_size, missing_only=missing_only
+        )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=REFRESH_CHUNK_SIZE,
+        help="Persons refreshed per transaction",
+    )
+    parser.add_argument(
+        "--missing-only",
+        action="store_true",
+        help="Skip persons whose suggestions are up to date",
+    )
+    args = parser.parse_args(argv)
+
+    logger.info("Backfilling discovery suggestions")
+    refreshed = backfill(args.batch_size, args.missing_only)
+    logger.info(f"Discovery suggestions computed for {refreshed} persons")
+
+
+if __name__ == "__main__":
+    main()
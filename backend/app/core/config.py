@@ -110,8 +110,54 @@ class Settings(BaseSettings):
     FIRST_SUPERUSER: EmailStr
     FIRST_SUPERUSER_PASSWORD: str
 
+    # Application cache settings (see app/utils/cache.py)
+    # "redis" shares cached values across workers (requires the redis extra)
+    CACHE_BACKEND: Literal["memory", "redis"] = "memory"
+    CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+    CACHE_KEY_PREFIX: str = "cache:"
+    # In-memory backend bounds
+    CACHE_MAX_ENTRIES: int = 10000
+    # Upper bound on the estimated size of cached values (0 means unlimited)
+    CACHE_MAX_BYTES: int = 0
+    CACHE_SWEEP_INTERVAL_SECONDS: int = 60
+
+    # Discovery results are invalidated by relationship writes; the TTL only
+    # bounds how long person details (names, addresses) may lag
+    DISCOVERY_CACHE_TTL_SECONDS: int = 600
+    # Serve discovery results from the discovery_suggestion table (migration
+    # 002), refreshed by a background worker after relationship writes
+    DISCOVERY_SUGGESTIONS_ENABLED: bool = False
+
+    # Buffer profile views in process and write them in batches (write-behind);
+    # buffered views are flushed on shutdown
+    PROFILE_VIEW_BUFFER_ENABLED: bool = False
+    PROFILE_VIEW_FLUSH_INTERVAL_SECONDS: float = 5.0
+    # Flush early once this many (viewer, viewed) pairs are buffered
+    PROFILE_VIEW_FLUSH_MAX_PAIRS: int = 1000
+    # Non-aggregated profile views last seen longer ago than this are rolled up
+    # into monthly per-person records (python -m app.rollup_profile_views)
+    PROFILE_VIEW_ROLLUP_AGE_DAYS: int = 30
+    # Also run the roll-up in a background thread this often (0 disables it)
+    PROFILE_VIEW_ROLLUP_INTERVAL_SECONDS: int = 0
+
+    # Person name search settings
+    # "trigram" narrows and pre-ranks fuzzy name candidates in PostgreSQL with
+    # pg_trgm (migration 001); falls back to "python" without the extension
+    PERSON_NAME_SEARCH_MODE: Literal["python", "trigram"] = "python"
+    # Candidates re-scored with rapidfuzz after trigram pre-ranking
+    PERSON_NAME_TRIGRAM_TOP_K: int = 200
+    # pg_trgm.similarity_threshold used by the indexed % operator
+    PERSON_NAME_TRIGRAM_THRESHOLD: float = 0.2
+    # Ranked fuzzy search results kept for cursor pagination
+    PERSON_SEARCH_SNAPSHOT_TTL_SECONDS: int = 300
+
     # Lineage Path Finder settings
     LINEAGE_PATH_MAX_DEPTH: int = 10
+    # Per-process cache of lineage path results (0 entries disables it)
+    LINEAGE_PATH_CACHE_MAX_ENTRIES: int = 10000
+    # Bounds how long cached paths may lag person details (names, addresses)
+    # and relationship writes made by other workers
+    LINEAGE_PATH_CACHE_TTL_SECONDS: int = 60
 
     # Partner Match Finder settings
     PARTNER_MATCH_DEFAULT_DEPTH: int = 5
@@ -120,6 +166,34 @@ class Settings(BaseSettings):
     # Relatives Network settings
     RELATIVES_NETWORK_MAX_DEPTH: int = 20
 
+    # Graph traversal settings
+    # Push bounded-depth walks into PostgreSQL as WITH RECURSIVE queries
+    GRAPH_TRAVERSAL_USE_RECURSIVE_CTE: bool = True
+    # Keep a process-wide in-memory adjacency index of active relationships
+    GRAPH_ADJACENCY_INDEX_ENABLED: bool = False
+    # Rebuild the index once it is this old, so that relationship writes made
+    # by other workers are picked up (0 disables rebuilds)
+    GRAPH_ADJACENCY_INDEX_TTL_SECONDS: int = 300
+
+    # Address display names are served from an in-process gazetteer that is
+    # reloaded when the address table change counters move; the TTL is a
+    # backstop forcing a periodic full reload (0 disables the TTL)
+    ADDRESS_GAZETTEER_TTL_SECONDS: int = 300
+    # Same for religion display names and hierarchy checks
+    RELIGION_TAXONOMY_TTL_SECONDS: int = 300
+
+    # Metadata list endpoints serve serialized responses from an in-process
+    # cache keyed by the reference table change counters (migration 005)
+    REFERENCE_DATA_CACHE_MAX_ENTRIES: int = 1000
+    # How often the counters are re-read to notice writes by other workers
+    REFERENCE_DATA_VERSION_CHECK_SECONDS: float = 5.0
+    # Cache-Control max-age of the metadata list responses; clients always
+    # revalidate with If-None-Match once it has passed
+    REFERENCE_DATA_MAX_AGE_SECONDS: int = 0
+    # Responses at least this large are also kept gzip-compressed and served
+    # compressed to clients that accept it (0 disables compression)
+    REFERENCE_DATA_GZIP_MIN_BYTES: int = 1024
+
     # Image upload settings
     IMAGE_MAX_SIZE_MB: int = 5
     IMAGE_MAX_DIMENSION: int = 400
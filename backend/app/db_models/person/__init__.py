@@ -1,5 +1,9 @@
 """Person database models."""
 
+from app.db_models.person.discovery_suggestion import (
+    DiscoverySuggestion,
+    DiscoverySuggestionState,
+)
 from app.db_models.person.gender import Gender
 from app.db_models.person.person import Person
 from app.db_models.person.person_address import PersonAddress
@@ -12,6 +16,8 @@ from app.db_models.person.person_religion import PersonReligion
 from app.db_models.person.profession import Profession
 
 __all__ = [
+    "DiscoverySuggestion",
+    "DiscoverySuggestionState",
     "Gender",
     "Person",
     "PersonAddress",
@@ -0,0 +1,52 @@
+"""Discovery Suggestion database models."""
+
+import uuid
+from datetime import datetime
+
+from sqlmodel import Field, SQLModel
+
+
+class DiscoverySuggestion(SQLModel, table=True):
+    """Precomputed family member discovery result for a person."""
+
+    __tablename__ = "discovery_suggestion"
+
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    person_id: uuid.UUID = Field(
+        foreign_key="person.id",
+        ondelete="CASCADE",
+        description="Person the suggestion is for",
+    )
+    suggested_person_id: uuid.UUID = Field(
+        foreign_key="person.id",
+        ondelete="CASCADE",
+        description="Suggested family member",
+    )
+    position: int = Field(description="Position in the sorted discovery results")
+    inferred_relationship_type: str = Field(
+        max_length=50, description="Inferred relationship type ID"
+    )
+    connection_path: str = Field(description="Human-readable connection path")
+    proximity_score: int = Field(description="Relationship proximity")
+    relationship_priority: int = Field(description="Relationship type priority")
+
+
+class DiscoverySuggestionState(SQLModel, table=True):
+    """Marks a person whose discovery suggestions are up to date.
+
+    Persons without a state row have not been computed yet, or were
+    invalidated by a relationship change and are waiting for a refresh.
+    """
+
+    __tablename__ = "discovery_suggestion_state"
+
+    person_id: uuid.UUID = Field(
+        foreign_key="person.id",
+        ondelete="CASCADE",
+        primary_key=True,
+        description="Person the suggestions are for",
+    )
+    refreshed_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        description="When the suggestions were computed",
+    )
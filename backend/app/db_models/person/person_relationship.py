@@ -18,7 +18,7 @@ class PersonRelationship(SQLModel, table=True):
         foreign_key="person.id", index=True, description="Person reference"
     )
     related_person_id: uuid.UUID = Field(
-        foreign_key="person.id", description="Related person reference"
+        foreign_key="person.id", index=True, description="Related person reference"
     )
     relationship_type: RelationshipType = Field(description="Relationship type")
     start_date: date | None = Field(default=None, description="Relationship start date")
@@ -1,8 +1,9 @@
 """Profile View Tracking database model."""
 
 import uuid
-from datetime import datetime
+from datetime import date, datetime
 
+from sqlalchemy import Index, text
 from sqlmodel import Field, SQLModel
 
 
@@ -10,6 +11,37 @@ class ProfileViewTracking(SQLModel, table=True):
     """Track profile view events for analytics."""
 
     __tablename__ = "profile_view_tracking"
+    __table_args__ = (
+        # One non-aggregated row per viewer-viewed pair; target of the
+        # buffered INSERT ... ON CONFLICT increments (migration 003)
+        Index(
+            "uq_profile_view_tracking_pair_non_aggregated",
+            "viewer_person_id",
+            "viewed_person_id",
+            unique=True,
+            postgresql_where=text("is_aggregated = false"),
+        ),
+        # One aggregated row per viewed person and month (migration 004)
+        Index(
+            "uq_profile_view_tracking_aggregate_period",
+            "viewed_person_id",
+            "period_start",
+            unique=True,
+            postgresql_where=text("is_aggregated = true"),
+        ),
+        # View totals are summed from the index alone
+        Index(
+            "ix_profile_view_tracking_viewed_views",
+            "viewed_person_id",
+            postgresql_include=["view_count"],
+        ),
+        # Finds the non-aggregated rows due for roll-up
+        Index(
+            "ix_profile_view_tracking_rollup",
+            "last_viewed_at",
+            postgresql_where=text("is_aggregated = false"),
+        ),
+    )
 
     id: uuid.UUID = Field(
         default_factory=uuid.uuid4,
@@ -19,14 +51,14 @@ class ProfileViewTracking(SQLModel, table=True):
 
     viewed_person_id: uuid.UUID = Field(
         foreign_key="person.id",
-        index=True,
         description="Person whose profile was viewed",
     )
 
-    viewer_person_id: uuid.UUID = Field(
+    viewer_person_id: uuid.UUID | None = Field(
+        default=None,
         foreign_key="person.id",
         index=True,
-        description="Person who viewed the profile",
+        description="Person who viewed the profile (None for aggregated records)",
     )
 
     view_count: int = Field(
@@ -44,6 +76,11 @@ class ProfileViewTracking(SQLModel, table=True):
         description="Whether this is an aggregated record",
     )
 
+    period_start: date | None = Field(
+        default=None,
+        description="First day of the month of an aggregated record's views",
+    )
+
     created_at: datetime = Field(
         default_factory=datetime.utcnow,
         description="Record creation timestamp",
@@ -0,0 +1,24 @@
+"""Reference Data Version database model."""
+
+from sqlalchemy import BigInteger, Column
+from sqlmodel import Field, SQLModel
+
+
+class ReferenceDataVersion(SQLModel, table=True):
+    """Change counter of a reference data table.
+
+    Incremented by a statement-level trigger on every INSERT, UPDATE or
+    DELETE of the table (migration 005), so writes from any worker or
+    directly in the database are counted.
+    """
+
+    __tablename__ = "reference_data_version"
+
+    table_name: str = Field(
+        max_length=63, primary_key=True, description="Counted table"
+    )
+    version: int = Field(
+        default=0,
+        sa_column=Column(BigInteger, nullable=False, server_default="0"),
+        description="Number of write statements on the table",
+    )
@@ -1,13 +1,28 @@
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 import sentry_sdk
 from fastapi import FastAPI
 from fastapi.routing import APIRoute
+from sqlmodel import Session
 from starlette.middleware.cors import CORSMiddleware
 
 from app.api.main import api_router
 from app.core.config import settings
+from app.core.db import engine
 from app.core.logging_config import setup_logging
+from app.services.graph_traversal import build_adjacency_index
+from app.services.person.discovery_suggestion_service import (
+    start_discovery_suggestion_worker,
+    stop_discovery_suggestion_worker,
+)
+from app.services.profile_view_tracking_service import (
+    start_profile_view_buffer,
+    start_profile_view_rollup_scheduler,
+    stop_profile_view_buffer,
+    stop_profile_view_rollup_scheduler,
+)
 
 # Setup logging before anything else
 setup_logging()
@@ -24,10 +39,30 @@ if settings.SENTRY_DSN and settings.ENVIRONMENT != "local":
 
 logger.info(f"Starting {settings.PROJECT_NAME} in {settings.ENVIRONMENT} environment")
 
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    if settings.GRAPH_ADJACENCY_INDEX_ENABLED:
+        with Session(engine) as session:
+            build_adjacency_index(session)
+        logger.info("In-memory adjacency index enabled")
+    if settings.DISCOVERY_SUGGESTIONS_ENABLED:
+        start_discovery_suggestion_worker(engine)
+    if settings.PROFILE_VIEW_BUFFER_ENABLED:
+        start_profile_view_buffer(engine)
+    if settings.PROFILE_VIEW_ROLLUP_INTERVAL_SECONDS > 0:
+        start_profile_view_rollup_scheduler(engine)
+    yield
+    stop_discovery_suggestion_worker()
+    stop_profile_view_rollup_scheduler()
+    stop_profile_view_buffer()
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     generate_unique_id_function=custom_generate_unique_id,
+    lifespan=lifespan,
 )
 
 # Set all CORS enabled origins
@@ -1,7 +1,7 @@
 import logging
 from uuid import UUID
 
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
 
 from app.db_models.address import District
 from app.repositories.base import BaseRepository
@@ -28,6 +28,19 @@ class DistrictRepository(BaseRepository[District]):
         logger.debug(f"Retrieved {len(results)} districts for state {state_id}")
         return results
 
+    def get_by_states(self, state_ids: list[UUID]) -> list[District]:
+        """Get all active districts of several states, ordered by name"""
+        logger.debug(f"Querying districts for {len(state_ids)} states")
+        statement = (
+            select(District)
+            .where(col(District.state_id).in_(state_ids))
+            .where(District.is_active)
+            .order_by(District.name)
+        )
+        results = list(self.session.exec(statement).all())
+        logger.debug(f"Retrieved {len(results)} districts")
+        return results
+
     def get_by_code(self, code: str, state_id: UUID) -> District | None:
         """Get district by code within a specific state"""
         logger.debug(f"Querying district by code: {code}, state_id: {state_id}")
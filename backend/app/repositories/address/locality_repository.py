@@ -1,7 +1,7 @@
 import logging
 from uuid import UUID
 
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
 
 from app.db_models.address import Locality
 from app.repositories.base import BaseRepository
@@ -30,6 +30,19 @@ class LocalityRepository(BaseRepository[Locality]):
         )
         return results
 
+    def get_by_sub_districts(self, sub_district_ids: list[UUID]) -> list[Locality]:
+        """Get all active localities of several sub-districts, ordered by name"""
+        logger.debug(f"Querying localities for {len(sub_district_ids)} sub-districts")
+        statement = (
+            select(Locality)
+            .where(col(Locality.sub_district_id).in_(sub_district_ids))
+            .where(Locality.is_active)
+            .order_by(Locality.name)
+        )
+        results = list(self.session.exec(statement).all())
+        logger.debug(f"Retrieved {len(results)} localities")
+        return results
+
     def get_by_code(self, code: str, sub_district_id: UUID) -> Locality | None:
         """Get locality by code within a specific sub-district"""
         logger.debug(
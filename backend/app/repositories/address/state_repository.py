@@ -1,7 +1,7 @@
 import logging
 from uuid import UUID
 
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
 
 from app.db_models.address import State
 from app.repositories.base import BaseRepository
@@ -28,6 +28,19 @@ class StateRepository(BaseRepository[State]):
         logger.debug(f"Retrieved {len(results)} states for country {country_id}")
         return results
 
+    def get_by_countries(self, country_ids: list[UUID]) -> list[State]:
+        """Get all active states of several countries, ordered by name"""
+        logger.debug(f"Querying states for {len(country_ids)} countries")
+        statement = (
+            select(State)
+            .where(col(State.country_id).in_(country_ids))
+            .where(State.is_active)
+            .order_by(State.name)
+        )
+        results = list(self.session.exec(statement).all())
+        logger.debug(f"Retrieved {len(results)} states")
+        return results
+
     def get_by_code(self, code: str, country_id: UUID) -> State | None:
         """Get state by code within a specific country"""
         logger.debug(f"Querying state by code: {code}, country_id: {country_id}")
@@ -1,7 +1,7 @@
 import logging
 from uuid import UUID
 
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
 
 from app.db_models.address import SubDistrict
 from app.repositories.base import BaseRepository
@@ -30,6 +30,19 @@ class SubDistrictRepository(BaseRepository[SubDistrict]):
         )
         return results
 
+    def get_by_districts(self, district_ids: list[UUID]) -> list[SubDistrict]:
+        """Get all active sub-districts of several districts, ordered by name"""
+        logger.debug(f"Querying sub-districts for {len(district_ids)} districts")
+        statement = (
+            select(SubDistrict)
+            .where(col(SubDistrict.district_id).in_(district_ids))
+            .where(SubDistrict.is_active)
+            .order_by(SubDistrict.name)
+        )
+        results = list(self.session.exec(statement).all())
+        logger.debug(f"Retrieved {len(results)} sub-districts")
+        return results
+
     def get_by_code(self, code: str, district_id: UUID) -> SubDistrict | None:
         """Get sub-district by code within a specific district"""
         logger.debug(
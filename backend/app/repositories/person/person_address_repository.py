@@ -3,8 +3,11 @@
 import logging
 import uuid
 
-from sqlmodel import Session, desc, select
+from sqlmodel import Session, col, desc, select
 
+from app.db_models.address.district import District
+from app.db_models.address.locality import Locality
+from app.db_models.address.state import State
 from app.db_models.person.person_address import PersonAddress
 from app.repositories.base import BaseRepository
 
@@ -29,6 +32,42 @@ class PersonAddressRepository(BaseRepository[PersonAddress]):
         logger.debug(f"Retrieved {len(results)} addresses for person {person_id}")
         return results
 
+    def get_by_person_ids_with_names(
+        self, person_ids: list[uuid.UUID]
+    ) -> list[tuple[PersonAddress, str | None, str | None, str | None]]:
+        """Get all addresses of several persons with their location names.
+
+        Args:
+            person_ids: Persons whose addresses to load
+
+        Returns:
+            List of (address, locality_name, district_name, state_name)
+            tuples, ordered by person and newest start date first
+        """
+        if not person_ids:
+            return []
+
+        logger.debug(f"Querying addresses for {len(person_ids)} persons")
+        statement = (
+            select(PersonAddress, Locality.name, District.name, State.name)
+            .outerjoin(Locality, col(Locality.id) == PersonAddress.locality_id)
+            .outerjoin(District, col(District.id) == PersonAddress.district_id)
+            .outerjoin(State, col(State.id) == PersonAddress.state_id)
+            .where(col(PersonAddress.person_id).in_(person_ids))
+            .order_by(col(PersonAddress.person_id), desc(PersonAddress.start_date))
+        )
+        # Location names are None when the outer joins find no row
+        results: list[tuple[PersonAddress, str | None, str | None, str | None]] = [
+            (address, locality_name, district_name, state_name)
+            for address, locality_name, district_name, state_name in (
+                self.session.exec(statement).all()
+            )
+        ]
+        logger.debug(
+            f"Retrieved {len(results)} addresses for {len(person_ids)} persons"
+        )
+        return results
+
     def get_current_address(self, person_id: uuid.UUID) -> PersonAddress | None:
         """Get current address for a person."""
         logger.debug(f"Querying current address for person: {person_id}")
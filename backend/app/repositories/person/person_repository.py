@@ -2,10 +2,12 @@
 
 import logging
 import uuid
+from typing import Literal
 
-from sqlmodel import Session, select
+from sqlmodel import Session, col, func, select
 
 from app.db_models.person.person import Person
+from app.db_models.profile_view_tracking import ProfileViewTracking
 from app.repositories.base import BaseRepository
 
 logger = logging.getLogger(__name__)
@@ -44,3 +46,57 @@ class PersonRepository(BaseRepository[Person]):
         results = list(self.session.exec(statement).all())
         logger.debug(f"Found {len(results)} persons created by user {creator_user_id}")
         return results
+
+    def get_by_creator_with_views(
+        self,
+        creator_user_id: uuid.UUID,
+        sort_by: Literal["views", "created_at"] = "views",
+        skip: int = 0,
+        limit: int | None = None,
+    ) -> list[tuple[Person, int]]:
+        """Get persons created by a user with their total view counts.
+
+        View counts are summed in a subquery, so sorting and pagination
+        happen in the database.
+
+        Args:
+            creator_user_id: User who created the persons
+            sort_by: "views" for most viewed first, "created_at" for newest first
+            skip: Number of persons to skip
+            limit: Maximum number of persons to return (None for all)
+
+        Returns:
+            List of (person, total_views) tuples in the requested order
+        """
+        logger.debug(
+            f"Querying persons with views by creator_user_id: {creator_user_id}, "
+            f"sort_by={sort_by}, skip={skip}, limit={limit}"
+        )
+        views = (
+            select(
+                ProfileViewTracking.viewed_person_id,
+                func.sum(ProfileViewTracking.view_count).label("total_views"),
+            )
+            .group_by(col(ProfileViewTracking.viewed_person_id))
+            .subquery()
+        )
+        total_views = func.coalesce(views.c.total_views, 0)
+
+        order_by = [total_views.desc(), col(Person.created_at).desc()]
+        if sort_by == "created_at":
+            order_by.reverse()
+
+        statement = (
+            select(Person, total_views)
+            .outerjoin(views, views.c.viewed_person_id == Person.id)
+            .where(Person.created_by_user_id == creator_user_id)
+            .order_by(*order_by, col(Person.id))
+            .offset(skip)
+            .limit(limit)
+        )
+        results = [
+            (person, int(views_count))
+            for person, views_count in self.session.exec(statement).all()
+        ]
+        logger.debug(f"Found {len(results)} persons created by user {creator_user_id}")
+        return results
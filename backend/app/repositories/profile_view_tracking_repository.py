@@ -1,12 +1,17 @@
 """Repository for profile view tracking data access."""
 
 import uuid
+from datetime import date, datetime
 
-from sqlmodel import Session, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session, col, delete, func, select
 
 from app.db_models.profile_view_tracking import ProfileViewTracking
 from app.repositories.base import BaseRepository
 
+# Rows per INSERT statement when writing view increments
+INCREMENT_CHUNK_SIZE = 1000
+
 
 class ProfileViewTrackingRepository(BaseRepository[ProfileViewTracking]):
     """Repository for profile view tracking data access."""
@@ -76,3 +81,141 @@ class ProfileViewTrackingRepository(BaseRepository[ProfileViewTracking]):
 
         results = self.session.exec(statement).all()
         return {person_id: int(total_views) for person_id, total_views in results}
+
+    def increment_views(
+        self,
+        increments: list[tuple[uuid.UUID, uuid.UUID, int, datetime]],
+    ) -> None:
+        """Add view counts to non-aggregated viewer-viewed records.
+
+        Each pair's record is created or incremented with INSERT ... ON
+        CONFLICT DO UPDATE, and all increments are committed together.
+
+        Args:
+            increments: (viewer_person_id, viewed_person_id, views,
+                last_viewed_at) tuples, at most one per pair
+        """
+        if not increments:
+            return
+
+        for start in range(0, len(increments), INCREMENT_CHUNK_SIZE):
+            chunk = increments[start : start + INCREMENT_CHUNK_SIZE]
+            statement = insert(ProfileViewTracking).values(
+                [
+                    {
+                        "id": uuid.uuid4(),
+                        "viewer_person_id": viewer_person_id,
+                        "viewed_person_id": viewed_person_id,
+                        "view_count": views,
+                        "last_viewed_at": last_viewed_at,
+                        "is_aggregated": False,
+                        "created_at": last_viewed_at,
+                        "updated_at": last_viewed_at,
+                    }
+                    for viewer_person_id, viewed_person_id, views, last_viewed_at in chunk
+                ]
+            )
+            statement = statement.on_conflict_do_update(
+                index_elements=[
+                    col(ProfileViewTracking.viewer_person_id),
+                    col(ProfileViewTracking.viewed_person_id),
+                ],
+                index_where=col(ProfileViewTracking.is_aggregated) == False,  # noqa: E712
+                set_={
+                    "view_count": ProfileViewTracking.view_count
+                    + statement.excluded.view_count,
+                    "last_viewed_at": func.greatest(
+                        ProfileViewTracking.last_viewed_at,
+                        statement.excluded.last_viewed_at,
+                    ),
+                    "updated_at": statement.excluded.updated_at,
+                },
+            )
+            self.session.execute(statement)
+
+        self.session.commit()
+
+    def roll_up_views(self, older_than: datetime, batch_size: int) -> int:
+        """Compact one batch of old non-aggregated records.
+
+        Deletes up to batch_size non-aggregated records last viewed before
+        older_than and adds their view counts to one aggregated record per
+        viewed person and month, in a single transaction. Records locked by
+        concurrent writers or roll-ups are skipped, so totals stay exact.
+
+        Args:
+            older_than: Only records last viewed before this are rolled up
+            batch_size: Maximum number of records rolled up
+
+        Returns:
+            Number of non-aggregated records rolled up
+        """
+        candidates = (
+            select(ProfileViewTracking.id)
+            .where(
+                ProfileViewTracking.is_aggregated == False,  # noqa: E712
+                col(ProfileViewTracking.last_viewed_at) < older_than,
+            )
+            .order_by(col(ProfileViewTracking.last_viewed_at))
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        rolled_up = self.session.execute(
+            delete(ProfileViewTracking)
+            .where(col(ProfileViewTracking.id).in_(candidates.scalar_subquery()))
+            .returning(
+                col(ProfileViewTracking.viewed_person_id),
+                col(ProfileViewTracking.view_count),
+                col(ProfileViewTracking.last_viewed_at),
+            )
+        ).all()
+        if not rolled_up:
+            self.session.commit()
+            return 0
+
+        # Sum per viewed person and month
+        aggregates: dict[tuple[uuid.UUID, date], tuple[int, datetime]] = {}
+        for viewed_person_id, view_count, last_viewed_at in rolled_up:
+            key = (viewed_person_id, last_viewed_at.date().replace(day=1))
+            views, latest = aggregates.get(key, (0, last_viewed_at))
+            aggregates[key] = (views + view_count, max(latest, last_viewed_at))
+
+        now = datetime.utcnow()
+        statement = insert(ProfileViewTracking).values(
+            [
+                {
+                    "id": uuid.uuid4(),
+                    "viewer_person_id": None,
+                    "viewed_person_id": viewed_person_id,
+                    "view_count": views,
+                    "last_viewed_at": last_viewed_at,
+                    "is_aggregated": True,
+                    "period_start": period_start,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for (viewed_person_id, period_start), (
+                    views,
+                    last_viewed_at,
+                ) in aggregates.items()
+            ]
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[
+                col(ProfileViewTracking.viewed_person_id),
+                col(ProfileViewTracking.period_start),
+            ],
+            index_where=col(ProfileViewTracking.is_aggregated) == True,  # noqa: E712
+            set_={
+                "view_count": ProfileViewTracking.view_count
+                + statement.excluded.view_count,
+                "last_viewed_at": func.greatest(
+                    ProfileViewTracking.last_viewed_at,
+                    statement.excluded.last_viewed_at,
+                ),
+                "updated_at": statement.excluded.updated_at,
+            },
+        )
+        self.session.execute(statement)
+        self.session.commit()
+        return len(rolled_up)
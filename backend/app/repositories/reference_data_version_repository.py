@@ -0,0 +1,25 @@
+"""Reference data version repository."""
+
+import logging
+
+from sqlmodel import Session, select
+
+from app.db_models.reference_data_version import ReferenceDataVersion
+
+logger = logging.getLogger(__name__)
+
+
+class ReferenceDataVersionRepository:
+    """Repository for the reference data change counters."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get_versions(self) -> dict[str, int]:
+        """Get the change counter of every counted table."""
+        statement = select(
+            ReferenceDataVersion.table_name, ReferenceDataVersion.version
+        )
+        versions = dict(self.session.exec(statement).all())
+        logger.debug(f"Reference data versions: {versions}")
+        return versions
@@ -3,14 +3,22 @@
 import logging
 import uuid
 
-from sqlmodel import Session, desc, select
+from sqlalchemy.orm import aliased
+from sqlmodel import Session, col, desc, func, select
+from sqlmodel.sql.expression import Select
 
 from app.db_models.support_ticket import SupportTicket
+from app.db_models.user import User
 from app.repositories.base import BaseRepository
 from app.schemas.support_ticket import IssueStatus, IssueType
 
 logger = logging.getLogger(__name__)
 
+# (ticket, creator_email, creator_full_name, resolver_email, resolver_full_name)
+SupportTicketWithUsersRow = tuple[
+    SupportTicket, str | None, str | None, str | None, str | None
+]
+
 
 class SupportTicketRepository(BaseRepository[SupportTicket]):
     """Repository for SupportTicket data access."""
@@ -69,6 +77,71 @@ class SupportTicketRepository(BaseRepository[SupportTicket]):
         logger.debug(f"Retrieved {len(results)} tickets")
         return results
 
+    def get_all_with_users(
+        self,
+        status: IssueStatus | None = None,
+        issue_type: IssueType | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> tuple[list[SupportTicketWithUsersRow], int]:
+        """Get a page of tickets with creator and resolver details (admin only).
+
+        Creator and resolver are joined in the same query, which also returns
+        the total number of matching tickets as a window count.
+
+        Returns:
+            Tuple of (rows, total count) where each row is (ticket,
+            creator_email, creator_full_name, resolver_email,
+            resolver_full_name)
+        """
+        logger.debug(
+            f"Querying all tickets with users: status={status}, "
+            f"issue_type={issue_type}, skip={skip}, limit={limit}"
+        )
+        creator = aliased(User)
+        resolver = aliased(User)
+        # sqlmodel's select() is only typed for up to four columns
+        statement: Select[
+            tuple[SupportTicket, str | None, str | None, str | None, str | None, int]
+        ] = (
+            Select(
+                SupportTicket,
+                col(creator.email),
+                col(creator.full_name),
+                col(resolver.email),
+                col(resolver.full_name),
+                func.count().over().label("total_count"),
+            )
+            .outerjoin(creator, col(creator.id) == SupportTicket.user_id)
+            .outerjoin(resolver, col(resolver.id) == SupportTicket.resolved_by_user_id)
+        )
+
+        if status is not None:
+            statement = statement.where(SupportTicket.status == status.value)
+
+        if issue_type is not None:
+            statement = statement.where(SupportTicket.issue_type == issue_type.value)
+
+        statement = (
+            statement.order_by(desc(SupportTicket.created_at)).offset(skip).limit(limit)
+        )
+
+        rows = self.session.exec(statement).all()
+        if rows:
+            count = rows[0][-1]
+        elif skip > 0:
+            # A page past the end has no row to carry the window count
+            count = self._count_filtered(status=status, issue_type=issue_type)
+        else:
+            count = 0
+
+        results: list[SupportTicketWithUsersRow] = [
+            (ticket, user_email, user_name, resolver_email, resolver_name)
+            for ticket, user_email, user_name, resolver_email, resolver_name, _ in rows
+        ]
+        logger.debug(f"Retrieved {len(results)} tickets with users (total: {count})")
+        return results, count
+
     def count_by_user_id(
         self, user_id: uuid.UUID, status: IssueStatus | None = None
     ) -> int:
@@ -99,3 +172,17 @@ class SupportTicketRepository(BaseRepository[SupportTicket]):
         count = len(list(self.session.exec(statement).all()))
         logger.debug(f"Total tickets: {count}")
         return count
+
+    def _count_filtered(
+        self, status: IssueStatus | None = None, issue_type: IssueType | None = None
+    ) -> int:
+        """Count matching tickets with a COUNT query."""
+        statement = select(func.count()).select_from(SupportTicket)
+
+        if status is not None:
+            statement = statement.where(SupportTicket.status == status.value)
+
+        if issue_type is not None:
+            statement = statement.where(SupportTicket.issue_type == issue_type.value)
+
+        return self.session.exec(statement).one()
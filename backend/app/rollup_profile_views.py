@@ -0,0 +1,59 @@
+"""Roll up old non-aggregated profile views into monthly aggregates.
+
+Usage:
+    python -m app.rollup_profile_views [--older-than-days N] [--batch-size N]
+"""
+
+import argparse
+import logging
+
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.db import engine
+from app.services.profile_view_tracking_service import (
+    ROLLUP_BATCH_SIZE,
+    ProfileViewTrackingService,
+)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value}")
+    return number
+
+
+def rollup(older_than_days: int, batch_size: int) -> int:
+    with Session(engine) as session:
+        return ProfileViewTrackingService(session).roll_up_views(
+            older_than_days=older_than_days, batch_size=batch_size
+        )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--older-than-days",
+        type=int,
+        default=settings.PROFILE_VIEW_ROLLUP_AGE_DAYS,
+        help="Roll up records last viewed more than this many days ago",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=positive_int,
+        default=ROLLUP_BATCH_SIZE,
+        help="Records rolled up per transaction",
+    )
+    args = parser.parse_args(argv)
+
+    logger.info("Rolling up profile views")
+    rolled_up = rollup(args.older_than_days, args.batch_size)
+    logger.info(f"Rolled up {rolled_up} profile view records")
+
+
+if __name__ == "__main__":
+    main()
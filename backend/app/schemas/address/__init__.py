@@ -1,4 +1,5 @@
 # Address-related schemas
+from .address_tree import AddressTreeLevel, AddressTreePublic
 from .country import (
     CountryBase,
     CountryCreate,
@@ -61,4 +62,6 @@ __all__ = [
     "LocalityUpdate",
     "LocalityPublic",
     "LocalityDetailPublic",
+    "AddressTreeLevel",
+    "AddressTreePublic",
 ]
@@ -0,0 +1,26 @@
+import uuid
+
+from sqlmodel import SQLModel
+
+
+class AddressTreeLevel(SQLModel):
+    """
+    One level of an address subtree in columnar form.
+
+    The i-th entry is (ids[i], names[i]); parents[i] is the index of its
+    parent in the previous level (or 0, the root, for the first level).
+    """
+
+    level: str
+    ids: list[uuid.UUID]
+    names: list[str]
+    parents: list[int]
+
+
+class AddressTreePublic(SQLModel):
+    """An address entry and all active entries below it, level by level"""
+
+    level: str
+    id: uuid.UUID
+    name: str
+    levels: list[AddressTreeLevel]
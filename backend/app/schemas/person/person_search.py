@@ -61,6 +61,16 @@ class PersonSearchFilterRequest(SQLModel):
         default=20, ge=1, le=100, description="Maximum number of records to return"
     )
 
+    # Cursor pagination (alternative to skip)
+    use_cursor: bool = Field(
+        default=False, description="Return next_cursor for cursor pagination"
+    )
+    cursor: str | None = Field(
+        default=None,
+        max_length=1024,
+        description="next_cursor from the previous page (skip is ignored)",
+    )
+
     @field_validator(
         "gender_id", "locality_id", "religion_sub_category_id", mode="before"
     )
@@ -90,6 +100,14 @@ class PersonSearchFilterRequest(SQLModel):
             return None
         return v
 
+    @field_validator("cursor", mode="before")
+    @classmethod
+    def empty_string_cursor_to_none(cls, v: Any) -> Any:
+        """Convert empty string to None for the optional cursor."""
+        if v == "" or v is None:
+            return None
+        return v
+
     @model_validator(mode="after")
     def validate_birth_year_range(self) -> "PersonSearchFilterRequest":
         """Validate that birth_year_from <= birth_year_to when both are provided."""
@@ -138,6 +156,10 @@ class PersonSearchResponse(SQLModel):
     total: int = Field(description="Total count of matching persons")
     skip: int = Field(description="Number of records skipped")
     limit: int = Field(description="Maximum records per page")
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor for the next page (cursor pagination only)",
+    )
 
 
 # =============================================================================
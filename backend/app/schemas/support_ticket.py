@@ -67,6 +67,9 @@ class SupportTicketPublicWithUser(SupportTicketPublic):
     resolved_by_email: str | None = Field(
         default=None, description="Email of the admin who resolved the ticket"
     )
+    resolved_by_full_name: str | None = Field(
+        default=None, description="Full name of the admin who resolved the ticket"
+    )
 
 
 class SupportTicketsPublic(SQLModel):
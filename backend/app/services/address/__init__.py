@@ -1,4 +1,11 @@
 # Address-related services
+from .address_gazetteer import (
+    AddressGazetteer,
+    AddressNames,
+    get_address_gazetteer,
+    invalidate_address_gazetteer,
+)
+from .address_tree_service import AddressTreeService
 from .country_service import CountryService
 from .district_service import DistrictService
 from .locality_service import LocalityService
@@ -11,4 +18,9 @@ __all__ = [
     "DistrictService",
     "SubDistrictService",
     "LocalityService",
+    "AddressTreeService",
+    "AddressGazetteer",
+    "AddressNames",
+    "get_address_gazetteer",
+    "invalidate_address_gazetteer",
 ]
@@ -0,0 +1,180 @@
+"""In-memory gazetteer of the address hierarchy."""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from typing import NamedTuple
+
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.db_models.address import Country, District, Locality, State, SubDistrict
+from app.db_models.person.person_address import PersonAddress
+from app.services.reference_data_cache import expire_reference_data_versions
+from app.services.reference_snapshot import TTLSnapshot
+
+logger = logging.getLogger(__name__)
+
+# id -> (name, parent_id); parent_id is None for countries
+LevelEntries = dict[uuid.UUID, tuple[str, uuid.UUID | None]]
+
+
+class AddressNames(NamedTuple):
+    """Location names of an address, from most to least specific."""
+
+    locality: str | None
+    sub_district: str | None
+    district: str | None
+    state: str | None
+    country: str | None
+
+
+class AddressGazetteer(TTLSnapshot):
+    """
+    Snapshot of all five address levels as id -> (name, parent_id) maps.
+
+    The address tables are small reference data, so they are loaded in one
+    go and every lookup afterwards is a dictionary access. The snapshot is
+    reloaded on next use after any address table changes, or once
+    ADDRESS_GAZETTEER_TTL_SECONDS has elapsed.
+    """
+
+    tables = (
+        "address_country",
+        "address_state",
+        "address_district",
+        "address_sub_district",
+        "address_locality",
+    )
+
+    def __init__(self) -> None:
+        """Initialize an empty, stale gazetteer."""
+        super().__init__()
+        self._countries: LevelEntries = {}
+        self._states: LevelEntries = {}
+        self._districts: LevelEntries = {}
+        self._sub_districts: LevelEntries = {}
+        self._localities: LevelEntries = {}
+
+    @property
+    def ttl_seconds(self) -> int:
+        """Seconds after which a loaded gazetteer is stale."""
+        return settings.ADDRESS_GAZETTEER_TTL_SECONDS
+
+    def _load(self, session: Session) -> None:
+        """
+        Read all address levels from the database.
+
+        Args:
+            session: Database session
+        """
+        countries: LevelEntries = {
+            row_id: (name, None)
+            for row_id, name in session.exec(select(Country.id, Country.name)).all()
+        }
+        states: LevelEntries = {
+            row_id: (name, parent_id)
+            for row_id, name, parent_id in session.exec(
+                select(State.id, State.name, State.country_id)
+            ).all()
+        }
+        districts: LevelEntries = {
+            row_id: (name, parent_id)
+            for row_id, name, parent_id in session.exec(
+                select(District.id, District.name, District.state_id)
+            ).all()
+        }
+        sub_districts: LevelEntries = {
+            row_id: (name, parent_id)
+            for row_id, name, parent_id in session.exec(
+                select(SubDistrict.id, SubDistrict.name, SubDistrict.district_id)
+            ).all()
+        }
+        localities: LevelEntries = {
+            row_id: (name, parent_id)
+            for row_id, name, parent_id in session.exec(
+                select(Locality.id, Locality.name, Locality.sub_district_id)
+            ).all()
+        }
+
+        self._countries = countries
+        self._states = states
+        self._districts = districts
+        self._sub_districts = sub_districts
+        self._localities = localities
+
+        logger.info(
+            f"Address gazetteer loaded: {len(countries)} countries, "
+            f"{len(states)} states, {len(districts)} districts, "
+            f"{len(sub_districts)} sub-districts, {len(localities)} localities"
+        )
+
+    def get_names(self, address: PersonAddress) -> AddressNames:
+        """
+        Resolve the location names of an address.
+
+        Args:
+            address: Person address whose location IDs to resolve
+
+        Returns:
+            AddressNames with None for unset or unknown levels
+        """
+        return AddressNames(
+            locality=self._name(self._localities, address.locality_id),
+            sub_district=self._name(self._sub_districts, address.sub_district_id),
+            district=self._name(self._districts, address.district_id),
+            state=self._name(self._states, address.state_id),
+            country=self._name(self._countries, address.country_id),
+        )
+
+    def format_address(self, address: PersonAddress) -> str | None:
+        """
+        Format an address as "address line, locality, ..., country".
+
+        Args:
+            address: Person address to format
+
+        Returns:
+            Comma-separated address string, or None if no part is known
+        """
+        parts = [address.address_line, *self.get_names(address)]
+        formatted = ", ".join(part for part in parts if part)
+        return formatted or None
+
+    @staticmethod
+    def _name(entries: LevelEntries, entry_id: uuid.UUID | None) -> str | None:
+        """Get the name of an entry, or None if unset or unknown."""
+        if entry_id is None:
+            return None
+        entry = entries.get(entry_id)
+        return entry[0] if entry else None
+
+
+# Global gazetteer instance (loaded lazily on first use)
+_address_gazetteer = AddressGazetteer()
+
+
+def get_address_gazetteer(session: Session) -> AddressGazetteer:
+    """
+    Get the global address gazetteer, (re)loading it if stale.
+
+    Args:
+        session: Database session used if a reload is needed
+
+    Returns:
+        Global AddressGazetteer instance
+    """
+    _address_gazetteer.ensure_loaded(session)
+    return _address_gazetteer
+
+
+def invalidate_address_gazetteer() -> None:
+    """Mark the global address gazetteer stale after an address metadata write."""
+    _address_gazetteer.invalidate()
+
+
+def reference_data_changed() -> None:
+    """Drop every in-process copy of the address tables after a write."""
+    invalidate_address_gazetteer()
+    expire_reference_data_versions()
@@ -0,0 +1,113 @@
+import logging
+from collections.abc import Callable, Sequence
+from typing import Any
+from uuid import UUID
+
+from sqlmodel import Session
+
+from app.repositories.address import (
+    CountryRepository,
+    DistrictRepository,
+    LocalityRepository,
+    StateRepository,
+    SubDistrictRepository,
+)
+from app.schemas.address import AddressTreeLevel, AddressTreePublic
+
+logger = logging.getLogger(__name__)
+
+# Address levels from least to most specific
+ADDRESS_LEVELS = ("country", "state", "district", "sub_district", "locality")
+
+# Table each level is stored in
+ADDRESS_LEVEL_TABLES = {
+    "country": "address_country",
+    "state": "address_state",
+    "district": "address_district",
+    "sub_district": "address_sub_district",
+    "locality": "address_locality",
+}
+
+# Foreign key of each level to its parent level
+_PARENT_FIELDS = {
+    "state": "country_id",
+    "district": "state_id",
+    "sub_district": "district_id",
+    "locality": "sub_district_id",
+}
+
+
+class AddressTreeService:
+    """Service for whole address subtrees, for clients caching the gazetteer"""
+
+    def __init__(self, session: Session):
+        self.session = session
+        self.country_repo = CountryRepository(session)
+        self.state_repo = StateRepository(session)
+        self.district_repo = DistrictRepository(session)
+        self.sub_district_repo = SubDistrictRepository(session)
+        self.locality_repo = LocalityRepository(session)
+
+    def get_tree(self, level: str, root_id: UUID) -> AddressTreePublic | None:
+        """
+        Get an address entry and all active entries below it.
+
+        Each level below the root is loaded with one query and returned in
+        columnar form, with parents referenced by index into the level above.
+
+        Args:
+            level: Level of the root entry, one of ADDRESS_LEVELS
+            root_id: ID of the root entry
+
+        Returns:
+            AddressTreePublic, or None if the root entry does not exist
+        """
+        root = self._get_by_id(level)(root_id)
+        if root is None:
+            return None
+
+        logger.debug(f"Building address tree for {level} {root_id}")
+        levels: list[AddressTreeLevel] = []
+        parents: Sequence[Any] = [root]
+        for child_level in ADDRESS_LEVELS[ADDRESS_LEVELS.index(level) + 1 :]:
+            parent_index = {parent.id: i for i, parent in enumerate(parents)}
+            children = (
+                self._get_children(child_level)(list(parent_index)) if parents else []
+            )
+            parent_field = _PARENT_FIELDS[child_level]
+            levels.append(
+                AddressTreeLevel(
+                    level=child_level,
+                    ids=[child.id for child in children],
+                    names=[child.name for child in children],
+                    parents=[
+                        parent_index[getattr(child, parent_field)] for child in children
+                    ],
+                )
+            )
+            parents = children
+
+        counts = ", ".join(f"{len(entry.ids)} {entry.level}" for entry in levels)
+        logger.debug(f"Address tree for {level} {root_id}: {counts}")
+        return AddressTreePublic(level=level, id=root.id, name=root.name, levels=levels)
+
+    def _get_by_id(self, level: str) -> Callable[[UUID], Any]:
+        """Get the lookup by ID of a level."""
+        return {
+            "country": self.country_repo.get_by_id,
+            "state": self.state_repo.get_by_id,
+            "district": self.district_repo.get_by_id,
+            "sub_district": self.sub_district_repo.get_by_id,
+            "locality": self.locality_repo.get_by_id,
+        }[level]
+
+    def _get_children(self, level: str) -> Callable[[list[UUID]], Sequence[Any]]:
+        """Get the query for the active entries of a level under given parents."""
+        # Annotated so the per-level result types join to Sequence, not object
+        queries: dict[str, Callable[[list[UUID]], Sequence[Any]]] = {
+            "state": self.state_repo.get_by_countries,
+            "district": self.district_repo.get_by_states,
+            "sub_district": self.sub_district_repo.get_by_districts,
+            "locality": self.locality_repo.get_by_sub_districts,
+        }
+        return queries[level]
@@ -6,6 +6,7 @@ from sqlmodel import Session
 from app.db_models.address import Country
 from app.repositories.address import CountryRepository
 from app.schemas.address import CountryCreate, CountryPublic, CountryUpdate
+from app.services.address.address_gazetteer import reference_data_changed
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +57,7 @@ class CountryService:
             is_active=country_in.is_active,
         )
         created_country = self.country_repo.create(country)
+        reference_data_changed()
         logger.info(
             f"Country created successfully: {created_country.name} (ID: {created_country.id})"
         )
@@ -79,6 +81,7 @@ class CountryService:
 
         country.sqlmodel_update(update_data)
         updated_country = self.country_repo.update(country)
+        reference_data_changed()
         logger.info(
             f"Country updated successfully: {updated_country.name} (ID: {updated_country.id})"
         )
@@ -101,4 +104,5 @@ class CountryService:
         """Delete a country"""
         logger.warning(f"Deleting country: {country.name} (ID: {country.id})")
         self.country_repo.delete(country)
+        reference_data_changed()
         logger.info(f"Country deleted successfully: {country.name} (ID: {country.id})")
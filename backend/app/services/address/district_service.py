@@ -6,6 +6,7 @@ from sqlmodel import Session
 from app.db_models.address import District
 from app.repositories.address import DistrictRepository
 from app.schemas.address.district import DistrictCreate, DistrictPublic, DistrictUpdate
+from app.services.address.address_gazetteer import reference_data_changed
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +50,7 @@ class DistrictService:
             is_active=district_in.is_active,
         )
         created_district = self.district_repo.create(district)
+        reference_data_changed()
         logger.info(
             f"District created successfully: {created_district.name} (ID: {created_district.id})"
         )
@@ -72,6 +74,7 @@ class DistrictService:
 
         district.sqlmodel_update(update_data)
         updated_district = self.district_repo.update(district)
+        reference_data_changed()
         logger.info(
             f"District updated successfully: {updated_district.name} (ID: {updated_district.id})"
         )
@@ -98,6 +101,7 @@ class DistrictService:
         """Delete a district"""
         logger.warning(f"Deleting district: {district.name} (ID: {district.id})")
         self.district_repo.delete(district)
+        reference_data_changed()
         logger.info(
             f"District deleted successfully: {district.name} (ID: {district.id})"
         )
@@ -10,6 +10,7 @@ from app.schemas.address.locality import (
     LocalityPublic,
     LocalityUpdate,
 )
+from app.services.address.address_gazetteer import reference_data_changed
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +58,7 @@ class LocalityService:
             is_active=locality_in.is_active,
         )
         created_locality = self.locality_repo.create(locality)
+        reference_data_changed()
         logger.info(
             f"Locality created successfully: {created_locality.name} (ID: {created_locality.id})"
         )
@@ -80,6 +82,7 @@ class LocalityService:
 
         locality.sqlmodel_update(update_data)
         updated_locality = self.locality_repo.update(locality)
+        reference_data_changed()
         logger.info(
             f"Locality updated successfully: {updated_locality.name} (ID: {updated_locality.id})"
         )
@@ -113,6 +116,7 @@ class LocalityService:
         """Delete a locality"""
         logger.warning(f"Deleting locality: {locality.name} (ID: {locality.id})")
         self.locality_repo.delete(locality)
+        reference_data_changed()
         logger.info(
             f"Locality deleted successfully: {locality.name} (ID: {locality.id})"
         )
@@ -6,6 +6,7 @@ from sqlmodel import Session
 from app.db_models.address import State
 from app.repositories.address import StateRepository
 from app.schemas.address import StateCreate, StatePublic, StateUpdate
+from app.services.address.address_gazetteer import reference_data_changed
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +47,7 @@ class StateService:
             is_active=state_in.is_active,
         )
         created_state = self.state_repo.create(state)
+        reference_data_changed()
         logger.info(
             f"State created successfully: {created_state.name} (ID: {created_state.id})"
         )
@@ -67,6 +69,7 @@ class StateService:
 
         state.sqlmodel_update(update_data)
         updated_state = self.state_repo.update(state)
+        reference_data_changed()
         logger.info(
             f"State updated successfully: {updated_state.name} (ID: {updated_state.id})"
         )
@@ -93,4 +96,5 @@ class StateService:
         """Delete a state"""
         logger.warning(f"Deleting state: {state.name} (ID: {state.id})")
         self.state_repo.delete(state)
+        reference_data_changed()
         logger.info(f"State deleted successfully: {state.name} (ID: {state.id})")
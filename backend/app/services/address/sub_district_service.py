@@ -10,6 +10,7 @@ from app.schemas.address.sub_district import (
     SubDistrictPublic,
     SubDistrictUpdate,
 )
+from app.services.address.address_gazetteer import reference_data_changed
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +60,7 @@ class SubDistrictService:
             is_active=sub_district_in.is_active,
         )
         created_sub_district = self.sub_district_repo.create(sub_district)
+        reference_data_changed()
         logger.info(
             f"Sub-district created successfully: {created_sub_district.name} (ID: {created_sub_district.id})"
         )
@@ -86,6 +88,7 @@ class SubDistrictService:
 
         sub_district.sqlmodel_update(update_data)
         updated_sub_district = self.sub_district_repo.update(sub_district)
+        reference_data_changed()
         logger.info(
             f"Sub-district updated successfully: {updated_sub_district.name} (ID: {updated_sub_district.id})"
         )
@@ -124,6 +127,7 @@ class SubDistrictService:
             f"Deleting sub-district: {sub_district.name} (ID: {sub_district.id})"
         )
         self.sub_district_repo.delete(sub_district)
+        reference_data_changed()
         logger.info(
             f"Sub-district deleted successfully: {sub_district.name} (ID: {sub_district.id})"
         )
@@ -29,6 +29,10 @@ from app.schemas.attachment_request import (
     MyPendingRequestResponse,
 )
 from app.services.person.person_address_service import PersonAddressService
+from app.services.person.person_relationship_service import (
+    invalidate_relationship_state,
+    sync_relationship_caches,
+)
 from app.services.person.person_religion_service import PersonReligionService
 
 logger = logging.getLogger(__name__)
@@ -563,6 +567,7 @@ class AttachmentRequestService:
             # 3. Delete person_relationship records
             relationship_repo = PersonRelationshipRepository(self.session)
             relationships = relationship_repo.get_by_person_id(person_id)
+            related_person_ids = [rel.related_person_id for rel in relationships]
             for relationship in relationships:
                 self.session.delete(relationship)
             logger.debug(
@@ -600,7 +605,11 @@ class AttachmentRequestService:
                 self.session.delete(person)
                 logger.debug(f"Deleted person record {person_id}")
 
-            # Commit all deletions in a single transaction
+            # Commit all deletions in a single transaction. The deleted
+            # person's own suggestions are removed with it.
+            refresh_ids = invalidate_relationship_state(
+                self.session, related_person_ids
+            )
             self.session.commit()
             logger.info(f"Successfully deleted person {person_id} with all metadata")
 
@@ -614,3 +623,8 @@ class AttachmentRequestService:
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to delete person data",
             )
+
+        # Keep graph indexes and caches in sync with the removed relationships
+        sync_relationship_caches(
+            self.session, [person_id, *related_person_ids], refresh_ids
+        )
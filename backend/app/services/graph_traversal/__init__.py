@@ -0,0 +1,21 @@
+"""Graph Traversal service module."""
+
+from app.services.graph_traversal.adjacency_index import (
+    AdjacencyIndex,
+    build_adjacency_index,
+    get_adjacency_index,
+    refresh_adjacency_index,
+)
+from app.services.graph_traversal.graph_traversal_service import (
+    GraphTraversalService,
+    TraversalNode,
+)
+
+__all__ = [
+    "AdjacencyIndex",
+    "GraphTraversalService",
+    "TraversalNode",
+    "build_adjacency_index",
+    "get_adjacency_index",
+    "refresh_adjacency_index",
+]
@@ -0,0 +1,289 @@
+"""In-memory adjacency index of the family relationship graph."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import uuid
+from array import array
+from collections.abc import Iterable
+
+from sqlmodel import Session, col, select
+
+from app.core.config import settings
+from app.db_models.person.person_relationship import PersonRelationship
+
+logger = logging.getLogger(__name__)
+
+# Number of per-person overrides accumulated by incremental updates before
+# they are folded back into the compact CSR arrays
+COMPACT_THRESHOLD = 1024
+
+
+class AdjacencyIndex:
+    """
+    Compact snapshot of active person relationships.
+
+    Persons are interned to dense integer node ids and the graph is stored in
+    CSR form: the neighbours of node ``n`` are
+    ``targets[offsets[n]:offsets[n + 1]]``. Writes do not rebuild the arrays;
+    the affected persons' neighbour lists are re-read and kept as overrides
+    until enough of them accumulate to be compacted.
+
+    Rebuilds and refreshes hold a refresh lock from reading the rows until
+    they are applied, so a refresh can neither be overwritten by an older
+    one nor discarded by a rebuild that read the rows before it. Lookups only
+    take the short data lock and never wait for the database.
+
+    Each process holds its own snapshot. Writes made through this process
+    refresh it at once; writes made by other workers are only seen once
+    GRAPH_ADJACENCY_INDEX_TTL_SECONDS has elapsed and the index is rebuilt.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        # Guards the snapshot data; held only to read or swap it
+        self._lock = threading.RLock()
+        # Serializes rebuilds and refreshes, which hold it while reading rows
+        self._refresh_lock = threading.RLock()
+        self._node_ids: list[uuid.UUID] = []
+        self._node_index: dict[uuid.UUID, int] = {}
+        self._offsets: array[int] = array("q", [0])
+        self._targets: array[int] = array("q")
+        self._overrides: dict[int, array[int]] = {}
+        self._loaded_at = 0.0
+
+    @property
+    def node_count(self) -> int:
+        """Number of persons known to the index."""
+        return len(self._node_ids)
+
+    @property
+    def is_stale(self) -> bool:
+        """Whether the snapshot is older than the TTL and must be rebuilt."""
+        ttl = settings.GRAPH_ADJACENCY_INDEX_TTL_SECONDS
+        return ttl > 0 and time.monotonic() - self._loaded_at > ttl
+
+    def load(self, session: Session) -> None:
+        """
+        (Re)build the whole index from active relationships.
+
+        Args:
+            session: Database session
+        """
+        statement = (
+            select(PersonRelationship.person_id, PersonRelationship.related_person_id)
+            .where(PersonRelationship.is_active == True)  # noqa: E712
+            .order_by(col(PersonRelationship.person_id))
+        )
+        with self._refresh_lock:
+            rows = session.exec(statement).all()
+
+            with self._lock:
+                self._node_ids = []
+                self._node_index = {}
+                self._overrides = {}
+
+                adjacency: dict[int, array[int]] = {}
+                for person_id, related_id in rows:
+                    source = self._intern(person_id)
+                    target = self._intern(related_id)
+                    adjacency.setdefault(source, array("q")).append(target)
+
+                self._rebuild_csr(adjacency)
+                self._loaded_at = time.monotonic()
+
+        logger.info(
+            f"Adjacency index built: {self.node_count} persons, "
+            f"{len(rows)} relationships"
+        )
+
+    def ensure_fresh(self, session: Session) -> None:
+        """
+        Rebuild the snapshot if it is older than the TTL.
+
+        Args:
+            session: Database session used for the rebuild
+        """
+        if not self.is_stale:
+            return
+        with self._refresh_lock:
+            # Another thread may have rebuilt while we waited for the lock
+            if self.is_stale:
+                self.load(session)
+
+    def neighbors(self, person_id: uuid.UUID) -> list[uuid.UUID]:
+        """
+        Get the related_person_ids of a person's active relationships.
+
+        Args:
+            person_id: Person's ID
+
+        Returns:
+            List of related_person_ids (empty if the person is unknown)
+        """
+        with self._lock:
+            node = self._node_index.get(person_id)
+            if node is None:
+                return []
+            node_ids = self._node_ids
+            return [node_ids[target] for target in self._neighbor_nodes(node)]
+
+    def neighbors_batch(
+        self, person_ids: Iterable[uuid.UUID]
+    ) -> dict[uuid.UUID, list[uuid.UUID]]:
+        """
+        Get the related_person_ids for several persons at once.
+
+        Args:
+            person_ids: Persons' IDs
+
+        Returns:
+            Dictionary mapping person_id to its list of related_person_ids,
+            omitting persons without relationships
+        """
+        result: dict[uuid.UUID, list[uuid.UUID]] = {}
+        with self._lock:
+            node_ids = self._node_ids
+            for person_id in person_ids:
+                node = self._node_index.get(person_id)
+                if node is None:
+                    continue
+                targets = self._neighbor_nodes(node)
+                if targets:
+                    result[person_id] = [node_ids[target] for target in targets]
+        return result
+
+    def refresh_persons(
+        self, session: Session, person_ids: Iterable[uuid.UUID]
+    ) -> None:
+        """
+        Re-read the active relationships of the given persons.
+
+        Called after relationship writes so that only the touched rows of the
+        graph are reloaded.
+
+        Args:
+            session: Database session
+            person_ids: Persons whose relationships changed
+        """
+        ids = list(dict.fromkeys(person_ids))
+        if not ids:
+            return
+
+        statement = select(
+            PersonRelationship.person_id, PersonRelationship.related_person_id
+        ).where(
+            col(PersonRelationship.person_id).in_(ids),
+            PersonRelationship.is_active == True,  # noqa: E712
+        )
+        with self._refresh_lock:
+            rows = session.exec(statement).all()
+
+            with self._lock:
+                overrides = {self._intern(person_id): array("q") for person_id in ids}
+                for person_id, related_id in rows:
+                    overrides[self._node_index[person_id]].append(
+                        self._intern(related_id)
+                    )
+
+                self._overrides.update(overrides)
+                if len(self._overrides) >= COMPACT_THRESHOLD:
+                    self._compact()
+
+        logger.debug(f"Adjacency index refreshed for {len(ids)} persons")
+
+    def _intern(self, person_id: uuid.UUID) -> int:
+        """Get or assign the integer node id for a person."""
+        node = self._node_index.get(person_id)
+        if node is None:
+            node = len(self._node_ids)
+            self._node_ids.append(person_id)
+            self._node_index[person_id] = node
+        return node
+
+    def _neighbor_nodes(self, node: int) -> array[int]:
+        """Get the neighbour node ids of a node, honouring overrides."""
+        override = self._overrides.get(node)
+        if override is not None:
+            return override
+        if node + 1 >= len(self._offsets):
+            # Interned after the last compaction and never overridden
+            return array("q")
+        return self._targets[self._offsets[node] : self._offsets[node + 1]]
+
+    def _compact(self) -> None:
+        """Fold overrides back into the CSR arrays."""
+        adjacency = {
+            node: self._neighbor_nodes(node) for node in range(len(self._node_ids))
+        }
+        self._overrides = {}
+        self._rebuild_csr(adjacency)
+
+    def _rebuild_csr(self, adjacency: dict[int, array[int]]) -> None:
+        """Rebuild offsets and targets from a node -> neighbours mapping."""
+        offsets: array[int] = array("q", [0])
+        targets: array[int] = array("q")
+        for node in range(len(self._node_ids)):
+            targets.extend(adjacency.get(node, ()))
+            offsets.append(len(targets))
+        self._offsets = offsets
+        self._targets = targets
+
+
+# Global adjacency index instance (None until built)
+_adjacency_index: AdjacencyIndex | None = None
+
+
+def get_adjacency_index(session: Session) -> AdjacencyIndex | None:
+    """
+    Get the global adjacency index if it is enabled and built.
+
+    The index is rebuilt first if it is older than
+    GRAPH_ADJACENCY_INDEX_TTL_SECONDS.
+
+    Args:
+        session: Database session used if a rebuild is needed
+
+    Returns:
+        Global AdjacencyIndex instance, or None
+    """
+    if not settings.GRAPH_ADJACENCY_INDEX_ENABLED or _adjacency_index is None:
+        return None
+    _adjacency_index.ensure_fresh(session)
+    return _adjacency_index
+
+
+def build_adjacency_index(session: Session) -> AdjacencyIndex:
+    """
+    Build (or rebuild) the global adjacency index from the database.
+
+    Args:
+        session: Database session
+
+    Returns:
+        The freshly built global AdjacencyIndex
+    """
+    global _adjacency_index
+
+    # Reuse the existing instance so services holding it see the rebuild
+    if _adjacency_index is None:
+        _adjacency_index = AdjacencyIndex()
+    _adjacency_index.load(session)
+    return _adjacency_index
+
+
+def refresh_adjacency_index(session: Session, person_ids: Iterable[uuid.UUID]) -> None:
+    """
+    Refresh the global adjacency index for persons whose relationships changed.
+
+    No-op when the index is disabled or has not been built.
+
+    Args:
+        session: Database session
+        person_ids: Persons whose relationships changed
+    """
+    index = get_adjacency_index(session)
+    if index is not None:
+        index.refresh_persons(session, person_ids)
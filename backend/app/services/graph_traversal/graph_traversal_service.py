@@ -0,0 +1,214 @@
+"""Graph Traversal service for bounded-depth walks over person relationships."""
+
+import logging
+import uuid
+from dataclasses import dataclass
+
+from sqlalchemy import text
+from sqlmodel import Session, col, select
+
+from app.core.config import settings
+from app.db_models.person.person_relationship import PersonRelationship
+from app.services.graph_traversal.adjacency_index import get_adjacency_index
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of person IDs sent in a single IN (...) clause when
+# expanding a BFS frontier
+FRONTIER_CHUNK_SIZE = 1000
+
+# Bounded-depth walk over active relationships. The recursive part uses UNION
+# on (person_id, depth) so each person appears at most once per level, which
+# keeps the working set at O(persons * depth) even on cyclic graphs. The BFS
+# parent of each person is any neighbour sitting exactly one level closer.
+RECURSIVE_TRAVERSAL_SQL = text(
+    """
+    WITH RECURSIVE walk(person_id, depth) AS (
+        SELECT CAST(:start_id AS uuid), 0
+        UNION
+        SELECT r.related_person_id, w.depth + 1
+        FROM walk w
+        JOIN person_relationship r ON r.person_id = w.person_id
+        WHERE r.is_active AND w.depth < :max_depth
+    ),
+    shortest AS (
+        SELECT person_id, MIN(depth) AS depth
+        FROM walk
+        GROUP BY person_id
+    ),
+    nodes AS (
+        SELECT DISTINCT ON (s.person_id)
+            s.person_id, s.depth, p.person_id AS parent_id
+        FROM shortest s
+        LEFT JOIN person_relationship r
+            ON r.related_person_id = s.person_id AND r.is_active
+        LEFT JOIN shortest p
+            ON p.person_id = r.person_id AND p.depth = s.depth - 1
+        ORDER BY s.person_id, p.person_id NULLS LAST
+    )
+    SELECT person_id, depth, parent_id
+    FROM nodes
+    ORDER BY depth, person_id
+    """
+)
+
+
+@dataclass
+class TraversalNode:
+    """A person reached by a traversal, with its BFS depth and parent."""
+
+    person_id: uuid.UUID
+    depth: int
+    parent_id: uuid.UUID | None = None
+
+
+class GraphTraversalService:
+    """Service for bounded-depth traversal of the family relationship graph.
+
+    When the in-memory adjacency index is enabled the walk never touches the
+    database. Otherwise, on PostgreSQL the whole walk runs as a single
+    WITH RECURSIVE query. With GRAPH_TRAVERSAL_USE_RECURSIVE_CTE disabled, or
+    on any other database, it falls back to a level-synchronous BFS in Python
+    that expands each frontier with one batched query.
+    """
+
+    def __init__(self, session: Session):
+        """Initialize the graph traversal service.
+
+        Args:
+            session: Database session
+        """
+        self.session = session
+        self.use_recursive_cte = settings.GRAPH_TRAVERSAL_USE_RECURSIVE_CTE
+        self.adjacency_index = get_adjacency_index(session)
+
+    @property
+    def supports_recursive_cte(self) -> bool:
+        """Whether traversals can be pushed into the database."""
+        if not self.use_recursive_cte:
+            return False
+        return bool(self.session.get_bind().dialect.name == "postgresql")
+
+    def traverse(
+        self, start_id: uuid.UUID, max_depth: int
+    ) -> dict[uuid.UUID, TraversalNode]:
+        """Walk active relationships from a person up to max_depth hops.
+
+        Args:
+            start_id: Starting person ID
+            max_depth: Maximum traversal depth
+
+        Returns:
+            Dictionary mapping person_id to TraversalNode, ordered by depth.
+            The starting person is included at depth 0 with no parent.
+        """
+        if self.adjacency_index is None and self.supports_recursive_cte:
+            nodes = self._traverse_recursive_cte(start_id, max_depth)
+        else:
+            nodes = self._traverse_bfs(start_id, max_depth)
+
+        logger.debug(
+            f"Traversal from {start_id} complete: visited {len(nodes)} persons "
+            f"up to depth {max_depth}"
+        )
+
+        return nodes
+
+    def get_relationships_batch(
+        self, person_ids: list[uuid.UUID]
+    ) -> dict[uuid.UUID, list[uuid.UUID]]:
+        """Get all active relationships for a set of persons.
+
+        Served from the adjacency index when available, otherwise issues one
+        query per FRONTIER_CHUNK_SIZE person IDs.
+
+        Args:
+            person_ids: Persons' IDs
+
+        Returns:
+            Dictionary mapping person_id to its list of related_person_ids
+        """
+        if self.adjacency_index is not None:
+            return self.adjacency_index.neighbors_batch(person_ids)
+
+        relationships_map: dict[uuid.UUID, list[uuid.UUID]] = {}
+
+        for start in range(0, len(person_ids), FRONTIER_CHUNK_SIZE):
+            chunk = person_ids[start : start + FRONTIER_CHUNK_SIZE]
+            statement = select(
+                PersonRelationship.person_id, PersonRelationship.related_person_id
+            ).where(
+                col(PersonRelationship.person_id).in_(chunk),
+                PersonRelationship.is_active == True,  # noqa: E712
+            )
+            for owner_id, related_id in self.session.exec(statement).all():
+                relationships_map.setdefault(owner_id, []).append(related_id)
+
+        return relationships_map
+
+    def _traverse_recursive_cte(
+        self, start_id: uuid.UUID, max_depth: int
+    ) -> dict[uuid.UUID, TraversalNode]:
+        """Run the traversal as a single recursive query.
+
+        Args:
+            start_id: Starting person ID
+            max_depth: Maximum traversal depth
+
+        Returns:
+            Dictionary mapping person_id to TraversalNode, ordered by depth
+        """
+        rows = self.session.execute(
+            RECURSIVE_TRAVERSAL_SQL,
+            {"start_id": start_id, "max_depth": max_depth},
+        ).all()
+
+        return {
+            person_id: TraversalNode(
+                person_id=person_id, depth=depth, parent_id=parent_id
+            )
+            for person_id, depth, parent_id in rows
+        }
+
+    def _traverse_bfs(
+        self, start_id: uuid.UUID, max_depth: int
+    ) -> dict[uuid.UUID, TraversalNode]:
+        """Run the traversal as a level-synchronous BFS in Python.
+
+        The whole frontier of each depth level is expanded with a single
+        batched relationship query, so the number of round trips grows with
+        the depth rather than the number of visited persons.
+
+        Args:
+            start_id: Starting person ID
+            max_depth: Maximum traversal depth
+
+        Returns:
+            Dictionary mapping person_id to TraversalNode in BFS visit order
+        """
+        visited: dict[uuid.UUID, TraversalNode] = {
+            start_id: TraversalNode(person_id=start_id, depth=0)
+        }
+        frontier: list[uuid.UUID] = [start_id]
+        current_depth = 0
+
+        while frontier and current_depth < max_depth:
+            current_depth += 1
+            relationships_map = self.get_relationships_batch(frontier)
+            next_frontier: list[uuid.UUID] = []
+
+            # Walk the frontier in order so the visit order matches a
+            # node-by-node BFS
+            for current_id in frontier:
+                for related_id in relationships_map.get(current_id, []):
+                    if related_id not in visited:
+                        visited[related_id] = TraversalNode(
+                            person_id=related_id,
+                            depth=current_depth,
+                            parent_id=current_id,
+                        )
+                        next_frontier.append(related_id)
+
+            frontier = next_frontier
+
+        return visited
@@ -1,5 +1,15 @@
 """Lineage Path service module."""
 
+from app.services.lineage_path.lineage_path_cache import (
+    LineagePathCache,
+    get_lineage_path_cache,
+    invalidate_lineage_path_cache,
+)
 from app.services.lineage_path.lineage_path_service import LineagePathService
 
-__all__ = ["LineagePathService"]
+__all__ = [
+    "LineagePathCache",
+    "LineagePathService",
+    "get_lineage_path_cache",
+    "invalidate_lineage_path_cache",
+]
@@ -0,0 +1,225 @@
+"""In-process cache of lineage path results."""
+
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from app.core.config import settings
+from app.schemas.lineage_path import LineagePathResponse
+
+logger = logging.getLogger(__name__)
+
+PairKey = frozenset[uuid.UUID]
+
+
+@dataclass
+class LineagePathCacheEntry:
+    """A cached lineage path result."""
+
+    person_a_id: uuid.UUID
+    response: LineagePathResponse
+    person_ids: frozenset[uuid.UUID]
+    expires_at: float
+
+
+class LineagePathCache:
+    """
+    LRU cache of lineage path responses keyed on the unordered person pair.
+
+    Each entry records the persons the search visited. A relationship write
+    can only change a result if it touches one of those persons, so writes
+    drop just the entries tagged with the changed persons.
+
+    The cache also keeps a graph version that is bumped on every
+    invalidation. Results computed against an older version are not stored,
+    which prevents a slow lookup from caching a path made stale by a write
+    that happened while it was running.
+
+    Each process holds its own cache and only sees the relationship writes it
+    makes itself. Writes made by other workers are picked up once the
+    affected entries expire, so LINEAGE_PATH_CACHE_TTL_SECONDS bounds how
+    long a stale path may be served.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: int) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of cached pairs
+            ttl_seconds: Time-to-live of an entry in seconds
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.version = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[PairKey, LineagePathCacheEntry] = OrderedDict()
+        self._keys_by_person: dict[uuid.UUID, set[PairKey]] = {}
+
+    def __len__(self) -> int:
+        """Number of cached pairs."""
+        return len(self._entries)
+
+    def get(
+        self, person_a_id: uuid.UUID, person_b_id: uuid.UUID
+    ) -> LineagePathResponse | None:
+        """
+        Get the cached result for a pair in the requested direction.
+
+        Args:
+            person_a_id: First person's ID
+            person_b_id: Second person's ID
+
+        Returns:
+            Cached LineagePathResponse, or None on a miss
+        """
+        key = frozenset((person_a_id, person_b_id))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() >= entry.expires_at:
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+
+        if entry.person_a_id == person_a_id:
+            return entry.response
+        return reverse_lineage_path(entry.response)
+
+    def set(
+        self,
+        person_a_id: uuid.UUID,
+        person_b_id: uuid.UUID,
+        response: LineagePathResponse,
+        person_ids: Iterable[uuid.UUID],
+        version: int,
+    ) -> None:
+        """
+        Store a result computed against the given graph version.
+
+        Args:
+            person_a_id: First person's ID
+            person_b_id: Second person's ID
+            response: Lineage path response for person A to person B
+            person_ids: Persons visited while computing the response
+            version: Cache version read before the computation started
+        """
+        if self.max_entries <= 0:
+            return
+
+        key = frozenset((person_a_id, person_b_id))
+        entry = LineagePathCacheEntry(
+            person_a_id=person_a_id,
+            response=response,
+            person_ids=frozenset(person_ids) | key,
+            expires_at=time.monotonic() + self.ttl_seconds,
+        )
+
+        with self._lock:
+            if version != self.version:
+                logger.debug("Lineage path result computed on an old graph, not cached")
+                return
+
+            self._remove(key)
+            self._entries[key] = entry
+            for person_id in entry.person_ids:
+                self._keys_by_person.setdefault(person_id, set()).add(key)
+
+            while len(self._entries) > self.max_entries:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+
+    def invalidate_persons(self, person_ids: Iterable[uuid.UUID]) -> int:
+        """
+        Drop all entries whose search visited any of the given persons.
+
+        Args:
+            person_ids: Persons whose relationships changed
+
+        Returns:
+            Number of entries dropped
+        """
+        with self._lock:
+            self.version += 1
+            keys: set[PairKey] = set()
+            for person_id in person_ids:
+                keys |= self._keys_by_person.get(person_id, set())
+            for key in keys:
+                self._remove(key)
+
+        if keys:
+            logger.debug(f"Invalidated {len(keys)} cached lineage paths")
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self.version += 1
+            self._entries.clear()
+            self._keys_by_person.clear()
+
+    def _remove(self, key: PairKey) -> None:
+        """Remove an entry and its person index references."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for person_id in entry.person_ids:
+            keys = self._keys_by_person.get(person_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_person[person_id]
+
+
+def reverse_lineage_path(response: LineagePathResponse) -> LineagePathResponse:
+    """
+    Turn a person A to person B response into the person B to person A one.
+
+    Relationship labels are stored from each node's own perspective, so
+    reversing the path only swaps every node's from_person and to_person.
+
+    Args:
+        response: Lineage path response to reverse
+
+    Returns:
+        New response with the graph in the opposite direction
+    """
+    graph = {
+        person_id: node.model_copy(
+            update={"from_person": node.to_person, "to_person": node.from_person}
+        )
+        for person_id, node in reversed(response.graph.items())
+    }
+    return response.model_copy(update={"graph": graph})
+
+
+# Global lineage path cache instance
+_lineage_path_cache = LineagePathCache(
+    max_entries=settings.LINEAGE_PATH_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.LINEAGE_PATH_CACHE_TTL_SECONDS,
+)
+
+
+def get_lineage_path_cache() -> LineagePathCache:
+    """
+    Get the global lineage path cache instance.
+
+    Returns:
+        Global LineagePathCache instance
+    """
+    return _lineage_path_cache
+
+
+def invalidate_lineage_path_cache(person_ids: Iterable[uuid.UUID]) -> None:
+    """
+    Invalidate cached lineage paths after relationship writes.
+
+    Args:
+        person_ids: Persons whose relationships changed
+    """
+    _lineage_path_cache.invalidate_persons(person_ids)
@@ -2,29 +2,21 @@
 
 import logging
 import uuid
-from collections import deque
 
 from fastapi import HTTPException
 from sqlmodel import Session, select
 
 from app.core.config import settings
-from app.db_models.address.country import Country
-from app.db_models.address.district import District
-from app.db_models.address.locality import Locality
-from app.db_models.address.state import State
-from app.db_models.address.sub_district import SubDistrict
 from app.db_models.person.person import Person
-from app.db_models.person.person_address import PersonAddress
 from app.db_models.person.person_relationship import PersonRelationship
-from app.db_models.person.person_religion import PersonReligion
-from app.db_models.religion.religion import Religion
-from app.db_models.religion.religion_category import ReligionCategory
-from app.db_models.religion.religion_sub_category import ReligionSubCategory
 from app.schemas.lineage_path import (
     ConnectionInfo,
     LineagePathResponse,
     PersonNode,
 )
+from app.services.graph_traversal import GraphTraversalService
+from app.services.lineage_path.lineage_path_cache import get_lineage_path_cache
+from app.services.person.person_enrichment_service import PersonEnrichmentService
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +24,8 @@ logger = logging.getLogger(__name__)
 class LineagePathService:
     """Service for finding lineage paths between two persons in a family tree.
 
-    Uses Bidirectional BFS to find the shortest path through family relationships.
+    Uses a meet-in-the-middle bidirectional BFS to find the shortest path through
+    family relationships.
     """
 
     def __init__(self, session: Session):
@@ -43,6 +36,11 @@ class LineagePathService:
         """
         self.session = session
         self.max_depth = settings.LINEAGE_PATH_MAX_DEPTH
+        self.graph_traversal = GraphTraversalService(session)
+        self.person_enrichment = PersonEnrichmentService(session)
+        # Persons expanded by the last bidirectional search
+        self.explored_node_count = 0
+        self.path_cache = get_lineage_path_cache()
 
     def find_path(
         self, person_a_id: uuid.UUID, person_b_id: uuid.UUID
@@ -63,6 +61,13 @@ class LineagePathService:
             f"Finding lineage path between person_a={person_a_id} and person_b={person_b_id}"
         )
 
+        # Serve repeated lookups of the same pair from the cache
+        cached_response = self.path_cache.get(person_a_id, person_b_id)
+        if cached_response is not None:
+            logger.info(f"Lineage path cache hit for {person_a_id}, {person_b_id}")
+            return cached_response
+        cache_version = self.path_cache.version
+
         # Validate both persons exist
         person_a = self._get_person(person_a_id)
         if not person_a:
@@ -78,17 +83,25 @@ class LineagePathService:
         if person_a_id == person_b_id:
             logger.info(f"Same person provided: {person_a_id}")
             person_node = self._enrich_person_data(person_a_id)
-            return LineagePathResponse(
+            response = LineagePathResponse(
                 connection_found=True,
                 message="Same person provided for both inputs",
                 common_ancestor_id=person_a_id,
                 graph={person_a_id: person_node},
             )
+            self.path_cache.set(
+                person_a_id, person_b_id, response, [person_a_id], cache_version
+            )
+            return response
 
         # Run BFS to find common ancestor
         common_person_id, visited_map_a_to_common, visited_map_b_to_common = (
             self._bfs_find_common_ancestor(person_a_id, person_b_id)
         )
+        # Any relationship change on a visited person may change the result
+        visited_person_ids = (
+            visited_map_a_to_common.keys() | visited_map_b_to_common.keys()
+        )
 
         if common_person_id is None:
             # No connection found
@@ -97,16 +110,17 @@ class LineagePathService:
                 f"within {self.max_depth} levels"
             )
             # Build graph with just the two persons (no connections)
-            graph = {
-                person_a_id: self._enrich_person_data(person_a_id),
-                person_b_id: self._enrich_person_data(person_b_id),
-            }
-            return LineagePathResponse(
+            graph = self._enrich_persons([person_a_id, person_b_id])
+            response = LineagePathResponse(
                 connection_found=False,
                 message=f"No relation found up to {self.max_depth}th connection",
                 common_ancestor_id=None,
                 graph=graph,
             )
+            self.path_cache.set(
+                person_a_id, person_b_id, response, visited_person_ids, cache_version
+            )
+            return response
 
         # Build the ordered path from person A to person B
         ordered_path = self._build_final_ordered_list(
@@ -120,12 +134,16 @@ class LineagePathService:
         # Build the bidirectional linked list graph
         graph = self._build_bidirectional_linked_list(ordered_path)
 
-        return LineagePathResponse(
+        response = LineagePathResponse(
             connection_found=True,
             message="Connection found",
             common_ancestor_id=common_person_id,
             graph=graph,
         )
+        self.path_cache.set(
+            person_a_id, person_b_id, response, visited_person_ids, cache_version
+        )
+        return response
 
     def _build_final_ordered_list(
         self,
@@ -187,10 +205,8 @@ class LineagePathService:
         if not ordered_person_ids:
             return {}
 
-        # First, enrich all person data
-        enriched_nodes: dict[uuid.UUID, PersonNode] = {}
-        for person_id in ordered_person_ids:
-            enriched_nodes[person_id] = self._enrich_person_data(person_id)
+        # First, enrich all person data in one batch
+        enriched_nodes = self._enrich_persons(ordered_person_ids)
 
         # If only one person, return as-is (no connections to set)
         if len(ordered_person_ids) == 1:
@@ -261,23 +277,6 @@ class LineagePathService:
         statement = select(Person).where(Person.id == person_id)
         return self.session.exec(statement).first()
 
-    def _get_relationships(self, person_id: uuid.UUID) -> list[uuid.UUID]:
-        """Get all active relationships for a person.
-
-        Args:
-            person_id: Person's ID
-
-        Returns:
-            List of related_person_id
-        """
-        statement = select(PersonRelationship).where(
-            PersonRelationship.person_id == person_id,
-            PersonRelationship.is_active == True,  # noqa: E712
-        )
-        relationships = self.session.exec(statement).all()
-
-        return [rel.related_person_id for rel in relationships]
-
     def _bfs_find_common_ancestor(
         self, person_a_id: uuid.UUID, person_b_id: uuid.UUID
     ) -> tuple[
@@ -285,7 +284,17 @@ class LineagePathService:
         dict[uuid.UUID, uuid.UUID | None],
         dict[uuid.UUID, uuid.UUID | None],
     ]:
-        """Find common ancestor using bidirectional BFS.
+        """Find common ancestor using meet-in-the-middle bidirectional BFS.
+
+        Each step expands one whole level of the side with the smaller
+        frontier (the shallower side on ties), fetching the neighbours of that
+        level in one batch. Each side walks at most max_depth levels. The
+        search stops after the first level in which the two sides meet; the
+        meeting point closest to the other side is chosen so the returned path
+        is a shortest one.
+
+        The number of persons whose relationships were fetched is stored in
+        ``explored_node_count``.
 
         Args:
             person_a_id: First person's ID
@@ -299,216 +308,156 @@ class LineagePathService:
         # visited_a[person_id] = parent_person_id (or None for start)
         visited_a: dict[uuid.UUID, uuid.UUID | None] = {person_a_id: None}
         visited_b: dict[uuid.UUID, uuid.UUID | None] = {person_b_id: None}
+        depths_a: dict[uuid.UUID, int] = {person_a_id: 0}
+        depths_b: dict[uuid.UUID, int] = {person_b_id: 0}
+
+        frontier_a: list[uuid.UUID] = [person_a_id]
+        frontier_b: list[uuid.UUID] = [person_b_id]
+        depth_a = 0
+        depth_b = 0
+        self.explored_node_count = 0
+
+        common_person_id: uuid.UUID | None = None
+
+        # An exhausted side means the two persons are not connected
+        while frontier_a and frontier_b:
+            can_expand_a = depth_a < self.max_depth
+            can_expand_b = depth_b < self.max_depth
+            if not (can_expand_a or can_expand_b):
+                break
+
+            # Smaller frontier first; on ties the shallower side, then A
+            if can_expand_a and (
+                not can_expand_b
+                or (len(frontier_a), depth_a) <= (len(frontier_b), depth_b)
+            ):
+                self.explored_node_count += len(frontier_a)
+                frontier_a, common_person_id = self._expand_level(
+                    frontier_a, depth_a, visited_a, depths_a, depths_b
+                )
+                depth_a += 1
+            else:
+                self.explored_node_count += len(frontier_b)
+                frontier_b, common_person_id = self._expand_level(
+                    frontier_b, depth_b, visited_b, depths_b, depths_a
+                )
+                depth_b += 1
 
-        # BFS queues
-        queue_a: deque[uuid.UUID] = deque([person_a_id])
-        queue_b: deque[uuid.UUID] = deque([person_b_id])
-
-        depth = 0
-
-        while depth < self.max_depth and (queue_a or queue_b):
-            # Expand from A
-            if queue_a:
-                next_queue_a: deque[uuid.UUID] = deque()
-                while queue_a:
-                    current = queue_a.popleft()
-                    relationships = self._get_relationships(current)
-
-                    for related_id in relationships:
-                        # Check if we found a connection
-                        if related_id in visited_b:
-                            # Found common point
-                            visited_a[related_id] = current
-                            return (related_id, visited_a, visited_b)
-
-                        if related_id not in visited_a:
-                            visited_a[related_id] = current
-                            next_queue_a.append(related_id)
-
-                queue_a = next_queue_a
-
-            # Expand from B
-            if queue_b:
-                next_queue_b: deque[uuid.UUID] = deque()
-                while queue_b:
-                    current = queue_b.popleft()
-                    relationships = self._get_relationships(current)
-
-                    for related_id in relationships:
-                        # Check if we found a connection
-                        if related_id in visited_a:
-                            visited_b[related_id] = current
-                            return (related_id, visited_a, visited_b)
-
-                        if related_id not in visited_b:
-                            visited_b[related_id] = current
-                            next_queue_b.append(related_id)
-
-                queue_b = next_queue_b
-
-            depth += 1
             logger.debug(
-                f"BFS depth {depth}: visited_a={len(visited_a)}, visited_b={len(visited_b)}"
+                f"BFS depth_a={depth_a}, depth_b={depth_b}: "
+                f"visited_a={len(visited_a)}, visited_b={len(visited_b)}"
             )
 
-        return (None, visited_a, visited_b)
+            if common_person_id is not None:
+                break
 
-    def _enrich_person_data(self, person_id: uuid.UUID) -> PersonNode:
-        """Fetch and format person details including address and religion.
+        logger.info(
+            f"Bidirectional BFS explored {self.explored_node_count} persons, "
+            f"common point={common_person_id}"
+        )
+        return (common_person_id, visited_a, visited_b)
+
+    def _expand_level(
+        self,
+        frontier: list[uuid.UUID],
+        depth: int,
+        visited: dict[uuid.UUID, uuid.UUID | None],
+        depths: dict[uuid.UUID, int],
+        other_depths: dict[uuid.UUID, int],
+    ) -> tuple[list[uuid.UUID], uuid.UUID | None]:
+        """Expand one BFS level of one side of the bidirectional search.
 
         Args:
-            person_id: Person's ID
+            frontier: Persons at the current level of this side
+            depth: Depth of the current level
+            visited: This side's person_id -> parent_id map (updated in place)
+            depths: This side's person_id -> depth map (updated in place)
+            other_depths: The other side's person_id -> depth map
 
         Returns:
-            PersonNode with enriched data (from_person and to_person are set separately)
+            Tuple of (next_frontier, meeting_person_id). meeting_person_id is
+            the reached person closest to the other side's start, or None.
         """
-        person = self._get_person(person_id)
-        if not person:
-            # Return minimal node if person not found (shouldn't happen)
-            return PersonNode(
-                person_id=person_id,
-                first_name="Unknown",
-                last_name="Unknown",
-                birth_year=None,
-                death_year=None,
-                address="",
-                religion="",
-                from_person=None,
-                to_person=None,
-                profile_image_key=None,
-            )
-
-        # Extract birth and death years
-        birth_year = person.date_of_birth.year if person.date_of_birth else None
-        death_year = person.date_of_death.year if person.date_of_death else None
-
-        # Get address string
-        address = self._get_address_string(person_id)
-
-        # Get religion string
-        religion = self._get_religion_string(person_id)
-
-        return PersonNode(
-            person_id=person_id,
-            first_name=person.first_name,
-            last_name=person.last_name,
-            birth_year=birth_year,
-            death_year=death_year,
-            address=address,
-            religion=religion,
-            from_person=None,
-            to_person=None,
-            profile_image_key=person.profile_image_key,
-        )
+        relationships = self.graph_traversal.get_relationships_batch(frontier)
+
+        next_frontier: list[uuid.UUID] = []
+        meeting_id: uuid.UUID | None = None
+        meeting_parent: uuid.UUID | None = None
+
+        for current in frontier:
+            for related_id in relationships.get(current, []):
+                # Check if we found a connection
+                if related_id in other_depths:
+                    if (
+                        meeting_id is None
+                        or other_depths[related_id] < other_depths[meeting_id]
+                    ):
+                        meeting_id = related_id
+                        meeting_parent = current
+                    continue
+
+                if related_id not in visited:
+                    visited[related_id] = current
+                    depths[related_id] = depth + 1
+                    next_frontier.append(related_id)
+
+        if meeting_id is not None:
+            visited[meeting_id] = meeting_parent
+
+        return next_frontier, meeting_id
 
-    def _get_address_string(self, person_id: uuid.UUID) -> str:
-        """Get comma-separated address string for a person.
+    def _enrich_person_data(self, person_id: uuid.UUID) -> PersonNode:
+        """Fetch and format person details including address and religion.
 
         Args:
             person_id: Person's ID
 
         Returns:
-            Comma-separated address string or empty string if not available
+            PersonNode with enriched data (from_person and to_person are set separately)
         """
-        # Get current address
-        statement = select(PersonAddress).where(
-            PersonAddress.person_id == person_id,
-            PersonAddress.is_current == True,  # noqa: E712
-        )
-        person_address = self.session.exec(statement).first()
-
-        if not person_address:
-            return ""
-
-        parts: list[str] = []
-
-        # Get locality name
-        if person_address.locality_id:
-            locality = self.session.exec(
-                select(Locality).where(Locality.id == person_address.locality_id)
-            ).first()
-            if locality:
-                parts.append(locality.name)
-
-        # Get sub-district name
-        if person_address.sub_district_id:
-            sub_district = self.session.exec(
-                select(SubDistrict).where(
-                    SubDistrict.id == person_address.sub_district_id
-                )
-            ).first()
-            if sub_district:
-                parts.append(sub_district.name)
-
-        # Get district name
-        if person_address.district_id:
-            district = self.session.exec(
-                select(District).where(District.id == person_address.district_id)
-            ).first()
-            if district:
-                parts.append(district.name)
-
-        # Get state name
-        if person_address.state_id:
-            state = self.session.exec(
-                select(State).where(State.id == person_address.state_id)
-            ).first()
-            if state:
-                parts.append(state.name)
-
-        # Get country name
-        if person_address.country_id:
-            country = self.session.exec(
-                select(Country).where(Country.id == person_address.country_id)
-            ).first()
-            if country:
-                parts.append(country.name)
-
-        return ", ".join(parts)
-
-    def _get_religion_string(self, person_id: uuid.UUID) -> str:
-        """Get comma-separated religion string for a person.
+        return self._enrich_persons([person_id])[person_id]
+
+    def _enrich_persons(
+        self, person_ids: list[uuid.UUID]
+    ) -> dict[uuid.UUID, PersonNode]:
+        """Fetch and format details of several persons with batched queries.
 
         Args:
-            person_id: Person's ID
+            person_ids: Persons' IDs
 
         Returns:
-            Comma-separated religion string or empty string if not available
+            Dictionary mapping person_id -> PersonNode (connections unset)
         """
-        statement = select(PersonReligion).where(PersonReligion.person_id == person_id)
-        person_religion = self.session.exec(statement).first()
-
-        if not person_religion:
-            return ""
-
-        parts: list[str] = []
-
-        # Get religion name
-        if person_religion.religion_id:
-            religion = self.session.exec(
-                select(Religion).where(Religion.id == person_religion.religion_id)
-            ).first()
-            if religion:
-                parts.append(religion.name)
-
-        # Get category name
-        if person_religion.religion_category_id:
-            category = self.session.exec(
-                select(ReligionCategory).where(
-                    ReligionCategory.id == person_religion.religion_category_id
+        records = self.person_enrichment.get_display_records(person_ids)
+        nodes: dict[uuid.UUID, PersonNode] = {}
+        for person_id in person_ids:
+            record = records.get(person_id)
+            if not record:
+                # Return minimal node if person not found (shouldn't happen)
+                nodes[person_id] = PersonNode(
+                    person_id=person_id,
+                    first_name="Unknown",
+                    last_name="Unknown",
+                    birth_year=None,
+                    death_year=None,
+                    address="",
+                    religion="",
+                    from_person=None,
+                    to_person=None,
+                    profile_image_key=None,
                 )
-            ).first()
-            if category:
-                parts.append(category.name)
-
-        # Get sub-category name
-        if person_religion.religion_sub_category_id:
-            sub_category = self.session.exec(
-                select(ReligionSubCategory).where(
-                    ReligionSubCategory.id == person_religion.religion_sub_category_id
-                )
-            ).first()
-            if sub_category:
-                parts.append(sub_category.name)
+                continue
 
-        return ", ".join(parts)
+            nodes[person_id] = PersonNode(
+                person_id=person_id,
+                first_name=record.first_name,
+                last_name=record.last_name,
+                birth_year=record.birth_year,
+                death_year=record.death_year,
+                address=record.address,
+                religion=record.religion,
+                from_person=None,
+                to_person=None,
+                profile_image_key=record.profile_image_key,
+            )
+        return nodes
@@ -2,25 +2,17 @@
 
 import logging
 import uuid
-from collections import deque
 from dataclasses import dataclass
+from datetime import date
 
 from fastapi import HTTPException
 from sqlmodel import Session, col, select
+from sqlmodel.sql.expression import Select
 
 from app.core.config import settings
-from app.db_models.address.country import Country
-from app.db_models.address.district import District
-from app.db_models.address.locality import Locality
-from app.db_models.address.state import State
-from app.db_models.address.sub_district import SubDistrict
 from app.db_models.person.person import Person
-from app.db_models.person.person_address import PersonAddress
 from app.db_models.person.person_relationship import PersonRelationship
 from app.db_models.person.person_religion import PersonReligion
-from app.db_models.religion.religion import Religion
-from app.db_models.religion.religion_category import ReligionCategory
-from app.db_models.religion.religion_sub_category import ReligionSubCategory
 from app.enums.gender import get_gender_by_code, get_gender_by_id
 from app.enums.marital_status import MaritalStatus
 from app.enums.relationship_type import RelationshipType
@@ -30,9 +22,15 @@ from app.schemas.partner_match import (
     PartnerMatchRequest,
     PartnerMatchResponse,
 )
+from app.services.graph_traversal import GraphTraversalService
+from app.services.person.person_enrichment_service import PersonEnrichmentService
+from app.services.religion.religion_taxonomy import get_religion_taxonomy
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of candidates screened with a single IN (...) list
+ELIGIBILITY_CHUNK_SIZE = 1000
+
 
 @dataclass
 class PersonReligionIds:
@@ -84,6 +82,8 @@ class PartnerMatchService:
         self.session = session
         self.default_depth = settings.PARTNER_MATCH_DEFAULT_DEPTH
         self.max_allowed_depth = settings.PARTNER_MATCH_MAX_DEPTH
+        self.graph_traversal = GraphTraversalService(session)
+        self.person_enrichment = PersonEnrichmentService(session)
 
     def find_matches(self, request: PartnerMatchRequest) -> PartnerMatchResponse:
         """Find potential partner matches for a seeker.
@@ -179,39 +179,32 @@ class PartnerMatchService:
             - depth_map: {person_id: depth} distance from seeker
             - matches: list of eligible match person_ids
         """
-        parent_map: dict[uuid.UUID, uuid.UUID | None] = {seeker_id: None}
-        depth_map: dict[uuid.UUID, int] = {seeker_id: 0}
-        matches: list[uuid.UUID] = []
+        parent_map: dict[uuid.UUID, uuid.UUID | None] = {}
+        depth_map: dict[uuid.UUID, int] = {}
 
         # Get seeker's close family members to exclude from matches
         close_family_ids = self._get_close_family_ids(seeker_id)
 
-        queue: deque[uuid.UUID] = deque([seeker_id])
-        current_depth = 0
-
-        while queue and current_depth < max_depth:
-            level_size = len(queue)
-            current_depth += 1
-
-            for _ in range(level_size):
-                current_id = queue.popleft()
-                relationships = self._get_relationships(current_id)
-
-                for related_id in relationships:
-                    if related_id in parent_map:
-                        continue  # Already visited
-
-                    parent_map[related_id] = current_id
-                    depth_map[related_id] = current_depth
-                    queue.append(related_id)
-
-                    # Check if eligible match (skip seeker and close family)
-                    if (
-                        related_id != seeker_id
-                        and related_id not in close_family_ids
-                        and self._is_eligible_match(related_id, request)
-                    ):
-                        matches.append(related_id)
+        # Nodes come back in BFS order (by depth), so matches keep the
+        # order in which they were reached
+        nodes = self.graph_traversal.traverse(seeker_id, max_depth)
+
+        for related_id, node in nodes.items():
+            parent_map[related_id] = node.parent_id
+            depth_map[related_id] = node.depth
+
+        # Screen all candidates in bulk (skip seeker and close family)
+        candidate_ids = [
+            related_id
+            for related_id in nodes
+            if related_id != seeker_id and related_id not in close_family_ids
+        ]
+        eligible_ids = self._filter_eligible_matches(candidate_ids, request)
+        matches = [
+            candidate_id
+            for candidate_id in candidate_ids
+            if candidate_id in eligible_ids
+        ]
 
         return parent_map, depth_map, matches
 
@@ -276,58 +269,154 @@ class PartnerMatchService:
 
         return close_family
 
-    def _is_eligible_match(
-        self, person_id: uuid.UUID, request: PartnerMatchRequest
-    ) -> bool:
-        """Check if a person passes all eligibility filters.
+    def _filter_eligible_matches(
+        self, person_ids: list[uuid.UUID], request: PartnerMatchRequest
+    ) -> set[uuid.UUID]:
+        """Get the persons that pass all eligibility filters.
+
+        Screens candidates in chunks with at most two queries per chunk: one
+        for person and religion attributes, and one relationship lookup for the
+        survivors whose marital status is UNKNOWN.
 
         Args:
-            person_id: Person to check
+            person_ids: Persons to check
             request: Partner match request with filters
 
         Returns:
-            True if person is an eligible match
+            Set of eligible person IDs
         """
-        person = self._get_person(person_id)
-        if not person:
-            return False
-
-        # 1. Gender check
-        if not self._matches_gender(person, request.target_gender_code):
-            return False
-
-        # 2. Living check - must not have date_of_death
-        if person.date_of_death is not None:
-            return False
+        narrowed_request = self._narrow_religion_filters(request)
+        if narrowed_request is None:
+            logger.debug("Religion inclusion filters exclude every candidate")
+            return set()
+        request = narrowed_request
+
+        eligible: set[uuid.UUID] = set()
+        for start in range(0, len(person_ids), ELIGIBILITY_CHUNK_SIZE):
+            chunk = person_ids[start : start + ELIGIBILITY_CHUNK_SIZE]
+            eligible |= self._filter_eligible_chunk(chunk, request)
+
+        logger.debug(f"{len(eligible)} of {len(person_ids)} candidates are eligible")
+        return eligible
+
+    def _filter_eligible_chunk(
+        self, person_ids: list[uuid.UUID], request: PartnerMatchRequest
+    ) -> set[uuid.UUID]:
+        """Apply the eligibility filters to one chunk of candidates."""
+        # sqlmodel's select() is only typed for up to four columns
+        statement: Select[
+            tuple[
+                uuid.UUID,
+                uuid.UUID,
+                date,
+                date | None,
+                MaritalStatus,
+                uuid.UUID | None,
+                uuid.UUID | None,
+                uuid.UUID | None,
+            ]
+        ] = (
+            Select(
+                col(Person.id),
+                col(Person.gender_id),
+                col(Person.date_of_birth),
+                col(Person.date_of_death),
+                col(Person.marital_status),
+                col(PersonReligion.religion_id),
+                col(PersonReligion.religion_category_id),
+                col(PersonReligion.religion_sub_category_id),
+            )
+            .outerjoin(PersonReligion, col(PersonReligion.person_id) == Person.id)
+            .where(col(Person.id).in_(person_ids))
+        )
 
-        # 3. Age/birth year check
-        birth_year = person.date_of_birth.year if person.date_of_birth else None
-        if not self._in_birth_year_range(
-            birth_year, request.birth_year_min, request.birth_year_max
-        ):
-            return False
+        # Inclusion filters are also applied in the query so that candidates
+        # failing them are not fetched; the row checks below still run
+        if request.include_religion_ids:
+            statement = statement.where(
+                col(PersonReligion.religion_id).in_(request.include_religion_ids)
+            )
+        if request.include_category_ids:
+            statement = statement.where(
+                col(PersonReligion.religion_category_id).in_(
+                    request.include_category_ids
+                )
+            )
+        if request.include_sub_category_ids:
+            statement = statement.where(
+                col(PersonReligion.religion_sub_category_id).in_(
+                    request.include_sub_category_ids
+                )
+            )
 
-        # 4-7. Religion filters (inclusion and exclusion)
-        if not self._passes_religion_filters(person_id, request):
-            return False
+        eligible: set[uuid.UUID] = set()
+        unknown_status_ids: set[uuid.UUID] = set()
+
+        for row in self.session.exec(statement).all():
+            (
+                person_id,
+                gender_id,
+                date_of_birth,
+                date_of_death,
+                marital_status,
+                religion_id,
+                category_id,
+                sub_category_id,
+            ) = row
+
+            # 1. Gender check
+            if not self._matches_gender(gender_id, request.target_gender_code):
+                continue
+
+            # 2. Living check - must not have date_of_death
+            if date_of_death is not None:
+                continue
+
+            # 3. Age/birth year check
+            birth_year = date_of_birth.year if date_of_birth else None
+            if not self._in_birth_year_range(
+                birth_year, request.birth_year_min, request.birth_year_max
+            ):
+                continue
 
-        # 8. Marital status check - use marital_status field with relationship fallback
-        if self._is_ineligible_marital_status(person):
-            return False
+            # 4-7. Religion filters (inclusion and exclusion)
+            religion_ids = PersonReligionIds(
+                religion_id=religion_id,
+                category_id=category_id,
+                sub_category_id=sub_category_id,
+            )
+            if not self._passes_religion_filters(religion_ids, request):
+                continue
+
+            # 8. Marital status check, deferred for the relationship fallback
+            if marital_status == MaritalStatus.UNKNOWN:
+                unknown_status_ids.add(person_id)
+            elif not self._is_ineligible_marital_status(marital_status, False):
+                eligible.add(person_id)
+
+        if unknown_status_ids:
+            with_spouse_or_children = self._get_persons_with_spouse_or_children(
+                unknown_status_ids
+            )
+            for person_id in unknown_status_ids:
+                if not self._is_ineligible_marital_status(
+                    MaritalStatus.UNKNOWN, person_id in with_spouse_or_children
+                ):
+                    eligible.add(person_id)
 
-        return True
+        return eligible
 
-    def _matches_gender(self, person: Person, target_gender_code: str) -> bool:
-        """Check if person's gender matches the target gender code.
+    def _matches_gender(self, gender_id: uuid.UUID, target_gender_code: str) -> bool:
+        """Check if a gender matches the target gender code.
 
         Args:
-            person: Person to check
+            gender_id: Person's gender ID
             target_gender_code: Target gender code (e.g., 'MALE', 'FEMALE')
 
         Returns:
             True if gender matches
         """
-        person_gender = get_gender_by_id(person.gender_id)
+        person_gender = get_gender_by_id(gender_id)
         if not person_gender:
             return False
         return person_gender.code.upper() == target_gender_code.upper()
@@ -360,20 +449,79 @@ class PartnerMatchService:
 
         return True
 
+    def _narrow_religion_filters(
+        self, request: PartnerMatchRequest
+    ) -> PartnerMatchRequest | None:
+        """Drop included categories and sub-categories outside the included parents.
+
+        Uses the descendant sets of the cached religion taxonomy. A category
+        that does not belong to any included religion (or a sub-category that
+        does not belong to any included category) cannot match a consistent
+        religion record together with the other inclusion filters. IDs the
+        taxonomy does not know are kept.
+
+        Args:
+            request: Partner match request with religion filters
+
+        Returns:
+            Request with narrowed inclusion filters, or None if a non-empty
+            inclusion filter was narrowed to nothing
+        """
+        include_religion_ids = request.include_religion_ids
+        include_category_ids = request.include_category_ids
+        include_sub_category_ids = request.include_sub_category_ids
+        if not include_sub_category_ids and not (
+            include_religion_ids and include_category_ids
+        ):
+            return request
+
+        taxonomy = get_religion_taxonomy(self.session)
+
+        if include_religion_ids and include_category_ids:
+            allowed = taxonomy.category_ids_of(include_religion_ids)
+            include_category_ids = [
+                category_id
+                for category_id in include_category_ids
+                if category_id in allowed or not taxonomy.has_category(category_id)
+            ]
+            if not include_category_ids:
+                return None
+
+        if include_sub_category_ids and (include_category_ids or include_religion_ids):
+            if include_category_ids:
+                allowed = taxonomy.sub_category_ids_of(include_category_ids)
+            else:
+                allowed = taxonomy.sub_category_ids_of_religions(
+                    include_religion_ids or []
+                )
+            include_sub_category_ids = [
+                sub_category_id
+                for sub_category_id in include_sub_category_ids
+                if sub_category_id in allowed
+                or not taxonomy.has_sub_category(sub_category_id)
+            ]
+            if not include_sub_category_ids:
+                return None
+
+        return request.model_copy(
+            update={
+                "include_category_ids": include_category_ids,
+                "include_sub_category_ids": include_sub_category_ids,
+            }
+        )
+
     def _passes_religion_filters(
-        self, person_id: uuid.UUID, request: PartnerMatchRequest
+        self, religion_ids: PersonReligionIds, request: PartnerMatchRequest
     ) -> bool:
-        """Check if person passes all religion inclusion and exclusion filters.
+        """Check if religion IDs pass all religion inclusion and exclusion filters.
 
         Args:
-            person_id: Person to check
+            religion_ids: Person's religion IDs (all None if no religion is set)
             request: Partner match request with religion filters
 
         Returns:
             True if person passes all religion filters
         """
-        religion_ids = self._get_person_religion_ids(person_id)
-
         # Inclusion filters (AND logic between different levels)
         # If include list is provided and non-empty, person must match
 
@@ -408,49 +556,61 @@ class PartnerMatchService:
 
         return True
 
-    def _is_ineligible_marital_status(self, person: Person) -> bool:
+    def _is_ineligible_marital_status(
+        self, marital_status: MaritalStatus, has_spouse_or_children: bool
+    ) -> bool:
         """Check if person is ineligible based on marital status.
 
         Uses the person's marital_status field as the primary check.
-        Falls back to relationship-based check only if marital_status is UNKNOWN.
+        Falls back to relationships only if marital_status is UNKNOWN.
 
         Eligible statuses: SINGLE, DIVORCED, WIDOWED, SEPARATED
         Ineligible statuses: MARRIED
-        Fallback (UNKNOWN): Check for spouse/child relationships
+        Fallback (UNKNOWN): Ineligible if the person has a spouse or child
 
         Args:
-            person: Person object (already fetched from DB)
+            marital_status: Person's marital status
+            has_spouse_or_children: Whether the person has an active spouse or
+                child relationship (only used for UNKNOWN)
 
         Returns:
             True if person is ineligible (married or has children)
         """
         # Use marital_status field if it's set (not UNKNOWN)
-        if person.marital_status != MaritalStatus.UNKNOWN:
+        if marital_status != MaritalStatus.UNKNOWN:
             # MARRIED means ineligible
             # SINGLE, DIVORCED, WIDOWED, SEPARATED are all eligible
-            return person.marital_status == MaritalStatus.MARRIED
+            return marital_status == MaritalStatus.MARRIED
 
-        # Fallback: marital_status is UNKNOWN, check relationships
+        return has_spouse_or_children
+
+    def _get_persons_with_spouse_or_children(
+        self, person_ids: set[uuid.UUID]
+    ) -> set[uuid.UUID]:
+        """Get the persons that have an active spouse or child relationship.
+
+        Args:
+            person_ids: Persons to check
+
+        Returns:
+            Subset of person_ids with a spouse or child
+        """
         logger.debug(
-            f"Person {person.id} has UNKNOWN marital status, "
+            f"{len(person_ids)} candidates have UNKNOWN marital status, "
             "falling back to relationship-based check"
         )
-
-        statement = select(PersonRelationship).where(
-            PersonRelationship.person_id == person.id,
-            PersonRelationship.is_active == True,  # noqa: E712
+        statement = (
+            select(PersonRelationship.person_id)
+            .where(
+                col(PersonRelationship.person_id).in_(list(person_ids)),
+                PersonRelationship.is_active == True,  # noqa: E712
+                col(PersonRelationship.relationship_type).in_(
+                    list(self.SPOUSE_RELATIONSHIP_TYPES | self.CHILD_RELATIONSHIP_TYPES)
+                ),
+            )
+            .distinct()
         )
-        relationships = self.session.exec(statement).all()
-
-        for rel in relationships:
-            # Check for spouse relationships
-            if rel.relationship_type in self.SPOUSE_RELATIONSHIP_TYPES:
-                return True
-            # Check for child relationships (person has children)
-            if rel.relationship_type in self.CHILD_RELATIONSHIP_TYPES:
-                return True
-
-        return False
+        return set(self.session.exec(statement).all())
 
     def _build_exploration_tree(
         self,
@@ -473,9 +633,10 @@ class PartnerMatchService:
         matches_set = set(matches)
         graph: dict[uuid.UUID, MatchGraphNode] = {}
 
-        # First pass: create all nodes with enriched data
+        # First pass: create all nodes with enriched data in one batch
+        enriched_nodes = self._enrich_nodes(list(parent_map))
         for person_id in parent_map:
-            node = self._enrich_node_data(person_id)
+            node = enriched_nodes[person_id]
             node.depth = depth_map[person_id]
             node.is_match = person_id in matches_set
             graph[person_id] = node
@@ -619,23 +780,6 @@ class PartnerMatchService:
         statement = select(Person).where(Person.id == person_id)
         return self.session.exec(statement).first()
 
-    def _get_relationships(self, person_id: uuid.UUID) -> list[uuid.UUID]:
-        """Get all active relationships for a person.
-
-        Args:
-            person_id: Person's ID
-
-        Returns:
-            List of related_person_ids
-        """
-        statement = select(PersonRelationship).where(
-            PersonRelationship.person_id == person_id,
-            PersonRelationship.is_active == True,  # noqa: E712
-        )
-        relationships = self.session.exec(statement).all()
-
-        return [rel.related_person_id for rel in relationships]
-
     def _get_relationship_type(
         self, from_person_id: uuid.UUID, to_person_id: uuid.UUID
     ) -> str:
@@ -660,187 +804,62 @@ class PartnerMatchService:
 
         return "Related"
 
-    def _get_person_religion_ids(self, person_id: uuid.UUID) -> PersonReligionIds:
-        """Get religion IDs for a person.
+    def _enrich_node_data(self, person_id: uuid.UUID) -> MatchGraphNode:
+        """Fetch and format person details including address and religion.
 
         Args:
             person_id: Person's ID
 
         Returns:
-            PersonReligionIds with religion, category, and sub-category IDs
+            MatchGraphNode with enriched data (from_person and to_persons are set separately)
         """
-        statement = select(PersonReligion).where(PersonReligion.person_id == person_id)
-        person_religion = self.session.exec(statement).first()
-
-        if not person_religion:
-            return PersonReligionIds()
-
-        return PersonReligionIds(
-            religion_id=person_religion.religion_id,
-            category_id=person_religion.religion_category_id,
-            sub_category_id=person_religion.religion_sub_category_id,
-        )
+        return self._enrich_nodes([person_id])[person_id]
 
-    def _enrich_node_data(self, person_id: uuid.UUID) -> MatchGraphNode:
-        """Fetch and format person details including address and religion.
+    def _enrich_nodes(
+        self, person_ids: list[uuid.UUID]
+    ) -> dict[uuid.UUID, MatchGraphNode]:
+        """Fetch and format details of several persons with batched queries.
 
         Args:
-            person_id: Person's ID
+            person_ids: Persons' IDs
 
         Returns:
-            MatchGraphNode with enriched data (from_person and to_persons are set separately)
+            Dictionary mapping person_id -> MatchGraphNode (connections unset)
         """
-        person = self._get_person(person_id)
-        if not person:
-            # Return minimal node if person not found (shouldn't happen)
-            return MatchGraphNode(
+        records = self.person_enrichment.get_display_records(person_ids)
+        nodes: dict[uuid.UUID, MatchGraphNode] = {}
+        for person_id in person_ids:
+            record = records.get(person_id)
+            if not record:
+                # Return minimal node if person not found (shouldn't happen)
+                nodes[person_id] = MatchGraphNode(
+                    person_id=person_id,
+                    first_name="Unknown",
+                    last_name="Unknown",
+                    birth_year=None,
+                    death_year=None,
+                    address="",
+                    religion="",
+                    is_match=False,
+                    depth=0,
+                    from_person=None,
+                    to_persons=[],
+                    profile_image_key=None,
+                )
+                continue
+
+            nodes[person_id] = MatchGraphNode(
                 person_id=person_id,
-                first_name="Unknown",
-                last_name="Unknown",
-                birth_year=None,
-                death_year=None,
-                address="",
-                religion="",
+                first_name=record.first_name,
+                last_name=record.last_name,
+                birth_year=record.birth_year,
+                death_year=record.death_year,
+                address=record.address,
+                religion=record.religion,
                 is_match=False,
                 depth=0,
                 from_person=None,
                 to_persons=[],
-                profile_image_key=None,
+                profile_image_key=record.profile_image_key,
             )
-
-        # Extract birth and death years
-        birth_year = person.date_of_birth.year if person.date_of_birth else None
-        death_year = person.date_of_death.year if person.date_of_death else None
-
-        # Get address string
-        address = self._get_address_string(person_id)
-
-        # Get religion string
-        religion = self._get_religion_string(person_id)
-
-        return MatchGraphNode(
-            person_id=person_id,
-            first_name=person.first_name,
-            last_name=person.last_name,
-            birth_year=birth_year,
-            death_year=death_year,
-            address=address,
-            religion=religion,
-            is_match=False,
-            depth=0,
-            from_person=None,
-            to_persons=[],
-            profile_image_key=person.profile_image_key,
-        )
-
-    def _get_address_string(self, person_id: uuid.UUID) -> str:
-        """Get comma-separated address string for a person.
-
-        Args:
-            person_id: Person's ID
-
-        Returns:
-            Comma-separated address string or empty string if not available
-        """
-        # Get current address
-        statement = select(PersonAddress).where(
-            PersonAddress.person_id == person_id,
-            PersonAddress.is_current == True,  # noqa: E712
-        )
-        person_address = self.session.exec(statement).first()
-
-        if not person_address:
-            return ""
-
-        parts: list[str] = []
-
-        # Get locality name
-        if person_address.locality_id:
-            locality = self.session.exec(
-                select(Locality).where(Locality.id == person_address.locality_id)
-            ).first()
-            if locality:
-                parts.append(locality.name)
-
-        # Get sub-district name
-        if person_address.sub_district_id:
-            sub_district = self.session.exec(
-                select(SubDistrict).where(
-                    SubDistrict.id == person_address.sub_district_id
-                )
-            ).first()
-            if sub_district:
-                parts.append(sub_district.name)
-
-        # Get district name
-        if person_address.district_id:
-            district = self.session.exec(
-                select(District).where(District.id == person_address.district_id)
-            ).first()
-            if district:
-                parts.append(district.name)
-
-        # Get state name
-        if person_address.state_id:
-            state = self.session.exec(
-                select(State).where(State.id == person_address.state_id)
-            ).first()
-            if state:
-                parts.append(state.name)
-
-        # Get country name
-        if person_address.country_id:
-            country = self.session.exec(
-                select(Country).where(Country.id == person_address.country_id)
-            ).first()
-            if country:
-                parts.append(country.name)
-
-        return ", ".join(parts)
-
-    def _get_religion_string(self, person_id: uuid.UUID) -> str:
-        """Get comma-separated religion string for a person.
-
-        Args:
-            person_id: Person's ID
-
-        Returns:
-            Comma-separated religion string or empty string if not available
-        """
-        statement = select(PersonReligion).where(PersonReligion.person_id == person_id)
-        person_religion = self.session.exec(statement).first()
-
-        if not person_religion:
-            return ""
-
-        parts: list[str] = []
-
-        # Get religion name
-        if person_religion.religion_id:
-            religion = self.session.exec(
-                select(Religion).where(Religion.id == person_religion.religion_id)
-            ).first()
-            if religion:
-                parts.append(religion.name)
-
-        # Get category name
-        if person_religion.religion_category_id:
-            category = self.session.exec(
-                select(ReligionCategory).where(
-                    ReligionCategory.id == person_religion.religion_category_id
-                )
-            ).first()
-            if category:
-                parts.append(category.name)
-
-        # Get sub-category name
-        if person_religion.religion_sub_category_id:
-            sub_category = self.session.exec(
-                select(ReligionSubCategory).where(
-                    ReligionSubCategory.id == person_religion.religion_sub_category_id
-                )
-            ).first()
-            if sub_category:
-                parts.append(sub_category.name)
-
-        return ", ".join(parts)
+        return nodes
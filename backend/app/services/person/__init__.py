@@ -1,9 +1,16 @@
 """Person services."""
 
+from app.services.person.discovery_suggestion_service import (
+    DiscoverySuggestionService,
+)
 from app.services.person.gender_service import GenderService
 from app.services.person.life_event_service import LifeEventService
 from app.services.person.person_address_service import PersonAddressService
 from app.services.person.person_discovery_service import PersonDiscoveryService
+from app.services.person.person_enrichment_service import (
+    PersonDisplayRecord,
+    PersonEnrichmentService,
+)
 from app.services.person.person_matching_service import PersonMatchingService
 from app.services.person.person_metadata_service import PersonMetadataService
 from app.services.person.person_profession_service import PersonProfessionService
@@ -14,10 +21,13 @@ from app.services.person.person_service import PersonService
 from app.services.person.profession_service import ProfessionService
 
 __all__ = [
+    "DiscoverySuggestionService",
     "GenderService",
     "LifeEventService",
     "PersonAddressService",
     "PersonDiscoveryService",
+    "PersonDisplayRecord",
+    "PersonEnrichmentService",
     "PersonMatchingService",
     "PersonMetadataService",
     "PersonProfessionService",
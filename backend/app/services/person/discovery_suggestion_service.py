@@ -0,0 +1,477 @@
+"""Precomputed family member discovery suggestions.
+
+When DISCOVERY_SUGGESTIONS_ENABLED is set, discovery results are kept in the
+discovery_suggestion table (migration 002) and the discovery endpoints read
+them with a single indexed query. A person's rows are only served while
+discovery_suggestion_state has a row for the person.
+
+Relationship writes call invalidate_discovery_suggestions before they commit,
+which deletes the state rows of every person whose discovery reads the changed
+relationships in the same transaction. Once committed, those persons are
+queued for the background worker. Until the worker has refreshed them, reads
+fall back to computing (and caching) the results in the request.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import threading
+import uuid
+from collections.abc import Iterable
+from datetime import datetime
+
+from sqlalchemy import Engine
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session, col, delete, select
+
+from app.core.config import settings
+from app.db_models.person.discovery_suggestion import (
+    DiscoverySuggestion,
+    DiscoverySuggestionState,
+)
+from app.db_models.person.person import Person
+from app.db_models.person.person_relationship import PersonRelationship
+from app.enums.relationship_type import RelationshipType
+from app.schemas.person.person_discovery import PersonDiscoveryResult
+from app.services.person.person_discovery_service import PersonDiscoveryService
+
+logger = logging.getLogger(__name__)
+
+# Persons refreshed per transaction by the worker and the backfill
+REFRESH_CHUNK_SIZE = 500
+
+
+class DiscoverySuggestionService:
+    """Service for reading and maintaining precomputed discovery suggestions."""
+
+    def __init__(self, session: Session):
+        """Initialize the discovery suggestion service.
+
+        Args:
+            session: Database session
+        """
+        self.session = session
+        self.discovery_service = PersonDiscoveryService(session)
+
+    def get_suggestions(
+        self, current_user_id: uuid.UUID, person_id: uuid.UUID | None = None
+    ) -> list[PersonDiscoveryResult]:
+        """Get discovery results for the current user or a specific person.
+
+        Served from the store when it is enabled and up to date for the
+        person. Otherwise the results are computed by PersonDiscoveryService
+        and the person is queued for a background refresh.
+
+        Args:
+            current_user_id: Current user's ID
+            person_id: Optional person ID to discover for instead of the
+                current user's person
+
+        Returns:
+            List of discovered persons with inferred relationships
+        """
+        if settings.DISCOVERY_SUGGESTIONS_ENABLED:
+            person_repo = self.discovery_service.person_repo
+            person = (
+                person_repo.get_by_id(person_id)
+                if person_id
+                else person_repo.get_by_user_id(current_user_id)
+            )
+            if person is not None:
+                stored = self.get_stored_suggestions(person.id)
+                if stored is not None:
+                    logger.debug(f"Serving stored discovery suggestions: {person.id}")
+                    return stored
+                enqueue_discovery_refresh([person.id])
+
+        results: list[PersonDiscoveryResult] = (
+            self.discovery_service.discover_family_members(
+                current_user_id, person_id=person_id
+            )
+        )
+        return results
+
+    def get_stored_suggestions(
+        self, person_id: uuid.UUID
+    ) -> list[PersonDiscoveryResult] | None:
+        """Read a person's precomputed suggestions.
+
+        Args:
+            person_id: Person the suggestions are for
+
+        Returns:
+            Suggestions in discovery order, or None if the person's
+            suggestions are missing or out of date
+        """
+        statement = (
+            select(DiscoverySuggestionState.person_id, DiscoverySuggestion, Person)
+            .select_from(DiscoverySuggestionState)
+            .outerjoin(
+                DiscoverySuggestion,
+                col(DiscoverySuggestion.person_id)
+                == DiscoverySuggestionState.person_id,
+            )
+            .outerjoin(
+                Person, col(Person.id) == DiscoverySuggestion.suggested_person_id
+            )
+            .where(DiscoverySuggestionState.person_id == person_id)
+            .order_by(col(DiscoverySuggestion.position))
+        )
+        rows = self.session.exec(statement).all()
+        if not rows:
+            return None
+
+        return [
+            self._to_discovery_result(suggestion, person)
+            for _, suggestion, person in rows
+            # Persons deactivated after the refresh are no longer suggested
+            if suggestion is not None and person is not None and person.is_active
+        ]
+
+    def invalidate_persons(self, person_ids: Iterable[uuid.UUID]) -> list[uuid.UUID]:
+        """Mark suggestions that depend on changed relationships as out of date.
+
+        Discovery for a person reads the person's relationships and those of
+        directly related persons, so a change to a person's relationships
+        affects the person and everyone with an active relationship to them.
+
+        The state rows are deleted in the caller's transaction, so they are
+        committed (or rolled back) together with the relationship write.
+
+        Args:
+            person_ids: Persons whose relationships changed
+
+        Returns:
+            Affected persons, whose suggestions need a refresh
+        """
+        changed = list(dict.fromkeys(person_ids))
+        if not changed:
+            return []
+
+        statement = (
+            select(PersonRelationship.person_id)
+            .where(
+                col(PersonRelationship.related_person_id).in_(changed),
+                PersonRelationship.is_active == True,  # noqa: E712
+            )
+            .distinct()
+        )
+        affected = list(dict.fromkeys([*changed, *self.session.exec(statement).all()]))
+
+        self.session.execute(
+            delete(DiscoverySuggestionState).where(
+                col(DiscoverySuggestionState.person_id).in_(affected)
+            )
+        )
+        logger.debug(f"Invalidated discovery suggestions of {len(affected)} persons")
+        return affected
+
+    def refresh_persons(self, person_ids: Iterable[uuid.UUID]) -> int:
+        """Recompute and store the suggestions of the given persons.
+
+        All persons are written in one transaction. Persons whose discovery
+        fails are skipped and stay out of date.
+
+        Args:
+            person_ids: Persons to refresh
+
+        Returns:
+            Number of persons refreshed
+        """
+        ids = list(dict.fromkeys(person_ids))
+        if not ids:
+            return 0
+
+        persons = self.session.exec(select(Person).where(col(Person.id).in_(ids))).all()
+
+        suggestion_rows: list[dict[str, object]] = []
+        refreshed_ids: list[uuid.UUID] = []
+        for person in persons:
+            try:
+                discoveries = self.discovery_service.discover_for_person(
+                    person, strict=True
+                )
+            except Exception as e:
+                logger.error(
+                    f"Failed to refresh discovery suggestions for person "
+                    f"{person.id}: {str(e)}"
+                )
+                continue
+
+            refreshed_ids.append(person.id)
+            suggestion_rows.extend(
+                {
+                    "person_id": person.id,
+                    "suggested_person_id": discovery.person_id,
+                    "position": position,
+                    "inferred_relationship_type": discovery.inferred_relationship_type,
+                    "connection_path": discovery.connection_path,
+                    "proximity_score": discovery.proximity_score,
+                    "relationship_priority": discovery.relationship_priority,
+                }
+                for position, discovery in enumerate(discoveries)
+            )
+
+        if not refreshed_ids:
+            return 0
+
+        self.session.execute(
+            delete(DiscoverySuggestion).where(
+                col(DiscoverySuggestion.person_id).in_(refreshed_ids)
+            )
+        )
+        if suggestion_rows:
+            self.session.execute(insert(DiscoverySuggestion), suggestion_rows)
+
+        refreshed_at = datetime.utcnow()
+        state_insert = insert(DiscoverySuggestionState).values(
+            [
+                {"person_id": person_id, "refreshed_at": refreshed_at}
+                for person_id in refreshed_ids
+            ]
+        )
+        self.session.execute(
+            state_insert.on_conflict_do_update(
+                index_elements=[col(DiscoverySuggestionState.person_id)],
+                set_={"refreshed_at": state_insert.excluded.refreshed_at},
+            )
+        )
+        self.session.commit()
+
+        logger.debug(f"Refreshed discovery suggestions of {len(refreshed_ids)} persons")
+        return len(refreshed_ids)
+
+    def backfill(
+        self, batch_size: int = REFRESH_CHUNK_SIZE, missing_only: bool = False
+    ) -> int:
+        """Compute suggestions for all active persons.
+
+        Persons are processed in batches in primary key order, one
+        transaction per batch.
+
+        Args:
+            batch_size: Persons refreshed per transaction
+            missing_only: Skip persons whose suggestions are up to date
+
+        Returns:
+            Number of persons refreshed
+        """
+        refreshed = 0
+        last_id: uuid.UUID | None = None
+        while True:
+            statement = (
+                select(Person.id)
+                .where(Person.is_active == True)  # noqa: E712
+                .order_by(col(Person.id))
+                .limit(batch_size)
+            )
+            if last_id is not None:
+                statement = statement.where(col(Person.id) > last_id)
+            if missing_only:
+                statement = statement.where(
+                    ~select(DiscoverySuggestionState.person_id)
+                    .where(DiscoverySuggestionState.person_id == Person.id)
+                    .exists()
+                )
+
+            batch = list(self.session.exec(statement).all())
+            if not batch:
+                break
+
+            refreshed += self.refresh_persons(batch)
+            last_id = batch[-1]
+            logger.info(f"Backfilled discovery suggestions of {refreshed} persons")
+
+        return refreshed
+
+    def _to_discovery_result(
+        self, suggestion: DiscoverySuggestion, person: Person
+    ) -> PersonDiscoveryResult:
+        """Build a discovery result from a stored suggestion and its person."""
+        return PersonDiscoveryResult(
+            person_id=person.id,
+            first_name=person.first_name,
+            middle_name=person.middle_name,
+            last_name=person.last_name,
+            date_of_birth=person.date_of_birth,
+            date_of_death=person.date_of_death,
+            gender_id=person.gender_id,
+            address_display=None,
+            religion_display=None,
+            inferred_relationship_type=suggestion.inferred_relationship_type,
+            inferred_relationship_label=RelationshipType(
+                suggestion.inferred_relationship_type
+            ).label,
+            connection_path=suggestion.connection_path,
+            proximity_score=suggestion.proximity_score,
+            relationship_priority=suggestion.relationship_priority,
+        )
+
+
+class DiscoverySuggestionWorker:
+    """Background thread that refreshes queued persons' suggestions.
+
+    Queued person IDs are coalesced, so a burst of writes around the same
+    persons refreshes each of them once. Persons still queued when the worker
+    stops are refreshed again on their next read.
+    """
+
+    def __init__(self, engine: Engine, batch_size: int = REFRESH_CHUNK_SIZE):
+        """Initialize a stopped worker.
+
+        Args:
+            engine: Engine the worker opens its own sessions on
+            batch_size: Persons refreshed per transaction
+        """
+        self._engine = engine
+        self._batch_size = batch_size
+        self._lock = threading.Lock()
+        self._pending: dict[uuid.UUID, None] = {}
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def pending_count(self) -> int:
+        """Number of persons waiting for a refresh."""
+        with self._lock:
+            return len(self._pending)
+
+    def enqueue(self, person_ids: Iterable[uuid.UUID]) -> None:
+        """Queue persons for a refresh.
+
+        Args:
+            person_ids: Persons whose suggestions are out of date
+        """
+        with self._lock:
+            self._pending.update(dict.fromkeys(person_ids))
+            has_pending = bool(self._pending)
+        if has_pending:
+            self._wakeup.set()
+
+    def start(self) -> None:
+        """Start the worker thread if it is not running."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="discovery-suggestion-worker", daemon=True
+        )
+        self._thread.start()
+        logger.info("Discovery suggestion worker started")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the worker thread after its current batch.
+
+        Args:
+            timeout: Seconds to wait for the thread to finish
+        """
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        logger.info("Discovery suggestion worker stopped")
+
+    def run_pending(self) -> int:
+        """Refresh all queued persons in the calling thread.
+
+        Returns:
+            Number of persons refreshed
+        """
+        refreshed = 0
+        while not self._stopping.is_set():
+            batch = self._take_batch()
+            if not batch:
+                break
+            try:
+                with Session(self._engine) as session:
+                    service = DiscoverySuggestionService(session)
+                    refreshed += service.refresh_persons(batch)
+            except Exception:
+                logger.exception(
+                    f"Failed to refresh discovery suggestions of {len(batch)} persons"
+                )
+        return refreshed
+
+    def _take_batch(self) -> list[uuid.UUID]:
+        """Remove up to batch_size persons from the queue."""
+        with self._lock:
+            batch = list(itertools.islice(self._pending, self._batch_size))
+            for person_id in batch:
+                del self._pending[person_id]
+        return batch
+
+    def _run(self) -> None:
+        """Refresh queued persons until stopped."""
+        while not self._stopping.is_set():
+            self._wakeup.wait()
+            self._wakeup.clear()
+            self.run_pending()
+
+
+# Global worker instance (None until started)
+_worker: DiscoverySuggestionWorker | None = None
+
+
+def start_discovery_suggestion_worker(engine: Engine) -> DiscoverySuggestionWorker:
+    """
+    Start the global discovery suggestion worker.
+
+    Args:
+        engine: Engine the worker opens its sessions on
+
+    Returns:
+        The running global worker
+    """
+    global _worker
+
+    if _worker is None:
+        _worker = DiscoverySuggestionWorker(engine)
+    _worker.start()
+    return _worker
+
+
+def stop_discovery_suggestion_worker() -> None:
+    """Stop the global discovery suggestion worker if it is running."""
+    global _worker
+
+    if _worker is not None:
+        _worker.stop()
+        _worker = None
+
+
+def enqueue_discovery_refresh(person_ids: Iterable[uuid.UUID]) -> None:
+    """
+    Queue persons for a background refresh of their suggestions.
+
+    No-op when the worker is not running in this process.
+
+    Args:
+        person_ids: Persons whose suggestions are out of date
+    """
+    if _worker is not None:
+        _worker.enqueue(person_ids)
+
+
+def invalidate_discovery_suggestions(
+    session: Session, person_ids: Iterable[uuid.UUID]
+) -> list[uuid.UUID]:
+    """
+    Invalidate the suggestions affected by relationship changes.
+
+    Should be called before relationship writes are committed, so the
+    invalidation is part of their transaction. No-op unless
+    DISCOVERY_SUGGESTIONS_ENABLED is set.
+
+    Args:
+        session: Database session
+        person_ids: Persons whose relationships changed
+
+    Returns:
+        Affected persons, to pass to enqueue_discovery_refresh once committed
+    """
+    if not settings.DISCOVERY_SUGGESTIONS_ENABLED:
+        return []
+    return DiscoverySuggestionService(session).invalidate_persons(person_ids)
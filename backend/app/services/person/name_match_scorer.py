@@ -0,0 +1,208 @@
+"""Batch fuzzy name scoring shared by person search and person matching."""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from rapidfuzz import fuzz, process
+
+try:
+    # Optional dependency ("scoring" extra), needed by process.cdist
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised by patching np to None
+    np = None  # type: ignore[assignment]
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a name for comparison (lowercase, strip whitespace)."""
+    return name.lower().strip()
+
+
+@dataclass(frozen=True)
+class NameMatchScorer:
+    """
+    Weighted fuzzy similarity of first and last names (0-100).
+
+    The score is the weighted average of rapidfuzz ratios of the normalized
+    first and last names, rounded to 2 decimal places. Batch scoring
+    normalizes every candidate once and scores all of them with
+    rapidfuzz.process.cdist on all cores. Without NumPy it falls back to
+    scoring pairs in a loop with the same results.
+    """
+
+    first_name_weight: float
+    last_name_weight: float
+
+    def score(
+        self,
+        search_first: str,
+        search_last: str,
+        person_first: str,
+        person_last: str,
+    ) -> float:
+        """
+        Score a single person against the searched name.
+
+        Args:
+            search_first: First name from search criteria
+            search_last: Last name from search criteria
+            person_first: First name of person being compared
+            person_last: Last name of person being compared
+
+        Returns:
+            Match score from 0-100, rounded to 2 decimal places
+        """
+        first_name_score = fuzz.ratio(
+            normalize_name(search_first), normalize_name(person_first)
+        )
+        last_name_score = fuzz.ratio(
+            normalize_name(search_last), normalize_name(person_last)
+        )
+        return self._combine(first_name_score, last_name_score)
+
+    def score_batch(
+        self,
+        search_first: str,
+        search_last: str,
+        candidates: Sequence[tuple[str, str]],
+    ) -> Sequence[float]:
+        """
+        Score many persons against the searched name.
+
+        Args:
+            search_first: First name from search criteria
+            search_last: Last name from search criteria
+            candidates: (first_name, last_name) of each person, in order
+
+        Returns:
+            Scores in candidate order
+        """
+        if np is not None:
+            scores: list[float] = self._score_array(
+                search_first, search_last, candidates
+            ).tolist()
+            return scores
+
+        search_first = normalize_name(search_first)
+        search_last = normalize_name(search_last)
+        return [
+            self._combine(
+                fuzz.ratio(search_first, normalize_name(first)),
+                fuzz.ratio(search_last, normalize_name(last)),
+            )
+            for first, last in candidates
+        ]
+
+    def _score_array(
+        self,
+        search_first: str,
+        search_last: str,
+        candidates: Sequence[tuple[str, str]],
+    ) -> Any:
+        """score_batch as a float64 NumPy array, scored with process.cdist."""
+        if not candidates:
+            return np.empty(0, dtype=np.float64)
+
+        first_names = [normalize_name(first) for first, _ in candidates]
+        last_names = [normalize_name(last) for _, last in candidates]
+        search_first = normalize_name(search_first)
+        search_last = normalize_name(search_last)
+
+        first_scores = _ratio_row(search_first, first_names)
+        last_scores = _ratio_row(search_last, last_names)
+        weighted = (first_scores * self.first_name_weight) + (
+            last_scores * self.last_name_weight
+        )
+        # Python's round() keeps values identical to score()
+        return np.fromiter(
+            (round(value, 2) for value in weighted.tolist()),
+            dtype=np.float64,
+            count=len(candidates),
+        )
+
+    def rank(
+        self,
+        search_first: str,
+        search_last: str,
+        candidates: Sequence[tuple[str, str]],
+        threshold: float,
+        skip: int = 0,
+        limit: int | None = None,
+    ) -> tuple[list[tuple[int, float]], int]:
+        """
+        Score candidates and return one page of matches by score descending.
+
+        Candidates with equal scores keep their input order. With NumPy only
+        the first skip + limit matches are fully sorted; argpartition selects
+        them from the rest.
+
+        Args:
+            search_first: First name from search criteria
+            search_last: Last name from search criteria
+            candidates: (first_name, last_name) of each person, in order
+            threshold: Minimum score of a match
+            skip: Number of matches to skip
+            limit: Maximum number of matches to return (None = all)
+
+        Returns:
+            Tuple of ([(candidate index, score), ...] for the page, total
+            number of matches)
+        """
+        end = None if limit is None else skip + limit
+
+        if np is None:
+            scores = self.score_batch(search_first, search_last, candidates)
+            matches = [
+                (index, score)
+                for index, score in enumerate(scores)
+                if score >= threshold
+            ]
+            matches.sort(key=lambda match: match[1], reverse=True)
+            return matches[skip:end], len(matches)
+
+        score_array = self._score_array(search_first, search_last, candidates)
+        matched = np.flatnonzero(score_array >= threshold)
+        total = int(matched.size)
+
+        if end is not None and end < total:
+            matched = _stable_top_k(score_array, matched, end)
+
+        # Sort by score descending, then by candidate order
+        ordered = matched[np.lexsort((matched, -score_array[matched]))]
+        page = ordered[skip:end]
+        return [(int(index), float(score_array[index])) for index in page], total
+
+    def _combine(self, first_name_score: float, last_name_score: float) -> float:
+        """Weighted average of the two name scores, rounded to 2 decimals."""
+        match_score = (first_name_score * self.first_name_weight) + (
+            last_name_score * self.last_name_weight
+        )
+        return round(match_score, 2)
+
+
+def _ratio_row(query: str, choices: list[str]) -> Any:
+    """fuzz.ratio of one query against all choices as a float64 array."""
+    return process.cdist(
+        [query], choices, scorer=fuzz.ratio, dtype=np.float64, workers=-1
+    )[0]
+
+
+def _stable_top_k(scores: Any, indices: Any, k: int) -> Any:
+    """
+    Select the k best indices, keeping the earliest ones among equal scores.
+
+    Args:
+        scores: Score of every candidate
+        indices: Candidate indices to choose from, in ascending order
+        k: Number of indices to keep (less than len(indices))
+
+    Returns:
+        Array of k candidate indices in no particular order
+    """
+    candidate_scores = scores[indices]
+    top = np.argpartition(-candidate_scores, k - 1)[:k]
+    cutoff = candidate_scores[top].min()
+
+    above = indices[candidate_scores > cutoff]
+    tied = indices[candidate_scores == cutoff][: k - above.size]
+    return np.concatenate((above, tied))
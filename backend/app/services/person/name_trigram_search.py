@@ -0,0 +1,134 @@
+"""Trigram pre-ranking for fuzzy person name search.
+
+When PERSON_NAME_SEARCH_MODE is "trigram" and the pg_trgm extension is
+installed (see the 001 migration), name searches narrow candidates in
+PostgreSQL with the GIN-indexed % operator on lower(first_name) and
+lower(last_name), and keep only the top-K by weighted trigram similarity.
+The caller then applies the exact rapidfuzz score to those rows.
+
+Without the extension, callers keep scoring every candidate in Python.
+"""
+
+import logging
+from typing import Any, TypeVar
+
+from sqlalchemy import column, func, literal, or_, select, table
+from sqlmodel import Session, col
+from sqlmodel.sql.expression import Select, SelectOfScalar
+
+from app.core.config import settings
+from app.db_models.person.person import Person
+
+logger = logging.getLogger(__name__)
+
+# Person queries selecting either Person rows or a tuple of columns
+PersonQuery = TypeVar("PersonQuery", Select[Any], SelectOfScalar[Any])
+
+TRIGRAM_EXTENSION = "pg_trgm"
+
+# Whether pg_trgm is installed, detected once per process
+_trigram_available: bool | None = None
+
+
+def is_trigram_search_enabled(session: Session) -> bool:
+    """Whether name searches should be pre-ranked with pg_trgm.
+
+    Args:
+        session: Database session used to detect the extension
+
+    Returns:
+        True if trigram mode is configured and pg_trgm is installed
+    """
+    global _trigram_available
+
+    if settings.PERSON_NAME_SEARCH_MODE != "trigram":
+        return False
+
+    if _trigram_available is None:
+        _trigram_available = _detect_trigram_extension(session)
+        if not _trigram_available:
+            logger.warning(
+                f"{TRIGRAM_EXTENSION} is not installed, "
+                "falling back to Python name matching"
+            )
+
+    return _trigram_available
+
+
+def reset_trigram_availability() -> None:
+    """Forget the detected extension state, e.g. after running migrations."""
+    global _trigram_available
+    _trigram_available = None
+
+
+def _detect_trigram_extension(session: Session) -> bool:
+    """Check whether pg_trgm is installed in the connected database."""
+    if session.get_bind().dialect.name != "postgresql":
+        return False
+
+    pg_extension = table("pg_extension", column("extname"))
+    statement = (
+        select(literal(1))
+        .select_from(pg_extension)
+        .where(pg_extension.c.extname == TRIGRAM_EXTENSION)
+    )
+    return session.execute(statement).first() is not None
+
+
+def prerank_name_candidates(
+    session: Session,
+    query: PersonQuery,
+    search_first: str,
+    search_last: str,
+    first_name_weight: float,
+    last_name_weight: float,
+) -> PersonQuery:
+    """Narrow a Person query to the best trigram matches for a name.
+
+    Only non-empty search terms are used. A row is kept if either name is
+    similar enough for the indexed % operator, and rows are ordered by the
+    weighted trigram similarity of both names.
+
+    Args:
+        session: Database session; the % threshold is set for its transaction
+        query: Select statement over Person rows with all other filters
+        search_first: First name from search criteria
+        search_last: Last name from search criteria
+        first_name_weight: Weight of the first name similarity
+        last_name_weight: Weight of the last name similarity
+
+    Returns:
+        Select statement limited to PERSON_NAME_TRIGRAM_TOP_K candidates
+    """
+    terms = [
+        (
+            func.lower(Person.first_name),
+            search_first.lower().strip(),
+            first_name_weight,
+        ),
+        (func.lower(Person.last_name), search_last.lower().strip(), last_name_weight),
+    ]
+    terms = [(name, term, weight) for name, term, weight in terms if term]
+    if not terms:
+        return query
+
+    # The threshold only applies to this transaction
+    session.execute(
+        select(
+            func.set_config(
+                "pg_trgm.similarity_threshold",
+                str(settings.PERSON_NAME_TRIGRAM_THRESHOLD),
+                True,
+            )
+        )
+    )
+
+    rank = sum(
+        (func.similarity(name, term) * weight for name, term, weight in terms),
+        start=literal(0.0),
+    )
+    return (
+        query.where(or_(*(name.op("%")(term) for name, term, _ in terms)))
+        .order_by(rank.desc(), col(Person.id))
+        .limit(settings.PERSON_NAME_TRIGRAM_TOP_K)
+    )
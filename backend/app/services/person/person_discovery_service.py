@@ -3,8 +3,10 @@
 import logging
 import uuid
 
-from sqlmodel import Session
+from sqlalchemy.orm import aliased
+from sqlmodel import Session, col, select
 
+from app.core.config import settings
 from app.db_models.person.person import Person
 from app.db_models.person.person_relationship import PersonRelationship
 from app.enums.relationship_type import RelationshipType
@@ -15,7 +17,12 @@ from app.repositories.person.person_relationship_repository import (
 from app.repositories.person.person_religion_repository import PersonReligionRepository
 from app.repositories.person.person_repository import PersonRepository
 from app.schemas.person.person_discovery import PersonDiscoveryResult
-from app.utils.cache import cached
+from app.utils.cache import (
+    add_cache_tags,
+    cached,
+    person_cache_tag,
+    skip_result_caching,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -53,7 +60,7 @@ class PersonDiscoveryService:
         self.address_repo = PersonAddressRepository(session)
         self.religion_repo = PersonReligionRepository(session)
 
-    @cached(ttl_seconds=60, key_prefix="discovery")
+    @cached(ttl_seconds=settings.DISCOVERY_CACHE_TTL_SECONDS, key_prefix="discovery")
     def discover_family_members(
         self, current_user_id: uuid.UUID, person_id: uuid.UUID | None = None
     ) -> list[PersonDiscoveryResult]:
@@ -64,8 +71,10 @@ class PersonDiscoveryService:
         2. Parent's spouse → User's parent
         3. Child's parent → User's spouse
 
-        Results are cached for 1 minute to improve performance.
-        Cache is invalidated when relationships are created, updated, or deleted.
+        Results are cached and tagged with the person and every directly
+        connected person. All three patterns only read relationships of these
+        persons, so relationship writes invalidate exactly the affected
+        results through invalidate_person_cache.
 
         Args:
             current_user_id: Current user's ID (used for cache key and logging)
@@ -97,6 +106,7 @@ class PersonDiscoveryService:
                     logger.warning(
                         f"No person record found for person_id: {person_id}."
                     )
+                    skip_result_caching()
                     return []
             else:
                 person = self.person_repo.get_by_user_id(current_user_id)
@@ -105,108 +115,143 @@ class PersonDiscoveryService:
                         f"No person record found for user: {current_user_id}. "
                         "User may not have completed profile setup."
                     )
+                    # Not tagged by any relationship write, so do not cache
+                    skip_result_caching()
                     return []
 
             logger.debug(
                 f"Found person record: {person.first_name} {person.last_name} (ID: {person.id})"
             )
 
-            # Fetch all active relationships for the user ONCE
-            try:
-                user_relationships = self.relationship_repo.get_active_relationships(
-                    person.id
-                )
-                logger.debug(
-                    f"Fetched {len(user_relationships)} active relationships for user"
-                )
-            except Exception as e:
-                logger.error(
-                    f"Database error fetching relationships for person {person.id}: {str(e)}",
-                    exc_info=True,
-                )
-                raise
+            return self.discover_for_person(person)
 
-            # Get all connected person IDs to filter out existing connections
-            connected_person_ids = self._get_connected_person_ids_from_relationships(
-                person.id, user_relationships
+        except Exception as e:
+            # Log the error and re-raise for API layer to handle
+            logger.exception(
+                f"Unexpected error in family member discovery for user {current_user_id}: {str(e)}"
             )
-            logger.debug(f"User has {len(connected_person_ids)} existing connections")
+            raise
 
-            # Discover from all three patterns
-            discoveries: list[PersonDiscoveryResult] = []
+    def discover_for_person(
+        self, person: Person, strict: bool = False
+    ) -> list[PersonDiscoveryResult]:
+        """Run all three discovery patterns for a person, without caching.
 
-            # Pattern 1: Spouse's children
-            try:
-                spouses_children = self._discover_spouses_children(
-                    person.id, user_relationships, connected_person_ids
-                )
-                logger.debug(
-                    f"Found {len(spouses_children)} potential children from spouse(s)"
-                )
-                discoveries.extend(spouses_children)
-            except Exception as e:
-                logger.error(
-                    f"Error discovering spouse's children for person {person.id}: {str(e)}",
-                    exc_info=True,
-                )
-                # Continue with other patterns even if this one fails
+        Inside discover_family_members the result is tagged with the person and
+        every directly connected person. Background refreshes of the
+        discovery suggestion store call this directly.
 
-            # Pattern 2: Parent's spouse
-            try:
-                parents_spouse = self._discover_parents_spouse(
-                    person.id, user_relationships, connected_person_ids
-                )
-                logger.debug(
-                    f"Found {len(parents_spouse)} potential parents from parent's spouse"
-                )
-                discoveries.extend(parents_spouse)
-            except Exception as e:
-                logger.error(
-                    f"Error discovering parent's spouse for person {person.id}: {str(e)}",
-                    exc_info=True,
-                )
-                # Continue with other patterns even if this one fails
+        Args:
+            person: Person to discover family members for
+            strict: Re-raise errors of individual patterns instead of
+                returning partial results
 
-            # Pattern 3: Child's parent
-            try:
-                childs_parent = self._discover_childs_parent(
-                    person.id, user_relationships, connected_person_ids
-                )
-                logger.debug(
-                    f"Found {len(childs_parent)} potential spouses from child's parent"
-                )
-                discoveries.extend(childs_parent)
-            except Exception as e:
-                logger.error(
-                    f"Error discovering child's parent for person {person.id}: {str(e)}",
-                    exc_info=True,
-                )
-                # Continue even if this pattern fails
-
-            # Sort and filter results
-            try:
-                sorted_discoveries = self._sort_and_limit_discoveries(discoveries)
-            except Exception as e:
-                logger.error(
-                    f"Error sorting discoveries for person {person.id}: {str(e)}",
-                    exc_info=True,
-                )
-                # Return unsorted results rather than failing completely
-                sorted_discoveries = discoveries[:20]
+        Returns:
+            List of discovered persons with inferred relationships,
+            sorted by proximity and relationship priority, limited to 20 results
+        """
+        # Fetch all active relationships for the user ONCE
+        try:
+            user_relationships = self.relationship_repo.get_active_relationships(
+                person.id
+            )
+            logger.debug(
+                f"Fetched {len(user_relationships)} active relationships for user"
+            )
+        except Exception as e:
+            logger.error(
+                f"Database error fetching relationships for person {person.id}: {str(e)}",
+                exc_info=True,
+            )
+            raise
 
-            logger.info(
-                f"Discovery complete for user {current_user_id}: "
-                f"Found {len(sorted_discoveries)} suggestions"
+        # Get all connected person IDs to filter out existing connections
+        connected_person_ids = self._get_connected_person_ids_from_relationships(
+            person.id, user_relationships
+        )
+        logger.debug(f"User has {len(connected_person_ids)} existing connections")
+        add_cache_tags(*(person_cache_tag(pid) for pid in connected_person_ids))
+
+        # Discover from all three patterns
+        discoveries: list[PersonDiscoveryResult] = []
+
+        # Pattern 1: Spouse's children
+        try:
+            spouses_children = self._discover_spouses_children(
+                person.id, user_relationships, connected_person_ids
             )
+            logger.debug(
+                f"Found {len(spouses_children)} potential children from spouse(s)"
+            )
+            discoveries.extend(spouses_children)
+        except Exception as e:
+            logger.error(
+                f"Error discovering spouse's children for person {person.id}: {str(e)}",
+                exc_info=True,
+            )
+            if strict:
+                raise
+            # Continue with other patterns even if this one fails
+            skip_result_caching()
 
-            return sorted_discoveries
+        # Pattern 2: Parent's spouse
+        try:
+            parents_spouse = self._discover_parents_spouse(
+                person.id, user_relationships, connected_person_ids
+            )
+            logger.debug(
+                f"Found {len(parents_spouse)} potential parents from parent's spouse"
+            )
+            discoveries.extend(parents_spouse)
+        except Exception as e:
+            logger.error(
+                f"Error discovering parent's spouse for person {person.id}: {str(e)}",
+                exc_info=True,
+            )
+            if strict:
+                raise
+            # Continue with other patterns even if this one fails
+            skip_result_caching()
 
+        # Pattern 3: Child's parent
+        try:
+            childs_parent = self._discover_childs_parent(
+                person.id, user_relationships, connected_person_ids
+            )
+            logger.debug(
+                f"Found {len(childs_parent)} potential spouses from child's parent"
+            )
+            discoveries.extend(childs_parent)
         except Exception as e:
-            # Log the error and re-raise for API layer to handle
-            logger.exception(
-                f"Unexpected error in family member discovery for user {current_user_id}: {str(e)}"
+            logger.error(
+                f"Error discovering child's parent for person {person.id}: {str(e)}",
+                exc_info=True,
             )
-            raise
+            if strict:
+                raise
+            # Continue even if this pattern fails
+            skip_result_caching()
+
+        # Sort and filter results
+        try:
+            sorted_discoveries = self._sort_and_limit_discoveries(discoveries)
+        except Exception as e:
+            logger.error(
+                f"Error sorting discoveries for person {person.id}: {str(e)}",
+                exc_info=True,
+            )
+            if strict:
+                raise
+            # Return unsorted results rather than failing completely
+            sorted_discoveries = discoveries[:20]
+            skip_result_caching()
+
+        logger.info(
+            f"Discovery complete for person {person.id}: "
+            f"Found {len(sorted_discoveries)} suggestions"
+        )
+
+        return sorted_discoveries
 
     def _get_connected_person_ids_from_relationships(
         self, person_id: uuid.UUID, relationships: list[PersonRelationship]
@@ -349,6 +394,60 @@ class PersonDiscoveryService:
             )
             return None
 
+    def _find_two_hop_relatives(
+        self,
+        person_id: uuid.UUID,
+        first_hop_types: list[RelationshipType],
+        second_hop_types: list[RelationshipType],
+        connected_person_ids: set[uuid.UUID],
+    ) -> list[tuple[Person, Person]]:
+        """Find relatives of the user's relatives in a single query.
+
+        Joins person_relationship to itself: the first hop goes from the user
+        to a relative of one of first_hop_types, the second hop from that
+        relative to a candidate of one of second_hop_types. Both hops must be
+        active, and candidates already connected to the user are excluded.
+
+        Args:
+            person_id: User's person ID
+            first_hop_types: Relationship types from the user to the relative
+            second_hop_types: Relationship types from the relative to the candidate
+            connected_person_ids: Set of already-connected person IDs
+
+        Returns:
+            List of (relative, candidate) Person pairs
+        """
+        first_hop = aliased(PersonRelationship)
+        second_hop = aliased(PersonRelationship)
+        relative = aliased(Person)
+        candidate = aliased(Person)
+
+        statement = (
+            select(relative, candidate)
+            .select_from(first_hop)
+            .join(
+                second_hop,
+                col(second_hop.person_id) == first_hop.related_person_id,
+            )
+            .join(relative, col(relative.id) == first_hop.related_person_id)
+            .join(candidate, col(candidate.id) == second_hop.related_person_id)
+            .where(
+                first_hop.person_id == person_id,
+                first_hop.is_active == True,  # noqa: E712
+                col(first_hop.relationship_type).in_(first_hop_types),
+                second_hop.is_active == True,  # noqa: E712
+                col(second_hop.relationship_type).in_(second_hop_types),
+                col(second_hop.related_person_id).not_in(connected_person_ids),
+            )
+            .order_by(
+                col(first_hop.created_at),
+                col(first_hop.id),
+                col(second_hop.created_at),
+                col(second_hop.id),
+            )
+        )
+        return [(row[0], row[1]) for row in self.session.exec(statement).all()]
+
     def _discover_spouses_children(
         self,
         person_id: uuid.UUID,
@@ -358,8 +457,9 @@ class PersonDiscoveryService:
         """Discover children of user's spouse.
 
         Logic:
-        1. Filter user's spouses from provided relationships (Wife/Husband/Spouse)
-        2. For each spouse, find their children (Son/Daughter relationships)
+        1. Skip the query if the user has no spouse (Wife/Husband/Spouse)
+        2. Find the children (Son/Daughter relationships) of all spouses
+           with one two-hop query
         3. Filter out children already connected to user
         4. Infer relationship type based on child's gender
 
@@ -371,96 +471,51 @@ class PersonDiscoveryService:
         Returns:
             List of discovered children
         """
-        from app.enums.relationship_type import RelationshipType
-
-        discoveries: list[PersonDiscoveryResult] = []
-
-        # Filter user's spouses from the provided relationships
-        spouse_relationships = [
-            r
-            for r in user_relationships
-            if r.relationship_type
-            in [
-                RelationshipType.WIFE,
-                RelationshipType.HUSBAND,
-                RelationshipType.SPOUSE,
-            ]
+        spouse_types = [
+            RelationshipType.WIFE,
+            RelationshipType.HUSBAND,
+            RelationshipType.SPOUSE,
         ]
+        spouse_count = sum(
+            1 for r in user_relationships if r.relationship_type in spouse_types
+        )
+        logger.debug(f"Found {spouse_count} spouse(s) for person {person_id}")
+        if not spouse_count:
+            return []
 
+        spouses_children = self._find_two_hop_relatives(
+            person_id,
+            spouse_types,
+            [RelationshipType.SON, RelationshipType.DAUGHTER],
+            connected_person_ids,
+        )
         logger.debug(
-            f"Found {len(spouse_relationships)} spouse(s) for person {person_id}"
+            f"Spouse(s) of person {person_id} have "
+            f"{len(spouses_children)} unconnected child(ren)"
         )
 
-        # For each spouse, find their children
-        for spouse_rel in spouse_relationships:
-            spouse_id = spouse_rel.related_person_id
-            spouse = self.person_repo.get_by_id(spouse_id)
-
-            if not spouse:
-                logger.warning(f"Spouse person not found: {spouse_id}")
-                continue
-
+        discoveries: list[PersonDiscoveryResult] = []
+        for spouse, child in spouses_children:
             spouse_name = f"{spouse.first_name} {spouse.last_name}"
-            logger.debug(
-                f"Checking children of spouse: {spouse_name} (ID: {spouse_id})"
-            )
-
-            # Find spouse's children
-            child_relationships = self.relationship_repo.get_by_relationship_types(
-                spouse_id, [RelationshipType.SON, RelationshipType.DAUGHTER]
-            )
-
-            # Filter to active relationships only
-            child_relationships = [r for r in child_relationships if r.is_active]
-
-            logger.debug(
-                f"Spouse {spouse_name} has {len(child_relationships)} child(ren)"
-            )
 
-            # Check each child
-            for child_rel in child_relationships:
-                child_id = child_rel.related_person_id
-
-                # Skip if already connected to user
-                if child_id in connected_person_ids:
-                    logger.debug(
-                        f"Child {child_id} already connected to user, skipping"
-                    )
-                    continue
-
-                # Fetch child person details ONCE
-                child = self.person_repo.get_by_id(child_id)
-                if not child:
-                    logger.warning(f"Child person not found: {child_id}")
-                    continue
-
-                # Infer relationship type based on child's gender
-                inferred_relationship_type = self._infer_child_relationship(
+            discovery = self._build_discovery_result(
+                person=child,
+                inferred_relationship_type=self._infer_child_relationship(
                     child.gender_id
-                )
-
-                # Build connection path
-                connection_path = f"Connected to your spouse {spouse_name}"
+                ),
+                connection_path=f"Connected to your spouse {spouse_name}",
+                proximity_score=2,  # 2 degrees of separation
+                relationship_priority=1,  # Children have priority 1
+            )
 
-                # Build discovery result (pass Person object, not ID)
-                discovery = self._build_discovery_result(
-                    person=child,
-                    inferred_relationship_type=inferred_relationship_type,
-                    connection_path=connection_path,
-                    proximity_score=2,  # 2 degrees of separation
-                    relationship_priority=1,  # Children have priority 1
+            if discovery:
+                discoveries.append(discovery)
+                logger.debug(
+                    f"Added discovery: {discovery.first_name} {discovery.last_name} "
+                    f"as {discovery.inferred_relationship_label}"
                 )
-
-                if discovery:
-                    discoveries.append(discovery)
-                    logger.debug(
-                        f"Added discovery: {discovery.first_name} {discovery.last_name} "
-                        f"as {discovery.inferred_relationship_label}"
-                    )
-                else:
-                    logger.warning(
-                        f"Failed to build discovery result for child {child_id}"
-                    )
+            else:
+                logger.warning(f"Failed to build discovery result for child {child.id}")
 
         return discoveries
 
@@ -473,8 +528,9 @@ class PersonDiscoveryService:
         """Discover spouse of user's parent.
 
         Logic:
-        1. Filter user's parents from provided relationships (Father/Mother)
-        2. For each parent, find their spouse (Spouse/Wife/Husband relationships)
+        1. Skip the query if the user has no parent (Father/Mother)
+        2. Find the spouses (Spouse/Wife/Husband relationships) of all parents
+           with one two-hop query
         3. Filter out spouses already connected to user
         4. Infer relationship type based on spouse's gender
 
@@ -486,95 +542,54 @@ class PersonDiscoveryService:
         Returns:
             List of discovered parents
         """
-        from app.enums.relationship_type import RelationshipType
-
-        discoveries: list[PersonDiscoveryResult] = []
-
-        # Filter user's parents from the provided relationships
-        parent_relationships = [
-            r
-            for r in user_relationships
-            if r.relationship_type in [RelationshipType.FATHER, RelationshipType.MOTHER]
-        ]
+        parent_types = [RelationshipType.FATHER, RelationshipType.MOTHER]
+        parent_count = sum(
+            1 for r in user_relationships if r.relationship_type in parent_types
+        )
+        logger.debug(f"Found {parent_count} parent(s) for person {person_id}")
+        if not parent_count:
+            return []
 
+        parents_spouses = self._find_two_hop_relatives(
+            person_id,
+            parent_types,
+            [
+                RelationshipType.WIFE,
+                RelationshipType.HUSBAND,
+                RelationshipType.SPOUSE,
+            ],
+            connected_person_ids,
+        )
         logger.debug(
-            f"Found {len(parent_relationships)} parent(s) for person {person_id}"
+            f"Parent(s) of person {person_id} have "
+            f"{len(parents_spouses)} unconnected spouse(s)"
         )
 
-        # For each parent, find their spouse
-        for parent_rel in parent_relationships:
-            parent_id = parent_rel.related_person_id
-            parent = self.person_repo.get_by_id(parent_id)
-
-            if not parent:
-                logger.warning(f"Parent person not found: {parent_id}")
-                continue
-
+        discoveries: list[PersonDiscoveryResult] = []
+        for parent, spouse in parents_spouses:
             parent_name = f"{parent.first_name} {parent.last_name}"
-            logger.debug(f"Checking spouse of parent: {parent_name} (ID: {parent_id})")
-
-            # Find parent's spouse
-            spouse_relationships = self.relationship_repo.get_by_relationship_types(
-                parent_id,
-                [
-                    RelationshipType.WIFE,
-                    RelationshipType.HUSBAND,
-                    RelationshipType.SPOUSE,
-                ],
-            )
-
-            # Filter to active relationships only
-            spouse_relationships = [r for r in spouse_relationships if r.is_active]
 
-            logger.debug(
-                f"Parent {parent_name} has {len(spouse_relationships)} spouse(s)"
+            discovery = self._build_discovery_result(
+                person=spouse,
+                inferred_relationship_type=self._infer_parent_relationship(
+                    spouse.gender_id
+                ),
+                connection_path=f"Connected to your parent {parent_name}",
+                proximity_score=2,  # 2 degrees of separation
+                relationship_priority=2,  # Parents have priority 2
             )
 
-            # Check each spouse
-            for spouse_rel in spouse_relationships:
-                spouse_id = spouse_rel.related_person_id
-
-                # Skip if already connected to user
-                if spouse_id in connected_person_ids:
-                    logger.debug(
-                        f"Spouse {spouse_id} already connected to user, skipping"
-                    )
-                    continue
-
-                # Fetch spouse person details ONCE
-                spouse = self.person_repo.get_by_id(spouse_id)
-                if not spouse:
-                    logger.warning(f"Spouse person not found: {spouse_id}")
-                    continue
-
-                # Infer relationship type based on spouse's gender
-                inferred_relationship_type = self._infer_parent_relationship(
-                    spouse.gender_id
+            if discovery:
+                discoveries.append(discovery)
+                logger.debug(
+                    f"Added discovery: {discovery.first_name} {discovery.last_name} "
+                    f"as {discovery.inferred_relationship_label}"
                 )
-
-                # Build connection path
-                connection_path = f"Connected to your parent {parent_name}"
-
-                # Build discovery result (pass Person object, not ID)
-                discovery = self._build_discovery_result(
-                    person=spouse,
-                    inferred_relationship_type=inferred_relationship_type,
-                    connection_path=connection_path,
-                    proximity_score=2,  # 2 degrees of separation
-                    relationship_priority=2,  # Parents have priority 2
+            else:
+                logger.warning(
+                    f"Failed to build discovery result for spouse {spouse.id}"
                 )
 
-                if discovery:
-                    discoveries.append(discovery)
-                    logger.debug(
-                        f"Added discovery: {discovery.first_name} {discovery.last_name} "
-                        f"as {discovery.inferred_relationship_label}"
-                    )
-                else:
-                    logger.warning(
-                        f"Failed to build discovery result for spouse {spouse_id}"
-                    )
-
         return discoveries
 
     def _discover_childs_parent(
@@ -586,8 +601,9 @@ class PersonDiscoveryService:
         """Discover parent of user's child.
 
         Logic:
-        1. Filter user's children from provided relationships (Son/Daughter)
-        2. For each child, find their parents (Father/Mother relationships)
+        1. Skip the query if the user has no child (Son/Daughter)
+        2. Find the parents (Father/Mother relationships) of all children
+           with one two-hop query
         3. Filter out parents already connected to user
         4. Infer relationship type as "Spouse" (gender-neutral)
 
@@ -599,87 +615,48 @@ class PersonDiscoveryService:
         Returns:
             List of discovered spouses
         """
-        from app.enums.relationship_type import RelationshipType
-
-        discoveries: list[PersonDiscoveryResult] = []
-
-        # Filter user's children from the provided relationships
-        child_relationships = [
-            r
-            for r in user_relationships
-            if r.relationship_type in [RelationshipType.SON, RelationshipType.DAUGHTER]
-        ]
+        child_types = [RelationshipType.SON, RelationshipType.DAUGHTER]
+        child_count = sum(
+            1 for r in user_relationships if r.relationship_type in child_types
+        )
+        logger.debug(f"Found {child_count} child(ren) for person {person_id}")
+        if not child_count:
+            return []
 
+        childrens_parents = self._find_two_hop_relatives(
+            person_id,
+            child_types,
+            [RelationshipType.FATHER, RelationshipType.MOTHER],
+            connected_person_ids,
+        )
         logger.debug(
-            f"Found {len(child_relationships)} child(ren) for person {person_id}"
+            f"Child(ren) of person {person_id} have "
+            f"{len(childrens_parents)} unconnected parent(s)"
         )
 
-        # For each child, find their parents
-        for child_rel in child_relationships:
-            child_id = child_rel.related_person_id
-            child = self.person_repo.get_by_id(child_id)
-
-            if not child:
-                logger.warning(f"Child person not found: {child_id}")
-                continue
-
+        discoveries: list[PersonDiscoveryResult] = []
+        for child, parent in childrens_parents:
             child_name = f"{child.first_name} {child.last_name}"
-            logger.debug(f"Checking parents of child: {child_name} (ID: {child_id})")
 
-            # Find child's parents
-            parent_relationships = self.relationship_repo.get_by_relationship_types(
-                child_id, [RelationshipType.FATHER, RelationshipType.MOTHER]
+            discovery = self._build_discovery_result(
+                person=parent,
+                # Gender-neutral, the user's role is not known
+                inferred_relationship_type=RelationshipType.SPOUSE,
+                connection_path=f"Connected to your child {child_name}",
+                proximity_score=2,  # 2 degrees of separation
+                relationship_priority=3,  # Spouses have priority 3
             )
 
-            # Filter to active relationships only
-            parent_relationships = [r for r in parent_relationships if r.is_active]
-
-            logger.debug(
-                f"Child {child_name} has {len(parent_relationships)} parent(s)"
-            )
-
-            # Check each parent
-            for parent_rel in parent_relationships:
-                parent_id = parent_rel.related_person_id
-
-                # Skip if already connected to user
-                if parent_id in connected_person_ids:
-                    logger.debug(
-                        f"Parent {parent_id} already connected to user, skipping"
-                    )
-                    continue
-
-                # Fetch parent person details ONCE
-                parent = self.person_repo.get_by_id(parent_id)
-                if not parent:
-                    logger.warning(f"Parent person not found: {parent_id}")
-                    continue
-
-                # Infer relationship type as "Spouse" (gender-neutral)
-                inferred_relationship_type = RelationshipType.SPOUSE
-
-                # Build connection path
-                connection_path = f"Connected to your child {child_name}"
-
-                # Build discovery result (pass Person object, not ID)
-                discovery = self._build_discovery_result(
-                    person=parent,
-                    inferred_relationship_type=inferred_relationship_type,
-                    connection_path=connection_path,
-                    proximity_score=2,  # 2 degrees of separation
-                    relationship_priority=3,  # Spouses have priority 3
+            if discovery:
+                discoveries.append(discovery)
+                logger.debug(
+                    f"Added discovery: {discovery.first_name} {discovery.last_name} "
+                    f"as {discovery.inferred_relationship_label}"
+                )
+            else:
+                logger.warning(
+                    f"Failed to build discovery result for parent {parent.id}"
                 )
-
-                if discovery:
-                    discoveries.append(discovery)
-                    logger.debug(
-                        f"Added discovery: {discovery.first_name} {discovery.last_name} "
-                        f"as {discovery.inferred_relationship_label}"
-                    )
-                else:
-                    logger.warning(
-                        f"Failed to build discovery result for parent {parent_id}"
-                    )
 
         return discoveries
 
@@ -0,0 +1,178 @@
+"""Person Enrichment service for bulk loading person display data."""
+
+import logging
+import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from sqlmodel import Session, col, select
+from sqlmodel.sql.expression import Select
+
+from app.db_models.address.country import Country
+from app.db_models.address.district import District
+from app.db_models.address.locality import Locality
+from app.db_models.address.state import State
+from app.db_models.address.sub_district import SubDistrict
+from app.db_models.person.person import Person
+from app.db_models.person.person_address import PersonAddress
+from app.db_models.person.person_religion import PersonReligion
+from app.db_models.religion.religion import Religion
+from app.db_models.religion.religion_category import ReligionCategory
+from app.db_models.religion.religion_sub_category import ReligionSubCategory
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of person ids sent in a single IN (...) list
+ENRICHMENT_CHUNK_SIZE = 1000
+
+
+@dataclass
+class PersonDisplayRecord:
+    """Display data for a person as shown in graph and list responses."""
+
+    person_id: uuid.UUID
+    first_name: str
+    last_name: str
+    gender_id: uuid.UUID
+    birth_year: int | None = None
+    death_year: int | None = None
+    profile_image_key: str | None = None
+    address: str = ""
+    religion: str = ""
+    district_name: str | None = None
+    locality_name: str | None = None
+
+
+class PersonEnrichmentService:
+    """Service for loading display data of many persons at once.
+
+    Runs a fixed number of joined queries (person, current address with its
+    hierarchy names, religion with its taxonomy names) per chunk of ids instead
+    of several lookups per person.
+    """
+
+    def __init__(self, session: Session):
+        """Initialize the person enrichment service.
+
+        Args:
+            session: Database session
+        """
+        self.session = session
+
+    def get_display_records(
+        self, person_ids: Iterable[uuid.UUID]
+    ) -> dict[uuid.UUID, PersonDisplayRecord]:
+        """Load display records for the given persons.
+
+        Args:
+            person_ids: Persons' IDs
+
+        Returns:
+            Dictionary mapping person_id to PersonDisplayRecord, omitting
+            persons that do not exist
+        """
+        ids = list(dict.fromkeys(person_ids))
+        records: dict[uuid.UUID, PersonDisplayRecord] = {}
+
+        for start in range(0, len(ids), ENRICHMENT_CHUNK_SIZE):
+            chunk = ids[start : start + ENRICHMENT_CHUNK_SIZE]
+            chunk_records = self._load_persons(chunk)
+            if chunk_records:
+                self._load_addresses(chunk_records)
+                self._load_religions(chunk_records)
+                records.update(chunk_records)
+
+        logger.debug(f"Enriched {len(records)} of {len(ids)} requested persons")
+        return records
+
+    def _load_persons(
+        self, person_ids: list[uuid.UUID]
+    ) -> dict[uuid.UUID, PersonDisplayRecord]:
+        """Load the person rows of one chunk."""
+        statement = select(Person).where(col(Person.id).in_(person_ids))
+        records: dict[uuid.UUID, PersonDisplayRecord] = {}
+        for person in self.session.exec(statement).all():
+            records[person.id] = PersonDisplayRecord(
+                person_id=person.id,
+                first_name=person.first_name,
+                last_name=person.last_name,
+                gender_id=person.gender_id,
+                birth_year=person.date_of_birth.year if person.date_of_birth else None,
+                death_year=person.date_of_death.year if person.date_of_death else None,
+                profile_image_key=person.profile_image_key,
+            )
+        return records
+
+    def _load_addresses(self, records: dict[uuid.UUID, PersonDisplayRecord]) -> None:
+        """Fill current address strings and names for one chunk.
+
+        The address string lists the known parts from the most specific to the
+        least specific: locality, sub-district, district, state, country.
+        """
+        # sqlmodel's select() is only typed for up to four columns
+        statement: Select[
+            tuple[uuid.UUID, str | None, str | None, str | None, str | None, str | None]
+        ] = (
+            Select(
+                col(PersonAddress.person_id),
+                col(Locality.name),
+                col(SubDistrict.name),
+                col(District.name),
+                col(State.name),
+                col(Country.name),
+            )
+            .outerjoin(Locality, col(Locality.id) == PersonAddress.locality_id)
+            .outerjoin(
+                SubDistrict, col(SubDistrict.id) == PersonAddress.sub_district_id
+            )
+            .outerjoin(District, col(District.id) == PersonAddress.district_id)
+            .outerjoin(State, col(State.id) == PersonAddress.state_id)
+            .outerjoin(Country, col(Country.id) == PersonAddress.country_id)
+            .where(
+                col(PersonAddress.person_id).in_(list(records)),
+                PersonAddress.is_current == True,  # noqa: E712
+            )
+        )
+
+        seen: set[uuid.UUID] = set()
+        for row in self.session.exec(statement).all():
+            person_id, locality, sub_district, district, state, country = row
+            # A person should have one current address; keep the first if not
+            if person_id in seen:
+                continue
+            seen.add(person_id)
+
+            record = records[person_id]
+            parts = [locality, sub_district, district, state, country]
+            record.address = ", ".join(part for part in parts if part)
+            record.district_name = district
+            record.locality_name = locality
+
+    def _load_religions(self, records: dict[uuid.UUID, PersonDisplayRecord]) -> None:
+        """Fill religion strings for one chunk.
+
+        The religion string lists religion, category and sub-category.
+        """
+        statement = (
+            select(
+                PersonReligion.person_id,
+                Religion.name,
+                ReligionCategory.name,
+                ReligionSubCategory.name,
+            )
+            .outerjoin(Religion, col(Religion.id) == PersonReligion.religion_id)
+            .outerjoin(
+                ReligionCategory,
+                col(ReligionCategory.id) == PersonReligion.religion_category_id,
+            )
+            .outerjoin(
+                ReligionSubCategory,
+                col(ReligionSubCategory.id) == PersonReligion.religion_sub_category_id,
+            )
+            .where(col(PersonReligion.person_id).in_(list(records)))
+        )
+
+        for row in self.session.exec(statement).all():
+            person_id, religion, category, sub_category = row
+            parts = [religion, category, sub_category]
+            records[person_id].religion = ", ".join(part for part in parts if part)
@@ -3,7 +3,6 @@
 import logging
 import uuid
 
-from rapidfuzz import fuzz
 from sqlmodel import Session, col, select
 
 from app.db_models.person.person import Person
@@ -16,6 +15,11 @@ from app.repositories.person.person_relationship_repository import (
 from app.repositories.person.person_religion_repository import PersonReligionRepository
 from app.repositories.person.person_repository import PersonRepository
 from app.schemas.person.person_search import PersonMatchResult, PersonSearchRequest
+from app.services.person.name_match_scorer import NameMatchScorer
+from app.services.person.name_trigram_search import (
+    is_trigram_search_enabled,
+    prerank_name_candidates,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +27,10 @@ logger = logging.getLogger(__name__)
 class PersonMatchingService:
     """Service for finding and scoring person matches."""
 
+    FIRST_NAME_WEIGHT = 0.4
+    LAST_NAME_WEIGHT = 0.6
+    name_scorer = NameMatchScorer(FIRST_NAME_WEIGHT, LAST_NAME_WEIGHT)
+
     def __init__(self, session: Session):
         """Initialize the person matching service.
 
@@ -44,7 +52,6 @@ class PersonMatchingService:
     ) -> float:
         """Calculate fuzzy match score for names (0-100).
 
-        Uses rapidfuzz to calculate similarity between names.
         Weighted average: 40% first name, 60% last name.
 
         Args:
@@ -56,20 +63,9 @@ class PersonMatchingService:
         Returns:
             Match score from 0-100, rounded to 2 decimal places
         """
-        # Normalize names (lowercase, strip whitespace)
-        search_first = search_first.lower().strip()
-        search_last = search_last.lower().strip()
-        person_first = person_first.lower().strip()
-        person_last = person_last.lower().strip()
-
-        # Calculate individual scores using rapidfuzz
-        first_name_score = fuzz.ratio(search_first, person_first)
-        last_name_score = fuzz.ratio(search_last, person_last)
-
-        # Weighted average (last name more important)
-        match_score = (first_name_score * 0.4) + (last_name_score * 0.6)
-
-        return round(match_score, 2)
+        return self.name_scorer.score(
+            search_first, search_last, person_first, person_last
+        )
 
     def _find_persons_by_address(
         self,
@@ -359,6 +355,17 @@ class PersonMatchingService:
         else:
             logger.debug("Skipping gender filter (not provided)")
 
+        # Narrow and pre-rank name candidates in the database when enabled
+        if is_trigram_search_enabled(self.session):
+            query = prerank_name_candidates(
+                self.session,
+                query,
+                search_criteria.first_name,
+                search_criteria.last_name,
+                first_name_weight=self.FIRST_NAME_WEIGHT,
+                last_name_weight=self.LAST_NAME_WEIGHT,
+            )
+
         persons = self.session.exec(query).all()
         logger.info(f"After gender filter: {len(persons)} persons remain")
 
@@ -377,19 +384,19 @@ class PersonMatchingService:
 
         # Step 6: Calculate name match scores for all persons (no exclusion)
         # Instead, we'll mark them with flags
+        # Score all persons at once
+        name_scores = self.name_scorer.score_batch(
+            search_criteria.first_name,
+            search_criteria.last_name,
+            [(person.first_name, person.last_name) for person in persons],
+        )
+
         results = []
-        for person in persons:
+        for person, name_score in zip(persons, name_scores, strict=True):
             # Determine flags
             is_current_user = person.id == current_person.id
             is_already_connected = person.id in connected_person_ids
 
-            name_score = self.calculate_name_match_score(
-                search_criteria.first_name,
-                search_criteria.last_name,
-                person.first_name,
-                person.last_name,
-            )
-
             # Filter by minimum score threshold (40%)
             if name_score >= 40:
                 # Build display strings for THIS matched person (not the searcher)
@@ -13,12 +13,67 @@ from app.repositories.person.person_relationship_repository import (
 )
 from app.repositories.person.person_repository import PersonRepository
 from app.schemas.person import PersonRelationshipCreate, PersonRelationshipUpdate
-from app.utils.cache import invalidate_discovery_cache
+from app.services.graph_traversal import refresh_adjacency_index
+from app.services.lineage_path.lineage_path_cache import (
+    invalidate_lineage_path_cache,
+)
+from app.services.person.discovery_suggestion_service import (
+    enqueue_discovery_refresh,
+    invalidate_discovery_suggestions,
+)
+from app.utils.cache import invalidate_person_cache
 from app.utils.relationship_helper import RelationshipTypeHelper
 
 logger = logging.getLogger(__name__)
 
 
+def invalidate_relationship_state(
+    session: Session, person_ids: list[uuid.UUID]
+) -> list[uuid.UUID]:
+    """
+    Delete stored data derived from the persons' relationships.
+
+    Must be called before the relationship write is committed, so the
+    deletion is part of the same transaction.
+
+    Args:
+        session: Database session
+        person_ids: Persons whose relationships changed
+
+    Returns:
+        Persons whose discovery suggestions need a refresh after the commit
+    """
+    return invalidate_discovery_suggestions(session, person_ids)
+
+
+def sync_relationship_caches(
+    session: Session, person_ids: list[uuid.UUID], refresh_ids: list[uuid.UUID]
+) -> None:
+    """
+    Bring in-memory indexes and caches in line with committed relationships.
+
+    Called after the relationship write is committed. Errors are logged and
+    not raised, since the write itself has succeeded; the caches then catch
+    up when their TTLs expire.
+
+    Args:
+        session: Database session
+        person_ids: Persons whose relationships changed
+        refresh_ids: Persons returned by invalidate_relationship_state
+    """
+    try:
+        invalidate_lineage_path_cache(person_ids)
+        invalidate_person_cache(person_ids)
+        enqueue_discovery_refresh(refresh_ids)
+        refresh_adjacency_index(session, person_ids)
+    except Exception as e:
+        logger.error(
+            f"Error syncing caches after relationship change: {e}", exc_info=True
+        )
+        # Keep the session usable for the rest of the request
+        session.rollback()
+
+
 class PersonRelationshipService:
     """Service for person relationship business logic."""
 
@@ -59,6 +114,7 @@ class PersonRelationshipService:
         Raises:
             Exception: If the relationship creation fails (transaction will be rolled back)
         """
+        person_ids = [person_id, relationship_create.related_person_id]
         try:
             # Start transaction
             logger.info(
@@ -102,57 +158,51 @@ class PersonRelationshipService:
                     f"related_person.gender_id={related_person.gender_id}. "
                     f"Creating primary relationship only."
                 )
+                refresh_ids = invalidate_relationship_state(self.session, person_ids)
                 self.session.commit()
-                return primary_relationship
-
-            # Get gender mapping
-            gender_mapping = RelationshipTypeHelper.get_gender_mapping(self.session)
-
-            # Determine inverse relationship type using RelationshipTypeHelper
-            inverse_type = RelationshipTypeHelper.get_inverse_type(
-                relationship_type=relationship_create.relationship_type,
-                person_gender_id=person.gender_id,
-                related_person_gender_id=related_person.gender_id,
-                gender_mapping=gender_mapping,
-            )
-
-            # Create inverse relationship if type was determined
-            if inverse_type:
-                inverse_relationship = PersonRelationship(
-                    person_id=relationship_create.related_person_id,
-                    related_person_id=person_id,
-                    relationship_type=inverse_type,
-                    is_active=relationship_create.is_active,
-                    start_date=relationship_create.start_date,
-                    end_date=relationship_create.end_date,
-                )
-                inverse_relationship = self.relationship_repo.create(
-                    inverse_relationship
-                )
-                logger.info(
-                    f"Created inverse relationship with ID: {inverse_relationship.id}, "
-                    f"type: {inverse_type}"
-                )
             else:
-                logger.warning(
-                    f"Could not determine inverse relationship type for "
-                    f"relationship {primary_relationship.id} "
-                    f"(type={relationship_create.relationship_type}). "
-                    f"Creating primary relationship only."
+                # Get gender mapping
+                gender_mapping = RelationshipTypeHelper.get_gender_mapping(self.session)
+
+                # Determine inverse relationship type using RelationshipTypeHelper
+                inverse_type = RelationshipTypeHelper.get_inverse_type(
+                    relationship_type=relationship_create.relationship_type,
+                    person_gender_id=person.gender_id,
+                    related_person_gender_id=related_person.gender_id,
+                    gender_mapping=gender_mapping,
                 )
 
-            # Commit transaction
-            self.session.commit()
-            logger.info("Successfully committed bidirectional relationship creation")
-
-            # Invalidate discovery cache for both persons
-            # Get user IDs for both persons to invalidate their caches
-            if person.user_id:
-                invalidate_discovery_cache(person.user_id)
-            if related_person.user_id:
-                invalidate_discovery_cache(related_person.user_id)
+                # Create inverse relationship if type was determined
+                if inverse_type:
+                    inverse_relationship = PersonRelationship(
+                        person_id=relationship_create.related_person_id,
+                        related_person_id=person_id,
+                        relationship_type=inverse_type,
+                        is_active=relationship_create.is_active,
+                        start_date=relationship_create.start_date,
+                        end_date=relationship_create.end_date,
+                    )
+                    inverse_relationship = self.relationship_repo.create(
+                        inverse_relationship
+                    )
+                    logger.info(
+                        f"Created inverse relationship with ID: {inverse_relationship.id}, "
+                        f"type: {inverse_type}"
+                    )
+                else:
+                    logger.warning(
+                        f"Could not determine inverse relationship type for "
+                        f"relationship {primary_relationship.id} "
+                        f"(type={relationship_create.relationship_type}). "
+                        f"Creating primary relationship only."
+                    )
 
-            return primary_relationship
+                # Commit transaction
+                refresh_ids = invalidate_relationship_state(self.session, person_ids)
+                self.session.commit()
+                logger.info(
+                    "Successfully committed bidirectional relationship creation"
+                )
 
         except Exception as e:
             # Rollback transaction on any error
@@ -160,6 +210,11 @@ class PersonRelationshipService:
             self.session.rollback()
             raise
 
+        # Keep graph indexes and caches in sync for both persons
+        sync_relationship_caches(self.session, person_ids, refresh_ids)
+
+        return primary_relationship
+
     def update_relationship(
         self,
         relationship: PersonRelationship,
@@ -182,6 +237,7 @@ class PersonRelationshipService:
         Raises:
             Exception: If the update fails (transaction will be rolled back)
         """
+        person_ids = [relationship.person_id, relationship.related_person_id]
         try:
             logger.info(
                 f"Updating relationship: id={relationship.id}, "
@@ -235,27 +291,21 @@ class PersonRelationshipService:
                 )
 
             # Commit transaction
+            refresh_ids = invalidate_relationship_state(self.session, person_ids)
             self.session.commit()
             logger.info("Successfully committed bidirectional relationship update")
 
-            # Invalidate discovery cache for both persons
-            # Fetch person records to get user IDs
-            person = self.person_repo.get_by_id(relationship.person_id)
-            related_person = self.person_repo.get_by_id(relationship.related_person_id)
-
-            if person and person.user_id:
-                invalidate_discovery_cache(person.user_id)
-            if related_person and related_person.user_id:
-                invalidate_discovery_cache(related_person.user_id)
-
-            return updated_primary
-
         except Exception as e:
             # Rollback transaction on any error
             logger.error(f"Error updating relationship: {e}", exc_info=True)
             self.session.rollback()
             raise
 
+        # Keep graph indexes and caches in sync for both persons
+        sync_relationship_caches(self.session, person_ids, refresh_ids)
+
+        return updated_primary
+
     def delete_relationship(
         self, relationship: PersonRelationship, soft_delete: bool = False
     ) -> None:
@@ -273,6 +323,7 @@ class PersonRelationshipService:
         Raises:
             Exception: If the deletion fails (transaction will be rolled back)
         """
+        person_ids = [relationship.person_id, relationship.related_person_id]
         try:
             logger.info(
                 f"Deleting relationship: id={relationship.id}, "
@@ -343,25 +394,19 @@ class PersonRelationshipService:
                     )
 
             # Commit transaction
+            refresh_ids = invalidate_relationship_state(self.session, person_ids)
             self.session.commit()
             logger.info("Successfully committed bidirectional relationship deletion")
 
-            # Invalidate discovery cache for both persons
-            # Fetch person records to get user IDs
-            person = self.person_repo.get_by_id(relationship.person_id)
-            related_person = self.person_repo.get_by_id(relationship.related_person_id)
-
-            if person and person.user_id:
-                invalidate_discovery_cache(person.user_id)
-            if related_person and related_person.user_id:
-                invalidate_discovery_cache(related_person.user_id)
-
         except Exception as e:
             # Rollback transaction on any error
             logger.error(f"Error deleting relationship: {e}", exc_info=True)
             self.session.rollback()
             raise
 
+        # Keep graph indexes and caches in sync for both persons
+        sync_relationship_caches(self.session, person_ids, refresh_ids)
+
     def get_parents(self, person_id: uuid.UUID) -> list[PersonRelationship]:
         """Get all parents (father and mother) for a person."""
         parent_types = [RelationshipType.FATHER, RelationshipType.MOTHER]
@@ -8,17 +8,11 @@ from sqlmodel import Session
 
 from app.db_models.person.person_religion import PersonReligion
 from app.repositories.person.person_religion_repository import PersonReligionRepository
-from app.repositories.religion.religion_category_repository import (
-    ReligionCategoryRepository,
-)
-from app.repositories.religion.religion_repository import ReligionRepository
-from app.repositories.religion.religion_sub_category_repository import (
-    ReligionSubCategoryRepository,
-)
 from app.schemas.person.person_religion import (
     PersonReligionCreate,
     PersonReligionUpdate,
 )
+from app.services.religion.religion_taxonomy import get_religion_taxonomy
 
 logger = logging.getLogger(__name__)
 
@@ -65,33 +59,11 @@ class PersonReligionService:
             logger.debug(f"No religion found for person {person_id}")
             return None
 
-        # Initialize repositories for religion lookups
-        religion_repo = ReligionRepository(self.session)
-        category_repo = ReligionCategoryRepository(self.session)
-        sub_category_repo = ReligionSubCategoryRepository(self.session)
-
-        # Build religion string from available parts
-        parts = []
-
-        # Get religion name
-        religion = religion_repo.get_by_id(person_religion.religion_id)
-        if religion:
-            parts.append(religion.name)
-
-        # Get category name
-        if person_religion.religion_category_id:
-            category = category_repo.get_by_id(person_religion.religion_category_id)
-            if category:
-                parts.append(category.name)
-
-        # Get sub-category name
-        if person_religion.religion_sub_category_id:
-            sub_category = sub_category_repo.get_by_id(
-                person_religion.religion_sub_category_id
-            )
-            if sub_category:
-                parts.append(sub_category.name)
-
-        formatted = " - ".join(parts) if parts else None
+        # Resolve names from the cached religion taxonomy (no queries)
+        formatted = get_religion_taxonomy(self.session).format_religion(
+            person_religion.religion_id,
+            person_religion.religion_category_id,
+            person_religion.religion_sub_category_id,
+        )
         logger.debug(f"Formatted religion for person {person_id}: {formatted}")
         return formatted
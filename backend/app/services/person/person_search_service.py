@@ -1,12 +1,19 @@
 """Person search service for global person search functionality."""
 
+import base64
+import hashlib
+import json
 import logging
 import uuid
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass
+from typing import Any
 
-from rapidfuzz import fuzz
-from sqlalchemy import extract
+from sqlalchemy import ColumnElement, Row, extract, func, literal, tuple_
 from sqlmodel import Session, col, select
+from sqlmodel.sql.expression import Select
 
+from app.core.config import settings
 from app.db_models.person.person import Person
 from app.db_models.person.person_address import PersonAddress
 from app.db_models.person.person_religion import PersonReligion
@@ -15,15 +22,115 @@ from app.schemas.person.person_search import (
     PersonSearchResponse,
     PersonSearchResult,
 )
+from app.services.person.name_match_scorer import NameMatchScorer
+from app.services.person.name_trigram_search import (
+    is_trigram_search_enabled,
+    prerank_name_candidates,
+)
+from app.utils.cache import get_cache_manager
 
 logger = logging.getLogger(__name__)
 
+# Person columns needed to build a PersonSearchResult
+RESULT_COLUMNS = (
+    Person.id,
+    Person.first_name,
+    Person.middle_name,
+    Person.last_name,
+    Person.date_of_birth,
+    Person.gender_id,
+    Person.profile_image_key,
+)
+
+# Sort order of searches without name filters, also used as the keyset
+SORT_KEY = (
+    func.lower(Person.last_name),
+    func.lower(Person.first_name),
+    col(Person.id),
+)
+SORT_KEY_COLUMNS = (
+    SORT_KEY[0].label("last_name_key"),
+    SORT_KEY[1].label("first_name_key"),
+)
+
+SNAPSHOT_KEY_PREFIX = "person_search:snapshot"
+
+
+@dataclass
+class SearchCursor:
+    """Position in a paginated search, encoded as an opaque string."""
+
+    total: int
+    offset: int
+    # (lower(last_name), lower(first_name), id) of the last row returned
+    sort_key: tuple[str, str, str] | None = None
+    # Ranked fuzzy matches cached for the following pages
+    snapshot_id: str | None = None
+
+
+def _filters_fingerprint(request: PersonSearchFilterRequest) -> str:
+    """Hash of the search filters, excluding pagination fields."""
+    filters = request.model_dump(
+        mode="json", exclude={"skip", "limit", "cursor", "use_cursor"}
+    )
+    data = json.dumps(filters, sort_keys=True).encode()
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def encode_search_cursor(
+    request: PersonSearchFilterRequest, cursor: SearchCursor
+) -> str:
+    """Encode a cursor for the given search as an opaque URL-safe string."""
+    data = {"f": _filters_fingerprint(request), **asdict(cursor)}
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).decode()
+
+
+def decode_search_cursor(request: PersonSearchFilterRequest) -> SearchCursor:
+    """Decode request.cursor.
+
+    Args:
+        request: Search request carrying the cursor
+
+    Returns:
+        Decoded SearchCursor
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for other filters
+    """
+    try:
+        data = json.loads(base64.urlsafe_b64decode(request.cursor or ""))
+        fingerprint = data.pop("f")
+        sort_key = data.pop("sort_key")
+        if sort_key is not None:
+            last_name_key, first_name_key, person_id = sort_key
+            sort_key = (str(last_name_key), str(first_name_key), str(person_id))
+            uuid.UUID(person_id)
+        cursor = SearchCursor(**data, sort_key=sort_key)
+        if not isinstance(cursor.total, int) or not isinstance(cursor.offset, int):
+            raise TypeError("total and offset must be integers")
+        if cursor.offset < 0:
+            raise ValueError("offset must not be negative")
+    except (ValueError, TypeError, KeyError, AttributeError) as e:
+        raise ValueError("Invalid search cursor") from e
+
+    if fingerprint != _filters_fingerprint(request):
+        raise ValueError("Search cursor does not match the search filters")
+    return cursor
+
+
+def _snapshot_key(snapshot_id: str) -> str:
+    """Cache key of a ranked fuzzy search snapshot."""
+    return f"{SNAPSHOT_KEY_PREFIX}:{snapshot_id}"
+
 
 class PersonSearchService:
     """Service for global person search with filters and pagination."""
 
     # Name matching threshold (40% as per existing PersonMatchingService)
     NAME_MATCH_THRESHOLD = 40.0
+    FIRST_NAME_WEIGHT = 0.6
+    LAST_NAME_WEIGHT = 0.4
+    name_scorer = NameMatchScorer(FIRST_NAME_WEIGHT, LAST_NAME_WEIGHT)
 
     def __init__(self, session: Session):
         """Initialize the person search service.
@@ -42,8 +149,7 @@ class PersonSearchService:
     ) -> float:
         """Calculate fuzzy match score for names (0-100).
 
-        Uses rapidfuzz to calculate similarity between names.
-        Weighted average: 40% first name, 60% last name.
+        Weighted average: 60% first name, 40% last name.
 
         Args:
             search_first: First name from search criteria
@@ -54,189 +160,98 @@ class PersonSearchService:
         Returns:
             Match score from 0-100, rounded to 2 decimal places
         """
-        # Normalize names (lowercase, strip whitespace)
-        search_first = search_first.lower().strip()
-        search_last = search_last.lower().strip()
-        person_first = person_first.lower().strip()
-        person_last = person_last.lower().strip()
-
-        # Calculate individual scores using rapidfuzz
-        first_name_score = fuzz.ratio(search_first, person_first)
-        last_name_score = fuzz.ratio(search_last, person_last)
-
-        # Weighted average (last name more important)
-        match_score = (first_name_score * 0.6) + (last_name_score * 0.4)
-
-        return round(match_score, 2)
+        return self.name_scorer.score(
+            search_first, search_last, person_first, person_last
+        )
 
-    def _find_persons_by_address(
-        self,
-        country_id: uuid.UUID,
-        state_id: uuid.UUID,
-        district_id: uuid.UUID,
-        sub_district_id: uuid.UUID,
-        locality_id: uuid.UUID | None = None,
-    ) -> list[uuid.UUID]:
-        """Find persons with matching address criteria.
+    def _address_filter(
+        self, request: PersonSearchFilterRequest
+    ) -> ColumnElement[bool]:
+        """Build the address predicate for the search query.
 
         Required criteria (country, state, district, sub_district) must match exactly.
-        Optional criteria (locality) is only applied if provided.
+        Optional criteria (locality) is only applied if provided. The predicate is
+        an EXISTS semi-join, so persons with several matching addresses are
+        returned once.
 
         Args:
-            country_id: Country ID (required)
-            state_id: State ID (required)
-            district_id: District ID (required)
-            sub_district_id: Sub-district ID (required)
-            locality_id: Locality ID (optional, None = match any)
+            request: Search filter request with the address criteria
 
         Returns:
-            List of person IDs matching the address criteria
+            EXISTS clause correlated with the outer Person query
         """
-        logger.debug(
-            f"Querying person_address: country={country_id}, state={state_id}, "
-            f"district={district_id}, sub_district={sub_district_id}, locality={locality_id}"
-        )
-
-        # Start with required criteria
-        statement = select(PersonAddress.person_id).where(
-            PersonAddress.country_id == country_id,
-            PersonAddress.state_id == state_id,
-            PersonAddress.district_id == district_id,
-            PersonAddress.sub_district_id == sub_district_id,
+        statement = select(PersonAddress.id).where(
+            PersonAddress.person_id == Person.id,
+            PersonAddress.country_id == request.country_id,
+            PersonAddress.state_id == request.state_id,
+            PersonAddress.district_id == request.district_id,
+            PersonAddress.sub_district_id == request.sub_district_id,
         )
 
         # Only apply locality filter if value is provided
-        if locality_id is not None:
-            statement = statement.where(PersonAddress.locality_id == locality_id)
-            logger.debug(f"Applying locality filter: {locality_id}")
+        if request.locality_id is not None:
+            statement = statement.where(
+                PersonAddress.locality_id == request.locality_id
+            )
+            logger.debug(f"Applying locality filter: {request.locality_id}")
         else:
             logger.debug("Skipping locality filter (not provided)")
 
-        # Execute query and return list of person IDs
-        results = self.session.exec(statement).all()
-        logger.debug(f"Address query returned {len(results)} person IDs")
-        return list(results)
+        return statement.exists()
 
-    def _find_persons_by_religion(
-        self,
-        religion_id: uuid.UUID,
-        religion_category_id: uuid.UUID,
-        religion_sub_category_id: uuid.UUID | None = None,
-    ) -> list[uuid.UUID]:
-        """Find persons with matching religion criteria.
+    def _religion_filter(
+        self, request: PersonSearchFilterRequest
+    ) -> ColumnElement[bool]:
+        """Build the religion predicate for the search query.
 
         Required criteria (religion, category) must match exactly.
         Optional criteria (sub_category) is only applied if provided.
 
         Args:
-            religion_id: Religion ID (required)
-            religion_category_id: Religion category ID (required)
-            religion_sub_category_id: Religion sub-category ID (optional, None = match any)
+            request: Search filter request with the religion criteria
 
         Returns:
-            List of person IDs matching the religion criteria
+            EXISTS clause correlated with the outer Person query
         """
-        logger.debug(
-            f"Querying person_religion: religion={religion_id}, "
-            f"category={religion_category_id}, sub_category={religion_sub_category_id}"
-        )
-
-        # Start with required criteria
-        statement = select(PersonReligion.person_id).where(
-            PersonReligion.religion_id == religion_id,
-            PersonReligion.religion_category_id == religion_category_id,
+        statement = select(PersonReligion.id).where(
+            PersonReligion.person_id == Person.id,
+            PersonReligion.religion_id == request.religion_id,
+            PersonReligion.religion_category_id == request.religion_category_id,
         )
 
         # Only apply sub_category filter if value is provided
-        if religion_sub_category_id is not None:
+        if request.religion_sub_category_id is not None:
             statement = statement.where(
-                PersonReligion.religion_sub_category_id == religion_sub_category_id
+                PersonReligion.religion_sub_category_id
+                == request.religion_sub_category_id
             )
             logger.debug(
-                f"Applying religion_sub_category filter: {religion_sub_category_id}"
+                "Applying religion_sub_category filter: "
+                f"{request.religion_sub_category_id}"
             )
         else:
             logger.debug("Skipping religion_sub_category filter (not provided)")
 
-        # Execute query and return list of person IDs
-        results = self.session.exec(statement).all()
-        logger.debug(f"Religion query returned {len(results)} person IDs")
-        return list(results)
+        return statement.exists()
 
-    def search_persons(
-        self,
-        request: PersonSearchFilterRequest,
-    ) -> PersonSearchResponse:
-        """Search for persons with filters and pagination.
+    def _build_search_query(
+        self, request: PersonSearchFilterRequest, *columns: Any
+    ) -> Select[Any]:
+        """Build one query that applies every search filter in the database.
 
-        Steps:
-        1. Find persons by address (required filters)
-        2. Find persons by religion (required filters)
-        3. Compute intersection
-        4. Apply optional gender filter
-        5. Apply optional birth year range filter
-        6. Apply optional name fuzzy matching
-        7. Apply pagination
-        8. Return results with total count
+        Address and religion criteria are semi-joins on the Person row, so
+        matching person IDs never leave the database.
 
         Args:
-            request: Search filter request with all criteria and pagination
+            request: Search filter request with all criteria
+            *columns: Columns to select
 
         Returns:
-            PersonSearchResponse with paginated results and total count
+            Select statement over active persons matching all filters
         """
-        logger.info("Starting global person search")
-
-        # Step 1: Find persons by address
-        logger.debug(
-            f"Searching by address: country={request.country_id}, "
-            f"state={request.state_id}, district={request.district_id}, "
-            f"sub_district={request.sub_district_id}, locality={request.locality_id}"
-        )
-        address_person_ids = self._find_persons_by_address(
-            country_id=request.country_id,
-            state_id=request.state_id,
-            district_id=request.district_id,
-            sub_district_id=request.sub_district_id,
-            locality_id=request.locality_id,
-        )
-        logger.info(
-            f"Found {len(address_person_ids)} persons matching address criteria"
-        )
-
-        # Step 2: Find persons by religion
-        logger.debug(
-            f"Searching by religion: religion_id={request.religion_id}, "
-            f"category={request.religion_category_id}, "
-            f"sub_category={request.religion_sub_category_id}"
-        )
-        religion_person_ids = self._find_persons_by_religion(
-            religion_id=request.religion_id,
-            religion_category_id=request.religion_category_id,
-            religion_sub_category_id=request.religion_sub_category_id,
-        )
-        logger.info(
-            f"Found {len(religion_person_ids)} persons matching religion criteria"
-        )
-
-        # Step 3: Compute intersection of person IDs
-        matching_person_ids = set(address_person_ids) & set(religion_person_ids)
-        logger.info(
-            f"Found {len(matching_person_ids)} persons matching both address and religion"
-        )
-
-        if not matching_person_ids:
-            logger.info("No persons found matching both criteria, returning empty list")
-            return PersonSearchResponse(
-                results=[],
-                total=0,
-                skip=request.skip,
-                limit=request.limit,
-            )
-
-        # Step 4: Build query with optional filters and exclude inactive persons
-        query = select(Person).where(
-            col(Person.id).in_(matching_person_ids),
+        query: Select[Any] = Select(*columns).where(
+            self._address_filter(request),
+            self._religion_filter(request),
             Person.is_active == True,  # noqa: E712 - Exclude inactive persons from search
         )
 
@@ -247,7 +262,7 @@ class PersonSearchService:
         else:
             logger.debug("Skipping gender filter (not provided)")
 
-        # Step 5: Apply birth year range filter
+        # Apply birth year range filter
         if request.birth_year_from is not None:
             query = query.where(
                 extract("year", col(Person.date_of_birth)) >= request.birth_year_from
@@ -260,97 +275,335 @@ class PersonSearchService:
             )
             logger.debug(f"Applying birth_year_to filter: {request.birth_year_to}")
 
-        # Execute query to get all matching persons
-        persons = self.session.exec(query).all()
-        logger.info(f"After demographic filters: {len(persons)} persons remain")
+        return query
+
+    def search_persons(
+        self,
+        request: PersonSearchFilterRequest,
+    ) -> PersonSearchResponse:
+        """Search for persons with filters and pagination.
+
+        Address, religion, gender, birth year and active filters run as a
+        single query. Without name filters the database also sorts and
+        paginates, and COUNT(*) OVER() returns the total with the page. With
+        name filters the matching rows are scored with fuzzy matching, then
+        sorted and paginated in Python.
+
+        Pages are selected with skip/limit, or with cursors when use_cursor
+        is set or a cursor is passed. Cursor pages without name filters seek
+        on (lower(last_name), lower(first_name), id) instead of skipping
+        rows. Cursor pages with name filters are sliced from a short-lived
+        snapshot of the ranked matches.
+
+        Args:
+            request: Search filter request with all criteria and pagination
+
+        Returns:
+            PersonSearchResponse with paginated results and total count
+
+        Raises:
+            ValueError: If the cursor is malformed or from another search
+        """
+        logger.info("Starting global person search")
+        logger.debug(
+            f"Search filters: country={request.country_id}, "
+            f"state={request.state_id}, district={request.district_id}, "
+            f"sub_district={request.sub_district_id}, locality={request.locality_id}, "
+            f"religion_id={request.religion_id}, "
+            f"category={request.religion_category_id}, "
+            f"sub_category={request.religion_sub_category_id}"
+        )
+
+        cursor = decode_search_cursor(request) if request.cursor else None
+        use_cursor = request.use_cursor or cursor is not None
 
-        # Step 6: Apply name fuzzy matching if name filters provided
         has_name_filter = (
             request.first_name is not None or request.last_name is not None
         )
 
-        if has_name_filter:
-            # Apply name matching with threshold
-            search_first = request.first_name or ""
-            search_last = request.last_name or ""
-
-            scored_persons = []
-            for person in persons:
-                name_score = self.calculate_name_match_score(
-                    search_first,
-                    search_last,
-                    person.first_name,
-                    person.last_name,
-                )
+        if has_name_filter and use_cursor:
+            response = self._search_name_snapshot_page(request, cursor)
+        elif has_name_filter:
+            response = self._search_with_name_filter(request)
+        elif cursor is not None:
+            response = self._search_after_cursor(request, cursor)
+        else:
+            response = self._search_without_name_filter(request, use_cursor)
+
+        logger.info(
+            f"Returning {len(response.results)} results (skip={response.skip}, "
+            f"limit={request.limit}, total={response.total})"
+        )
 
-                # Filter by minimum score threshold (40%)
-                if name_score >= self.NAME_MATCH_THRESHOLD:
-                    scored_persons.append((person, name_score))
+        return response
 
-            logger.info(
-                f"After name matching (threshold {self.NAME_MATCH_THRESHOLD}%): "
-                f"{len(scored_persons)} matches found"
+    def _fetch_name_candidates(
+        self, request: PersonSearchFilterRequest
+    ) -> Sequence[Row[Any]]:
+        """Fetch the filtered persons to be scored by name.
+
+        Args:
+            request: Search filter request with at least one name filter
+
+        Returns:
+            Rows of RESULT_COLUMNS
+        """
+        query = self._build_search_query(request, *RESULT_COLUMNS)
+        if is_trigram_search_enabled(self.session):
+            query = prerank_name_candidates(
+                self.session,
+                query,
+                request.first_name or "",
+                request.last_name or "",
+                first_name_weight=self.FIRST_NAME_WEIGHT,
+                last_name_weight=self.LAST_NAME_WEIGHT,
             )
 
-            # Sort by name match score descending
-            scored_persons.sort(key=lambda x: x[1], reverse=True)
-
-            # Get total count before pagination
-            total = len(scored_persons)
-
-            # Apply pagination
-            paginated = scored_persons[request.skip : request.skip + request.limit]
-
-            # Build results with name_match_score
-            results = [
-                PersonSearchResult(
-                    person_id=person.id,
-                    first_name=person.first_name,
-                    middle_name=person.middle_name,
-                    last_name=person.last_name,
-                    date_of_birth=person.date_of_birth,
-                    gender_id=person.gender_id,
-                    name_match_score=score,
-                    profile_image_key=person.profile_image_key,
-                )
-                for person, score in paginated
-            ]
-        else:
-            # No name filter - return all matching persons sorted by last name
-            persons_list: list[Person] = list(persons)
-            persons_list.sort(key=lambda p: (p.last_name.lower(), p.first_name.lower()))
-
-            # Get total count before pagination
-            total = len(persons_list)
-
-            # Apply pagination
-            paginated_persons = persons_list[
-                request.skip : request.skip + request.limit
-            ]
-
-            # Build results without name_match_score
-            results = [
-                PersonSearchResult(
-                    person_id=person.id,
-                    first_name=person.first_name,
-                    middle_name=person.middle_name,
-                    last_name=person.last_name,
-                    date_of_birth=person.date_of_birth,
-                    gender_id=person.gender_id,
-                    name_match_score=None,
-                    profile_image_key=person.profile_image_key,
-                )
-                for person in paginated_persons
-            ]
+        rows = self.session.exec(query).all()
+        logger.info(f"After database filters: {len(rows)} persons remain")
+        return rows
+
+    def _rank_name_matches(
+        self,
+        request: PersonSearchFilterRequest,
+        rows: Sequence[Row[Any]],
+        skip: int = 0,
+        limit: int | None = None,
+    ) -> tuple[list[PersonSearchResult], int]:
+        """Score rows by name and return one page of matches.
 
+        Args:
+            request: Search filter request with at least one name filter
+            rows: Candidate rows of RESULT_COLUMNS
+            skip: Number of matches to skip
+            limit: Maximum number of matches to return (None = all)
+
+        Returns:
+            Tuple of (page of results with name_match_score, total matches)
+        """
+        page, total = self.name_scorer.rank(
+            request.first_name or "",
+            request.last_name or "",
+            [(row.first_name, row.last_name) for row in rows],
+            threshold=self.NAME_MATCH_THRESHOLD,
+            skip=skip,
+            limit=limit,
+        )
         logger.info(
-            f"Returning {len(results)} results (skip={request.skip}, "
-            f"limit={request.limit}, total={total})"
+            f"After name matching (threshold {self.NAME_MATCH_THRESHOLD}%): "
+            f"{total} matches found"
         )
 
+        results = [self._to_search_result(rows[index], score) for index, score in page]
+        return results, total
+
+    def _search_with_name_filter(
+        self, request: PersonSearchFilterRequest
+    ) -> PersonSearchResponse:
+        """Score all filtered persons by name and return one page.
+
+        Only the requested page of matches is fully sorted.
+
+        Args:
+            request: Search filter request with at least one name filter
+
+        Returns:
+            PersonSearchResponse with name_match_score on every result
+        """
+        rows = self._fetch_name_candidates(request)
+        results, total = self._rank_name_matches(
+            request, rows, skip=request.skip, limit=request.limit
+        )
+        return PersonSearchResponse(
+            results=results, total=total, skip=request.skip, limit=request.limit
+        )
+
+    def _search_name_snapshot_page(
+        self, request: PersonSearchFilterRequest, cursor: SearchCursor | None
+    ) -> PersonSearchResponse:
+        """Return a page of fuzzy matches from a ranked snapshot.
+
+        The first page ranks all matches and, if there are more pages, keeps
+        them in the cache for PERSON_SEARCH_SNAPSHOT_TTL_SECONDS. Later pages
+        only slice the snapshot. An expired snapshot is rebuilt.
+
+        Args:
+            request: Search filter request with at least one name filter
+            cursor: Decoded cursor, or None for the first page
+
+        Returns:
+            PersonSearchResponse with next_cursor if more matches remain
+        """
+        cache = get_cache_manager()
+        offset = cursor.offset if cursor is not None else request.skip
+
+        matches: list[PersonSearchResult] | None = None
+        if cursor is not None and cursor.snapshot_id is not None:
+            snapshot_id = cursor.snapshot_id
+            matches = cache.get(_snapshot_key(snapshot_id))
+            if matches is None:
+                logger.info(f"Search snapshot {snapshot_id} expired, rebuilding")
+
+        if matches is None:
+            snapshot_id = uuid.uuid4().hex
+            matches, _ = self._rank_name_matches(
+                request, self._fetch_name_candidates(request)
+            )
+            if offset + request.limit < len(matches):
+                cache.set(
+                    _snapshot_key(snapshot_id),
+                    matches,
+                    ttl_seconds=settings.PERSON_SEARCH_SNAPSHOT_TTL_SECONDS,
+                )
+
+        results = matches[offset : offset + request.limit]
+        next_offset = offset + len(results)
+        next_cursor = None
+        if results and next_offset < len(matches):
+            next_cursor = encode_search_cursor(
+                request,
+                SearchCursor(
+                    total=len(matches), offset=next_offset, snapshot_id=snapshot_id
+                ),
+            )
+
         return PersonSearchResponse(
             results=results,
+            total=len(matches),
+            skip=offset,
+            limit=request.limit,
+            next_cursor=next_cursor,
+        )
+
+    def _search_without_name_filter(
+        self, request: PersonSearchFilterRequest, use_cursor: bool = False
+    ) -> PersonSearchResponse:
+        """Fetch one page sorted by name, with the total, in a single query.
+
+        Args:
+            request: Search filter request without name filters
+            use_cursor: Whether to return a cursor for the next page
+
+        Returns:
+            PersonSearchResponse for the skip/limit page
+        """
+        query = (
+            self._build_search_query(
+                request,
+                *RESULT_COLUMNS,
+                *SORT_KEY_COLUMNS,
+                func.count().over().label("total"),
+            )
+            .order_by(*SORT_KEY)
+            .offset(request.skip)
+            .limit(request.limit)
+        )
+        rows = self.session.exec(query).all()
+
+        if rows:
+            total = rows[0].total
+        elif request.skip > 0:
+            # Page is past the end, so the window count is not available
+            (total,) = self.session.exec(
+                self._build_search_query(request, func.count())
+            ).one()
+        else:
+            total = 0
+
+        next_cursor = None
+        if use_cursor and rows and request.skip + len(rows) < total:
+            next_cursor = self._keyset_cursor(
+                request, rows[-1], total, request.skip + len(rows)
+            )
+
+        return PersonSearchResponse(
+            results=[self._to_search_result(row) for row in rows],
             total=total,
             skip=request.skip,
             limit=request.limit,
+            next_cursor=next_cursor,
+        )
+
+    def _search_after_cursor(
+        self, request: PersonSearchFilterRequest, cursor: SearchCursor
+    ) -> PersonSearchResponse:
+        """Fetch the page after a keyset cursor without skipping rows.
+
+        The total is carried in the cursor from the first page, so the page
+        query reads at most limit + 1 rows.
+
+        Args:
+            request: Search filter request without name filters
+            cursor: Decoded cursor holding the last row's sort key
+
+        Returns:
+            PersonSearchResponse with next_cursor if more rows remain
+
+        Raises:
+            ValueError: If the cursor does not hold a sort key
+        """
+        if cursor.sort_key is None:
+            raise ValueError("Invalid search cursor")
+
+        last_name_key, first_name_key, person_id = cursor.sort_key
+        query = (
+            self._build_search_query(request, *RESULT_COLUMNS, *SORT_KEY_COLUMNS)
+            .where(
+                tuple_(*SORT_KEY)
+                > tuple_(
+                    literal(last_name_key),
+                    literal(first_name_key),
+                    literal(uuid.UUID(person_id)),
+                )
+            )
+            .order_by(*SORT_KEY)
+            .limit(request.limit + 1)
+        )
+        rows = self.session.exec(query).all()
+
+        page = rows[: request.limit]
+        next_cursor = None
+        if len(rows) > request.limit:
+            next_cursor = self._keyset_cursor(
+                request, page[-1], cursor.total, cursor.offset + len(page)
+            )
+
+        return PersonSearchResponse(
+            results=[self._to_search_result(row) for row in page],
+            total=cursor.total,
+            skip=cursor.offset,
+            limit=request.limit,
+            next_cursor=next_cursor,
+        )
+
+    def _keyset_cursor(
+        self,
+        request: PersonSearchFilterRequest,
+        row: Row[Any],
+        total: int,
+        offset: int,
+    ) -> str:
+        """Encode a cursor positioned after the given row."""
+        return encode_search_cursor(
+            request,
+            SearchCursor(
+                total=total,
+                offset=offset,
+                sort_key=(row.last_name_key, row.first_name_key, str(row.id)),
+            ),
+        )
+
+    def _to_search_result(
+        self, row: Row[Any], name_match_score: float | None = None
+    ) -> PersonSearchResult:
+        """Build a search result from a row of RESULT_COLUMNS."""
+        return PersonSearchResult(
+            person_id=row.id,
+            first_name=row.first_name,
+            middle_name=row.middle_name,
+            last_name=row.last_name,
+            date_of_birth=row.date_of_birth,
+            gender_id=row.gender_id,
+            name_match_score=name_match_score,
+            profile_image_key=row.profile_image_key,
         )
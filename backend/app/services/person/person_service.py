@@ -3,35 +3,24 @@
 import logging
 import uuid
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal
 
 from sqlmodel import Session
 
 from app.db_models.person.person import Person
 from app.db_models.person.person_address import PersonAddress
 from app.enums import get_gender_by_id
-from app.repositories.address.country_repository import CountryRepository
-from app.repositories.address.district_repository import DistrictRepository
-from app.repositories.address.locality_repository import LocalityRepository
-from app.repositories.address.state_repository import StateRepository
-from app.repositories.address.sub_district_repository import SubDistrictRepository
 from app.repositories.person.person_address_repository import PersonAddressRepository
 from app.repositories.person.person_religion_repository import PersonReligionRepository
 from app.repositories.person.person_repository import PersonRepository
-from app.repositories.religion.religion_category_repository import (
-    ReligionCategoryRepository,
-)
-from app.repositories.religion.religion_repository import ReligionRepository
-from app.repositories.religion.religion_sub_category_repository import (
-    ReligionSubCategoryRepository,
-)
 from app.schemas.person import PersonCreate, PersonUpdate
 from app.schemas.person.person_complete_details import (
     PersonAddressDetails,
     PersonCompleteDetailsResponse,
     PersonReligionDetails,
 )
-from app.services.profile_view_tracking_service import ProfileViewTrackingService
+from app.services.address.address_gazetteer import get_address_gazetteer
+from app.services.religion.religion_taxonomy import get_religion_taxonomy
 
 logger = logging.getLogger(__name__)
 
@@ -122,43 +111,55 @@ class PersonService:
         logger.debug(f"User {user_id} has person: {has_person}")
         return has_person
 
-    def get_my_contributions(self, user_id: uuid.UUID) -> list[dict[str, Any]]:
+    def get_my_contributions(
+        self,
+        user_id: uuid.UUID,
+        sort_by: Literal["views", "created_at"] = "views",
+        skip: int = 0,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
         """
-        Get all persons created by the user with view statistics.
+        Get persons created by the user with view statistics.
 
         Returns list of dicts with person details, addresses, and view counts.
-        Sorted by view count descending (most viewed first).
+        Sorted by view count descending (most viewed first) or by creation
+        time descending (newest first). Sorting, view counts and pagination
+        are handled in the database, and all addresses are loaded in one query.
         """
         logger.info(f"Fetching contributions for user: {user_id}")
 
-        # Get all persons created by this user
-        persons = self.person_repo.get_by_creator(user_id)
+        # Get the requested page of persons created by this user with views
+        persons_with_views = self.person_repo.get_by_creator_with_views(
+            user_id, sort_by=sort_by, skip=skip, limit=limit
+        )
 
-        if not persons:
+        if not persons_with_views:
             logger.debug(f"No contributions found for user {user_id}")
             return []
 
-        logger.debug(f"Found {len(persons)} contributions for user {user_id}")
-
-        # Get person IDs for bulk operations
-        person_ids = [p.id for p in persons]
-
-        # Get view counts for all persons
-        view_tracking_service = ProfileViewTrackingService(self.person_repo.session)
-        view_counts = view_tracking_service.get_total_views_bulk(person_ids)
+        logger.debug(
+            f"Found {len(persons_with_views)} contributions for user {user_id}"
+        )
 
-        # Get addresses for all persons
+        # Get addresses with location names for all persons at once
         address_repo = PersonAddressRepository(self.person_repo.session)
+        address_rows = address_repo.get_by_person_ids_with_names(
+            [person.id for person, _ in persons_with_views]
+        )
+        addresses_by_person: dict[uuid.UUID, list[PersonAddress]] = {}
+        location_names: dict[uuid.UUID, str] = {}
+        for address, locality, district, state in address_rows:
+            addresses_by_person.setdefault(address.person_id, []).append(address)
+            location_names[address.id] = ", ".join(
+                name for name in (locality, district, state) if name
+            )
 
         # Build result list
         results = []
-        for person in persons:
-            # Get addresses for this person
-            addresses = address_repo.get_by_person_id(person.id)
-            address_str = self._format_addresses(addresses)
-
-            # Get view count (default to 0 if no views)
-            view_count = view_counts.get(person.id, 0)
+        for person, view_count in persons_with_views:
+            address_str = self._format_addresses(
+                addresses_by_person.get(person.id, []), location_names
+            )
 
             results.append(
                 {
@@ -176,33 +177,32 @@ class PersonService:
                 }
             )
 
-        # Sort by view count descending (total_views is always int)
-        # Type cast needed for mypy
-        from typing import cast
-
-        results.sort(
-            key=lambda x: cast(int, x.get("total_views", 0) or 0), reverse=True
-        )
-
         logger.info(
             f"Returning {len(results)} contributions for user {user_id}, "
-            f"sorted by view count"
+            f"sorted by {sort_by}"
         )
 
         return results
 
-    def _format_addresses(self, addresses: list[PersonAddress]) -> str:
-        """Format addresses as comma-separated string."""
+    def _format_addresses(
+        self,
+        addresses: list[PersonAddress],
+        location_names: dict[uuid.UUID, str] | None = None,
+    ) -> str:
+        """Format addresses as comma-separated string.
+
+        Uses each address's address_line, falling back to its locality,
+        district and state names from location_names (keyed by address ID).
+        """
         if not addresses:
             return ""
 
+        location_names = location_names or {}
         address_parts = []
         for addr in addresses:
-            # For now, use address_line if available
-            # In the future, this can be enhanced to join with location tables
-            # to get country, state, district, sub_district, locality names
-            if addr.address_line:
-                address_parts.append(addr.address_line)
+            address_part = addr.address_line or location_names.get(addr.id)
+            if address_part:
+                address_parts.append(address_part)
 
         return ", ".join(address_parts)
 
@@ -270,37 +270,15 @@ class PersonService:
             logger.debug(f"No current address found for person {person_id}")
             return None
 
-        # Initialize repositories for location lookups
-        country_repo = CountryRepository(self.person_repo.session)
-        state_repo = StateRepository(self.person_repo.session)
-        district_repo = DistrictRepository(self.person_repo.session)
-        sub_district_repo = SubDistrictRepository(self.person_repo.session)
-        locality_repo = LocalityRepository(self.person_repo.session)
-
-        # Resolve country name (required)
-        country = country_repo.get_by_id(current_address.country_id)
-        country_name = country.name if country else "Unknown"
-
-        # Resolve optional location names
-        state_name = None
-        if current_address.state_id:
-            state = state_repo.get_by_id(current_address.state_id)
-            state_name = state.name if state else None
-
-        district_name = None
-        if current_address.district_id:
-            district = district_repo.get_by_id(current_address.district_id)
-            district_name = district.name if district else None
-
-        sub_district_name = None
-        if current_address.sub_district_id:
-            sub_district = sub_district_repo.get_by_id(current_address.sub_district_id)
-            sub_district_name = sub_district.name if sub_district else None
-
-        locality_name = None
-        if current_address.locality_id:
-            locality = locality_repo.get_by_id(current_address.locality_id)
-            locality_name = locality.name if locality else None
+        # Resolve location names from the in-memory gazetteer (no queries)
+        names = get_address_gazetteer(self.person_repo.session).get_names(
+            current_address
+        )
+        country_name = names.country or "Unknown"
+        state_name = names.state
+        district_name = names.district
+        sub_district_name = names.sub_district
+        locality_name = names.locality
 
         logger.debug(
             f"Resolved address for person {person_id}: "
@@ -327,27 +305,15 @@ class PersonService:
             logger.debug(f"No religion found for person {person_id}")
             return None
 
-        # Initialize repositories for religion lookups
-        religion_master_repo = ReligionRepository(self.person_repo.session)
-        category_repo = ReligionCategoryRepository(self.person_repo.session)
-        sub_category_repo = ReligionSubCategoryRepository(self.person_repo.session)
-
-        # Resolve religion name (required)
-        religion = religion_master_repo.get_by_id(person_religion.religion_id)
-        religion_name = religion.name if religion else "Unknown"
-
-        # Resolve optional category and sub-category names
-        category_name = None
-        if person_religion.religion_category_id:
-            category = category_repo.get_by_id(person_religion.religion_category_id)
-            category_name = category.name if category else None
-
-        sub_category_name = None
-        if person_religion.religion_sub_category_id:
-            sub_category = sub_category_repo.get_by_id(
-                person_religion.religion_sub_category_id
-            )
-            sub_category_name = sub_category.name if sub_category else None
+        # Resolve names from the cached religion taxonomy (no queries)
+        names = get_religion_taxonomy(self.person_repo.session).get_names(
+            person_religion.religion_id,
+            person_religion.religion_category_id,
+            person_religion.religion_sub_category_id,
+        )
+        religion_name = names.religion or "Unknown"
+        category_name = names.category
+        sub_category_name = names.sub_category
 
         logger.debug(
             f"Resolved religion for person {person_id}: "
@@ -1,18 +1,35 @@
-"""Service for profile view tracking business logic."""
+"""Service for profile view tracking business logic.
+
+When PROFILE_VIEW_BUFFER_ENABLED is set, record_view only adds the view to an
+in-process ProfileViewBuffer. The buffer coalesces views per viewer-viewed
+pair and writes them with one INSERT ... ON CONFLICT DO UPDATE batch every
+PROFILE_VIEW_FLUSH_INTERVAL_SECONDS, when PROFILE_VIEW_FLUSH_MAX_PAIRS pairs
+are buffered, and on shutdown. View totals include buffered views.
+
+roll_up_views compacts old non-aggregated records into one aggregated record
+per viewed person and month. It runs from python -m app.rollup_profile_views
+and, when PROFILE_VIEW_ROLLUP_INTERVAL_SECONDS is set, from a background
+ProfileViewRollupScheduler.
+"""
 
 import logging
+import threading
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 
+from sqlalchemy import Engine
 from sqlmodel import Session
 
-from app.db_models.profile_view_tracking import ProfileViewTracking
+from app.core.config import settings
 from app.repositories.profile_view_tracking_repository import (
     ProfileViewTrackingRepository,
 )
 
 logger = logging.getLogger(__name__)
 
+# Non-aggregated records rolled up per transaction
+ROLLUP_BATCH_SIZE = 5000
+
 
 class ProfileViewTrackingService:
     """Service for profile view tracking business logic."""
@@ -29,8 +46,10 @@ class ProfileViewTrackingService:
         """
         Record a profile view event.
 
-        If a non-aggregated record exists for this viewer-viewed pair,
-        increment the count. Otherwise, create a new record.
+        The view is added to the non-aggregated record of the viewer-viewed
+        pair with INSERT ... ON CONFLICT DO UPDATE, so concurrent views of a
+        pair neither conflict nor lose counts. While the profile view buffer
+        is running, the view is buffered instead.
 
         Args:
             viewer_person_id: UUID of the person viewing the profile
@@ -42,37 +61,20 @@ class ProfileViewTrackingService:
                 logger.debug(f"Skipping self-view for person {viewer_person_id}")
                 return
 
-            # Check for existing non-aggregated record
-            existing = self.repo.get_non_aggregated_view(
-                viewer_person_id,
-                viewed_person_id,
-            )
+            if _buffer is not None:
+                _buffer.add(viewer_person_id, viewed_person_id)
+                return
 
-            if existing:
-                # Increment existing record
-                existing.view_count += 1
-                existing.last_viewed_at = datetime.utcnow()
-                existing.updated_at = datetime.utcnow()
-                self.repo.update(existing)
-                logger.info(
-                    f"Incremented view count to {existing.view_count} "
-                    f"for person {viewed_person_id} by {viewer_person_id}"
-                )
-            else:
-                # Create new record
-                view_record = ProfileViewTracking(
-                    viewer_person_id=viewer_person_id,
-                    viewed_person_id=viewed_person_id,
-                    view_count=1,
-                    is_aggregated=False,
-                )
-                self.repo.create(view_record)
-                logger.info(
-                    f"Created new view record for person {viewed_person_id} "
-                    f"by {viewer_person_id}"
-                )
+            self.repo.increment_views(
+                [(viewer_person_id, viewed_person_id, 1, datetime.utcnow())]
+            )
+            logger.info(
+                f"Recorded view of person {viewed_person_id} by {viewer_person_id}"
+            )
 
         except Exception as e:
+            # Keep the session usable for the rest of the request
+            self.session.rollback()
             # Log error but don't fail the request
             logger.error(
                 f"Error recording profile view: {e}",
@@ -87,9 +89,12 @@ class ProfileViewTrackingService:
             person_id: UUID of the person to get view count for
 
         Returns:
-            Total view count (sum of all view_count values)
+            Total view count (sum of all view_count values and buffered views)
         """
-        return self.repo.get_total_views_for_person(person_id)
+        total = self.repo.get_total_views_for_person(person_id)
+        if _buffer is not None:
+            total += _buffer.pending_views(person_id)
+        return total
 
     def get_total_views_bulk(
         self,
@@ -106,4 +111,345 @@ class ProfileViewTrackingService:
         """
         if not person_ids:
             return {}
-        return self.repo.get_total_views_for_persons(person_ids)
+        totals = self.repo.get_total_views_for_persons(person_ids)
+        if _buffer is not None:
+            for person_id in person_ids:
+                pending = _buffer.pending_views(person_id)
+                if pending:
+                    totals[person_id] = totals.get(person_id, 0) + pending
+        return totals
+
+    def roll_up_views(
+        self,
+        older_than_days: int | None = None,
+        batch_size: int = ROLLUP_BATCH_SIZE,
+    ) -> int:
+        """
+        Roll up old non-aggregated view records in batches.
+
+        Each batch moves view counts into monthly aggregated records of the
+        viewed persons in one transaction, so totals never change.
+
+        Args:
+            older_than_days: Roll up records last viewed more than this many
+                days ago (defaults to PROFILE_VIEW_ROLLUP_AGE_DAYS)
+            batch_size: Records rolled up per transaction
+
+        Returns:
+            Number of non-aggregated records rolled up
+
+        Raises:
+            ValueError: If batch_size is not positive
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        if older_than_days is None:
+            older_than_days = settings.PROFILE_VIEW_ROLLUP_AGE_DAYS
+        older_than = datetime.utcnow() - timedelta(days=older_than_days)
+
+        rolled_up = 0
+        while True:
+            batch_rolled_up = self.repo.roll_up_views(older_than, batch_size)
+            rolled_up += batch_rolled_up
+            if batch_rolled_up < batch_size:
+                break
+            logger.info(f"Rolled up {rolled_up} profile view records so far")
+
+        logger.info(
+            f"Rolled up {rolled_up} profile view records last viewed before "
+            f"{older_than}"
+        )
+        return rolled_up
+
+
+class ProfileViewBuffer:
+    """Write-behind buffer of profile views.
+
+    Views are coalesced per (viewer, viewed) pair under a short lock and
+    written by a background thread. Flushes swap the buffer out and write it
+    outside that lock, so recording and reading views never wait for the
+    database. Views of a failed flush are merged back and retried.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        flush_interval: float = 5.0,
+        max_pairs: int = 1000,
+    ):
+        """Initialize a stopped buffer.
+
+        Args:
+            engine: Engine flushes open their own sessions on
+            flush_interval: Seconds between periodic flushes
+            max_pairs: Buffered pairs that trigger an early flush
+        """
+        self._engine = engine
+        self._flush_interval = flush_interval
+        self._max_pairs = max_pairs
+        # Guards the buffers; held only to update or swap them
+        self._lock = threading.Lock()
+        # Serializes flushes, which hold it while writing to the database
+        self._flush_lock = threading.Lock()
+        self._pending: dict[tuple[uuid.UUID, uuid.UUID], tuple[int, datetime]] = {}
+        # Buffered and in-flight views per viewed person, read without locks
+        self._pending_by_viewed: dict[uuid.UUID, int] = {}
+        self._flushing_by_viewed: dict[uuid.UUID, int] = {}
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def pending_count(self) -> int:
+        """Number of buffered viewer-viewed pairs."""
+        with self._lock:
+            return len(self._pending)
+
+    def add(self, viewer_person_id: uuid.UUID, viewed_person_id: uuid.UUID) -> None:
+        """Buffer one profile view.
+
+        Args:
+            viewer_person_id: UUID of the person viewing the profile
+            viewed_person_id: UUID of the person whose profile is being viewed
+        """
+        key = (viewer_person_id, viewed_person_id)
+        now = datetime.utcnow()
+        with self._lock:
+            views, _ = self._pending.get(key, (0, now))
+            self._pending[key] = (views + 1, now)
+            self._pending_by_viewed[viewed_person_id] = (
+                self._pending_by_viewed.get(viewed_person_id, 0) + 1
+            )
+            full = len(self._pending) >= self._max_pairs
+        if full:
+            self._wakeup.set()
+
+    def pending_views(self, person_id: uuid.UUID) -> int:
+        """Get the views of a person that are not written to the database yet.
+
+        Takes no lock, so the result may be briefly off while a flush swaps
+        or finishes writing the buffer.
+
+        Args:
+            person_id: UUID of the viewed person
+
+        Returns:
+            Number of buffered and in-flight views
+        """
+        return self._pending_by_viewed.get(person_id, 0) + (
+            self._flushing_by_viewed.get(person_id, 0)
+        )
+
+    def flush(self) -> int:
+        """Write all buffered views in the calling thread.
+
+        Returns:
+            Number of viewer-viewed pairs written
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return 0
+                batch = self._pending
+                self._pending = {}
+                self._flushing_by_viewed = self._pending_by_viewed
+                self._pending_by_viewed = {}
+
+            increments = [
+                (viewer_person_id, viewed_person_id, views, last_viewed_at)
+                for (viewer_person_id, viewed_person_id), (
+                    views,
+                    last_viewed_at,
+                ) in batch.items()
+            ]
+            try:
+                with Session(self._engine) as session:
+                    ProfileViewTrackingRepository(session).increment_views(increments)
+            except Exception:
+                logger.exception(f"Failed to flush {len(batch)} buffered profile views")
+                self._merge_back(batch)
+                return 0
+            finally:
+                self._flushing_by_viewed = {}
+
+        logger.debug(f"Flushed {len(batch)} buffered profile view pairs")
+        return len(batch)
+
+    def start(self) -> None:
+        """Start the flush thread if it is not running."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="profile-view-buffer", daemon=True
+        )
+        self._thread.start()
+        logger.info("Profile view buffer started")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the flush thread and flush the remaining views.
+
+        Args:
+            timeout: Seconds to wait for the thread to finish
+        """
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.flush()
+        logger.info("Profile view buffer stopped")
+
+    def _merge_back(
+        self, batch: dict[tuple[uuid.UUID, uuid.UUID], tuple[int, datetime]]
+    ) -> None:
+        """Return the views of a failed flush to the buffer."""
+        with self._lock:
+            for key, (views, last_viewed_at) in batch.items():
+                pending_views, pending_last_viewed_at = self._pending.get(
+                    key, (0, last_viewed_at)
+                )
+                self._pending[key] = (
+                    pending_views + views,
+                    max(pending_last_viewed_at, last_viewed_at),
+                )
+                viewed_person_id = key[1]
+                self._pending_by_viewed[viewed_person_id] = (
+                    self._pending_by_viewed.get(viewed_person_id, 0) + views
+                )
+
+    def _run(self) -> None:
+        """Flush buffered views periodically until stopped."""
+        while not self._stopping.is_set():
+            self._wakeup.wait(self._flush_interval)
+            self._wakeup.clear()
+            if not self._stopping.is_set():
+                self.flush()
+
+
+class ProfileViewRollupScheduler:
+    """Background thread that rolls up old profile views periodically."""
+
+    def __init__(self, engine: Engine, interval: float):
+        """Initialize a stopped scheduler.
+
+        Args:
+            engine: Engine the roll-ups open their own sessions on
+            interval: Seconds between roll-ups
+        """
+        self._engine = engine
+        self._interval = interval
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def run_once(self) -> int:
+        """Roll up old profile views in the calling thread.
+
+        Returns:
+            Number of non-aggregated records rolled up
+        """
+        try:
+            with Session(self._engine) as session:
+                return ProfileViewTrackingService(session).roll_up_views()
+        except Exception:
+            logger.exception("Failed to roll up profile views")
+            return 0
+
+    def start(self) -> None:
+        """Start the scheduler thread if it is not running."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="profile-view-rollup", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Profile view roll-up scheduled every {self._interval}s")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the scheduler thread after its current roll-up.
+
+        Args:
+            timeout: Seconds to wait for the thread to finish
+        """
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        logger.info("Profile view roll-up scheduler stopped")
+
+    def _run(self) -> None:
+        """Roll up profile views every interval until stopped."""
+        while not self._stopping.wait(self._interval):
+            self.run_once()
+
+
+# Global buffer instance (None until started)
+_buffer: ProfileViewBuffer | None = None
+
+# Global roll-up scheduler instance (None until started)
+_rollup_scheduler: ProfileViewRollupScheduler | None = None
+
+
+def start_profile_view_buffer(engine: Engine) -> ProfileViewBuffer:
+    """
+    Start the global profile view buffer.
+
+    Args:
+        engine: Engine the buffer flushes with
+
+    Returns:
+        The running global buffer
+    """
+    global _buffer
+
+    if _buffer is None:
+        _buffer = ProfileViewBuffer(
+            engine,
+            flush_interval=settings.PROFILE_VIEW_FLUSH_INTERVAL_SECONDS,
+            max_pairs=settings.PROFILE_VIEW_FLUSH_MAX_PAIRS,
+        )
+    _buffer.start()
+    return _buffer
+
+
+def stop_profile_view_buffer() -> None:
+    """Stop the global profile view buffer, flushing the buffered views."""
+    global _buffer
+
+    if _buffer is not None:
+        buffer = _buffer
+        # Views recorded during the final flush are written directly
+        _buffer = None
+        buffer.stop()
+
+
+def start_profile_view_rollup_scheduler(
+    engine: Engine,
+) -> ProfileViewRollupScheduler:
+    """
+    Start the global profile view roll-up scheduler.
+
+    Args:
+        engine: Engine the roll-ups run on
+
+    Returns:
+        The running global scheduler
+    """
+    global _rollup_scheduler
+
+    if _rollup_scheduler is None:
+        _rollup_scheduler = ProfileViewRollupScheduler(
+            engine, interval=settings.PROFILE_VIEW_ROLLUP_INTERVAL_SECONDS
+        )
+    _rollup_scheduler.start()
+    return _rollup_scheduler
+
+
+def stop_profile_view_rollup_scheduler() -> None:
+    """Stop the global profile view roll-up scheduler if it is running."""
+    global _rollup_scheduler
+
+    if _rollup_scheduler is not None:
+        _rollup_scheduler.stop()
+        _rollup_scheduler = None
@@ -0,0 +1,256 @@
+"""In-process cache of serialized reference data responses."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.repositories.reference_data_version_repository import (
+    ReferenceDataVersionRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CachedReferenceResponse:
+    """Serialized JSON body of a reference data collection and its ETag."""
+
+    etag: str
+    body: bytes
+    # Pre-compressed body, kept for responses of REFERENCE_DATA_GZIP_MIN_BYTES
+    gzip_body: bytes | None = None
+
+    @property
+    def gzip_etag(self) -> str:
+        """ETag of the gzip-encoded representation."""
+        return f'{self.etag[:-1]}-gzip"'
+
+
+class ReferenceDataCache:
+    """
+    Serialized reference data responses keyed by collection and table versions.
+
+    Each collection declares the tables it is read from. Its cache key
+    includes the change counters of those tables (see ReferenceDataVersion),
+    so a write to any of them makes the next request miss and rebuild the
+    response; old entries are evicted in least-recently-used order.
+
+    The counters themselves are re-read at most every
+    REFERENCE_DATA_VERSION_CHECK_SECONDS, so hits within that interval do not
+    touch the database. Writes made through this process expire them at once.
+    """
+
+    def __init__(self, max_entries: int = 1000) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of cached responses
+        """
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._responses: OrderedDict[str, CachedReferenceResponse] = OrderedDict()
+        self._versions: dict[str, int] = {}
+        self._versions_checked_at: float | None = None
+
+    def get_versions(self, session: Session) -> dict[str, int]:
+        """
+        Get the table change counters, re-reading them if they are too old.
+
+        Args:
+            session: Database session used if the counters are re-read
+
+        Returns:
+            Dictionary mapping table name to change counter
+        """
+        now = time.monotonic()
+        with self._lock:
+            checked_at = self._versions_checked_at
+            if (
+                checked_at is not None
+                and now - checked_at < settings.REFERENCE_DATA_VERSION_CHECK_SECONDS
+            ):
+                return self._versions
+
+        versions = ReferenceDataVersionRepository(session).get_versions()
+        with self._lock:
+            self._versions = versions
+            self._versions_checked_at = now
+        return versions
+
+    def expire_versions(self) -> None:
+        """Re-read the table change counters on next use."""
+        with self._lock:
+            self._versions_checked_at = None
+
+    def get_response(
+        self,
+        session: Session,
+        collection: str,
+        tables: Sequence[str],
+        loader: Callable[[], Any],
+    ) -> CachedReferenceResponse:
+        """
+        Get the serialized response of a collection, building it on a miss.
+
+        Args:
+            session: Database session used to check the table versions
+            collection: Collection key, e.g. "address:states:{country_id}"
+            tables: Tables the collection is read from
+            loader: Loads the collection; only called on a miss
+
+        Returns:
+            Cached serialized response with its ETag
+        """
+        versions = self.get_versions(session)
+        version_key = ".".join(str(versions.get(table, 0)) for table in tables)
+        key = f"{collection}@{version_key}"
+
+        with self._lock:
+            cached = self._responses.get(key)
+            if cached is not None:
+                self._responses.move_to_end(key)
+                return cached
+
+        body = bytes(JSONResponse(content=jsonable_encoder(loader())).body)
+        digest = hashlib.sha256(body).hexdigest()[:16]
+        gzip_min_bytes = settings.REFERENCE_DATA_GZIP_MIN_BYTES
+        gzip_body = (
+            gzip.compress(body, mtime=0)
+            if gzip_min_bytes and len(body) >= gzip_min_bytes
+            else None
+        )
+        response = CachedReferenceResponse(
+            etag=f'"{version_key}-{digest}"', body=body, gzip_body=gzip_body
+        )
+
+        with self._lock:
+            self._responses[key] = response
+            self._responses.move_to_end(key)
+            while self.max_entries and len(self._responses) > self.max_entries:
+                self._responses.popitem(last=False)
+
+        logger.debug(f"Reference data response built: {key} ({len(body)} bytes)")
+        return response
+
+    def clear(self) -> None:
+        """Drop all cached responses and expire the table versions."""
+        with self._lock:
+            self._responses.clear()
+            self._versions_checked_at = None
+
+
+# Global reference data cache instance
+_reference_data_cache = ReferenceDataCache(
+    max_entries=settings.REFERENCE_DATA_CACHE_MAX_ENTRIES
+)
+
+
+def get_reference_data_cache() -> ReferenceDataCache:
+    """
+    Get the global reference data cache.
+
+    Returns:
+        Global ReferenceDataCache instance
+    """
+    return _reference_data_cache
+
+
+def expire_reference_data_versions() -> None:
+    """Re-read the table change counters after a reference data write."""
+    _reference_data_cache.expire_versions()
+
+
+def reference_data_response(
+    request: Request,
+    session: Session,
+    collection: str,
+    tables: Sequence[str],
+    loader: Callable[[], Any],
+) -> Response:
+    """
+    Serve a reference data collection with conditional GET support.
+
+    Answers 304 Not Modified when the request's If-None-Match matches the
+    collection's current ETag, and the cached JSON body otherwise. Large
+    bodies are sent gzip-compressed, without recompressing them per request,
+    to clients that accept gzip.
+
+    Args:
+        request: Incoming request
+        session: Database session
+        collection: Collection key, unique per URL
+        tables: Tables the collection is read from
+        loader: Loads the collection; only called on a cache miss
+
+    Returns:
+        304 response or JSON response, both with ETag and Cache-Control
+    """
+    cached = get_reference_data_cache().get_response(
+        session, collection, tables, loader
+    )
+    use_gzip = cached.gzip_body is not None and _accepts_gzip(
+        request.headers.get("accept-encoding")
+    )
+    headers = {
+        "ETag": cached.gzip_etag if use_gzip else cached.etag,
+        "Cache-Control": (
+            f"public, max-age={settings.REFERENCE_DATA_MAX_AGE_SECONDS}, "
+            "must-revalidate"
+        ),
+    }
+    if cached.gzip_body is not None:
+        headers["Vary"] = "Accept-Encoding"
+
+    if_none_match = request.headers.get("if-none-match")
+    if _etag_matches(if_none_match, cached.etag) or _etag_matches(
+        if_none_match, cached.gzip_etag
+    ):
+        return Response(status_code=304, headers=headers)
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+        return Response(
+            content=cached.gzip_body, media_type="application/json", headers=headers
+        )
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def _accepts_gzip(accept_encoding: str | None) -> bool:
+    """Check whether an Accept-Encoding header allows gzip."""
+    if not accept_encoding:
+        return False
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.partition(";")
+        if name.strip().lower() not in ("gzip", "*"):
+            continue
+        quality = params.strip().lower().removeprefix("q=")
+        try:
+            return not quality or float(quality) > 0
+        except ValueError:
+            return True
+    return False
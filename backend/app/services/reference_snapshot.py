@@ -0,0 +1,110 @@
+"""Base class for in-memory snapshots of reference tables."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+
+from sqlmodel import Session
+
+from app.services.reference_data_cache import get_reference_data_cache
+
+logger = logging.getLogger(__name__)
+
+
+class TTLSnapshot(ABC):
+    """
+    In-memory snapshot of reference tables, reloaded when stale.
+
+    A snapshot is stale until first loaded, after ``invalidate`` (called by
+    writes through this process), once the change counters of its ``tables``
+    (see ReferenceDataVersion) have moved, and once ``ttl_seconds`` has
+    elapsed. The counters are shared with the reference data cache and
+    re-read at most every REFERENCE_DATA_VERSION_CHECK_SECONDS, so writes
+    made by other workers are seen within that interval.
+    """
+
+    # Reference tables the snapshot is read from
+    tables: tuple[str, ...] = ()
+
+    def __init__(self) -> None:
+        """Initialize an empty, stale snapshot."""
+        self._lock = threading.RLock()
+        self._stale = True
+        self._loaded_at = 0.0
+        self._versions: dict[str, int] = {}
+
+    @property
+    @abstractmethod
+    def ttl_seconds(self) -> int:
+        """Seconds after which a loaded snapshot is stale (0 to never expire)."""
+
+    @abstractmethod
+    def _load(self, session: Session) -> None:
+        """
+        Read the tables and swap in the new data.
+
+        Called by ``load`` while holding ``_lock``.
+
+        Args:
+            session: Database session
+        """
+
+    def is_stale(self, session: Session) -> bool:
+        """
+        Whether the snapshot must be reloaded before use.
+
+        Args:
+            session: Database session used if the change counters are re-read
+
+        Returns:
+            True if invalidated, expired or behind the table change counters
+        """
+        if self._stale:
+            return True
+        ttl = self.ttl_seconds
+        if ttl > 0 and time.monotonic() - self._loaded_at > ttl:
+            return True
+        return self._table_versions(session) != self._versions
+
+    def load(self, session: Session) -> None:
+        """
+        (Re)load the snapshot from the database.
+
+        Args:
+            session: Database session
+        """
+        # Read before the rows, so a concurrent write only causes a reload
+        versions = self._table_versions(session)
+        with self._lock:
+            self._load(session)
+            self._versions = versions
+            self._stale = False
+            self._loaded_at = time.monotonic()
+
+    def ensure_loaded(self, session: Session) -> None:
+        """
+        Reload the snapshot if it is stale.
+
+        Args:
+            session: Database session used for the reload
+        """
+        if not self.is_stale(session):
+            return
+        with self._lock:
+            # Another thread may have reloaded while we waited for the lock
+            if self.is_stale(session):
+                self.load(session)
+
+    def invalidate(self) -> None:
+        """Mark the snapshot stale so it is reloaded on next use."""
+        with self._lock:
+            self._stale = True
+        logger.debug(f"{type(self).__name__} invalidated")
+
+    def _table_versions(self, session: Session) -> dict[str, int]:
+        """Get the current change counters of the snapshot's tables."""
+        versions = get_reference_data_cache().get_versions(session)
+        return {table: versions.get(table, 0) for table in self.tables}
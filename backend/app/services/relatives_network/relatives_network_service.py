@@ -2,28 +2,34 @@
 
 import logging
 import uuid
-from collections import deque
 
 from fastapi import HTTPException
-from sqlmodel import Session, select
+from sqlalchemy import Integer, Uuid, column, values
+from sqlmodel import Session, col, select
+from sqlmodel.sql.expression import SelectOfScalar
 
 from app.core.config import settings
-from app.db_models.address.district import District
-from app.db_models.address.locality import Locality
 from app.db_models.person.person import Person
 from app.db_models.person.person_address import PersonAddress
-from app.db_models.person.person_relationship import PersonRelationship
 from app.schemas.relatives_network import (
     RelativeInfo,
     RelativesNetworkRequest,
     RelativesNetworkResponse,
 )
+from app.services.graph_traversal import GraphTraversalService
+from app.services.person.person_enrichment_service import (
+    PersonDisplayRecord,
+    PersonEnrichmentService,
+)
 
 logger = logging.getLogger(__name__)
 
 # Maximum number of results to return
 MAX_RESULTS = 100
 
+# Maximum number of candidates matched by a single filter query
+FILTER_CHUNK_SIZE = 1000
+
 
 class RelativesNetworkService:
     """Service for finding relatives within a family network using BFS.
@@ -40,6 +46,8 @@ class RelativesNetworkService:
         """
         self.session = session
         self.max_depth = settings.RELATIVES_NETWORK_MAX_DEPTH
+        self.graph_traversal = GraphTraversalService(session)
+        self.person_enrichment = PersonEnrichmentService(session)
 
     def find_relatives(
         self, request: RelativesNetworkRequest
@@ -87,21 +95,11 @@ class RelativesNetworkService:
             pid for pid in filtered_person_ids if pid != request.person_id
         ]
 
-        # 6. Apply filters (living, gender, address)
+        # 6. Apply filters (living, gender, address) and limit results
         filtered_person_ids = self._apply_filters(filtered_person_ids, request)
 
-        # 7. Limit results
-        if len(filtered_person_ids) > MAX_RESULTS:
-            logger.info(
-                f"Limiting results from {len(filtered_person_ids)} to {MAX_RESULTS}"
-            )
-            filtered_person_ids = filtered_person_ids[:MAX_RESULTS]
-
-        # 8. Build response with relative info
-        relatives = [
-            self._enrich_relative_info(pid, depth_map[pid])
-            for pid in filtered_person_ids
-        ]
+        # 7. Build response with relative info
+        relatives = self._enrich_relatives(filtered_person_ids, depth_map)
 
         logger.info(f"Found {len(relatives)} relatives for person {request.person_id}")
 
@@ -118,8 +116,9 @@ class RelativesNetworkService:
     ) -> dict[uuid.UUID, int]:
         """BFS traversal returning {person_id: depth} mapping.
 
-        Uses deque for level-by-level traversal and tracks visited nodes
-        to avoid cycles.
+        Delegates to GraphTraversalService, which runs the walk as a single
+        recursive query on PostgreSQL and as a batched level-synchronous BFS
+        otherwise.
 
         Args:
             person_id: Starting person ID
@@ -128,29 +127,8 @@ class RelativesNetworkService:
         Returns:
             Dictionary mapping person_id to their depth from the starting person
         """
-        visited: dict[uuid.UUID, int] = {person_id: 0}
-        queue: deque[uuid.UUID] = deque([person_id])
-        current_depth = 0
-
-        while queue and current_depth < max_depth:
-            level_size = len(queue)
-            current_depth += 1
-
-            for _ in range(level_size):
-                current_id = queue.popleft()
-                relationships = self._get_relationships(current_id)
-
-                for related_id in relationships:
-                    if related_id not in visited:
-                        visited[related_id] = current_depth
-                        queue.append(related_id)
-
-        logger.debug(
-            f"BFS traversal complete: visited {len(visited)} persons "
-            f"up to depth {max_depth}"
-        )
-
-        return visited
+        nodes = self.graph_traversal.traverse(person_id, max_depth)
+        return {pid: node.depth for pid, node in nodes.items()}
 
     def _filter_by_depth_mode(
         self, depth_map: dict[uuid.UUID, int], depth: int, mode: str
@@ -173,103 +151,128 @@ class RelativesNetworkService:
             return [pid for pid, d in depth_map.items() if d == depth]
 
     def _apply_filters(
-        self, person_ids: list[uuid.UUID], request: RelativesNetworkRequest
+        self,
+        person_ids: list[uuid.UUID],
+        request: RelativesNetworkRequest,
+        limit: int = MAX_RESULTS,
     ) -> list[uuid.UUID]:
-        """Apply living, gender, and address filters.
+        """Apply living, gender, and address filters and the result limit.
+
+        Filtering runs in the database: each chunk of candidates is matched in
+        one query joining person with the current address, keeping the
+        candidates' order and stopping once ``limit`` ids were found.
 
         Args:
-            person_ids: List of person IDs to filter
+            person_ids: List of person IDs to filter, in result order
             request: Request containing filter criteria
+            limit: Maximum number of person IDs to return
 
         Returns:
-            Filtered list of person IDs
+            Filtered list of at most ``limit`` person IDs, in input order
         """
         filtered_ids: list[uuid.UUID] = []
 
-        for person_id in person_ids:
-            person = self._get_person(person_id)
-            if not person:
-                continue
+        for start in range(0, len(person_ids), FILTER_CHUNK_SIZE):
+            remaining = limit - len(filtered_ids)
+            if remaining <= 0:
+                break
+            chunk = person_ids[start : start + FILTER_CHUNK_SIZE]
+            statement = self._build_filter_query(chunk, request).limit(remaining)
+            filtered_ids.extend(self.session.exec(statement).all())
 
-            # Living filter: exclude persons with date_of_death
-            if request.living_only and person.date_of_death is not None:
-                continue
+        return filtered_ids
 
-            # Gender filter: match gender_id
-            if request.gender_id is not None and person.gender_id != request.gender_id:
-                continue
+    def _build_filter_query(
+        self, person_ids: list[uuid.UUID], request: RelativesNetworkRequest
+    ) -> SelectOfScalar[uuid.UUID]:
+        """Build the query selecting candidates that pass all filters.
 
-            # Address filters: match address hierarchy
-            if not self._matches_address_filters(person_id, request):
-                continue
+        Candidates are joined as an inline VALUES list carrying their position
+        so results come back in BFS order.
 
-            filtered_ids.append(person_id)
+        Args:
+            person_ids: Candidate person IDs, in result order
+            request: Request containing filter criteria
 
-        return filtered_ids
+        Returns:
+            Select statement yielding matching person IDs in input order
+        """
+        candidates = values(
+            column("person_id", Uuid),
+            column("position", Integer),
+            name="candidates",
+        ).data([(person_id, position) for position, person_id in enumerate(person_ids)])
+
+        statement = (
+            select(Person.id)
+            .join(candidates, candidates.c.person_id == Person.id)
+            .order_by(candidates.c.position)
+        )
+
+        # Living filter: exclude persons with date_of_death
+        if request.living_only:
+            statement = statement.where(col(Person.date_of_death).is_(None))
+
+        # Gender filter: match gender_id
+        if request.gender_id is not None:
+            statement = statement.where(Person.gender_id == request.gender_id)
+
+        # Address filters: the current address must match every given level
+        address_filters = [
+            (PersonAddress.country_id, request.country_id),
+            (PersonAddress.state_id, request.state_id),
+            (PersonAddress.district_id, request.district_id),
+            (PersonAddress.sub_district_id, request.sub_district_id),
+            (PersonAddress.locality_id, request.locality_id),
+        ]
+        address_conditions = [
+            col(field) == value for field, value in address_filters if value
+        ]
+        if address_conditions:
+            current_address = select(PersonAddress.id).where(
+                PersonAddress.person_id == Person.id,
+                PersonAddress.is_current == True,  # noqa: E712
+                *address_conditions,
+            )
+            statement = statement.where(current_address.exists())
+
+        return statement
 
-    def _matches_address_filters(
-        self, person_id: uuid.UUID, request: RelativesNetworkRequest
-    ) -> bool:
-        """Check if person's address matches the address filters.
+    def _enrich_relatives(
+        self, person_ids: list[uuid.UUID], depth_map: dict[uuid.UUID, int]
+    ) -> list[RelativeInfo]:
+        """Build RelativeInfo for several persons with batched queries.
 
         Args:
-            person_id: Person ID to check
-            request: Request containing address filter criteria
+            person_ids: Person IDs to enrich, in result order
+            depth_map: Dictionary mapping person_id to depth
 
         Returns:
-            True if address matches all specified filters
+            List of RelativeInfo in the order of person_ids
         """
-        # If no address filters specified, match all
-        if not any(
-            [
-                request.country_id,
-                request.state_id,
-                request.district_id,
-                request.sub_district_id,
-                request.locality_id,
-            ]
-        ):
-            return True
-
-        # Get person's current address
-        statement = select(PersonAddress).where(
-            PersonAddress.person_id == person_id,
-            PersonAddress.is_current == True,  # noqa: E712
-        )
-        person_address = self.session.exec(statement).first()
-
-        if not person_address:
-            return False
-
-        # Check each address filter
-        if request.country_id and person_address.country_id != request.country_id:
-            return False
-        if request.state_id and person_address.state_id != request.state_id:
-            return False
-        if request.district_id and person_address.district_id != request.district_id:
-            return False
-        if (
-            request.sub_district_id
-            and person_address.sub_district_id != request.sub_district_id
-        ):
-            return False
-        if request.locality_id and person_address.locality_id != request.locality_id:
-            return False
-
-        return True
-
-    def _enrich_relative_info(self, person_id: uuid.UUID, depth: int) -> RelativeInfo:
-        """Fetch person details and build RelativeInfo.
+        records = self.person_enrichment.get_display_records(person_ids)
+        return [
+            self._enrich_relative_info(pid, depth_map[pid], records.get(pid))
+            for pid in person_ids
+        ]
+
+    def _enrich_relative_info(
+        self,
+        person_id: uuid.UUID,
+        depth: int,
+        record: PersonDisplayRecord | None,
+    ) -> RelativeInfo:
+        """Build RelativeInfo from a person's display record.
 
         Args:
             person_id: Person ID to enrich
             depth: Relationship depth from the requesting person
+            record: Display record of the person, or None if not found
 
         Returns:
             RelativeInfo with person details and address
         """
-        person = self._get_person(person_id)
-        if not person:
+        if not record:
             # Return minimal info if person not found (shouldn't happen)
             return RelativeInfo(
                 person_id=person_id,
@@ -284,66 +287,19 @@ class RelativesNetworkService:
                 profile_image_key=None,
             )
 
-        # Extract birth and death years
-        birth_year = person.date_of_birth.year if person.date_of_birth else None
-        death_year = person.date_of_death.year if person.date_of_death else None
-
-        # Get district and locality names
-        district_name, locality_name = self._get_address_names(person_id)
-
         return RelativeInfo(
             person_id=person_id,
-            first_name=person.first_name,
-            last_name=person.last_name,
-            gender_id=person.gender_id,
-            birth_year=birth_year,
-            death_year=death_year,
-            district_name=district_name,
-            locality_name=locality_name,
+            first_name=record.first_name,
+            last_name=record.last_name,
+            gender_id=record.gender_id,
+            birth_year=record.birth_year,
+            death_year=record.death_year,
+            district_name=record.district_name,
+            locality_name=record.locality_name,
             depth=depth,
-            profile_image_key=person.profile_image_key,
+            profile_image_key=record.profile_image_key,
         )
 
-    def _get_address_names(self, person_id: uuid.UUID) -> tuple[str | None, str | None]:
-        """Get district and locality names for a person.
-
-        Args:
-            person_id: Person ID
-
-        Returns:
-            Tuple of (district_name, locality_name)
-        """
-        # Get current address
-        statement = select(PersonAddress).where(
-            PersonAddress.person_id == person_id,
-            PersonAddress.is_current == True,  # noqa: E712
-        )
-        person_address = self.session.exec(statement).first()
-
-        if not person_address:
-            return None, None
-
-        district_name = None
-        locality_name = None
-
-        # Get district name
-        if person_address.district_id:
-            district = self.session.exec(
-                select(District).where(District.id == person_address.district_id)
-            ).first()
-            if district:
-                district_name = district.name
-
-        # Get locality name
-        if person_address.locality_id:
-            locality = self.session.exec(
-                select(Locality).where(Locality.id == person_address.locality_id)
-            ).first()
-            if locality:
-                locality_name = locality.name
-
-        return district_name, locality_name
-
     # ==================== Helper Methods ====================
 
     def _get_person(self, person_id: uuid.UUID) -> Person | None:
@@ -357,20 +313,3 @@ class RelativesNetworkService:
         """
         statement = select(Person).where(Person.id == person_id)
         return self.session.exec(statement).first()
-
-    def _get_relationships(self, person_id: uuid.UUID) -> list[uuid.UUID]:
-        """Get all active relationships for a person.
-
-        Args:
-            person_id: Person's ID
-
-        Returns:
-            List of related_person_ids
-        """
-        statement = select(PersonRelationship).where(
-            PersonRelationship.person_id == person_id,
-            PersonRelationship.is_active == True,  # noqa: E712
-        )
-        relationships = self.session.exec(statement).all()
-
-        return [rel.related_person_id for rel in relationships]
@@ -5,9 +5,19 @@ from app.services.religion.religion_service import ReligionService
 from app.services.religion.religion_sub_category_service import (
     ReligionSubCategoryService,
 )
+from app.services.religion.religion_taxonomy import (
+    ReligionNames,
+    ReligionTaxonomy,
+    get_religion_taxonomy,
+    invalidate_religion_taxonomy,
+)
 
 __all__ = [
     "ReligionService",
     "ReligionCategoryService",
     "ReligionSubCategoryService",
+    "ReligionNames",
+    "ReligionTaxonomy",
+    "get_religion_taxonomy",
+    "invalidate_religion_taxonomy",
 ]
@@ -14,6 +14,7 @@ from app.schemas.religion import (
     ReligionCategoryPublic,
     ReligionCategoryUpdate,
 )
+from app.services.religion.religion_taxonomy import reference_data_changed
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +60,7 @@ class ReligionCategoryService:
         if category.code:
             category.code = category.code.upper()
         created_category = self.category_repo.create(category)
+        reference_data_changed()
         logger.info(
             f"Religion category created successfully: {created_category.name} (ID: {created_category.id})"
         )
@@ -83,6 +85,7 @@ class ReligionCategoryService:
         for key, value in update_data.items():
             setattr(category, key, value)
         updated_category = self.category_repo.update(category)
+        reference_data_changed()
         logger.info(
             f"Religion category updated successfully: {updated_category.name} (ID: {updated_category.id})"
         )
@@ -94,6 +97,7 @@ class ReligionCategoryService:
             f"Deleting religion category: {category.name} (ID: {category.id})"
         )
         self.category_repo.delete(category)
+        reference_data_changed()
         logger.info(
             f"Religion category deleted successfully: {category.name} (ID: {category.id})"
         )
@@ -8,6 +8,7 @@ from sqlmodel import Session
 from app.db_models.religion.religion import Religion
 from app.repositories.religion.religion_repository import ReligionRepository
 from app.schemas.religion import ReligionCreate, ReligionPublic, ReligionUpdate
+from app.services.religion.religion_taxonomy import reference_data_changed
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +44,7 @@ class ReligionService:
         religion = Religion(**religion_create.model_dump())
         religion.code = religion.code.upper()
         created_religion = self.religion_repo.create(religion)
+        reference_data_changed()
         logger.info(
             f"Religion created successfully: {created_religion.name} (ID: {created_religion.id})"
         )
@@ -65,6 +67,7 @@ class ReligionService:
         for key, value in update_data.items():
             setattr(religion, key, value)
         updated_religion = self.religion_repo.update(religion)
+        reference_data_changed()
         logger.info(
             f"Religion updated successfully: {updated_religion.name} (ID: {updated_religion.id})"
         )
@@ -74,6 +77,7 @@ class ReligionService:
         """Delete a religion."""
         logger.warning(f"Deleting religion: {religion.name} (ID: {religion.id})")
         self.religion_repo.delete(religion)
+        reference_data_changed()
         logger.info(
             f"Religion deleted successfully: {religion.name} (ID: {religion.id})"
         )
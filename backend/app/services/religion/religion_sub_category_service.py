@@ -14,6 +14,7 @@ from app.schemas.religion import (
     ReligionSubCategoryPublic,
     ReligionSubCategoryUpdate,
 )
+from app.services.religion.religion_taxonomy import reference_data_changed
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +66,7 @@ class ReligionSubCategoryService:
         if sub_category.code:
             sub_category.code = sub_category.code.upper()
         created_sub_category = self.sub_category_repo.create(sub_category)
+        reference_data_changed()
         logger.info(
             f"Religion sub-category created successfully: {created_sub_category.name} (ID: {created_sub_category.id})"
         )
@@ -93,6 +95,7 @@ class ReligionSubCategoryService:
         for key, value in update_data.items():
             setattr(sub_category, key, value)
         updated_sub_category = self.sub_category_repo.update(sub_category)
+        reference_data_changed()
         logger.info(
             f"Religion sub-category updated successfully: {updated_sub_category.name} (ID: {updated_sub_category.id})"
         )
@@ -104,6 +107,7 @@ class ReligionSubCategoryService:
             f"Deleting religion sub-category: {sub_category.name} (ID: {sub_category.id})"
         )
         self.sub_category_repo.delete(sub_category)
+        reference_data_changed()
         logger.info(
             f"Religion sub-category deleted successfully: {sub_category.name} (ID: {sub_category.id})"
         )
@@ -0,0 +1,224 @@
+"""In-memory cache of the religion taxonomy."""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.db_models.religion.religion import Religion
+from app.db_models.religion.religion_category import ReligionCategory
+from app.db_models.religion.religion_sub_category import ReligionSubCategory
+from app.services.reference_data_cache import expire_reference_data_versions
+from app.services.reference_snapshot import TTLSnapshot
+
+logger = logging.getLogger(__name__)
+
+
+class ReligionNames(NamedTuple):
+    """Names of a religion selection, from least to most specific."""
+
+    religion: str | None
+    category: str | None
+    sub_category: str | None
+
+
+class ReligionTaxonomy(TTLSnapshot):
+    """
+    Snapshot of the religion -> category -> sub-category tree.
+
+    Names and parents are held in dictionaries, and the descendant sets of
+    every religion and category are precomputed at load time, so formatting
+    and hierarchy checks need no queries. The snapshot is reloaded on next
+    use after any religion table changes, or once
+    RELIGION_TAXONOMY_TTL_SECONDS has elapsed.
+    """
+
+    tables = ("religion", "religion_category", "religion_sub_category")
+
+    def __init__(self) -> None:
+        """Initialize an empty, stale taxonomy."""
+        super().__init__()
+        self._religions: dict[uuid.UUID, str] = {}
+        # id -> (name, parent_id)
+        self._categories: dict[uuid.UUID, tuple[str, uuid.UUID]] = {}
+        self._sub_categories: dict[uuid.UUID, tuple[str, uuid.UUID]] = {}
+        # Precomputed descendant sets
+        self._religion_categories: dict[uuid.UUID, frozenset[uuid.UUID]] = {}
+        self._religion_sub_categories: dict[uuid.UUID, frozenset[uuid.UUID]] = {}
+        self._category_sub_categories: dict[uuid.UUID, frozenset[uuid.UUID]] = {}
+
+    @property
+    def ttl_seconds(self) -> int:
+        """Seconds after which a loaded taxonomy is stale."""
+        return settings.RELIGION_TAXONOMY_TTL_SECONDS
+
+    def _load(self, session: Session) -> None:
+        """
+        Read the whole taxonomy from the database.
+
+        Args:
+            session: Database session
+        """
+        religions: dict[uuid.UUID, str] = dict(
+            session.exec(select(Religion.id, Religion.name)).all()
+        )
+        categories = {
+            row_id: (name, parent_id)
+            for row_id, name, parent_id in session.exec(
+                select(
+                    ReligionCategory.id,
+                    ReligionCategory.name,
+                    ReligionCategory.religion_id,
+                )
+            ).all()
+        }
+        sub_categories = {
+            row_id: (name, parent_id)
+            for row_id, name, parent_id in session.exec(
+                select(
+                    ReligionSubCategory.id,
+                    ReligionSubCategory.name,
+                    ReligionSubCategory.category_id,
+                )
+            ).all()
+        }
+
+        religion_categories: dict[uuid.UUID, set[uuid.UUID]] = {}
+        for category_id, (_, religion_id) in categories.items():
+            religion_categories.setdefault(religion_id, set()).add(category_id)
+
+        category_sub_categories: dict[uuid.UUID, set[uuid.UUID]] = {}
+        religion_sub_categories: dict[uuid.UUID, set[uuid.UUID]] = {}
+        for sub_category_id, (_, category_id) in sub_categories.items():
+            category_sub_categories.setdefault(category_id, set()).add(sub_category_id)
+            category = categories.get(category_id)
+            if category is not None:
+                religion_sub_categories.setdefault(category[1], set()).add(
+                    sub_category_id
+                )
+
+        self._religions = religions
+        self._categories = categories
+        self._sub_categories = sub_categories
+        self._religion_categories = {
+            key: frozenset(ids) for key, ids in religion_categories.items()
+        }
+        self._religion_sub_categories = {
+            key: frozenset(ids) for key, ids in religion_sub_categories.items()
+        }
+        self._category_sub_categories = {
+            key: frozenset(ids) for key, ids in category_sub_categories.items()
+        }
+
+        logger.info(
+            f"Religion taxonomy loaded: {len(religions)} religions, "
+            f"{len(categories)} categories, {len(sub_categories)} sub-categories"
+        )
+
+    def get_names(
+        self,
+        religion_id: uuid.UUID | None,
+        category_id: uuid.UUID | None = None,
+        sub_category_id: uuid.UUID | None = None,
+    ) -> ReligionNames:
+        """
+        Resolve the names of a religion selection.
+
+        Args:
+            religion_id: Religion ID
+            category_id: Religion category ID
+            sub_category_id: Religion sub-category ID
+
+        Returns:
+            ReligionNames with None for unset or unknown levels
+        """
+        category = self._categories.get(category_id) if category_id else None
+        sub_category = (
+            self._sub_categories.get(sub_category_id) if sub_category_id else None
+        )
+        return ReligionNames(
+            religion=self._religions.get(religion_id) if religion_id else None,
+            category=category[0] if category else None,
+            sub_category=sub_category[0] if sub_category else None,
+        )
+
+    def format_religion(
+        self,
+        religion_id: uuid.UUID | None,
+        category_id: uuid.UUID | None = None,
+        sub_category_id: uuid.UUID | None = None,
+    ) -> str | None:
+        """
+        Format a religion selection as "Religion - Category - Sub-category".
+
+        Returns:
+            Formatted string, or None if no level is known
+        """
+        names = self.get_names(religion_id, category_id, sub_category_id)
+        formatted = " - ".join(name for name in names if name)
+        return formatted or None
+
+    def has_category(self, category_id: uuid.UUID) -> bool:
+        """Whether the category is known to the snapshot."""
+        return category_id in self._categories
+
+    def has_sub_category(self, sub_category_id: uuid.UUID) -> bool:
+        """Whether the sub-category is known to the snapshot."""
+        return sub_category_id in self._sub_categories
+
+    def category_ids_of(self, religion_ids: Iterable[uuid.UUID]) -> set[uuid.UUID]:
+        """Get the categories of the given religions."""
+        result: set[uuid.UUID] = set()
+        for religion_id in religion_ids:
+            result |= self._religion_categories.get(religion_id, frozenset())
+        return result
+
+    def sub_category_ids_of_religions(
+        self, religion_ids: Iterable[uuid.UUID]
+    ) -> set[uuid.UUID]:
+        """Get the sub-categories of all categories of the given religions."""
+        result: set[uuid.UUID] = set()
+        for religion_id in religion_ids:
+            result |= self._religion_sub_categories.get(religion_id, frozenset())
+        return result
+
+    def sub_category_ids_of(self, category_ids: Iterable[uuid.UUID]) -> set[uuid.UUID]:
+        """Get the sub-categories of the given categories."""
+        result: set[uuid.UUID] = set()
+        for category_id in category_ids:
+            result |= self._category_sub_categories.get(category_id, frozenset())
+        return result
+
+
+# Global taxonomy instance (loaded lazily on first use)
+_religion_taxonomy = ReligionTaxonomy()
+
+
+def get_religion_taxonomy(session: Session) -> ReligionTaxonomy:
+    """
+    Get the global religion taxonomy, (re)loading it if stale.
+
+    Args:
+        session: Database session used if a reload is needed
+
+    Returns:
+        Global ReligionTaxonomy instance
+    """
+    _religion_taxonomy.ensure_loaded(session)
+    return _religion_taxonomy
+
+
+def invalidate_religion_taxonomy() -> None:
+    """Mark the global religion taxonomy stale after a religion metadata write."""
+    _religion_taxonomy.invalidate()
+
+
+def reference_data_changed() -> None:
+    """Drop every in-process copy of the religion tables after a write."""
+    invalidate_religion_taxonomy()
+    expire_reference_data_versions()
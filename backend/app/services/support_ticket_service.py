@@ -12,6 +12,7 @@ from app.schemas.support_ticket import (
     IssueStatus,
     IssueType,
     SupportTicketCreate,
+    SupportTicketPublicWithUser,
     SupportTicketUpdate,
 )
 
@@ -82,16 +83,43 @@ class SupportTicketService:
         issue_type: IssueType | None = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[list[SupportTicket], int]:
-        """Get all support tickets for admin with filters and pagination."""
+    ) -> tuple[list[SupportTicketPublicWithUser], int]:
+        """Get all support tickets with user details for admin.
+
+        Creator and resolver details are loaded with the tickets in one query.
+        """
         logger.debug(
             f"Fetching all support tickets (admin), "
             f"status={status}, issue_type={issue_type}, skip={skip}, limit={limit}"
         )
-        tickets = self.support_ticket_repo.get_all(
+        rows, count = self.support_ticket_repo.get_all_with_users(
             status=status, issue_type=issue_type, skip=skip, limit=limit
         )
-        count = self.support_ticket_repo.count_all(status=status, issue_type=issue_type)
+        tickets = [
+            SupportTicketPublicWithUser(
+                id=ticket.id,
+                user_id=ticket.user_id,
+                issue_type=ticket.issue_type,
+                title=ticket.title,
+                description=ticket.description,
+                status=ticket.status,
+                resolved_by_user_id=ticket.resolved_by_user_id,
+                resolved_at=ticket.resolved_at,
+                created_at=ticket.created_at,
+                updated_at=ticket.updated_at,
+                user_email=user_email or "Unknown",
+                user_full_name=user_full_name,
+                resolved_by_email=resolved_by_email,
+                resolved_by_full_name=resolved_by_full_name,
+            )
+            for (
+                ticket,
+                user_email,
+                user_full_name,
+                resolved_by_email,
+                resolved_by_full_name,
+            ) in rows
+        ]
         logger.info(f"Retrieved {len(tickets)} support tickets (total: {count})")
         return tickets, count
 
@@ -1,30 +1,152 @@
 """Caching utilities for the application."""
 
 import functools
+import heapq
+import inspect
 import logging
+import pickle
+import sys
+import threading
 import time
 import uuid
-from collections.abc import Callable
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from contextvars import ContextVar
+from dataclasses import dataclass
 from typing import Any
 
+from app.core.config import settings
+
 logger = logging.getLogger(__name__)
 
+# How long a tag invalidation is remembered, so that results computed from
+# data read before the invalidation are not stored after it
+TAG_GENERATION_TTL_SECONDS = 3600
+
 
-class CacheManager:
+class CacheBackend(ABC):
     """
-    Simple in-memory cache manager with TTL support.
+    Interface of the application cache returned by get_cache_manager().
 
-    This is a lightweight caching solution that stores data in memory
-    with time-to-live (TTL) expiration. Suitable for single-instance
-    deployments or development environments.
+    CacheManager keeps entries in process memory and is the default.
+    RedisCacheBackend stores them in Redis so that all workers and
+    containers share one cache. Select the backend with CACHE_BACKEND.
 
-    For production multi-instance deployments, consider using Redis
-    or another distributed caching solution.
+    Every tag invalidation advances a generation counter and records the new
+    generation on the invalidated tags. A caller that reads generation()
+    before computing a value and passes it to set() has the value dropped if
+    any of its tags was invalidated in the meantime.
     """
 
-    def __init__(self) -> None:
-        """Initialize the cache manager."""
-        self._cache: dict[str, tuple[Any, float]] = {}
+    @abstractmethod
+    def get(self, key: str) -> Any | None:
+        """Get a value, or None if it is missing or expired."""
+
+    @abstractmethod
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: int = 300,
+        tags: Iterable[str] = (),
+        generation: int | None = None,
+    ) -> None:
+        """Set a value with TTL, optional invalidation tags and generation."""
+
+    @abstractmethod
+    def generation(self) -> int:
+        """Get the current tag invalidation generation."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Delete a value."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Clear all cached values."""
+
+    @abstractmethod
+    def invalidate_pattern(self, pattern: str) -> int:
+        """Invalidate all keys starting with pattern and return the count."""
+
+    @abstractmethod
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Invalidate all entries carrying any of the tags and return the count."""
+
+    @abstractmethod
+    def stats(self) -> dict[str, int]:
+        """Get cache counters."""
+
+
+@dataclass
+class CacheEntry:
+    """A cached value with its expiry, estimated size and tags."""
+
+    value: Any
+    expires_at: float
+    size: int
+    tags: frozenset[str]
+
+
+class CacheManager(CacheBackend):
+    """
+    Bounded in-memory cache manager with TTL support.
+
+    Entries are kept in least-recently-used order and evicted once the cache
+    holds more than ``max_entries`` entries or, when ``max_bytes`` is set,
+    more than ``max_bytes`` of estimated value size. Expired entries are
+    removed on read and by a sweep that runs at most every
+    ``sweep_interval_seconds`` on writes, so memory stays bounded under a
+    long uptime even for keys that are never read again.
+
+    Keys are indexed by every ``:``-delimited prefix and by optional tags,
+    so prefix and tag invalidation only touch the matching entries. All
+    operations take a lock and are safe to call from the FastAPI threadpool.
+
+    The cache is per process. For multi-instance deployments, use
+    RedisCacheBackend so that workers share cached values.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        max_bytes: int = 0,
+        sweep_interval_seconds: float = 60,
+    ) -> None:
+        """
+        Initialize the cache manager.
+
+        Args:
+            max_entries: Maximum number of entries (0 means unlimited)
+            max_bytes: Maximum estimated size of all values (0 means unlimited)
+            sweep_interval_seconds: Minimum interval between expiry sweeps
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sweep_interval_seconds = sweep_interval_seconds
+
+        self._lock = threading.Lock()
+        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._keys_by_prefix: dict[str, set[str]] = {}
+        self._keys_by_tag: dict[str, set[str]] = {}
+        # Generation and time of each tag's last invalidation, oldest first
+        self._tag_generations: OrderedDict[str, tuple[int, float]] = OrderedDict()
+        self._generation = 0
+        # Min-heap of (expires_at, key); stale items are skipped when popped
+        self._expiry_heap: list[tuple[float, str]] = []
+        self._next_sweep_at = time.monotonic() + sweep_interval_seconds
+        self._bytes = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def __len__(self) -> int:
+        """Number of entries, including expired ones not yet swept."""
+        return len(self._cache)
 
     def get(self, key: str) -> Any | None:
         """
@@ -36,22 +158,34 @@ class CacheManager:
         Returns:
             Cached value if found and not expired, None otherwise
         """
-        if key not in self._cache:
-            return None
-
-        value, expiry = self._cache[key]
-
-        # Check if expired
-        if time.time() > expiry:
-            # Remove expired entry
-            del self._cache[key]
-            logger.debug(f"Cache expired for key: {key}")
-            return None
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            # Check if expired
+            if time.monotonic() >= entry.expires_at:
+                self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                logger.debug(f"Cache expired for key: {key}")
+                return None
+
+            self._cache.move_to_end(key)
+            self._hits += 1
 
         logger.debug(f"Cache hit for key: {key}")
-        return value
-
-    def set(self, key: str, value: Any, ttl_seconds: int = 300) -> None:
+        return entry.value
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: int = 300,
+        tags: Iterable[str] = (),
+        generation: int | None = None,
+    ) -> None:
         """
         Set a value in the cache with TTL.
 
@@ -59,9 +193,44 @@ class CacheManager:
             key: Cache key
             value: Value to cache
             ttl_seconds: Time to live in seconds (default: 300 = 5 minutes)
+            tags: Tags that can later invalidate this entry via invalidate_tags
+            generation: Generation read before the value was computed; the
+                value is not stored if any of its tags was invalidated since
         """
-        expiry = time.time() + ttl_seconds
-        self._cache[key] = (value, expiry)
+        size = estimate_size(value) if self.max_bytes > 0 else 0
+        if self.max_bytes > 0 and size > self.max_bytes:
+            logger.debug(f"Cache value too large for key: {key} ({size} bytes)")
+            return
+
+        now = time.monotonic()
+        entry = CacheEntry(
+            value=value,
+            expires_at=now + ttl_seconds,
+            size=size,
+            tags=frozenset(tags),
+        )
+
+        with self._lock:
+            if now >= self._next_sweep_at:
+                self._sweep_expired(now)
+
+            if generation is not None and self._invalidated_since(
+                entry.tags, generation
+            ):
+                logger.debug(f"Cache value for key: {key} is stale, not stored")
+                return
+
+            self._remove(key)
+            self._cache[key] = entry
+            self._bytes += size
+            for prefix in _key_prefixes(key):
+                self._keys_by_prefix.setdefault(prefix, set()).add(key)
+            for tag in entry.tags:
+                self._keys_by_tag.setdefault(tag, set()).add(key)
+            heapq.heappush(self._expiry_heap, (entry.expires_at, key))
+
+            self._evict_to_limits()
+
         logger.debug(f"Cache set for key: {key}, TTL: {ttl_seconds}s")
 
     def delete(self, key: str) -> None:
@@ -71,50 +240,692 @@ class CacheManager:
         Args:
             key: Cache key
         """
-        if key in self._cache:
-            del self._cache[key]
+        with self._lock:
+            removed = self._remove(key)
+        if removed:
             logger.debug(f"Cache deleted for key: {key}")
 
     def clear(self) -> None:
         """Clear all cached values."""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
+            self._keys_by_prefix.clear()
+            self._keys_by_tag.clear()
+            self._expiry_heap.clear()
+            self._bytes = 0
         logger.debug("Cache cleared")
 
-    def invalidate_pattern(self, pattern: str) -> None:
+    def invalidate_pattern(self, pattern: str) -> int:
         """
         Invalidate all cache keys matching a pattern.
 
+        Patterns ending at a ``:`` boundary are answered from the prefix index.
+        Other patterns only scan the keys under their longest ``:``-delimited
+        prefix, or every key when the pattern contains no ``:``.
+
         Args:
             pattern: Pattern to match (simple string prefix matching)
+
+        Returns:
+            Number of invalidated entries
         """
-        keys_to_delete = [key for key in self._cache.keys() if key.startswith(pattern)]
-        for key in keys_to_delete:
-            del self._cache[key]
+        indexed_prefix = pattern[: pattern.rfind(":") + 1]
+
+        with self._lock:
+            candidates: Iterable[str]
+            if indexed_prefix:
+                candidates = self._keys_by_prefix.get(indexed_prefix, set())
+            else:
+                candidates = self._cache.keys()
+            keys_to_delete = [key for key in candidates if key.startswith(pattern)]
+            for key in keys_to_delete:
+                self._remove(key)
 
         if keys_to_delete:
             logger.debug(
                 f"Invalidated {len(keys_to_delete)} cache entries matching pattern: {pattern}"
             )
+        return len(keys_to_delete)
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """
+        Invalidate all cache entries carrying any of the given tags.
+
+        Args:
+            tags: Tags to invalidate
+
+        Returns:
+            Number of invalidated entries
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._generation += 1
+            keys_to_delete: set[str] = set()
+            for tag in tags:
+                self._tag_generations.pop(tag, None)
+                self._tag_generations[tag] = (self._generation, now)
+                keys_to_delete |= self._keys_by_tag.get(tag, set())
+            for key in keys_to_delete:
+                self._remove(key)
+
+        if keys_to_delete:
+            logger.debug(f"Invalidated {len(keys_to_delete)} tagged cache entries")
+        return len(keys_to_delete)
+
+    def generation(self) -> int:
+        """
+        Get the current tag invalidation generation.
+
+        Returns:
+            Number of invalidate_tags calls so far
+        """
+        with self._lock:
+            return self._generation
+
+    def sweep_expired(self) -> int:
+        """
+        Remove all expired entries now.
+
+        Returns:
+            Number of removed entries
+        """
+        with self._lock:
+            return self._sweep_expired(time.monotonic())
+
+    def stats(self) -> dict[str, int]:
+        """
+        Get cache counters and current size.
+
+        Returns:
+            Dictionary with hits, misses, evictions, expirations, entries and
+            bytes (estimated, only tracked when max_bytes is set)
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "entries": len(self._cache),
+                "bytes": self._bytes,
+            }
+
+    def _remove(self, key: str) -> bool:
+        """Remove an entry and its index references. Caller holds the lock."""
+        entry = self._cache.pop(key, None)
+        if entry is None:
+            return False
+
+        self._bytes -= entry.size
+        for prefix in _key_prefixes(key):
+            _discard_from_index(self._keys_by_prefix, prefix, key)
+        for tag in entry.tags:
+            _discard_from_index(self._keys_by_tag, tag, key)
+        return True
+
+    def _invalidated_since(self, tags: Iterable[str], generation: int) -> bool:
+        """Whether any tag was invalidated after a generation. Caller holds the lock."""
+        return any(
+            self._tag_generations.get(tag, (0, 0.0))[0] > generation for tag in tags
+        )
+
+    def _evict_to_limits(self) -> None:
+        """Evict least recently used entries until within limits."""
+        while self._cache and (
+            (self.max_entries > 0 and len(self._cache) > self.max_entries)
+            or (self.max_bytes > 0 and self._bytes > self.max_bytes)
+        ):
+            oldest_key = next(iter(self._cache))
+            self._remove(oldest_key)
+            self._evictions += 1
+
+    def _sweep_expired(self, now: float) -> int:
+        """Remove entries expired at ``now``. Caller holds the lock."""
+        removed = 0
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # Skip heap items left behind by overwritten or deleted keys
+            if entry is not None and entry.expires_at == expires_at:
+                self._remove(key)
+                removed += 1
+
+        # Drop stale heap items once they outnumber live entries
+        if len(heap) > 2 * len(self._cache) + 64:
+            self._expiry_heap = [
+                (entry.expires_at, key) for key, entry in self._cache.items()
+            ]
+            heapq.heapify(self._expiry_heap)
+
+        # Forget tag invalidations that no running computation can predate
+        while self._tag_generations:
+            tag, (_, invalidated_at) = next(iter(self._tag_generations.items()))
+            if now - invalidated_at <= TAG_GENERATION_TTL_SECONDS:
+                break
+            del self._tag_generations[tag]
+
+        self._expirations += removed
+        self._next_sweep_at = now + self.sweep_interval_seconds
+        if removed:
+            logger.debug(f"Cache sweep removed {removed} expired entries")
+        return removed
+
+
+def _key_prefixes(key: str) -> list[str]:
+    """Get every ``:``-delimited prefix of a key, including the trailing ``:``."""
+    prefixes = []
+    index = key.find(":")
+    while index != -1:
+        prefixes.append(key[: index + 1])
+        index = key.find(":", index + 1)
+    return prefixes
+
+
+def _discard_from_index(index: dict[str, set[str]], name: str, key: str) -> None:
+    """Remove a key from an index bucket, dropping the bucket when empty."""
+    keys = index.get(name)
+    if keys is not None:
+        keys.discard(key)
+        if not keys:
+            del index[name]
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Estimate the memory footprint of a value in bytes.
+
+    Follows containers and public object attributes (including pydantic and
+    SQLModel instances), counting every object once.
+
+    Args:
+        value: Value to measure
+
+    Returns:
+        Approximate size in bytes
+    """
+    seen: set[int] = set()
+    stack = [value]
+    size = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+
+        if isinstance(obj, str | bytes | bytearray | int | float | bool | uuid.UUID):
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, list | tuple | set | frozenset):
+            stack.extend(obj)
+        elif hasattr(obj, "__dict__"):
+            # Skip private attributes such as SQLAlchemy instance state, which
+            # references the session rather than the cached data
+            attributes = vars(obj)
+            size += sys.getsizeof(attributes)
+            stack.extend(
+                attr_value
+                for attr_name, attr_value in attributes.items()
+                if not attr_name.startswith("_")
+            )
+    return size
+
+
+# Values larger than this are zlib-compressed before they are sent to Redis
+COMPRESS_MIN_BYTES = 1024
+
+_PICKLED = b"p"
+_COMPRESSED = b"z"
+
+# Characters with a special meaning in Redis SCAN MATCH patterns
+_GLOB_SPECIAL_CHARS = frozenset("*?[]\\")
+
+
+def serialize_value(value: Any) -> bytes:
+    """
+    Serialize a cached value for an out-of-process backend.
+
+    Uses the highest pickle protocol, which handles pydantic and SQLModel
+    results without per-type encoders, and compresses large payloads.
+
+    Args:
+        value: Value to serialize
+
+    Returns:
+        Serialized bytes with a one-byte format marker
+    """
+    data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    if len(data) >= COMPRESS_MIN_BYTES:
+        return _COMPRESSED + zlib.compress(data, 1)
+    return _PICKLED + data
+
+
+def deserialize_value(data: bytes) -> Any:
+    """
+    Deserialize a value produced by serialize_value.
+
+    Args:
+        data: Serialized bytes
+
+    Returns:
+        Original value
+    """
+    marker, payload = data[:1], data[1:]
+    if marker == _COMPRESSED:
+        payload = zlib.decompress(payload)
+    return pickle.loads(payload)
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Cache backend shared by all workers through a Redis-protocol server.
+
+    Values are stored under ``{namespace}{key}`` with a Redis TTL. Each tag is
+    a Redis set of the keys that carry it, so tag invalidation touches only
+    the matching keys. Prefix invalidation uses SCAN and is meant for
+    administrative use. The invalidation generation is a Redis counter, and
+    each invalidated tag keeps its generation for TAG_GENERATION_TTL_SECONDS.
+
+    Values are pickled, so the Redis server must only be writable by the
+    application. Redis errors are logged and treated as cache misses so that
+    an unavailable cache never fails a request. Tag sets use EXPIRE NX/GT,
+    which requires Redis 7.0 or later.
+    """
+
+    def __init__(self, client: Any, namespace: str = "cache:") -> None:
+        """
+        Initialize the Redis cache backend.
+
+        Args:
+            client: redis.Redis compatible client returning bytes
+            namespace: Prefix of all keys written by this backend
+        """
+        self.client = client
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._errors = 0
+
+    def get(self, key: str) -> Any | None:
+        """
+        Get a value from the cache.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value if found and not expired, None otherwise
+        """
+        value_key = self._value_key(key)
+        try:
+            data = self.client.get(value_key)
+        except Exception as e:
+            self._record_error("get", e)
+            return None
+
+        value = None
+        if data is not None:
+            try:
+                value = deserialize_value(data)
+            except Exception as e:
+                # A value that cannot be read back (corrupt, or pickled by an
+                # incompatible release) is dropped and treated as a miss
+                self._record_error("deserialize", e)
+                self.delete(key)
+                data = None
+
+        with self._lock:
+            if data is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        if data is None:
+            return None
+
+        logger.debug(f"Cache hit for key: {key}")
+        return value
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: int = 300,
+        tags: Iterable[str] = (),
+        generation: int | None = None,
+    ) -> None:
+        """
+        Set a value in the cache with TTL.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl_seconds: Time to live in seconds (default: 300 = 5 minutes)
+            tags: Tags that can later invalidate this entry via invalidate_tags
+            generation: Generation read before the value was computed; the
+                value is not stored if any of its tags was invalidated since
+        """
+        value_key = self._value_key(key)
+        unique_tags = set(tags)
+        try:
+            data = serialize_value(value)
+            pipe = self.client.pipeline(transaction=True)
+            pipe.set(value_key, data, ex=ttl_seconds)
+            for tag in unique_tags:
+                tag_key = self._tag_key(tag)
+                pipe.sadd(tag_key, value_key)
+                # Keep the tag set alive as long as its longest-lived key
+                pipe.expire(tag_key, ttl_seconds, nx=True)
+                pipe.expire(tag_key, ttl_seconds, gt=True)
+            if generation is not None and unique_tags:
+                pipe.mget([self._tag_generation_key(tag) for tag in unique_tags])
+            results = pipe.execute()
+
+            # invalidate_tags records the tag generations before it reads the
+            # tag sets, so a write that missed them is deleted by it instead
+            if generation is not None and unique_tags:
+                if any(int(g) > generation for g in results[-1] if g is not None):
+                    logger.debug(f"Cache value for key: {key} is stale, not stored")
+                    self.client.delete(value_key)
+                    return
+        except Exception as e:
+            self._record_error("set", e)
+            return
+
+        logger.debug(f"Cache set for key: {key}, TTL: {ttl_seconds}s")
+
+    def delete(self, key: str) -> None:
+        """
+        Delete a value from the cache.
+
+        Args:
+            key: Cache key
+        """
+        try:
+            self.client.delete(self._value_key(key))
+        except Exception as e:
+            self._record_error("delete", e)
+
+    def clear(self) -> None:
+        """Clear all values written under this backend's namespace."""
+        self._delete_matching(f"{_escape_glob(self.namespace)}*")
+        logger.debug("Cache cleared")
+
+    def invalidate_pattern(self, pattern: str) -> int:
+        """
+        Invalidate all cache keys matching a pattern.
+
+        Args:
+            pattern: Pattern to match (simple string prefix matching)
+
+        Returns:
+            Number of invalidated entries
+        """
+        deleted = self._delete_matching(
+            f"{_escape_glob(self._value_key(pattern))}*",
+        )
+        if deleted:
+            logger.debug(
+                f"Invalidated {deleted} cache entries matching pattern: {pattern}"
+            )
+        return deleted
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """
+        Invalidate all cache entries carrying any of the given tags.
+
+        Args:
+            tags: Tags to invalidate
+
+        Returns:
+            Number of invalidated entries
+        """
+        tag_keys = [self._tag_key(tag) for tag in set(tags)]
+        if not tag_keys:
+            return 0
+
+        try:
+            generation = self.client.incr(self._generation_key())
+            pipe = self.client.pipeline(transaction=False)
+            for tag in set(tags):
+                pipe.set(
+                    self._tag_generation_key(tag),
+                    generation,
+                    ex=TAG_GENERATION_TTL_SECONDS,
+                )
+            pipe.execute()
+
+            members = {tag_key: self.client.smembers(tag_key) for tag_key in tag_keys}
+            value_keys = set().union(*members.values())
+            if not value_keys:
+                return 0
+
+            # Remove only the members that were read, so that keys tagged by a
+            # concurrent set after SMEMBERS stay reachable through their tag
+            pipe = self.client.pipeline(transaction=True)
+            pipe.delete(*value_keys)
+            for tag_key, tag_members in members.items():
+                if tag_members:
+                    pipe.srem(tag_key, *tag_members)
+            deleted = int(pipe.execute()[0])
+        except Exception as e:
+            self._record_error("invalidate_tags", e)
+            return 0
+
+        if deleted:
+            logger.debug(f"Invalidated {deleted} tagged cache entries")
+        return deleted
+
+    def generation(self) -> int:
+        """
+        Get the current tag invalidation generation shared by all workers.
+
+        Returns:
+            Generation, or 0 if Redis is unavailable
+        """
+        try:
+            return int(self.client.get(self._generation_key()) or 0)
+        except Exception as e:
+            self._record_error("generation", e)
+            return 0
+
+    def stats(self) -> dict[str, int]:
+        """
+        Get this process's cache counters.
+
+        Returns:
+            Dictionary with hits, misses and errors since process start
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "errors": self._errors,
+            }
+
+    def _value_key(self, key: str) -> str:
+        return f"{self.namespace}{key}"
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.namespace}tag:{tag}"
+
+    def _tag_generation_key(self, tag: str) -> str:
+        return f"{self.namespace}tag-generation:{tag}"
+
+    def _generation_key(self) -> str:
+        return f"{self.namespace}generation"
+
+    def _delete_matching(self, match: str) -> int:
+        """Delete all keys matching a SCAN pattern in batches."""
+        deleted = 0
+        try:
+            batch: list[bytes] = []
+            for redis_key in self.client.scan_iter(match=match, count=1000):
+                batch.append(redis_key)
+                if len(batch) >= 1000:
+                    deleted += self.client.delete(*batch)
+                    batch = []
+            if batch:
+                deleted += self.client.delete(*batch)
+        except Exception as e:
+            self._record_error("scan", e)
+        return deleted
+
+    def _record_error(self, operation: str, error: Exception) -> None:
+        with self._lock:
+            self._errors += 1
+        logger.warning(f"Redis cache {operation} failed: {error}")
+
+
+def _escape_glob(text: str) -> str:
+    """Escape Redis SCAN MATCH special characters."""
+    return "".join(
+        f"\\{char}" if char in _GLOB_SPECIAL_CHARS else char for char in text
+    )
+
+
+def create_cache_manager() -> CacheBackend:
+    """
+    Create the cache backend selected by CACHE_BACKEND.
+
+    Returns:
+        CacheManager for "memory", RedisCacheBackend for "redis"
+    """
+    if settings.CACHE_BACKEND == "redis":
+        # Optional dependency, only needed when the Redis backend is selected
+        import redis
+
+        client = redis.Redis.from_url(settings.CACHE_REDIS_URL)
+        logger.info("Using Redis cache backend")
+        return RedisCacheBackend(client, namespace=settings.CACHE_KEY_PREFIX)
+
+    return CacheManager(
+        max_entries=settings.CACHE_MAX_ENTRIES,
+        max_bytes=settings.CACHE_MAX_BYTES,
+        sweep_interval_seconds=settings.CACHE_SWEEP_INTERVAL_SECONDS,
+    )
 
 
 # Global cache manager instance
-_cache_manager = CacheManager()
+_cache_manager = create_cache_manager()
 
 
-def get_cache_manager() -> CacheManager:
+def get_cache_manager() -> CacheBackend:
     """
     Get the global cache manager instance.
 
     Returns:
-        Global CacheManager instance
+        Global cache backend (CacheManager unless CACHE_BACKEND is "redis")
     """
     return _cache_manager
 
 
+@dataclass
+class _CachedCall:
+    """Dependencies declared by the function running inside @cached."""
+
+    tags: set[str]
+    cacheable: bool = True
+
+
+_current_cached_call: ContextVar[_CachedCall | None] = ContextVar(
+    "current_cached_call", default=None
+)
+
+
+def add_cache_tags(*tags: str) -> None:
+    """
+    Declare tags that the result of the running @cached function depends on.
+
+    The result is stored with these tags, so invalidate_tags() (for example
+    through invalidate_person_cache) drops it. Outside of a @cached call this
+    does nothing. Tags are not propagated to enclosing @cached calls.
+
+    Args:
+        tags: Cache tags, e.g. from person_cache_tag()
+    """
+    call = _current_cached_call.get()
+    if call is not None:
+        call.tags.update(tags)
+
+
+def skip_result_caching() -> None:
+    """
+    Prevent the result of the running @cached function from being stored.
+
+    Use for partial results or results whose dependencies cannot be tagged.
+    Outside of a @cached call this does nothing.
+    """
+    call = _current_cached_call.get()
+    if call is not None:
+        call.cacheable = False
+
+
+def person_cache_tag(person_id: uuid.UUID) -> str:
+    """
+    Get the cache tag for results that depend on a person's relationships.
+
+    Args:
+        person_id: Person ID
+
+    Returns:
+        Cache tag
+    """
+    return f"person:{person_id}"
+
+
+def invalidate_person_cache(person_ids: Iterable[uuid.UUID]) -> None:
+    """
+    Invalidate cached results tagged with any of the given persons.
+
+    This should be called when relationships of these persons are created,
+    updated, or deleted.
+
+    Args:
+        person_ids: Persons whose relationships changed
+    """
+    invalidated = get_cache_manager().invalidate_tags(
+        person_cache_tag(person_id) for person_id in person_ids
+    )
+    if invalidated:
+        logger.debug(f"Invalidated {invalidated} cached results for changed persons")
+
+
+def _build_cache_key(
+    key_prefix: str,
+    func: Callable[..., Any],
+    signature: inspect.Signature,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> str:
+    """
+    Build a cache key from the function name and its bound arguments.
+
+    Arguments are bound to the signature, so positional and keyword calls
+    produce the same key. Values appear in parameter order; None is written
+    as "None" and arguments of other types (self, sessions) are skipped.
+    """
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+
+    cache_key_parts = [key_prefix, func.__name__]
+    for value in bound.arguments.values():
+        if value is None or isinstance(value, uuid.UUID | str | int | float | bool):
+            cache_key_parts.append(str(value))
+    return ":".join(cache_key_parts)
+
+
 def cached(ttl_seconds: int = 300, key_prefix: str = "") -> Callable[..., Any]:
     """
     Decorator to cache function results with TTL.
 
+    The decorated function can call add_cache_tags() to declare what its
+    result depends on, and skip_result_caching() to keep a result out of the
+    cache.
+
     Args:
         ttl_seconds: Time to live in seconds (default: 300 = 5 minutes)
         key_prefix: Prefix for cache keys (default: empty string)
@@ -125,31 +936,17 @@ def cached(ttl_seconds: int = 300, key_prefix: str = "") -> Callable[..., Any]:
     Example:
         @cached(ttl_seconds=300, key_prefix="discovery")
         def discover_family_members(user_id: uuid.UUID) -> list:
+            add_cache_tags(person_cache_tag(person_id))
             # Expensive operation
             return results
     """
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        signature = inspect.signature(func)
+
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Build cache key from function name and arguments
-            # Convert UUID arguments to strings for cache key
-            cache_key_parts = [key_prefix, func.__name__]
-
-            for arg in args:
-                if isinstance(arg, uuid.UUID):
-                    cache_key_parts.append(str(arg))
-                elif isinstance(arg, (str, int, float, bool)):
-                    cache_key_parts.append(str(arg))
-                # Skip non-hashable types like Session
-
-            for key, value in sorted(kwargs.items()):
-                if isinstance(value, uuid.UUID):
-                    cache_key_parts.append(f"{key}={str(value)}")
-                elif isinstance(value, (str, int, float, bool)):
-                    cache_key_parts.append(f"{key}={str(value)}")
-
-            cache_key = ":".join(cache_key_parts)
+            cache_key = _build_cache_key(key_prefix, func, signature, args, kwargs)
 
             # Try to get from cache
             cache_manager = get_cache_manager()
@@ -159,12 +956,28 @@ def cached(ttl_seconds: int = 300, key_prefix: str = "") -> Callable[..., Any]:
                 logger.debug(f"Returning cached result for {func.__name__}")
                 return cached_value
 
-            # Call the function
+            # Read before computing, so that a result made stale by a tag
+            # invalidation during the call is not stored
+            generation = cache_manager.generation()
+
+            # Call the function, collecting the dependencies it declares
             logger.debug(f"Cache miss for {func.__name__}, executing function")
-            result = func(*args, **kwargs)
+            call = _CachedCall(tags=set())
+            token = _current_cached_call.set(call)
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                _current_cached_call.reset(token)
 
             # Store in cache
-            cache_manager.set(cache_key, result, ttl_seconds)
+            if call.cacheable:
+                cache_manager.set(
+                    cache_key,
+                    result,
+                    ttl_seconds,
+                    tags=call.tags,
+                    generation=generation,
+                )
 
             return result
 
@@ -175,15 +988,16 @@ def cached(ttl_seconds: int = 300, key_prefix: str = "") -> Callable[..., Any]:
 
 def invalidate_discovery_cache(user_id: uuid.UUID) -> None:
     """
-    Invalidate discovery cache for a specific user.
+    Invalidate discovery cache entries requested by a specific user.
 
-    This should be called when relationships are created, updated, or deleted
-    to ensure the discovery results are refreshed.
+    Covers both the user's own discovery and discoveries for persons the user
+    requested with person_id. Relationship writes use invalidate_person_cache
+    instead, which also reaches entries of other users that depend on the
+    changed persons.
 
     Args:
         user_id: User ID whose discovery cache should be invalidated
     """
     cache_manager = get_cache_manager()
-    cache_key_pattern = f"discovery:discover_family_members:{str(user_id)}"
-    cache_manager.delete(cache_key_pattern)
+    cache_manager.invalidate_pattern(f"discovery:discover_family_members:{user_id}")
     logger.info(f"Invalidated discovery cache for user: {user_id}")
@@ -323,6 +323,24 @@ class TestSearchPersonValidation:
         content = response.json()
         assert "Invalid filter combination" in content["detail"]
 
+    def test_search_invalid_cursor_returns_400(
+        self,
+        client: TestClient,
+        superuser_token_headers: dict[str, str],
+    ) -> None:
+        """Test 400 error when the cursor is not one issued by the search."""
+        search_data = create_valid_search_request()
+        search_data["cursor"] = "not-a-cursor"
+
+        response = client.post(
+            f"{settings.API_V1_STR}/person/search",
+            headers=superuser_token_headers,
+            json=search_data,
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid search cursor"
+
 
 # =============================================================================
 # Internal Error Tests
@@ -111,3 +111,40 @@ def test_clear_all_cache_as_normal_user(
         headers=normal_user_token_headers,
     )
     assert response.status_code == 403
+
+
+def test_get_cache_stats_as_superuser(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    """Test reading cache counters as superuser."""
+    cache_manager = get_cache_manager()
+    cache_manager.set("stats:key", "value", ttl_seconds=60)
+    cache_manager.get("stats:key")
+
+    response = client.get(
+        f"{settings.API_V1_STR}/utils/cache/stats",
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["hits"] >= 1
+    assert data["entries"] >= 1
+    assert set(data) == {
+        "hits",
+        "misses",
+        "evictions",
+        "expirations",
+        "entries",
+        "bytes",
+    }
+
+
+def test_get_cache_stats_as_normal_user(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    """Test that normal users cannot read cache stats."""
+    response = client.get(
+        f"{settings.API_V1_STR}/utils/cache/stats",
+        headers=normal_user_token_headers,
+    )
+    assert response.status_code == 403
@@ -10,10 +10,12 @@ Tests use seeded data from init_seed scripts and dynamically created test data.
 """
 
 import uuid
+from collections.abc import Generator
+from unittest.mock import patch
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import Session, select
+from sqlmodel import Session, delete, select
 
 from app.core.config import settings
 from app.db_models.address.country import Country
@@ -58,6 +60,66 @@ def get_seeded_address_hierarchy(db: Session) -> dict[str, uuid.UUID | None]:
     }
 
 
+@pytest.fixture
+def address_tree(db: Session) -> Generator[dict[str, uuid.UUID], None, None]:
+    """Create a small address hierarchy under a new country.
+
+    country
+    ├── state_1: district_1 (sub_district_1: locality_1, locality_2;
+    │            sub_district_2), district_2
+    ├── state_2: district_3 (sub_district_3: locality_3)
+    └── inactive_state
+
+    Yields the IDs by name; every row under the country is removed afterwards.
+    """
+    country = Country(
+        name=f"Test Country {uuid.uuid4().hex[:8]}",
+        code=f"{uuid.uuid4().int % 1000:03d}",
+    )
+    db.add(country)
+    db.flush()
+    rows: dict[str, Country | State | District | SubDistrict | Locality] = {
+        "country": country
+    }
+    for name, parent, model, parent_field in [
+        ("state_1", "country", State, "country_id"),
+        ("state_2", "country", State, "country_id"),
+        ("district_1", "state_1", District, "state_id"),
+        ("district_2", "state_1", District, "state_id"),
+        ("district_3", "state_2", District, "state_id"),
+        ("sub_district_1", "district_1", SubDistrict, "district_id"),
+        ("sub_district_2", "district_1", SubDistrict, "district_id"),
+        ("sub_district_3", "district_3", SubDistrict, "district_id"),
+        ("locality_1", "sub_district_1", Locality, "sub_district_id"),
+        ("locality_2", "sub_district_1", Locality, "sub_district_id"),
+        ("locality_3", "sub_district_3", Locality, "sub_district_id"),
+    ]:
+        rows[name] = model(name=f"Test {name}", **{parent_field: rows[parent].id})
+        db.add(rows[name])
+        db.flush()
+    rows["inactive_state"] = State(
+        name="Test inactive_state", country_id=country.id, is_active=False
+    )
+    db.add(rows["inactive_state"])
+    db.commit()
+    ids = {name: row.id for name, row in rows.items()}
+
+    yield ids
+
+    # Remove rows added by the tests too, e.g. states created through the API
+    state_ids = select(State.id).where(State.country_id == ids["country"])
+    district_ids = select(District.id).where(District.state_id.in_(state_ids))
+    sub_district_ids = select(SubDistrict.id).where(
+        SubDistrict.district_id.in_(district_ids)
+    )
+    db.execute(delete(Locality).where(Locality.sub_district_id.in_(sub_district_ids)))
+    db.execute(delete(SubDistrict).where(SubDistrict.id.in_(sub_district_ids)))
+    db.execute(delete(District).where(District.id.in_(district_ids)))
+    db.execute(delete(State).where(State.country_id == ids["country"]))
+    db.execute(delete(Country).where(Country.id == ids["country"]))
+    db.commit()
+
+
 # ============================================================================
 # Integration Tests - Country Endpoints (Task 30.1)
 # ============================================================================
@@ -454,3 +516,285 @@ class TestNonExistentAddressHierarchy:
         non_existent_uuid = uuid.uuid4()
         r = client.get(f"{settings.API_V1_STR}/metadata/address/sub-district/{non_existent_uuid}/localities")
         assert r.status_code == 404
+
+
+# ============================================================================
+# Integration Tests - Reference Data Caching
+# ============================================================================
+
+
+@pytest.mark.integration
+class TestAddressReferenceDataCaching:
+    """Integration tests for conditional GET and compression of address lists."""
+
+    def test_list_has_etag_and_cache_control(
+        self, client: TestClient, address_tree: dict[str, uuid.UUID]
+    ) -> None:
+        """Test that a list response carries an ETag and Cache-Control."""
+        r = client.get(
+            f"{settings.API_V1_STR}/metadata/address/country/{address_tree['country']}/states"
+        )
+        assert r.status_code == 200
+        assert r.headers["ETag"].startswith('"')
+        assert "must-revalidate" in r.headers["Cache-Control"]
+        assert (
+            f"max-age={settings.REFERENCE_DATA_MAX_AGE_SECONDS}"
+            in r.headers["Cache-Control"]
+        )
+
+    def test_matching_if_none_match_returns_304(
+        self, client: TestClient, address_tree: dict[str, uuid.UUID]
+    ) -> None:
+        """Test that revalidating with the current ETag returns an empty 304."""
+        url = f"{settings.API_V1_STR}/metadata/address/state/{address_tree['state_1']}/districts"
+        etag = client.get(url).headers["ETag"]
+
+        r = client.get(url, headers={"If-None-Match": etag})
+        assert r.status_code == 304
+        assert r.content == b""
+        assert r.headers["ETag"] == etag
+
+    def test_etag_changes_after_admin_write(
+        self, client: TestClient, db: Session, address_tree: dict[str, uuid.UUID]
+    ) -> None:
+        """Test that an admin write makes the old ETag miss."""
+        url = f"{settings.API_V1_STR}/metadata/address/country/{address_tree['country']}/states"
+        etag = client.get(url).headers["ETag"]
+
+        r = client.post(
+            f"{settings.API_V1_STR}/metadata/address/states",
+            headers=get_admin_auth_headers(client, db),
+            json={"name": "Test new_state", "country_id": str(address_tree["country"])},
+        )
+        assert r.status_code == 200
+        new_state_id = r.json()["id"]
+
+        r = client.get(url, headers={"If-None-Match": etag})
+        assert r.status_code == 200
+        assert r.headers["ETag"] != etag
+        assert new_state_id in [state["stateId"] for state in r.json()]
+
+    def test_unknown_parent_returns_404_and_is_not_cached(
+        self, client: TestClient, db: Session, address_tree: dict[str, uuid.UUID]
+    ) -> None:
+        """Test that a 404 for an unknown parent is not served from the cache."""
+        state_id = uuid.uuid4()
+        url = f"{settings.API_V1_STR}/metadata/address/state/{state_id}/districts"
+
+        r = client.get(url)
+        assert r.status_code == 404
+        assert "ETag" not in r.headers
+
+        # Added without the write hooks, so the table counters may not have
+        # been re-read yet; the next request must still see the new state
+        db.add(State(id=state_id, name="Test late_state", country_id=address_tree["country"]))
+        db.commit()
+
+        r = client.get(url)
+        assert r.status_code == 200
+        assert r.json() == []
+
+    def test_large_body_is_gzipped(
+        self, client: TestClient, address_tree: dict[str, uuid.UUID]
+    ) -> None:
+        """Test that bodies over the threshold are gzipped for gzip clients."""
+        url = f"{settings.API_V1_STR}/metadata/address/country/{address_tree['country']}/states"
+
+        with patch.object(settings, "REFERENCE_DATA_GZIP_MIN_BYTES", 1):
+            r = client.get(url, headers={"Accept-Encoding": "gzip"})
+        assert r.status_code == 200
+        assert r.headers["Content-Encoding"] == "gzip"
+        assert r.headers["Vary"] == "Accept-Encoding"
+        assert len(r.json()) == 2
+
+        r = client.get(url, headers={"Accept-Encoding": "identity"})
+        assert r.status_code == 200
+        assert "Content-Encoding" not in r.headers
+        assert r.headers["Vary"] == "Accept-Encoding"
+        assert len(r.json()) == 2
+
+    def test_small_body_is_not_gzipped(
+        self, client: TestClient, address_tree: dict[str, uuid.UUID]
+    ) -> None:
+        """Test that bodies under the threshold are sent uncompressed."""
+        r = client.get(
+            f"{settings.API_V1_STR}/metadata/address/country/{address_tree['country']}/states",
+            headers={"Accept-Encoding": "gzip"},
+        )
+        assert r.status_code == 200
+        assert "Content-Encoding" not in r.headers
+        assert "Vary" not in r.headers
+
+
+# ============================================================================
+# Integration Tests - Address Trees
+# ============================================================================
+
+
+# URL segment and fixture row of each tree root level
+TREE_ROOTS = [
+    ("country", "country"),
+    ("state", "state_1"),
+    ("district", "district_1"),
+    ("sub-district", "sub_district_1"),
+]
+
+
+def assert_tree_levels(
+    tree: dict, address_tree: dict[str, uuid.UUID], expected: dict[str, list[str]]
+) -> None:
+    """Check a tree's levels against fixture rows, following parent indexes.
+
+    Args:
+        tree: Tree response body
+        address_tree: IDs of the fixture rows by name
+        expected: Fixture row names expected at each level, in order
+    """
+    parent_names = {
+        "state_1": "country",
+        "state_2": "country",
+        "district_1": "state_1",
+        "district_2": "state_1",
+        "district_3": "state_2",
+        "sub_district_1": "district_1",
+        "sub_district_2": "district_1",
+        "sub_district_3": "district_3",
+        "locality_1": "sub_district_1",
+        "locality_2": "sub_district_1",
+        "locality_3": "sub_district_3",
+    }
+    names_by_id = {str(row_id): name for name, row_id in address_tree.items()}
+
+    assert [level["level"] for level in tree["levels"]] == list(expected)
+    previous_ids = [tree["id"]]
+    for level in tree["levels"]:
+        assert len(level["ids"]) == len(level["names"]) == len(level["parents"])
+        names = [names_by_id[row_id] for row_id in level["ids"]]
+        assert sorted(names) == sorted(expected[level["level"]])
+        assert level["names"] == [f"Test {name}" for name in names]
+        for name, parent in zip(names, level["parents"]):
+            assert names_by_id[previous_ids[parent]] == parent_names[name]
+        previous_ids = level["ids"]
+
+
+@pytest.mark.integration
+class TestAddressTreeEndpoints:
+    """Integration tests for the address subtree endpoints."""
+
+    def test_get_country_tree(
+        self, client: TestClient, address_tree: dict[str, uuid.UUID]
+    ) -> None:
+        """Test GET /metadata/address/country/{country_id}/tree - active subtree."""
+        r = client.get(
+            f"{settings.API_V1_STR}/metadata/address/country/{address_tree['country']}/tree"
+        )
+        assert r.status_code == 200
+        tree = r.json()
+        assert tree["level"] == "country"
+        assert tree["id"] == str(address_tree["country"])
+        assert_tree_levels(
+            tree,
+            address_tree,
+            {
+                "state": ["state_1", "state_2"],
+                "district": ["district_1", "district_2", "district_3"],
+                "sub_district": ["sub_district_1", "sub_district_2", "sub_district_3"],
+                "locality": ["locality_1", "locality_2", "locality_3"],
+            },
+        )
+
+    def test_get_state_tree(
+        self, client: TestClient, address_tree: dict[str, uuid.UUID]
+    ) -> None:
+        """Test GET /metadata/address/state/{state_id}/tree - active subtree."""
+        r = client.get(
+            f"{settings.API_V1_STR}/metadata/address/state/{address_tree['state_1']}/tree"
+        )
+        assert r.status_code == 200
+        tree = r.json()
+        assert tree["level"] == "state"
+        assert tree["name"] == "Test state_1"
+        assert_tree_levels(
+            tree,
+            address_tree,
+            {
+                "district": ["district_1", "district_2"],
+                "sub_district": ["sub_district_1", "sub_district_2"],
+                "locality": ["locality_1", "locality_2"],
+            },
+        )
+
+    def test_get_district_tree(
+        self, client: TestClient, address_tree: dict[str, uuid.UUID]
+    ) -> None:
+        """Test GET /metadata/address/district/{district_id}/tree - active subtree."""
+        r = client.get(
+            f"{settings.API_V1_STR}/metadata/address/district/{address_tree['district_1']}/tree"
+        )
+        assert r.status_code == 200
+        tree = r.json()
+        assert tree["level"] == "district"
+        assert_tree_levels(
+            tree,
+            address_tree,
+            {
+                "sub_district": ["sub_district_1", "sub_district_2"],
+                "locality": ["locality_1", "locality_2"],
+            },
+        )
+
+    def test_get_sub_district_tree(
+        self, client: TestClient, address_tree: dict[str, uuid.UUID]
+    ) -> None:
+        """Test GET /metadata/address/sub-district/{sub_district_id}/tree."""
+        r = client.get(
+            f"{settings.API_V1_STR}/metadata/address/sub-district/{address_tree['sub_district_1']}/tree"
+        )
+        assert r.status_code == 200
+        tree = r.json()
+        assert tree["level"] == "sub_district"
+        assert_tree_levels(
+            tree, address_tree, {"locality": ["locality_1", "locality_2"]}
+        )
+
+    def test_get_tree_of_leafless_root(
+        self, client: TestClient, address_tree: dict[str, uuid.UUID]
+    ) -> None:
+        """Test that a root without children has empty levels below it."""
+        r = client.get(
+            f"{settings.API_V1_STR}/metadata/address/district/{address_tree['district_2']}/tree"
+        )
+        assert r.status_code == 200
+        assert r.json()["levels"] == [
+            {"level": "sub_district", "ids": [], "names": [], "parents": []},
+            {"level": "locality", "ids": [], "names": [], "parents": []},
+        ]
+
+    @pytest.mark.parametrize("segment", [segment for segment, _ in TREE_ROOTS])
+    def test_get_tree_unknown_root_returns_404(
+        self, client: TestClient, segment: str
+    ) -> None:
+        """Test that the tree of a non-existent root returns 404."""
+        r = client.get(
+            f"{settings.API_V1_STR}/metadata/address/{segment}/{uuid.uuid4()}/tree"
+        )
+        assert r.status_code == 404
+
+    @pytest.mark.parametrize("segment,root", TREE_ROOTS)
+    def test_get_tree_revalidates_with_etag(
+        self,
+        client: TestClient,
+        address_tree: dict[str, uuid.UUID],
+        segment: str,
+        root: str,
+    ) -> None:
+        """Test that a tree is revalidated with its ETag."""
+        url = f"{settings.API_V1_STR}/metadata/address/{segment}/{address_tree[root]}/tree"
+        r = client.get(url)
+        assert r.status_code == 200
+        etag = r.headers["ETag"]
+        assert "must-revalidate" in r.headers["Cache-Control"]
+
+        r = client.get(url, headers={"If-None-Match": etag})
+        assert r.status_code == 304
+        assert r.content == b""
@@ -9,10 +9,12 @@ Tests use seeded data from init_seed scripts and dynamically created test data.
 """
 
 import uuid
+from collections.abc import Generator
+from unittest.mock import patch
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import Session, select
+from sqlmodel import Session, delete, select
 
 from app.core.config import settings
 from app.db_models.religion.religion import Religion
@@ -51,6 +53,58 @@ def get_seeded_religion_hierarchy(db: Session) -> dict[str, uuid.UUID | None]:
     }
 
 
+@pytest.fixture
+def religion_hierarchy(db: Session) -> Generator[dict[str, uuid.UUID], None, None]:
+    """Create a new religion with two categories and two sub-categories.
+
+    Yields the IDs by name; every row under the religion is removed afterwards.
+    """
+    religion = Religion(
+        name=f"Test Religion {uuid.uuid4().hex[:8]}",
+        code=uuid.uuid4().hex[:10].upper(),
+    )
+    db.add(religion)
+    db.flush()
+    category_1 = ReligionCategory(name="Test category_1", religion_id=religion.id)
+    category_2 = ReligionCategory(name="Test category_2", religion_id=religion.id)
+    db.add(category_1)
+    db.add(category_2)
+    db.flush()
+    sub_category_1 = ReligionSubCategory(
+        name="Test sub_category_1", category_id=category_1.id
+    )
+    sub_category_2 = ReligionSubCategory(
+        name="Test sub_category_2", category_id=category_1.id
+    )
+    db.add(sub_category_1)
+    db.add(sub_category_2)
+    db.commit()
+    ids = {
+        "religion": religion.id,
+        "category_1": category_1.id,
+        "category_2": category_2.id,
+        "sub_category_1": sub_category_1.id,
+        "sub_category_2": sub_category_2.id,
+    }
+
+    yield ids
+
+    # Remove rows added by the tests too, e.g. categories created through the API
+    category_ids = select(ReligionCategory.id).where(
+        ReligionCategory.religion_id == ids["religion"]
+    )
+    db.execute(
+        delete(ReligionSubCategory).where(
+            ReligionSubCategory.category_id.in_(category_ids)
+        )
+    )
+    db.execute(
+        delete(ReligionCategory).where(ReligionCategory.religion_id == ids["religion"])
+    )
+    db.execute(delete(Religion).where(Religion.id == ids["religion"]))
+    db.commit()
+
+
 # ============================================================================
 # Integration Tests - Religion Endpoints (Task 31.1)
 # ============================================================================
@@ -298,3 +352,126 @@ class TestNonExistentReligionHierarchy:
         non_existent_uuid = uuid.uuid4()
         r = client.get(f"{settings.API_V1_STR}/metadata/religion/category/{non_existent_uuid}/sub-categories")
         assert r.status_code == 404
+
+
+# ============================================================================
+# Integration Tests - Reference Data Caching
+# ============================================================================
+
+
+@pytest.mark.integration
+class TestReligionReferenceDataCaching:
+    """Integration tests for conditional GET and compression of religion lists."""
+
+    def test_list_has_etag_and_cache_control(
+        self, client: TestClient, religion_hierarchy: dict[str, uuid.UUID]
+    ) -> None:
+        """Test that a list response carries an ETag and Cache-Control."""
+        r = client.get(
+            f"{settings.API_V1_STR}/metadata/religion/religion/{religion_hierarchy['religion']}/categories"
+        )
+        assert r.status_code == 200
+        assert r.headers["ETag"].startswith('"')
+        assert "must-revalidate" in r.headers["Cache-Control"]
+        assert (
+            f"max-age={settings.REFERENCE_DATA_MAX_AGE_SECONDS}"
+            in r.headers["Cache-Control"]
+        )
+
+    def test_matching_if_none_match_returns_304(
+        self, client: TestClient, religion_hierarchy: dict[str, uuid.UUID]
+    ) -> None:
+        """Test that revalidating with the current ETag returns an empty 304."""
+        url = f"{settings.API_V1_STR}/metadata/religion/category/{religion_hierarchy['category_1']}/sub-categories"
+        etag = client.get(url).headers["ETag"]
+
+        r = client.get(url, headers={"If-None-Match": etag})
+        assert r.status_code == 304
+        assert r.content == b""
+        assert r.headers["ETag"] == etag
+
+    def test_etag_changes_after_admin_write(
+        self,
+        client: TestClient,
+        db: Session,
+        religion_hierarchy: dict[str, uuid.UUID],
+    ) -> None:
+        """Test that an admin write makes the old ETag miss."""
+        url = f"{settings.API_V1_STR}/metadata/religion/religion/{religion_hierarchy['religion']}/categories"
+        etag = client.get(url).headers["ETag"]
+
+        r = client.post(
+            f"{settings.API_V1_STR}/metadata/religion/categories",
+            headers=get_admin_auth_headers(client, db),
+            json={
+                "name": "Test new_category",
+                "religion_id": str(religion_hierarchy["religion"]),
+            },
+        )
+        assert r.status_code == 200
+        new_category_id = r.json()["id"]
+
+        r = client.get(url, headers={"If-None-Match": etag})
+        assert r.status_code == 200
+        assert r.headers["ETag"] != etag
+        assert new_category_id in [category["categoryId"] for category in r.json()]
+
+    def test_unknown_parent_returns_404_and_is_not_cached(
+        self,
+        client: TestClient,
+        db: Session,
+        religion_hierarchy: dict[str, uuid.UUID],
+    ) -> None:
+        """Test that a 404 for an unknown parent is not served from the cache."""
+        category_id = uuid.uuid4()
+        url = f"{settings.API_V1_STR}/metadata/religion/category/{category_id}/sub-categories"
+
+        r = client.get(url)
+        assert r.status_code == 404
+        assert "ETag" not in r.headers
+
+        # Added without the write hooks, so the table counters may not have
+        # been re-read yet; the next request must still see the new category
+        db.add(
+            ReligionCategory(
+                id=category_id,
+                name="Test late_category",
+                religion_id=religion_hierarchy["religion"],
+            )
+        )
+        db.commit()
+
+        r = client.get(url)
+        assert r.status_code == 200
+        assert r.json() == []
+
+    def test_large_body_is_gzipped(
+        self, client: TestClient, religion_hierarchy: dict[str, uuid.UUID]
+    ) -> None:
+        """Test that bodies over the threshold are gzipped for gzip clients."""
+        url = f"{settings.API_V1_STR}/metadata/religion/religion/{religion_hierarchy['religion']}/categories"
+
+        with patch.object(settings, "REFERENCE_DATA_GZIP_MIN_BYTES", 1):
+            r = client.get(url, headers={"Accept-Encoding": "gzip"})
+        assert r.status_code == 200
+        assert r.headers["Content-Encoding"] == "gzip"
+        assert r.headers["Vary"] == "Accept-Encoding"
+        assert len(r.json()) == 2
+
+        r = client.get(url, headers={"Accept-Encoding": "identity"})
+        assert r.status_code == 200
+        assert "Content-Encoding" not in r.headers
+        assert r.headers["Vary"] == "Accept-Encoding"
+        assert len(r.json()) == 2
+
+    def test_small_body_is_not_gzipped(
+        self, client: TestClient, religion_hierarchy: dict[str, uuid.UUID]
+    ) -> None:
+        """Test that bodies under the threshold are sent uncompressed."""
+        r = client.get(
+            f"{settings.API_V1_STR}/metadata/religion/religion/{religion_hierarchy['religion']}/categories",
+            headers={"Accept-Encoding": "gzip"},
+        )
+        assert r.status_code == 200
+        assert "Content-Encoding" not in r.headers
+        assert "Vary" not in r.headers
@@ -1,7 +1,7 @@
 """Unit tests for PersonRepository."""
 
 import uuid
-from datetime import date
+from datetime import date, datetime
 from unittest.mock import MagicMock
 
 import pytest
@@ -9,6 +9,7 @@ from sqlmodel import Session, select
 
 from app.db_models.person.gender import Gender
 from app.db_models.person.person import Person
+from app.db_models.profile_view_tracking import ProfileViewTracking
 from app.models import User
 from app.repositories.person.person_repository import PersonRepository
 
@@ -340,3 +341,74 @@ class TestGetByCreator:
         db.delete(person4)
         db.commit()
 
+
+@pytest.mark.integration
+class TestGetByCreatorWithViews:
+    """Tests for get_by_creator_with_views method."""
+
+    @pytest.fixture
+    def persons(
+        self, db: Session, test_user: User, male_gender: Gender
+    ) -> list[Person]:
+        """Create three persons, created one after another, with 0, 7 and 3 views."""
+        persons = []
+        for day, first_name in enumerate(["Old", "Middle", "New"], start=1):
+            person = Person(
+                created_by_user_id=test_user.id,
+                first_name=first_name,
+                last_name="Doe",
+                gender_id=male_gender.id,
+                date_of_birth=date(1990, 1, 1),
+                created_at=datetime(2024, 1, day),
+            )
+            db.add(person)
+            persons.append(person)
+        db.commit()
+
+        viewer = persons[0]
+        for person, counts in [(persons[1], [4, 3]), (persons[2], [3])]:
+            for count in counts:
+                db.add(
+                    ProfileViewTracking(
+                        viewed_person_id=person.id,
+                        viewer_person_id=viewer.id,
+                        view_count=count,
+                        is_aggregated=True,
+                    )
+                )
+        db.commit()
+        return persons
+
+    def test_sorted_by_views_with_totals(
+        self, db: Session, test_user: User, persons: list[Person]
+    ) -> None:
+        """Test that persons come most viewed first with summed view counts."""
+        repo = PersonRepository(db)
+
+        result = repo.get_by_creator_with_views(test_user.id)
+
+        assert [(p.first_name, views) for p, views in result] == [
+            ("Middle", 7),
+            ("New", 3),
+            ("Old", 0),
+        ]
+
+    def test_sorted_by_created_at(
+        self, db: Session, test_user: User, persons: list[Person]
+    ) -> None:
+        """Test that created_at sorting returns the newest persons first."""
+        repo = PersonRepository(db)
+
+        result = repo.get_by_creator_with_views(test_user.id, sort_by="created_at")
+
+        assert [p.first_name for p, _ in result] == ["New", "Middle", "Old"]
+
+    def test_pagination(
+        self, db: Session, test_user: User, persons: list[Person]
+    ) -> None:
+        """Test that skip and limit page through the sorted persons."""
+        repo = PersonRepository(db)
+
+        result = repo.get_by_creator_with_views(test_user.id, skip=1, limit=1)
+
+        assert [(p.first_name, views) for p, views in result] == [("New", 3)]
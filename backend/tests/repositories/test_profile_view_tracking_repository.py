@@ -5,13 +5,18 @@ Full integration tests with actual Person records are in the integration test su
 """
 
 import uuid
+from datetime import datetime
+from unittest.mock import MagicMock
 
 import pytest
-from sqlmodel import Session
+from sqlmodel import Session, col, delete, select
 
+from app.db_models.profile_view_tracking import ProfileViewTracking
+from app.models import User
 from app.repositories.profile_view_tracking_repository import (
     ProfileViewTrackingRepository,
 )
+from tests.factories import PersonFactory
 
 
 class TestGetNonAggregatedView:
@@ -65,3 +70,103 @@ class TestGetTotalViewsForPersons:
         
         # Person with no views should not appear in result
         assert len(result) == 0
+
+
+@pytest.mark.integration
+class TestIncrementViews:
+    """Tests for increment_views method."""
+
+    def test_increment_views_inserts_then_increments(
+        self, db: Session, test_user: User
+    ) -> None:
+        """Test that increments create a pair record and then add to it."""
+        repo = ProfileViewTrackingRepository(db)
+        viewer = PersonFactory.create(db, created_by_user=test_user)
+        viewed = PersonFactory.create(db, created_by_user=test_user)
+        other_viewed = PersonFactory.create(db, created_by_user=test_user)
+        first_seen = datetime(2024, 1, 1, 12, 0)
+        last_seen = datetime(2024, 1, 2, 12, 0)
+
+        repo.increment_views(
+            [
+                (viewer.id, viewed.id, 3, first_seen),
+                (viewer.id, other_viewed.id, 1, first_seen),
+            ]
+        )
+        repo.increment_views([(viewer.id, viewed.id, 2, last_seen)])
+
+        record = repo.get_non_aggregated_view(viewer.id, viewed.id)
+        assert record is not None
+        db.refresh(record)
+        assert record.view_count == 5
+        # Keeps the latest view time (stored as timestamptz)
+        assert record.last_viewed_at.date() == last_seen.date()
+        assert repo.get_total_views_for_persons([viewed.id, other_viewed.id]) == {
+            viewed.id: 5,
+            other_viewed.id: 1,
+        }
+
+    def test_increment_views_with_empty_list(self, mock_session: MagicMock) -> None:
+        """Test that no statement is executed without increments."""
+        repo = ProfileViewTrackingRepository(mock_session)
+
+        repo.increment_views([])
+
+        mock_session.execute.assert_not_called()
+
+
+@pytest.mark.integration
+class TestRollUpViews:
+    """Tests for roll_up_views method."""
+
+    def test_roll_up_views_keeps_totals(self, db: Session, test_user: User) -> None:
+        """Test that old records move into monthly aggregates with exact totals."""
+        repo = ProfileViewTrackingRepository(db)
+        older_than = datetime(2025, 1, 1)
+        # Drop old records left by other tests so only this test's are rolled up
+        db.execute(
+            delete(ProfileViewTracking).where(
+                ProfileViewTracking.is_aggregated == False,  # noqa: E712
+                col(ProfileViewTracking.last_viewed_at) < older_than,
+            )
+        )
+        db.commit()
+        viewed = PersonFactory.create(db, created_by_user=test_user)
+        viewers = [
+            PersonFactory.create(db, created_by_user=test_user) for _ in range(4)
+        ]
+        seen_at = [
+            datetime(2024, 1, 10, 12, 0),
+            datetime(2024, 1, 20, 12, 0),
+            datetime(2024, 2, 5, 12, 0),
+            datetime(2099, 1, 1, 12, 0),  # Too recent to roll up
+        ]
+        for viewer, last_viewed_at, views in zip(viewers, seen_at, [2, 3, 4, 5]):
+            db.add(
+                ProfileViewTracking(
+                    viewer_person_id=viewer.id,
+                    viewed_person_id=viewed.id,
+                    view_count=views,
+                    last_viewed_at=last_viewed_at,
+                )
+            )
+        db.commit()
+
+        assert repo.roll_up_views(older_than, batch_size=2) == 2
+        assert repo.roll_up_views(older_than, batch_size=2) == 1
+        assert repo.roll_up_views(older_than, batch_size=2) == 0
+
+        assert repo.get_total_views_for_person(viewed.id) == 14
+        db.expire_all()
+        records = db.exec(
+            select(ProfileViewTracking).where(
+                ProfileViewTracking.viewed_person_id == viewed.id
+            )
+        ).all()
+        aggregated = {
+            r.period_start.month: r.view_count for r in records if r.is_aggregated
+        }
+        assert aggregated == {1: 5, 2: 4}
+        remaining = [r for r in records if not r.is_aggregated]
+        assert [r.viewer_person_id for r in remaining] == [viewers[3].id]
+        assert all(r.viewer_person_id is None for r in records if r.is_aggregated)
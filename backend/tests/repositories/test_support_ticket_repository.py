@@ -247,3 +247,44 @@ class TestCountAll:
         result = repo.count_all(status=IssueStatus.OPEN, issue_type=IssueType.BUG)
 
         assert result == 0
+
+
+@pytest.mark.unit
+class TestGetAllWithUsers:
+    """Tests for get_all_with_users method."""
+
+    def test_get_all_with_users_uses_window_count(
+        self, mock_session: MagicMock
+    ) -> None:
+        """Test get_all_with_users returns rows and the count from one query."""
+        repo = SupportTicketRepository(mock_session)
+        ticket = SupportTicket(
+            id=uuid.uuid4(),
+            user_id=uuid.uuid4(),
+            title="Issue 1",
+            description="Description 1",
+            issue_type=IssueType.BUG.value,
+            status=IssueStatus.OPEN.value,
+        )
+        mock_session.exec.return_value.all.return_value = [
+            (ticket, "user@example.com", "User", None, None, 25),
+        ]
+
+        rows, count = repo.get_all_with_users(skip=0, limit=1)
+
+        assert rows == [(ticket, "user@example.com", "User", None, None)]
+        assert count == 25
+        mock_session.exec.assert_called_once()
+
+    def test_get_all_with_users_counts_past_last_page(
+        self, mock_session: MagicMock
+    ) -> None:
+        """Test a page past the end still reports the total count."""
+        repo = SupportTicketRepository(mock_session)
+        mock_session.exec.return_value.all.return_value = []
+        mock_session.exec.return_value.one.return_value = 3
+
+        rows, count = repo.get_all_with_users(skip=100)
+
+        assert rows == []
+        assert count == 3
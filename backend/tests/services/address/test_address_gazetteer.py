@@ -0,0 +1,266 @@
+"""Tests for the in-memory AddressGazetteer.
+
+Tests cover:
+- Loading all address levels and resolving names without queries
+- Address formatting
+- Invalidation and TTL expiry
+- Invalidation from address metadata writes
+"""
+
+import uuid
+from collections.abc import Generator
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlmodel import Session
+
+from app.db_models.address import State
+from app.db_models.person.person_address import PersonAddress
+from app.schemas.address import StateUpdate
+from app.services import reference_snapshot as snapshot_module
+from app.services.address import StateService
+from app.services.address import address_gazetteer as gazetteer_module
+from app.services.address.address_gazetteer import AddressGazetteer, AddressNames
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+
+@pytest.fixture(autouse=True)
+def table_versions() -> Generator[dict[str, int], None, None]:
+    """Reference table change counters, served without the database."""
+    versions: dict[str, int] = {}
+    with patch.object(
+        snapshot_module.get_reference_data_cache(),
+        "get_versions",
+        return_value=versions,
+    ):
+        yield versions
+
+
+@pytest.fixture
+def mock_session() -> MagicMock:
+    """Create a mock database session."""
+    return MagicMock(spec=Session)
+
+
+@pytest.fixture
+def ids() -> dict[str, uuid.UUID]:
+    """One ID per address level."""
+    return {
+        level: uuid.uuid4()
+        for level in ("country", "state", "district", "sub_district", "locality")
+    }
+
+
+@pytest.fixture
+def loaded_session(mock_session: MagicMock, ids: dict[str, uuid.UUID]) -> MagicMock:
+    """A session returning one row per level, in load order."""
+    level_rows = [
+        [(ids["country"], "India")],
+        [(ids["state"], "Maharashtra", ids["country"])],
+        [(ids["district"], "Mumbai", ids["state"])],
+        [(ids["sub_district"], "Andheri", ids["district"])],
+        [(ids["locality"], "Versova", ids["sub_district"])],
+    ]
+    # Enough rows for two loads
+    mock_session.exec.return_value.all.side_effect = level_rows * 2
+    return mock_session
+
+
+def make_address(ids: dict[str, uuid.UUID], **overrides: object) -> PersonAddress:
+    """Create a full address for the fixture hierarchy."""
+    fields: dict[str, object] = {
+        "person_id": uuid.uuid4(),
+        "country_id": ids["country"],
+        "state_id": ids["state"],
+        "district_id": ids["district"],
+        "sub_district_id": ids["sub_district"],
+        "locality_id": ids["locality"],
+        "address_line": "12 Beach Road",
+        "start_date": date(2020, 1, 1),
+        "is_current": True,
+    }
+    fields.update(overrides)
+    return PersonAddress(**fields)
+
+
+# =============================================================================
+# Lookups
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestAddressGazetteerLookups:
+    """Tests for name resolution and formatting."""
+
+    def test_get_names_resolves_every_level(
+        self, loaded_session: MagicMock, ids: dict[str, uuid.UUID]
+    ) -> None:
+        """All five levels are resolved from one load."""
+        gazetteer = AddressGazetteer()
+        gazetteer.load(loaded_session)
+
+        names = gazetteer.get_names(make_address(ids))
+
+        assert names == AddressNames(
+            locality="Versova",
+            sub_district="Andheri",
+            district="Mumbai",
+            state="Maharashtra",
+            country="India",
+        )
+        assert loaded_session.exec.call_count == 5
+
+    def test_get_names_unset_and_unknown_levels_are_none(
+        self, loaded_session: MagicMock, ids: dict[str, uuid.UUID]
+    ) -> None:
+        """Unset or unknown IDs resolve to None."""
+        gazetteer = AddressGazetteer()
+        gazetteer.load(loaded_session)
+
+        names = gazetteer.get_names(
+            make_address(ids, locality_id=None, district_id=uuid.uuid4())
+        )
+
+        assert names.locality is None
+        assert names.district is None
+        assert names.country == "India"
+
+    def test_format_address_includes_address_line(
+        self, loaded_session: MagicMock, ids: dict[str, uuid.UUID]
+    ) -> None:
+        """Formatting lists the address line first, then most to least specific."""
+        gazetteer = AddressGazetteer()
+        gazetteer.load(loaded_session)
+
+        formatted = gazetteer.format_address(make_address(ids))
+
+        assert formatted == (
+            "12 Beach Road, Versova, Andheri, Mumbai, Maharashtra, India"
+        )
+
+    def test_format_address_returns_none_when_nothing_known(
+        self, ids: dict[str, uuid.UUID]
+    ) -> None:
+        """An empty gazetteer and no address line gives None."""
+        gazetteer = AddressGazetteer()
+
+        assert gazetteer.format_address(make_address(ids, address_line=None)) is None
+
+
+# =============================================================================
+# Staleness
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestAddressGazetteerStaleness:
+    """Tests for invalidation, table changes and TTL expiry."""
+
+    def test_ensure_loaded_loads_once(self, loaded_session: MagicMock) -> None:
+        """A fresh snapshot is not reloaded."""
+        gazetteer = AddressGazetteer()
+
+        gazetteer.ensure_loaded(loaded_session)
+        gazetteer.ensure_loaded(loaded_session)
+
+        assert not gazetteer.is_stale(loaded_session)
+        assert loaded_session.exec.call_count == 5
+
+    def test_invalidate_reloads_on_next_use(self, loaded_session: MagicMock) -> None:
+        """Invalidation triggers a reload on next use."""
+        gazetteer = AddressGazetteer()
+        gazetteer.ensure_loaded(loaded_session)
+
+        gazetteer.invalidate()
+        assert gazetteer.is_stale(loaded_session)
+        gazetteer.ensure_loaded(loaded_session)
+
+        assert loaded_session.exec.call_count == 10
+        assert not gazetteer.is_stale(loaded_session)
+
+    def test_table_change_reloads_on_next_use(
+        self, loaded_session: MagicMock, table_versions: dict[str, int]
+    ) -> None:
+        """A moved change counter, e.g. from another worker, triggers a reload."""
+        gazetteer = AddressGazetteer()
+        gazetteer.ensure_loaded(loaded_session)
+
+        table_versions["religion"] = 1
+        assert not gazetteer.is_stale(loaded_session)
+        table_versions["address_state"] = 1
+        assert gazetteer.is_stale(loaded_session)
+        gazetteer.ensure_loaded(loaded_session)
+
+        assert loaded_session.exec.call_count == 10
+        assert not gazetteer.is_stale(loaded_session)
+
+    def test_ttl_expiry_marks_snapshot_stale(self, loaded_session: MagicMock) -> None:
+        """A snapshot older than the TTL is stale."""
+        gazetteer = AddressGazetteer()
+        gazetteer.load(loaded_session)
+
+        with patch.object(
+            gazetteer_module.settings, "ADDRESS_GAZETTEER_TTL_SECONDS", 60
+        ), patch.object(
+            snapshot_module.time,
+            "monotonic",
+            return_value=gazetteer._loaded_at + 61,
+        ):
+            assert gazetteer.is_stale(loaded_session)
+
+    def test_zero_ttl_never_expires(self, loaded_session: MagicMock) -> None:
+        """A TTL of 0 disables expiry."""
+        gazetteer = AddressGazetteer()
+        gazetteer.load(loaded_session)
+
+        with patch.object(
+            gazetteer_module.settings, "ADDRESS_GAZETTEER_TTL_SECONDS", 0
+        ), patch.object(
+            snapshot_module.time,
+            "monotonic",
+            return_value=gazetteer._loaded_at + 10**6,
+        ):
+            assert not gazetteer.is_stale(loaded_session)
+
+
+# =============================================================================
+# Write hooks
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestAddressGazetteerWriteHooks:
+    """Tests for invalidation from address metadata writes."""
+
+    def test_update_state_invalidates_global_gazetteer(
+        self, mock_session: MagicMock
+    ) -> None:
+        """Updating a state marks the global gazetteer stale."""
+        gazetteer = AddressGazetteer()
+        gazetteer._stale = False
+        state = State(id=uuid.uuid4(), name="Old", country_id=uuid.uuid4())
+        service = StateService(mock_session)
+
+        with patch.object(
+            gazetteer_module, "_address_gazetteer", gazetteer
+        ), patch.object(service.state_repo, "update", return_value=state):
+            service.update_state(state, StateUpdate(name="New"))
+
+        assert gazetteer.is_stale(mock_session)
+
+    def test_get_address_gazetteer_loads_lazily(
+        self, loaded_session: MagicMock
+    ) -> None:
+        """The global gazetteer is loaded on first use."""
+        gazetteer = AddressGazetteer()
+
+        with patch.object(gazetteer_module, "_address_gazetteer", gazetteer):
+            result = gazetteer_module.get_address_gazetteer(loaded_session)
+
+        assert result is gazetteer
+        assert not gazetteer.is_stale(loaded_session)
+        assert loaded_session.exec.call_count == 5
@@ -0,0 +1,105 @@
+"""Tests for AddressTreeService.
+
+Tests cover:
+- Columnar levels with parent indexes
+- One query per level below the root
+- Missing roots and empty levels
+"""
+
+import uuid
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlmodel import Session
+
+from app.db_models.address import District, Locality, State, SubDistrict
+from app.services.address import AddressTreeService
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def mock_session() -> MagicMock:
+    """Create a mock database session."""
+    return MagicMock(spec=Session)
+
+
+@pytest.fixture
+def service(mock_session: MagicMock) -> AddressTreeService:
+    """Create an AddressTreeService with a mock session."""
+    return AddressTreeService(mock_session)
+
+
+# =============================================================================
+# get_tree
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestGetTree:
+    """Tests for AddressTreeService.get_tree."""
+
+    def test_state_tree_is_columnar_with_parent_indexes(
+        self, service: AddressTreeService
+    ) -> None:
+        """Each level lists ids and names, and parents index the level above."""
+        state = State(id=uuid.uuid4(), name="Maharashtra", country_id=uuid.uuid4())
+        mumbai = District(id=uuid.uuid4(), name="Mumbai", state_id=state.id)
+        pune = District(id=uuid.uuid4(), name="Pune", state_id=state.id)
+        andheri = SubDistrict(id=uuid.uuid4(), name="Andheri", district_id=mumbai.id)
+        haveli = SubDistrict(id=uuid.uuid4(), name="Haveli", district_id=pune.id)
+        versova = Locality(id=uuid.uuid4(), name="Versova", sub_district_id=andheri.id)
+
+        with patch.object(
+            service.state_repo, "get_by_id", return_value=state
+        ), patch.object(
+            service.district_repo, "get_by_states", return_value=[mumbai, pune]
+        ), patch.object(
+            service.sub_district_repo,
+            "get_by_districts",
+            return_value=[andheri, haveli],
+        ) as get_sub_districts, patch.object(
+            service.locality_repo, "get_by_sub_districts", return_value=[versova]
+        ):
+            tree = service.get_tree("state", state.id)
+
+        assert tree is not None
+        assert (tree.level, tree.id, tree.name) == ("state", state.id, "Maharashtra")
+        assert [level.level for level in tree.levels] == [
+            "district",
+            "sub_district",
+            "locality",
+        ]
+        districts, sub_districts, localities = tree.levels
+        assert districts.names == ["Mumbai", "Pune"]
+        assert districts.parents == [0, 0]
+        assert sub_districts.ids == [andheri.id, haveli.id]
+        assert sub_districts.parents == [0, 1]
+        assert localities.parents == [0]
+        get_sub_districts.assert_called_once_with([mumbai.id, pune.id])
+
+    def test_missing_root_returns_none(self, service: AddressTreeService) -> None:
+        """An unknown root gives None."""
+        with patch.object(service.district_repo, "get_by_id", return_value=None):
+            assert service.get_tree("district", uuid.uuid4()) is None
+
+    def test_empty_level_skips_deeper_queries(
+        self, service: AddressTreeService
+    ) -> None:
+        """Levels below an empty level are empty without querying."""
+        district = District(id=uuid.uuid4(), name="Mumbai", state_id=uuid.uuid4())
+
+        with patch.object(
+            service.district_repo, "get_by_id", return_value=district
+        ), patch.object(
+            service.sub_district_repo, "get_by_districts", return_value=[]
+        ), patch.object(
+            service.locality_repo, "get_by_sub_districts"
+        ) as get_localities:
+            tree = service.get_tree("district", district.id)
+
+        assert tree is not None
+        assert [level.ids for level in tree.levels] == [[], []]
+        get_localities.assert_not_called()
@@ -0,0 +1 @@
+"""Graph Traversal service tests."""
@@ -0,0 +1,413 @@
+"""Tests for the in-memory AdjacencyIndex.
+
+Tests cover:
+- Building the CSR snapshot from active relationships
+- Incremental refreshes, compaction and TTL rebuilds
+- Ordering of concurrent refreshes and rebuilds
+- Global index lifecycle and the relationship-write hooks
+- GraphTraversalService serving traversals from the index
+"""
+
+import threading
+import uuid
+from collections.abc import Generator
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlmodel import Session
+
+from app.db_models.person.person_relationship import PersonRelationship
+from app.enums import RelationshipType
+from app.schemas.person import PersonRelationshipUpdate
+from app.services.graph_traversal import AdjacencyIndex, GraphTraversalService
+from app.services.graph_traversal import adjacency_index as adjacency_index_module
+from app.services.graph_traversal.adjacency_index import (
+    build_adjacency_index,
+    get_adjacency_index,
+    refresh_adjacency_index,
+)
+from app.services.person.person_relationship_service import PersonRelationshipService
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def mock_session() -> MagicMock:
+    """Create a mock database session."""
+    return MagicMock(spec=Session)
+
+
+@pytest.fixture
+def ids() -> list[uuid.UUID]:
+    """Five person IDs: a chain 0 - 1 - 2 - 3 plus an isolated person 4."""
+    return [uuid.uuid4() for _ in range(5)]
+
+
+@pytest.fixture
+def loaded_index(mock_session: MagicMock, ids: list[uuid.UUID]) -> AdjacencyIndex:
+    """An index loaded with the bidirectional chain 0 - 1 - 2 - 3."""
+    mock_session.exec.return_value.all.return_value = [
+        (ids[0], ids[1]),
+        (ids[1], ids[0]),
+        (ids[1], ids[2]),
+        (ids[2], ids[1]),
+        (ids[2], ids[3]),
+        (ids[3], ids[2]),
+    ]
+    index = AdjacencyIndex()
+    index.load(mock_session)
+    return index
+
+
+@pytest.fixture
+def enabled_global_index(
+    loaded_index: AdjacencyIndex,
+) -> Generator[AdjacencyIndex, None, None]:
+    """Install loaded_index as the enabled global index for one test."""
+    with patch.object(
+        adjacency_index_module.settings, "GRAPH_ADJACENCY_INDEX_ENABLED", True
+    ), patch.object(adjacency_index_module, "_adjacency_index", loaded_index):
+        yield loaded_index
+
+
+# =============================================================================
+# Test Classes
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestAdjacencyIndexLoad:
+    """Tests for building the snapshot."""
+
+    def test_load_builds_neighbors(
+        self, loaded_index: AdjacencyIndex, ids: list[uuid.UUID]
+    ) -> None:
+        """Test that neighbours are returned for every loaded person."""
+        assert loaded_index.node_count == 4
+        assert loaded_index.neighbors(ids[0]) == [ids[1]]
+        assert loaded_index.neighbors(ids[1]) == [ids[0], ids[2]]
+        assert loaded_index.neighbors(ids[3]) == [ids[2]]
+
+    def test_unknown_person_has_no_neighbors(
+        self, loaded_index: AdjacencyIndex, ids: list[uuid.UUID]
+    ) -> None:
+        """Test that persons without relationships return an empty list."""
+        assert loaded_index.neighbors(ids[4]) == []
+
+    def test_neighbors_batch_omits_persons_without_relationships(
+        self, loaded_index: AdjacencyIndex, ids: list[uuid.UUID]
+    ) -> None:
+        """Test batch lookups match the batched database query shape."""
+        result = loaded_index.neighbors_batch([ids[0], ids[4]])
+
+        assert result == {ids[0]: [ids[1]]}
+
+    def test_ensure_fresh_rebuilds_after_ttl(
+        self, loaded_index: AdjacencyIndex, mock_session: MagicMock
+    ) -> None:
+        """Test that a snapshot older than the TTL is rebuilt, once."""
+        with patch.object(
+            adjacency_index_module.settings, "GRAPH_ADJACENCY_INDEX_TTL_SECONDS", 60
+        ):
+            loaded_index.ensure_fresh(mock_session)
+            assert mock_session.exec.call_count == 1
+
+            loaded_index._loaded_at -= 61
+            assert loaded_index.is_stale
+            loaded_index.ensure_fresh(mock_session)
+            loaded_index.ensure_fresh(mock_session)
+
+        assert mock_session.exec.call_count == 2
+        assert not loaded_index.is_stale
+
+    def test_zero_ttl_never_rebuilds(self, loaded_index: AdjacencyIndex) -> None:
+        """Test that a TTL of 0 disables rebuilds."""
+        loaded_index._loaded_at -= 10**6
+
+        with patch.object(
+            adjacency_index_module.settings, "GRAPH_ADJACENCY_INDEX_TTL_SECONDS", 0
+        ):
+            assert not loaded_index.is_stale
+
+
+@pytest.mark.unit
+class TestAdjacencyIndexRefresh:
+    """Tests for incremental updates."""
+
+    def test_refresh_adds_new_edges(
+        self,
+        loaded_index: AdjacencyIndex,
+        mock_session: MagicMock,
+        ids: list[uuid.UUID],
+    ) -> None:
+        """Test that a new relationship becomes visible after refresh."""
+        mock_session.exec.return_value.all.return_value = [
+            (ids[3], ids[2]),
+            (ids[3], ids[4]),
+            (ids[4], ids[3]),
+        ]
+
+        loaded_index.refresh_persons(mock_session, [ids[3], ids[4]])
+
+        assert loaded_index.neighbors(ids[3]) == [ids[2], ids[4]]
+        assert loaded_index.neighbors(ids[4]) == [ids[3]]
+
+    def test_refresh_removes_deactivated_edges(
+        self,
+        loaded_index: AdjacencyIndex,
+        mock_session: MagicMock,
+        ids: list[uuid.UUID],
+    ) -> None:
+        """Test that a deactivated relationship disappears after refresh."""
+        mock_session.exec.return_value.all.return_value = [(ids[1], ids[0])]
+
+        loaded_index.refresh_persons(mock_session, [ids[1], ids[2]])
+
+        assert loaded_index.neighbors(ids[1]) == [ids[0]]
+        assert loaded_index.neighbors(ids[2]) == []
+        # Untouched persons keep their snapshot
+        assert loaded_index.neighbors(ids[3]) == [ids[2]]
+
+    def test_compaction_preserves_neighbors(
+        self,
+        loaded_index: AdjacencyIndex,
+        mock_session: MagicMock,
+        ids: list[uuid.UUID],
+    ) -> None:
+        """Test that folding overrides into CSR keeps the same graph."""
+        mock_session.exec.return_value.all.return_value = [
+            (ids[3], ids[2]),
+            (ids[3], ids[4]),
+            (ids[4], ids[3]),
+        ]
+
+        with patch.object(adjacency_index_module, "COMPACT_THRESHOLD", 1):
+            loaded_index.refresh_persons(mock_session, [ids[3], ids[4]])
+
+        assert loaded_index._overrides == {}
+        assert loaded_index.neighbors(ids[1]) == [ids[0], ids[2]]
+        assert loaded_index.neighbors(ids[3]) == [ids[2], ids[4]]
+        assert loaded_index.neighbors(ids[4]) == [ids[3]]
+
+
+def blocking_session(
+    rows: list[tuple[uuid.UUID, uuid.UUID]],
+) -> tuple[MagicMock, threading.Event, threading.Event]:
+    """Create a mock session whose query blocks until released.
+
+    Returns:
+        The session, an event set once the query started, and the event
+        releasing it
+    """
+    started = threading.Event()
+    release = threading.Event()
+
+    def all_rows() -> list[tuple[uuid.UUID, uuid.UUID]]:
+        started.set()
+        assert release.wait(timeout=5)
+        return rows
+
+    session = MagicMock(spec=Session)
+    session.exec.return_value.all.side_effect = all_rows
+    return session, started, release
+
+
+@pytest.mark.unit
+class TestAdjacencyIndexConcurrency:
+    """Tests for refreshes and rebuilds racing each other."""
+
+    def test_rebuild_does_not_discard_later_refresh(
+        self, loaded_index: AdjacencyIndex, ids: list[uuid.UUID]
+    ) -> None:
+        """Test that a refresh waits for a rebuild that read older rows."""
+        # The rebuild reads the rows before the 3 - 4 relationship was added
+        rebuild_session, rebuild_started, release_rebuild = blocking_session(
+            [(ids[2], ids[3]), (ids[3], ids[2])]
+        )
+        rebuild = threading.Thread(target=loaded_index.load, args=(rebuild_session,))
+        rebuild.start()
+        assert rebuild_started.wait(timeout=5)
+
+        refresh_session = MagicMock(spec=Session)
+        refresh_session.exec.return_value.all.return_value = [
+            (ids[3], ids[2]),
+            (ids[3], ids[4]),
+            (ids[4], ids[3]),
+        ]
+        refresh = threading.Thread(
+            target=loaded_index.refresh_persons,
+            args=(refresh_session, [ids[3], ids[4]]),
+        )
+        refresh.start()
+        refresh.join(timeout=0.1)
+        assert refresh.is_alive()
+        assert refresh_session.exec.call_count == 0
+
+        release_rebuild.set()
+        rebuild.join(timeout=5)
+        refresh.join(timeout=5)
+
+        assert loaded_index.neighbors(ids[3]) == [ids[2], ids[4]]
+        assert loaded_index.neighbors(ids[4]) == [ids[3]]
+
+    def test_refreshes_apply_in_read_order(
+        self,
+        loaded_index: AdjacencyIndex,
+        mock_session: MagicMock,
+        ids: list[uuid.UUID],
+    ) -> None:
+        """Test that a refresh cannot be overwritten by an earlier read."""
+        # The first refresh reads the rows before the 3 - 4 relationship was
+        # added, the second one after
+        first_session, first_started, release_first = blocking_session(
+            [(ids[3], ids[2])]
+        )
+        first = threading.Thread(
+            target=loaded_index.refresh_persons, args=(first_session, [ids[3]])
+        )
+        first.start()
+        assert first_started.wait(timeout=5)
+
+        mock_session.exec.return_value.all.return_value = [
+            (ids[3], ids[2]),
+            (ids[3], ids[4]),
+        ]
+        second = threading.Thread(
+            target=loaded_index.refresh_persons, args=(mock_session, [ids[3]])
+        )
+        second.start()
+        second.join(timeout=0.1)
+        assert second.is_alive()
+
+        release_first.set()
+        first.join(timeout=5)
+        second.join(timeout=5)
+
+        assert loaded_index.neighbors(ids[3]) == [ids[2], ids[4]]
+
+    def test_lookups_do_not_wait_for_refresh_reads(
+        self, loaded_index: AdjacencyIndex, ids: list[uuid.UUID]
+    ) -> None:
+        """Test that lookups are served while a refresh reads its rows."""
+        session, started, release = blocking_session([])
+        refresh = threading.Thread(
+            target=loaded_index.refresh_persons, args=(session, [ids[0]])
+        )
+        refresh.start()
+        assert started.wait(timeout=5)
+
+        try:
+            assert loaded_index.neighbors(ids[0]) == [ids[1]]
+        finally:
+            release.set()
+            refresh.join(timeout=5)
+
+        assert loaded_index.neighbors(ids[0]) == []
+
+
+@pytest.mark.unit
+class TestGlobalAdjacencyIndex:
+    """Tests for the process-wide index helpers."""
+
+    def test_disabled_index_is_not_returned(
+        self, loaded_index: AdjacencyIndex, mock_session: MagicMock
+    ) -> None:
+        """Test that the index is ignored unless enabled in settings."""
+        with patch.object(
+            adjacency_index_module.settings, "GRAPH_ADJACENCY_INDEX_ENABLED", False
+        ), patch.object(adjacency_index_module, "_adjacency_index", loaded_index):
+            assert get_adjacency_index(mock_session) is None
+
+    def test_stale_global_index_is_rebuilt_on_access(
+        self,
+        enabled_global_index: AdjacencyIndex,
+        mock_session: MagicMock,
+        ids: list[uuid.UUID],
+    ) -> None:
+        """Test that writes by other workers are picked up after the TTL."""
+        mock_session.exec.return_value.all.return_value = [(ids[3], ids[4])]
+        enabled_global_index._loaded_at -= (
+            adjacency_index_module.settings.GRAPH_ADJACENCY_INDEX_TTL_SECONDS + 1
+        )
+
+        index = get_adjacency_index(mock_session)
+
+        assert index is enabled_global_index
+        assert index.neighbors(ids[3]) == [ids[4]]
+        assert index.neighbors(ids[0]) == []
+
+    def test_rebuild_reuses_instance(self, mock_session: MagicMock) -> None:
+        """Test that rebuilding the global index keeps the same instance."""
+        mock_session.exec.return_value.all.return_value = []
+
+        with patch.object(adjacency_index_module, "_adjacency_index", None):
+            first = build_adjacency_index(mock_session)
+            second = build_adjacency_index(mock_session)
+
+        assert first is second
+
+    def test_refresh_is_noop_without_index(self, mock_session: MagicMock) -> None:
+        """Test that refreshing does not query when no index is built."""
+        with patch.object(adjacency_index_module, "_adjacency_index", None):
+            refresh_adjacency_index(mock_session, [uuid.uuid4()])
+
+        mock_session.exec.assert_not_called()
+
+    def test_relationship_update_refreshes_both_persons(
+        self, mock_session: MagicMock
+    ) -> None:
+        """Test that PersonRelationshipService writes refresh the index."""
+        relationship = PersonRelationship(
+            id=uuid.uuid4(),
+            person_id=uuid.uuid4(),
+            related_person_id=uuid.uuid4(),
+            relationship_type=RelationshipType.FATHER,
+            is_active=True,
+        )
+        service = PersonRelationshipService(mock_session)
+
+        with patch.object(
+            service.relationship_repo, "update", return_value=relationship
+        ), patch.object(
+            service.relationship_repo,
+            "find_inverse_including_inactive",
+            return_value=None,
+        ), patch.object(
+            service.person_repo, "get_by_id", return_value=None
+        ), patch(
+            "app.services.person.person_relationship_service.refresh_adjacency_index"
+        ) as mock_refresh:
+            service.update_relationship(
+                relationship, PersonRelationshipUpdate(is_active=False)
+            )
+
+        mock_refresh.assert_called_once_with(
+            mock_session, [relationship.person_id, relationship.related_person_id]
+        )
+
+
+@pytest.mark.unit
+class TestTraversalFromIndex:
+    """Tests for GraphTraversalService reading from the index."""
+
+    def test_traverse_runs_in_memory(
+        self,
+        enabled_global_index: AdjacencyIndex,
+        ids: list[uuid.UUID],
+    ) -> None:
+        """Test that traversals use the index instead of the database."""
+        session = MagicMock(spec=Session)
+        session.get_bind.return_value.dialect.name = "postgresql"
+        service = GraphTraversalService(session)
+
+        result = service.traverse(ids[0], max_depth=2)
+
+        assert {pid: node.depth for pid, node in result.items()} == {
+            ids[0]: 0,
+            ids[1]: 1,
+            ids[2]: 2,
+        }
+        session.exec.assert_not_called()
+        session.execute.assert_not_called()
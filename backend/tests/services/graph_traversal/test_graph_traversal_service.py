@@ -0,0 +1,273 @@
+"""Tests for GraphTraversalService.
+
+Tests cover:
+- Batched Python BFS fallback (depths, parents, cycles, max depth)
+- Frontier chunking for large IN (...) lists
+- Backend selection between the recursive CTE and the Python BFS
+- Recursive CTE results matching the Python BFS on PostgreSQL
+"""
+
+import uuid
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlmodel import Session
+
+from app.enums import RelationshipType
+from app.models import User
+from app.services.graph_traversal import GraphTraversalService, TraversalNode
+from app.services.graph_traversal.graph_traversal_service import (
+    FRONTIER_CHUNK_SIZE,
+)
+from tests.factories import PersonFactory, RelationshipFactory
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def mock_session() -> MagicMock:
+    """Create a mock database session."""
+    return MagicMock(spec=Session)
+
+
+@pytest.fixture
+def service(mock_session: MagicMock) -> GraphTraversalService:
+    """Create a GraphTraversalService instance with mock session."""
+    return GraphTraversalService(mock_session)
+
+
+def mock_relationships_batch(
+    relationships_map: dict[uuid.UUID, list[uuid.UUID]],
+) -> MagicMock:
+    """Build a get_relationships_batch side effect from an adjacency map."""
+    return MagicMock(
+        side_effect=lambda pids: {
+            pid: relationships_map[pid] for pid in pids if pid in relationships_map
+        }
+    )
+
+
+# =============================================================================
+# Test Classes
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestTraverseBFS:
+    """Tests for the batched Python BFS fallback."""
+
+    def test_traverse_returns_start_at_depth_0_without_parent(
+        self, service: GraphTraversalService
+    ) -> None:
+        """Test that the starting person is returned at depth 0."""
+        start_id = uuid.uuid4()
+
+        with patch.object(service, "get_relationships_batch", return_value={}):
+            result = service.traverse(start_id, max_depth=3)
+
+        assert result == {start_id: TraversalNode(person_id=start_id, depth=0)}
+
+    def test_traverse_tracks_depth_and_parent(
+        self, service: GraphTraversalService
+    ) -> None:
+        """Test that depth and BFS parent are recorded for each person."""
+        start_id = uuid.uuid4()
+        child_id = uuid.uuid4()
+        grandchild_id = uuid.uuid4()
+        relationships_map = {
+            start_id: [child_id],
+            child_id: [start_id, grandchild_id],
+            grandchild_id: [child_id],
+        }
+
+        with patch.object(
+            service,
+            "get_relationships_batch",
+            mock_relationships_batch(relationships_map),
+        ):
+            result = service.traverse(start_id, max_depth=5)
+
+        assert list(result) == [start_id, child_id, grandchild_id]
+        assert result[child_id].depth == 1
+        assert result[child_id].parent_id == start_id
+        assert result[grandchild_id].depth == 2
+        assert result[grandchild_id].parent_id == child_id
+
+    def test_traverse_respects_max_depth(
+        self, service: GraphTraversalService
+    ) -> None:
+        """Test that persons beyond max_depth are not visited."""
+        ids = [uuid.uuid4() for _ in range(4)]
+        relationships_map = {ids[i]: [ids[i + 1]] for i in range(3)}
+
+        with patch.object(
+            service,
+            "get_relationships_batch",
+            mock_relationships_batch(relationships_map),
+        ) as mock_batch:
+            result = service.traverse(ids[0], max_depth=2)
+
+        assert set(result) == set(ids[:3])
+        assert mock_batch.call_count == 2
+
+    def test_traverse_handles_cycles(self, service: GraphTraversalService) -> None:
+        """Test that cycles do not cause revisits."""
+        a_id, b_id, c_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        relationships_map = {
+            a_id: [b_id, c_id],
+            b_id: [a_id, c_id],
+            c_id: [a_id, b_id],
+        }
+
+        with patch.object(
+            service,
+            "get_relationships_batch",
+            mock_relationships_batch(relationships_map),
+        ):
+            result = service.traverse(a_id, max_depth=10)
+
+        assert len(result) == 3
+        assert result[b_id].depth == 1
+        assert result[c_id].depth == 1
+
+
+@pytest.mark.unit
+class TestGetRelationshipsBatch:
+    """Tests for get_relationships_batch."""
+
+    def test_groups_related_ids_by_person(
+        self, service: GraphTraversalService, mock_session: MagicMock
+    ) -> None:
+        """Test that rows are grouped by owning person in query order."""
+        a_id, b_id = uuid.uuid4(), uuid.uuid4()
+        r1, r2, r3 = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        mock_session.exec.return_value.all.return_value = [
+            (a_id, r1),
+            (b_id, r2),
+            (a_id, r3),
+        ]
+
+        result = service.get_relationships_batch([a_id, b_id])
+
+        assert result == {a_id: [r1, r3], b_id: [r2]}
+        assert mock_session.exec.call_count == 1
+
+    def test_chunks_large_frontiers(
+        self, service: GraphTraversalService, mock_session: MagicMock
+    ) -> None:
+        """Test that huge frontiers are split into several IN queries."""
+        person_ids = [uuid.uuid4() for _ in range(FRONTIER_CHUNK_SIZE + 1)]
+        related_id = uuid.uuid4()
+        mock_session.exec.return_value.all.side_effect = [
+            [(person_ids[0], related_id)],
+            [(person_ids[-1], related_id)],
+        ]
+
+        result = service.get_relationships_batch(person_ids)
+
+        assert mock_session.exec.call_count == 2
+        assert result == {
+            person_ids[0]: [related_id],
+            person_ids[-1]: [related_id],
+        }
+
+
+@pytest.mark.unit
+class TestBackendSelection:
+    """Tests for choosing between the recursive CTE and the Python BFS."""
+
+    def test_non_postgres_uses_python_bfs(
+        self, service: GraphTraversalService, mock_session: MagicMock
+    ) -> None:
+        """Test that non-PostgreSQL databases fall back to the Python BFS."""
+        mock_session.get_bind.return_value.dialect.name = "sqlite"
+        start_id = uuid.uuid4()
+
+        with patch.object(
+            service, "_traverse_recursive_cte"
+        ) as mock_cte, patch.object(
+            service, "get_relationships_batch", return_value={}
+        ):
+            service.traverse(start_id, max_depth=2)
+
+        assert service.supports_recursive_cte is False
+        mock_cte.assert_not_called()
+
+    def test_postgres_uses_recursive_cte(
+        self, service: GraphTraversalService, mock_session: MagicMock
+    ) -> None:
+        """Test that PostgreSQL runs the traversal as one recursive query."""
+        mock_session.get_bind.return_value.dialect.name = "postgresql"
+        start_id = uuid.uuid4()
+        related_id = uuid.uuid4()
+        mock_session.execute.return_value.all.return_value = [
+            (start_id, 0, None),
+            (related_id, 1, start_id),
+        ]
+
+        result = service.traverse(start_id, max_depth=2)
+
+        assert mock_session.execute.call_count == 1
+        mock_session.exec.assert_not_called()
+        assert result[related_id] == TraversalNode(
+            person_id=related_id, depth=1, parent_id=start_id
+        )
+
+    def test_recursive_cte_can_be_disabled(
+        self, service: GraphTraversalService, mock_session: MagicMock
+    ) -> None:
+        """Test that the setting turns the recursive CTE off."""
+        mock_session.get_bind.return_value.dialect.name = "postgresql"
+        service.use_recursive_cte = False
+
+        assert service.supports_recursive_cte is False
+
+
+@pytest.mark.integration
+class TestRecursiveCTEMatchesBFS:
+    """Tests that the recursive CTE agrees with the Python BFS on PostgreSQL."""
+
+    def test_cte_depths_and_parents_match_bfs(
+        self, db: Session, test_user: User
+    ) -> None:
+        """Test depths are identical and every CTE parent is one level closer."""
+        service = GraphTraversalService(db)
+        if not service.supports_recursive_cte:
+            pytest.skip("Recursive CTE traversal requires PostgreSQL")
+
+        # grandfather - father - self - son, plus a mother closing a cycle
+        grandfather, father, mother, me, son = (
+            PersonFactory.create(db, created_by_user=test_user) for _ in range(5)
+        )
+        for parent, child in [
+            (grandfather, father),
+            (father, me),
+            (mother, me),
+            (me, son),
+        ]:
+            RelationshipFactory.create_bidirectional(
+                db,
+                person=child,
+                related_person=parent,
+                relationship_type=RelationshipType.FATHER,
+            )
+        RelationshipFactory.create_bidirectional(
+            db,
+            person=father,
+            related_person=mother,
+            relationship_type=RelationshipType.WIFE,
+        )
+
+        cte_nodes = service._traverse_recursive_cte(son.id, max_depth=3)
+        bfs_nodes = service._traverse_bfs(son.id, max_depth=3)
+
+        assert {pid: n.depth for pid, n in cte_nodes.items()} == {
+            pid: n.depth for pid, n in bfs_nodes.items()
+        }
+        assert cte_nodes[grandfather.id].depth == 3
+        assert cte_nodes[son.id].parent_id is None
+        for node in cte_nodes.values():
+            if node.parent_id is not None:
+                assert cte_nodes[node.parent_id].depth == node.depth - 1
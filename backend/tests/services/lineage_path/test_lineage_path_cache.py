@@ -0,0 +1,263 @@
+"""Tests for LineagePathCache.
+
+Tests cover:
+- Lookups keyed on the unordered person pair, in both directions
+- Invalidation of only the entries that visited changed persons
+- Graph version guard against caching results computed before a write
+- LRU and TTL bounds
+- LineagePathService serving repeated lookups from the cache
+- Relationship writes invalidating cached paths end to end
+"""
+
+import uuid
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlmodel import Session
+
+from app.enums import RelationshipType
+from app.models import User
+from app.schemas.lineage_path import ConnectionInfo, LineagePathResponse, PersonNode
+from app.services.lineage_path import LineagePathCache, LineagePathService
+from app.services.lineage_path import lineage_path_cache as lineage_path_cache_module
+from app.services.person.person_relationship_service import PersonRelationshipService
+from tests.factories import PersonFactory, RelationshipFactory
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def cache() -> LineagePathCache:
+    """Create an empty cache."""
+    return LineagePathCache(max_entries=100, ttl_seconds=60)
+
+
+def create_path_response(person_ids: list[uuid.UUID]) -> LineagePathResponse:
+    """Create a response for a path from the first to the last person."""
+    graph: dict[uuid.UUID, PersonNode] = {}
+    for index, person_id in enumerate(person_ids):
+        node = PersonNode(person_id=person_id, first_name=f"P{index}", last_name="X")
+        if index > 0:
+            node.set_from_person(
+                ConnectionInfo(person_id=person_ids[index - 1], relationship="Son")
+            )
+        if index < len(person_ids) - 1:
+            node.set_to_person(
+                ConnectionInfo(person_id=person_ids[index + 1], relationship="Father")
+            )
+        graph[person_id] = node
+    return LineagePathResponse(
+        connection_found=True,
+        message="Connection found",
+        common_ancestor_id=person_ids[len(person_ids) // 2],
+        graph=graph,
+    )
+
+
+# =============================================================================
+# Test Classes
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestLineagePathCacheLookup:
+    """Tests for get and set."""
+
+    def test_miss_then_hit(self, cache: LineagePathCache) -> None:
+        """Test that a stored result is returned for the same pair."""
+        a_id, b_id = uuid.uuid4(), uuid.uuid4()
+        response = create_path_response([a_id, b_id])
+
+        assert cache.get(a_id, b_id) is None
+        cache.set(a_id, b_id, response, [a_id, b_id], cache.version)
+
+        assert cache.get(a_id, b_id) is response
+
+    def test_reverse_direction_swaps_connections(self, cache: LineagePathCache) -> None:
+        """Test that the pair is unordered and the path is reversed for B to A."""
+        a_id, middle_id, b_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        response = create_path_response([a_id, middle_id, b_id])
+        cache.set(a_id, b_id, response, [a_id, middle_id, b_id], cache.version)
+
+        reversed_response = cache.get(b_id, a_id)
+
+        assert reversed_response is not None
+        assert list(reversed_response.graph) == [b_id, middle_id, a_id]
+        middle = reversed_response.graph[middle_id]
+        assert middle.from_person == response.graph[middle_id].to_person
+        assert middle.to_person == response.graph[middle_id].from_person
+        assert reversed_response.graph[b_id].from_person is None
+        # The stored response is not modified
+        assert response.graph[b_id].to_person is None
+
+    def test_result_from_old_version_is_not_stored(
+        self, cache: LineagePathCache
+    ) -> None:
+        """Test that a write during the computation prevents caching."""
+        a_id, b_id = uuid.uuid4(), uuid.uuid4()
+        version = cache.version
+
+        cache.invalidate_persons([uuid.uuid4()])
+        cache.set(a_id, b_id, create_path_response([a_id, b_id]), [], version)
+
+        assert cache.get(a_id, b_id) is None
+
+    def test_disabled_cache_stores_nothing(self) -> None:
+        """Test that max_entries=0 disables caching."""
+        cache = LineagePathCache(max_entries=0, ttl_seconds=60)
+        a_id, b_id = uuid.uuid4(), uuid.uuid4()
+
+        cache.set(a_id, b_id, create_path_response([a_id, b_id]), [], cache.version)
+
+        assert len(cache) == 0
+
+
+@pytest.mark.unit
+class TestLineagePathCacheInvalidation:
+    """Tests for relationship-aware invalidation."""
+
+    def test_only_entries_visiting_changed_persons_are_dropped(
+        self, cache: LineagePathCache
+    ) -> None:
+        """Test that unrelated entries survive a write."""
+        a_id, b_id, c_id, d_id = (uuid.uuid4() for _ in range(4))
+        visited_id = uuid.uuid4()
+        cache.set(a_id, b_id, create_path_response([a_id, b_id]), [visited_id], 0)
+        cache.set(c_id, d_id, create_path_response([c_id, d_id]), [], 0)
+
+        dropped = cache.invalidate_persons([visited_id])
+
+        assert dropped == 1
+        assert cache.get(a_id, b_id) is None
+        assert cache.get(c_id, d_id) is not None
+
+    def test_endpoints_are_always_tagged(self, cache: LineagePathCache) -> None:
+        """Test that a write on either endpoint drops the entry."""
+        a_id, b_id = uuid.uuid4(), uuid.uuid4()
+        cache.set(a_id, b_id, create_path_response([a_id, b_id]), [], 0)
+
+        cache.invalidate_persons([b_id])
+
+        assert cache.get(a_id, b_id) is None
+        assert cache._keys_by_person == {}
+
+
+@pytest.mark.unit
+class TestLineagePathCacheBounds:
+    """Tests for LRU and TTL bounds."""
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        """Test that the oldest unused entry is evicted when full."""
+        cache = LineagePathCache(max_entries=2, ttl_seconds=60)
+        pairs = [(uuid.uuid4(), uuid.uuid4()) for _ in range(3)]
+        for a_id, b_id in pairs[:2]:
+            cache.set(a_id, b_id, create_path_response([a_id, b_id]), [], 0)
+
+        cache.get(*pairs[0])
+        cache.set(*pairs[2], create_path_response(list(pairs[2])), [], 0)
+
+        assert cache.get(*pairs[0]) is not None
+        assert cache.get(*pairs[1]) is None
+        assert cache.get(*pairs[2]) is not None
+
+    def test_expired_entry_is_a_miss(self, cache: LineagePathCache) -> None:
+        """Test that entries expire after the TTL."""
+        a_id, b_id = uuid.uuid4(), uuid.uuid4()
+        with patch.object(
+            lineage_path_cache_module.time, "monotonic", return_value=1000.0
+        ):
+            cache.set(a_id, b_id, create_path_response([a_id, b_id]), [], 0)
+
+        with patch.object(
+            lineage_path_cache_module.time, "monotonic", return_value=1061.0
+        ):
+            assert cache.get(a_id, b_id) is None
+
+        assert len(cache) == 0
+
+
+@pytest.mark.unit
+class TestFindPathUsesCache:
+    """Tests for LineagePathService reading and filling the cache."""
+
+    def test_repeated_lookup_skips_database(
+        self, mock_session: MagicMock, cache: LineagePathCache
+    ) -> None:
+        """Test that a cached pair is answered without any query."""
+        a_id, b_id = uuid.uuid4(), uuid.uuid4()
+        response = create_path_response([a_id, b_id])
+        cache.set(a_id, b_id, response, [], cache.version)
+
+        service = LineagePathService(mock_session)
+        service.path_cache = cache
+
+        assert service.find_path(b_id, a_id).graph[a_id].from_person is not None
+        mock_session.exec.assert_not_called()
+
+    def test_computed_path_is_tagged_with_visited_persons(
+        self, mock_session: MagicMock, cache: LineagePathCache
+    ) -> None:
+        """Test that find_path stores the result with the BFS visited set."""
+        a_id, common_id, b_id, side_id = (uuid.uuid4() for _ in range(4))
+        visited_a = {a_id: None, side_id: a_id, common_id: a_id}
+        visited_b = {b_id: None, common_id: b_id}
+
+        service = LineagePathService(mock_session)
+        service.path_cache = cache
+
+        with (
+            patch.object(service, "_get_person", return_value=MagicMock()),
+            patch.object(
+                service,
+                "_bfs_find_common_ancestor",
+                return_value=(common_id, visited_a, visited_b),
+            ),
+            patch.object(
+                service,
+                "_build_bidirectional_linked_list",
+                return_value=create_path_response([a_id, common_id, b_id]).graph,
+            ),
+        ):
+            service.find_path(a_id, b_id)
+
+        assert cache.get(a_id, b_id) is not None
+        cache.invalidate_persons([side_id])
+        assert cache.get(a_id, b_id) is None
+
+
+@pytest.mark.integration
+class TestRelationshipWritesInvalidateCache:
+    """Tests for invalidation through PersonRelationshipService."""
+
+    def test_deleted_relationship_is_not_served_from_cache(
+        self, db: Session, test_user: User
+    ) -> None:
+        """Test that removing a link on the path drops the cached result."""
+        father = PersonFactory.create(db, created_by_user=test_user)
+        son = PersonFactory.create(db, created_by_user=test_user)
+        daughter = PersonFactory.create(db, created_by_user=test_user)
+        son_to_father, _ = RelationshipFactory.create_bidirectional(
+            db,
+            person=son,
+            related_person=father,
+            relationship_type=RelationshipType.FATHER,
+        )
+        RelationshipFactory.create_bidirectional(
+            db,
+            person=daughter,
+            related_person=father,
+            relationship_type=RelationshipType.FATHER,
+        )
+
+        cache = LineagePathCache(max_entries=100, ttl_seconds=60)
+        service = LineagePathService(db)
+        service.path_cache = cache
+
+        with patch.object(lineage_path_cache_module, "_lineage_path_cache", cache):
+            assert service.find_path(son.id, daughter.id).connection_found is True
+            PersonRelationshipService(db).delete_relationship(son_to_father)
+
+            assert cache.get(son.id, daughter.id) is None
+            assert service.find_path(son.id, daughter.id).connection_found is False
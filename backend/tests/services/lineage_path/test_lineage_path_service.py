@@ -11,6 +11,7 @@ Requirements: 1.1, 1.2, 1.3, 1.4, 1.5, 2.1-2.11, 3.1-3.5
 """
 
 import uuid
+from collections.abc import Callable
 from datetime import date
 from unittest.mock import MagicMock, patch
 
@@ -21,6 +22,7 @@ from app.db_models.person.person import Person
 from app.db_models.person.person_relationship import PersonRelationship
 from app.enums.relationship_type import RelationshipType
 from app.services.lineage_path.lineage_path_service import LineagePathService
+from app.services.person.person_enrichment_service import PersonDisplayRecord
 
 
 # =============================================================================
@@ -54,6 +56,22 @@ def create_mock_person(
     )
 
 
+def create_display_record(
+    person: Person, address: str = "", religion: str = ""
+) -> PersonDisplayRecord:
+    """Create the display record the enrichment service returns for a person."""
+    return PersonDisplayRecord(
+        person_id=person.id,
+        first_name=person.first_name,
+        last_name=person.last_name,
+        gender_id=person.gender_id,
+        birth_year=person.date_of_birth.year,
+        death_year=person.date_of_death.year if person.date_of_death else None,
+        address=address,
+        religion=religion,
+    )
+
+
 def create_mock_relationship(
     person_id: uuid.UUID,
     related_person_id: uuid.UUID,
@@ -70,6 +88,19 @@ def create_mock_relationship(
     )
 
 
+def as_batch(
+    get_relationships: Callable[[uuid.UUID], list[uuid.UUID]],
+) -> Callable[[list[uuid.UUID]], dict[uuid.UUID, list[uuid.UUID]]]:
+    """Adapt a per-person relationship lookup to the batched frontier lookup."""
+
+    def get_relationships_batch(
+        person_ids: list[uuid.UUID],
+    ) -> dict[uuid.UUID, list[uuid.UUID]]:
+        return {pid: get_relationships(pid) for pid in person_ids}
+
+    return get_relationships_batch
+
+
 # =============================================================================
 # Tests for Relationship Fetching (Task 3.7)
 # Requirements: 1.3, 1.4
@@ -78,7 +109,7 @@ def create_mock_relationship(
 
 @pytest.mark.unit
 class TestRelationshipFetching:
-    """Tests for _get_relationships method."""
+    """Tests for the batched relationship lookup used by the BFS."""
 
     def test_get_relationships_returns_active_only(
         self, mock_session: MagicMock
@@ -98,11 +129,15 @@ class TestRelationshipFetching:
 
         # Mock the session.exec to return only active relationships
         mock_result = MagicMock()
-        mock_result.all.return_value = [active_rel]  # Only active
+        mock_result.all.return_value = [
+            (active_rel.person_id, active_rel.related_person_id)
+        ]  # Only active
         mock_session.exec.return_value = mock_result
 
         service = LineagePathService(mock_session)
-        result = service._get_relationships(person_id)
+        result = service.graph_traversal.get_relationships_batch([person_id]).get(
+            person_id, []
+        )
 
         assert len(result) == 1
         assert result[0] == related_id_1
@@ -122,7 +157,9 @@ class TestRelationshipFetching:
         mock_session.exec.return_value = mock_result
 
         service = LineagePathService(mock_session)
-        result = service._get_relationships(person_id)
+        result = service.graph_traversal.get_relationships_batch([person_id]).get(
+            person_id, []
+        )
 
         assert len(result) == 0
 
@@ -140,7 +177,9 @@ class TestRelationshipFetching:
         mock_session.exec.return_value = mock_result
 
         service = LineagePathService(mock_session)
-        result = service._get_relationships(person_id)
+        result = service.graph_traversal.get_relationships_batch([person_id]).get(
+            person_id, []
+        )
 
         assert result == []
 
@@ -173,11 +212,15 @@ class TestRelationshipFetching:
         ]
 
         mock_result = MagicMock()
-        mock_result.all.return_value = relationships
+        mock_result.all.return_value = [
+            (rel.person_id, rel.related_person_id) for rel in relationships
+        ]
         mock_session.exec.return_value = mock_result
 
         service = LineagePathService(mock_session)
-        result = service._get_relationships(person_id)
+        result = service.graph_traversal.get_relationships_batch([person_id]).get(
+            person_id, []
+        )
 
         assert len(result) == 4
         assert father_id in result
@@ -228,7 +271,9 @@ class TestBFSAlgorithm:
             return relationships_map.get(person_id, [])
 
         with patch.object(
-            service, "_get_relationships", side_effect=mock_get_relationships
+            service.graph_traversal,
+            "get_relationships_batch",
+            side_effect=as_batch(mock_get_relationships),
         ):
             common_person_id, visited_a, visited_b = service._bfs_find_common_ancestor(
                 person_a_id, person_b_id
@@ -264,7 +309,9 @@ class TestBFSAlgorithm:
             return relationships_map.get(person_id, [])
 
         with patch.object(
-            service, "_get_relationships", side_effect=mock_get_relationships
+            service.graph_traversal,
+            "get_relationships_batch",
+            side_effect=as_batch(mock_get_relationships),
         ):
             common_person_id, visited_a, visited_b = service._bfs_find_common_ancestor(
                 person_a_id, person_b_id
@@ -297,7 +344,9 @@ class TestBFSAlgorithm:
             return relationships_map.get(person_id, [])
 
         with patch.object(
-            service, "_get_relationships", side_effect=mock_get_relationships
+            service.graph_traversal,
+            "get_relationships_batch",
+            side_effect=as_batch(mock_get_relationships),
         ):
             # Try to find path between first and last person (too far apart)
             common_person_id, visited_a, visited_b = service._bfs_find_common_ancestor(
@@ -331,7 +380,9 @@ class TestBFSAlgorithm:
             return relationships_map.get(person_id, [])
 
         with patch.object(
-            service, "_get_relationships", side_effect=mock_get_relationships
+            service.graph_traversal,
+            "get_relationships_batch",
+            side_effect=as_batch(mock_get_relationships),
         ):
             # Should not hang or crash due to circular references
             common_person_id, visited_a, visited_b = service._bfs_find_common_ancestor(
@@ -361,7 +412,9 @@ class TestBFSAlgorithm:
             return relationships_map.get(person_id, [])
 
         with patch.object(
-            service, "_get_relationships", side_effect=mock_get_relationships
+            service.graph_traversal,
+            "get_relationships_batch",
+            side_effect=as_batch(mock_get_relationships),
         ):
             common_person_id, visited_a, visited_b = service._bfs_find_common_ancestor(
                 person_a_id, person_b_id
@@ -369,6 +422,148 @@ class TestBFSAlgorithm:
 
         assert common_person_id is None
 
+    def test_bfs_expands_smaller_frontier(self, mock_session: MagicMock) -> None:
+        """Test that a high-fanout side is not expanded while the other is smaller.
+
+        Structure: person_a (with 20 other relatives) - parent - b2 - b1 - person_b
+        """
+        person_a_id, parent_id, b2_id, b1_id, person_b_id = (
+            uuid.uuid4() for _ in range(5)
+        )
+        leaves = [uuid.uuid4() for _ in range(20)]
+        relationships_map = {
+            person_a_id: [parent_id, *leaves],
+            parent_id: [person_a_id, b2_id],
+            b2_id: [parent_id, b1_id],
+            b1_id: [b2_id, person_b_id],
+            person_b_id: [b1_id],
+        }
+
+        service = LineagePathService(mock_session)
+
+        def mock_get_relationships(person_id: uuid.UUID):
+            return relationships_map.get(person_id, [])
+
+        with patch.object(
+            service.graph_traversal,
+            "get_relationships_batch",
+            side_effect=as_batch(mock_get_relationships),
+        ) as mock_batch:
+            common_person_id, visited_a, visited_b = service._bfs_find_common_ancestor(
+                person_a_id, person_b_id
+            )
+
+        assert common_person_id == parent_id
+        assert [call.args[0] for call in mock_batch.call_args_list] == [
+            [person_a_id],
+            [person_b_id],
+            [b1_id],
+            [b2_id],
+        ]
+        assert service.explored_node_count == 4
+        assert service._build_final_ordered_list(
+            common_person_id, visited_a, visited_b
+        ) == [person_a_id, parent_id, b2_id, b1_id, person_b_id]
+
+    def test_bfs_fetches_whole_level_in_one_batch(
+        self, mock_session: MagicMock
+    ) -> None:
+        """Test that neighbours of a level are fetched with a single call."""
+        person_a_id = uuid.uuid4()
+        person_b_id = uuid.uuid4()
+        children_a = [uuid.uuid4() for _ in range(3)]
+        children_b = [uuid.uuid4() for _ in range(5)]
+        relationships_map = {person_a_id: children_a, person_b_id: children_b}
+
+        service = LineagePathService(mock_session)
+
+        def mock_get_relationships(person_id: uuid.UUID):
+            return relationships_map.get(person_id, [])
+
+        with patch.object(
+            service.graph_traversal,
+            "get_relationships_batch",
+            side_effect=as_batch(mock_get_relationships),
+        ) as mock_batch:
+            common_person_id, _, _ = service._bfs_find_common_ancestor(
+                person_a_id, person_b_id
+            )
+
+        assert common_person_id is None
+        # A's level 1 (3 persons) is smaller than B's (5) and is exhausted
+        assert [call.args[0] for call in mock_batch.call_args_list] == [
+            [person_a_id],
+            [person_b_id],
+            children_a,
+        ]
+        assert service.explored_node_count == 5
+
+    def test_bfs_reaches_max_depth_from_each_side(
+        self, mock_session: MagicMock
+    ) -> None:
+        """Test that persons up to 2 * max_depth apart are connected."""
+        person_ids = [uuid.uuid4() for _ in range(6)]
+        relationships_map: dict[uuid.UUID, list[uuid.UUID]] = {}
+        for left, right in zip(person_ids, person_ids[1:], strict=False):
+            relationships_map.setdefault(left, []).append(right)
+            relationships_map.setdefault(right, []).append(left)
+
+        service = LineagePathService(mock_session)
+        service.max_depth = 2
+
+        def mock_get_relationships(person_id: uuid.UUID):
+            return relationships_map.get(person_id, [])
+
+        with patch.object(
+            service.graph_traversal,
+            "get_relationships_batch",
+            side_effect=as_batch(mock_get_relationships),
+        ):
+            within_reach, _, _ = service._bfs_find_common_ancestor(
+                person_ids[0], person_ids[4]
+            )
+            out_of_reach, _, _ = service._bfs_find_common_ancestor(
+                person_ids[0], person_ids[5]
+            )
+
+        assert within_reach == person_ids[2]
+        assert out_of_reach is None
+
+    def test_bfs_picks_meeting_point_on_shortest_path(
+        self, mock_session: MagicMock
+    ) -> None:
+        """Test that the closest meeting point in a level wins over the first one.
+
+        Structure: person_a - parent - person_b and person_a - person_b
+        """
+        person_a_id = uuid.uuid4()
+        parent_id = uuid.uuid4()
+        person_b_id = uuid.uuid4()
+        relationships_map = {
+            person_a_id: [parent_id],
+            parent_id: [person_a_id, person_b_id],
+            person_b_id: [parent_id, person_a_id],
+        }
+
+        service = LineagePathService(mock_session)
+
+        def mock_get_relationships(person_id: uuid.UUID):
+            return relationships_map.get(person_id, [])
+
+        with patch.object(
+            service.graph_traversal,
+            "get_relationships_batch",
+            side_effect=as_batch(mock_get_relationships),
+        ):
+            common_person_id, visited_a, visited_b = service._bfs_find_common_ancestor(
+                person_a_id, person_b_id
+            )
+
+        assert common_person_id == person_a_id
+        assert service._build_final_ordered_list(
+            common_person_id, visited_a, visited_b
+        ) == [person_a_id, person_b_id]
+
 
 # =============================================================================
 # Tests for Person Data Enrichment (Task 3.9)
@@ -394,10 +589,14 @@ class TestPersonDataEnrichment:
 
         service = LineagePathService(mock_session)
 
-        with patch.object(service, "_get_person", return_value=mock_person), patch.object(
-            service, "_get_address_string", return_value="Village, District, State, Country"
-        ), patch.object(
-            service, "_get_religion_string", return_value="Hindu, Brahmin"
+        records = {
+            person_id: create_display_record(
+                mock_person, address="Village, District, State, Country", religion="Hindu, Brahmin"
+            )
+        }
+
+        with patch.object(
+            service.person_enrichment, "get_display_records", return_value=records
         ):
             result = service._enrich_person_data(person_id)
 
@@ -423,10 +622,14 @@ class TestPersonDataEnrichment:
 
         service = LineagePathService(mock_session)
 
-        with patch.object(service, "_get_person", return_value=mock_person), patch.object(
-            service, "_get_address_string", return_value=""
-        ), patch.object(
-            service, "_get_religion_string", return_value="Christian"
+        records = {
+            person_id: create_display_record(
+                mock_person, address="", religion="Christian"
+            )
+        }
+
+        with patch.object(
+            service.person_enrichment, "get_display_records", return_value=records
         ):
             result = service._enrich_person_data(person_id)
 
@@ -444,10 +647,14 @@ class TestPersonDataEnrichment:
 
         service = LineagePathService(mock_session)
 
-        with patch.object(service, "_get_person", return_value=mock_person), patch.object(
-            service, "_get_address_string", return_value="Some Address"
-        ), patch.object(
-            service, "_get_religion_string", return_value=""
+        records = {
+            person_id: create_display_record(
+                mock_person, address="Some Address", religion=""
+            )
+        }
+
+        with patch.object(
+            service.person_enrichment, "get_display_records", return_value=records
         ):
             result = service._enrich_person_data(person_id)
 
@@ -467,10 +674,14 @@ class TestPersonDataEnrichment:
 
         service = LineagePathService(mock_session)
 
-        with patch.object(service, "_get_person", return_value=mock_person), patch.object(
-            service, "_get_address_string", return_value=""
-        ), patch.object(
-            service, "_get_religion_string", return_value=""
+        records = {
+            person_id: create_display_record(
+                mock_person, address="", religion=""
+            )
+        }
+
+        with patch.object(
+            service.person_enrichment, "get_display_records", return_value=records
         ):
             result = service._enrich_person_data(person_id)
 
@@ -488,7 +699,9 @@ class TestPersonDataEnrichment:
 
         service = LineagePathService(mock_session)
 
-        with patch.object(service, "_get_person", return_value=None):
+        with patch.object(
+            service.person_enrichment, "get_display_records", return_value={}
+        ):
             result = service._enrich_person_data(person_id)
 
         assert result.person_id == person_id
@@ -521,10 +734,14 @@ class TestBidirectionalLinkedListBuilding:
 
         service = LineagePathService(mock_session)
 
-        with patch.object(service, "_get_person", return_value=mock_person), patch.object(
-            service, "_get_address_string", return_value=""
-        ), patch.object(
-            service, "_get_religion_string", return_value=""
+        records = {
+            person_id: create_display_record(
+                mock_person, address="", religion=""
+            )
+        }
+
+        with patch.object(
+            service.person_enrichment, "get_display_records", return_value=records
         ):
             result = service._build_bidirectional_linked_list([person_id])
 
@@ -543,21 +760,21 @@ class TestBidirectionalLinkedListBuilding:
 
         service = LineagePathService(mock_session)
 
-        def mock_get_person(pid):
-            if pid == person_a_id:
-                return mock_person_a
-            return mock_person_b
+        records = {
+            person_a_id: create_display_record(mock_person_a),
+            person_b_id: create_display_record(mock_person_b),
+        }
 
-        with patch.object(service, "_get_person", side_effect=mock_get_person), patch.object(
-            service, "_get_address_string", return_value=""
-        ), patch.object(
-            service, "_get_religion_string", return_value=""
-        ), patch.object(
+        with patch.object(
+            service.person_enrichment, "get_display_records", return_value=records
+        ) as mock_get_records, patch.object(
             service, "_get_relationship_type", return_value="Father"
         ):
             result = service._build_bidirectional_linked_list([person_a_id, person_b_id])
 
         assert len(result) == 2
+        # Both persons are enriched with one batched call
+        mock_get_records.assert_called_once_with([person_a_id, person_b_id])
         # Person A: no from_person, has to_person pointing to B
         assert result[person_a_id].from_person is None
         assert result[person_a_id].to_person is not None
@@ -584,13 +801,12 @@ class TestBidirectionalLinkedListBuilding:
 
         service = LineagePathService(mock_session)
 
-        def mock_get_person(pid):
-            return mock_persons.get(pid)
+        records = {
+            pid: create_display_record(person) for pid, person in mock_persons.items()
+        }
 
-        with patch.object(service, "_get_person", side_effect=mock_get_person), patch.object(
-            service, "_get_address_string", return_value=""
-        ), patch.object(
-            service, "_get_religion_string", return_value=""
+        with patch.object(
+            service.person_enrichment, "get_display_records", return_value=records
         ), patch.object(
             service, "_get_relationship_type", return_value="Related"
         ):
@@ -943,265 +1159,3 @@ class TestGetPerson:
         result = service._get_person(person_id)
 
         assert result is None
-
-
-# =============================================================================
-# Tests for _get_address_string Method
-# =============================================================================
-
-
-@pytest.mark.unit
-class TestGetAddressString:
-    """Tests for _get_address_string method."""
-
-    def test_get_address_string_returns_empty_when_no_address(
-        self, mock_session: MagicMock
-    ) -> None:
-        """Test that empty string is returned when no address found."""
-        person_id = uuid.uuid4()
-
-        mock_result = MagicMock()
-        mock_result.first.return_value = None
-        mock_session.exec.return_value = mock_result
-
-        service = LineagePathService(mock_session)
-        result = service._get_address_string(person_id)
-
-        assert result == ""
-
-    def test_get_address_string_returns_full_address(
-        self, mock_session: MagicMock
-    ) -> None:
-        """Test that full address string is returned with all parts."""
-        from app.db_models.address.country import Country
-        from app.db_models.address.district import District
-        from app.db_models.address.locality import Locality
-        from app.db_models.address.state import State
-        from app.db_models.address.sub_district import SubDistrict
-        from app.db_models.person.person_address import PersonAddress
-
-        person_id = uuid.uuid4()
-        locality_id = uuid.uuid4()
-        sub_district_id = uuid.uuid4()
-        district_id = uuid.uuid4()
-        state_id = uuid.uuid4()
-        country_id = uuid.uuid4()
-
-        # Create mock address
-        mock_address = MagicMock(spec=PersonAddress)
-        mock_address.locality_id = locality_id
-        mock_address.sub_district_id = sub_district_id
-        mock_address.district_id = district_id
-        mock_address.state_id = state_id
-        mock_address.country_id = country_id
-
-        # Create mock location objects
-        mock_locality = MagicMock(spec=Locality)
-        mock_locality.name = "TestVillage"
-
-        mock_sub_district = MagicMock(spec=SubDistrict)
-        mock_sub_district.name = "TestSubDistrict"
-
-        mock_district = MagicMock(spec=District)
-        mock_district.name = "TestDistrict"
-
-        mock_state = MagicMock(spec=State)
-        mock_state.name = "TestState"
-
-        mock_country = MagicMock(spec=Country)
-        mock_country.name = "TestCountry"
-
-        # Setup mock session to return different results based on query
-        call_count = [0]
-
-        def mock_exec_side_effect(query):
-            result = MagicMock()
-            call_count[0] += 1
-            if call_count[0] == 1:
-                result.first.return_value = mock_address
-            elif call_count[0] == 2:
-                result.first.return_value = mock_locality
-            elif call_count[0] == 3:
-                result.first.return_value = mock_sub_district
-            elif call_count[0] == 4:
-                result.first.return_value = mock_district
-            elif call_count[0] == 5:
-                result.first.return_value = mock_state
-            elif call_count[0] == 6:
-                result.first.return_value = mock_country
-            return result
-
-        mock_session.exec.side_effect = mock_exec_side_effect
-
-        service = LineagePathService(mock_session)
-        result = service._get_address_string(person_id)
-
-        assert "TestVillage" in result
-        assert "TestSubDistrict" in result
-        assert "TestDistrict" in result
-        assert "TestState" in result
-        assert "TestCountry" in result
-
-    def test_get_address_string_handles_partial_address(
-        self, mock_session: MagicMock
-    ) -> None:
-        """Test that partial address is handled correctly."""
-        from app.db_models.address.district import District
-        from app.db_models.address.state import State
-        from app.db_models.person.person_address import PersonAddress
-
-        person_id = uuid.uuid4()
-        district_id = uuid.uuid4()
-        state_id = uuid.uuid4()
-
-        # Create mock address with only district and state
-        mock_address = MagicMock(spec=PersonAddress)
-        mock_address.locality_id = None
-        mock_address.sub_district_id = None
-        mock_address.district_id = district_id
-        mock_address.state_id = state_id
-        mock_address.country_id = None
-
-        mock_district = MagicMock(spec=District)
-        mock_district.name = "OnlyDistrict"
-
-        mock_state = MagicMock(spec=State)
-        mock_state.name = "OnlyState"
-
-        call_count = [0]
-
-        def mock_exec_side_effect(query):
-            result = MagicMock()
-            call_count[0] += 1
-            if call_count[0] == 1:
-                result.first.return_value = mock_address
-            elif call_count[0] == 2:
-                result.first.return_value = mock_district
-            elif call_count[0] == 3:
-                result.first.return_value = mock_state
-            return result
-
-        mock_session.exec.side_effect = mock_exec_side_effect
-
-        service = LineagePathService(mock_session)
-        result = service._get_address_string(person_id)
-
-        assert "OnlyDistrict" in result
-        assert "OnlyState" in result
-        assert result == "OnlyDistrict, OnlyState"
-
-
-# =============================================================================
-# Tests for _get_religion_string Method
-# =============================================================================
-
-
-@pytest.mark.unit
-class TestGetReligionString:
-    """Tests for _get_religion_string method."""
-
-    def test_get_religion_string_returns_empty_when_no_religion(
-        self, mock_session: MagicMock
-    ) -> None:
-        """Test that empty string is returned when no religion found."""
-        person_id = uuid.uuid4()
-
-        mock_result = MagicMock()
-        mock_result.first.return_value = None
-        mock_session.exec.return_value = mock_result
-
-        service = LineagePathService(mock_session)
-        result = service._get_religion_string(person_id)
-
-        assert result == ""
-
-    def test_get_religion_string_returns_full_religion(
-        self, mock_session: MagicMock
-    ) -> None:
-        """Test that full religion string is returned with all parts."""
-        from app.db_models.person.person_religion import PersonReligion
-        from app.db_models.religion.religion import Religion
-        from app.db_models.religion.religion_category import ReligionCategory
-        from app.db_models.religion.religion_sub_category import ReligionSubCategory
-
-        person_id = uuid.uuid4()
-        religion_id = uuid.uuid4()
-        category_id = uuid.uuid4()
-        sub_category_id = uuid.uuid4()
-
-        # Create mock person religion
-        mock_person_religion = MagicMock(spec=PersonReligion)
-        mock_person_religion.religion_id = religion_id
-        mock_person_religion.religion_category_id = category_id
-        mock_person_religion.religion_sub_category_id = sub_category_id
-
-        # Create mock religion objects
-        mock_religion = MagicMock(spec=Religion)
-        mock_religion.name = "Hinduism"
-
-        mock_category = MagicMock(spec=ReligionCategory)
-        mock_category.name = "Brahmin"
-
-        mock_sub_category = MagicMock(spec=ReligionSubCategory)
-        mock_sub_category.name = "Iyer"
-
-        call_count = [0]
-
-        def mock_exec_side_effect(query):
-            result = MagicMock()
-            call_count[0] += 1
-            if call_count[0] == 1:
-                result.first.return_value = mock_person_religion
-            elif call_count[0] == 2:
-                result.first.return_value = mock_religion
-            elif call_count[0] == 3:
-                result.first.return_value = mock_category
-            elif call_count[0] == 4:
-                result.first.return_value = mock_sub_category
-            return result
-
-        mock_session.exec.side_effect = mock_exec_side_effect
-
-        service = LineagePathService(mock_session)
-        result = service._get_religion_string(person_id)
-
-        assert "Hinduism" in result
-        assert "Brahmin" in result
-        assert "Iyer" in result
-
-    def test_get_religion_string_handles_partial_religion(
-        self, mock_session: MagicMock
-    ) -> None:
-        """Test that partial religion info is handled correctly."""
-        from app.db_models.person.person_religion import PersonReligion
-        from app.db_models.religion.religion import Religion
-
-        person_id = uuid.uuid4()
-        religion_id = uuid.uuid4()
-
-        # Create mock person religion with only religion (no category/subcategory)
-        mock_person_religion = MagicMock(spec=PersonReligion)
-        mock_person_religion.religion_id = religion_id
-        mock_person_religion.religion_category_id = None
-        mock_person_religion.religion_sub_category_id = None
-
-        mock_religion = MagicMock(spec=Religion)
-        mock_religion.name = "Christianity"
-
-        call_count = [0]
-
-        def mock_exec_side_effect(query):
-            result = MagicMock()
-            call_count[0] += 1
-            if call_count[0] == 1:
-                result.first.return_value = mock_person_religion
-            elif call_count[0] == 2:
-                result.first.return_value = mock_religion
-            return result
-
-        mock_session.exec.side_effect = mock_exec_side_effect
-
-        service = LineagePathService(mock_session)
-        result = service._get_religion_string(person_id)
-
-        assert result == "Christianity"
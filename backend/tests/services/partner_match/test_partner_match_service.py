@@ -8,6 +8,7 @@ Tests cover:
 - Gotra exclusion filter
 - Living person filter
 - Marital status filter
+- Bulk eligibility screening against the database
 - Graph structure (from_person, to_persons)
 
 Requirements: 1.1, 1.2, 2.1, 3.1, 3.2, 4.1, 5.1, 6.1, 7.1, 7.2, 8.3, 8.4
@@ -19,17 +20,24 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from fastapi import HTTPException
+from sqlmodel import Session, select
 
 from app.db_models.person.person import Person
 from app.db_models.person.person_relationship import PersonRelationship
+from app.db_models.person.person_religion import PersonReligion
+from app.db_models.religion.religion import Religion
 from app.enums.gender import GENDER_DATA, GenderEnum
 from app.enums.marital_status import MaritalStatus
 from app.enums.relationship_type import RelationshipType
+from app.models import User
 from app.schemas.partner_match import PartnerMatchRequest
+from app.services.partner_match import partner_match_service
 from app.services.partner_match.partner_match_service import (
     PartnerMatchService,
     PersonReligionIds,
 )
+from app.services.religion.religion_taxonomy import ReligionTaxonomy
+from tests.factories import PersonFactory, RelationshipFactory
 
 
 # =============================================================================
@@ -78,6 +86,20 @@ def create_mock_relationship(
     )
 
 
+def create_eligibility_row(person: Person) -> tuple:
+    """Create a row of the eligibility query for a person without religion."""
+    return (
+        person.id,
+        person.gender_id,
+        person.date_of_birth,
+        person.date_of_death,
+        person.marital_status,
+        None,
+        None,
+        None,
+    )
+
+
 def create_basic_request(
     seeker_id: uuid.UUID,
     target_gender: str = "MALE",
@@ -167,12 +189,10 @@ class TestGenderFilter:
 
         Requirements: 2.1
         """
-        person_id = uuid.uuid4()
         male_gender_id = GENDER_DATA[GenderEnum.MALE].id
-        mock_person = create_mock_person(person_id, gender_id=male_gender_id)
 
         service = PartnerMatchService(mock_session)
-        result = service._matches_gender(mock_person, "MALE")
+        result = service._matches_gender(male_gender_id, "MALE")
 
         assert result is True
 
@@ -181,12 +201,10 @@ class TestGenderFilter:
 
         Requirements: 2.1
         """
-        person_id = uuid.uuid4()
         female_gender_id = GENDER_DATA[GenderEnum.FEMALE].id
-        mock_person = create_mock_person(person_id, gender_id=female_gender_id)
 
         service = PartnerMatchService(mock_session)
-        result = service._matches_gender(mock_person, "FEMALE")
+        result = service._matches_gender(female_gender_id, "FEMALE")
 
         assert result is True
 
@@ -195,12 +213,10 @@ class TestGenderFilter:
 
         Requirements: 2.1
         """
-        person_id = uuid.uuid4()
         male_gender_id = GENDER_DATA[GenderEnum.MALE].id
-        mock_person = create_mock_person(person_id, gender_id=male_gender_id)
 
         service = PartnerMatchService(mock_session)
-        result = service._matches_gender(mock_person, "FEMALE")
+        result = service._matches_gender(male_gender_id, "FEMALE")
 
         assert result is False
 
@@ -331,7 +347,6 @@ class TestReligionFilters:
 
         Requirements: 4.1
         """
-        person_id = uuid.uuid4()
         religion_id = uuid.uuid4()
 
         service = PartnerMatchService(mock_session)
@@ -342,12 +357,9 @@ class TestReligionFilters:
             include_religion_ids=[religion_id],
         )
 
-        with patch.object(
-            service,
-            "_get_person_religion_ids",
-            return_value=PersonReligionIds(religion_id=religion_id),
-        ):
-            result = service._passes_religion_filters(person_id, request)
+        result = service._passes_religion_filters(
+            PersonReligionIds(religion_id=religion_id), request
+        )
 
         assert result is True
 
@@ -356,7 +368,6 @@ class TestReligionFilters:
 
         Requirements: 4.1
         """
-        person_id = uuid.uuid4()
         religion_id = uuid.uuid4()
         other_religion_id = uuid.uuid4()
 
@@ -368,12 +379,9 @@ class TestReligionFilters:
             include_religion_ids=[religion_id],
         )
 
-        with patch.object(
-            service,
-            "_get_person_religion_ids",
-            return_value=PersonReligionIds(religion_id=other_religion_id),
-        ):
-            result = service._passes_religion_filters(person_id, request)
+        result = service._passes_religion_filters(
+            PersonReligionIds(religion_id=other_religion_id), request
+        )
 
         assert result is False
 
@@ -382,7 +390,6 @@ class TestReligionFilters:
 
         Requirements: 5.1
         """
-        person_id = uuid.uuid4()
         gotra_id = uuid.uuid4()
 
         service = PartnerMatchService(mock_session)
@@ -393,12 +400,9 @@ class TestReligionFilters:
             exclude_sub_category_ids=[gotra_id],
         )
 
-        with patch.object(
-            service,
-            "_get_person_religion_ids",
-            return_value=PersonReligionIds(sub_category_id=gotra_id),
-        ):
-            result = service._passes_religion_filters(person_id, request)
+        result = service._passes_religion_filters(
+            PersonReligionIds(sub_category_id=gotra_id), request
+        )
 
         assert result is False
 
@@ -409,7 +413,6 @@ class TestReligionFilters:
 
         Requirements: 5.1
         """
-        person_id = uuid.uuid4()
         excluded_gotra_id = uuid.uuid4()
         person_gotra_id = uuid.uuid4()
 
@@ -421,14 +424,116 @@ class TestReligionFilters:
             exclude_sub_category_ids=[excluded_gotra_id],
         )
 
+        result = service._passes_religion_filters(
+            PersonReligionIds(sub_category_id=person_gotra_id), request
+        )
+
+        assert result is True
+
+
+@pytest.mark.unit
+class TestNarrowReligionFilters:
+    """Tests for _narrow_religion_filters method."""
+
+    @pytest.fixture
+    def taxonomy_ids(self) -> dict[str, uuid.UUID]:
+        """Two religions with one category and one sub-category each."""
+        return {
+            key: uuid.uuid4()
+            for key in ("religion", "other", "category", "other_category", "sub")
+        }
+
+    @pytest.fixture
+    def taxonomy(self, taxonomy_ids: dict[str, uuid.UUID]) -> ReligionTaxonomy:
+        """A taxonomy loaded from mock rows."""
+        ids = taxonomy_ids
+        session = MagicMock(spec=Session)
+        session.exec.return_value.all.side_effect = [
+            [(ids["religion"], "Religion"), (ids["other"], "Other")],
+            [
+                (ids["category"], "Category", ids["religion"]),
+                (ids["other_category"], "Other Category", ids["other"]),
+            ],
+            [(ids["sub"], "Sub", ids["category"])],
+        ]
+        taxonomy = ReligionTaxonomy()
+        # Keep the table change counters from reading the mock rows
+        with patch.object(taxonomy, "_table_versions", return_value={}):
+            taxonomy.load(session)
+        return taxonomy
+
+    def test_without_nested_filters_skips_taxonomy(
+        self, mock_session: MagicMock
+    ) -> None:
+        """Test a religion-only filter is returned unchanged."""
+        service = PartnerMatchService(mock_session)
+        request = PartnerMatchRequest(
+            seeker_person_id=uuid.uuid4(),
+            target_gender_code="MALE",
+            include_religion_ids=[uuid.uuid4()],
+        )
+
         with patch.object(
-            service,
-            "_get_person_religion_ids",
-            return_value=PersonReligionIds(sub_category_id=person_gotra_id),
+            partner_match_service, "get_religion_taxonomy"
+        ) as get_taxonomy:
+            result = service._narrow_religion_filters(request)
+
+        assert result is request
+        get_taxonomy.assert_not_called()
+
+    def test_drops_categories_outside_included_religions(
+        self,
+        mock_session: MagicMock,
+        taxonomy: ReligionTaxonomy,
+        taxonomy_ids: dict[str, uuid.UUID],
+    ) -> None:
+        """Test categories of other religions are dropped, unknown ones kept."""
+        unknown_category = uuid.uuid4()
+        service = PartnerMatchService(mock_session)
+        request = PartnerMatchRequest(
+            seeker_person_id=uuid.uuid4(),
+            target_gender_code="MALE",
+            include_religion_ids=[taxonomy_ids["religion"]],
+            include_category_ids=[
+                taxonomy_ids["category"],
+                taxonomy_ids["other_category"],
+                unknown_category,
+            ],
+        )
+
+        with patch.object(
+            partner_match_service, "get_religion_taxonomy", return_value=taxonomy
         ):
-            result = service._passes_religion_filters(person_id, request)
+            result = service._narrow_religion_filters(request)
+
+        assert result is not None
+        assert result.include_category_ids == [
+            taxonomy_ids["category"],
+            unknown_category,
+        ]
+
+    def test_unsatisfiable_filters_return_none(
+        self,
+        mock_session: MagicMock,
+        taxonomy: ReligionTaxonomy,
+        taxonomy_ids: dict[str, uuid.UUID],
+    ) -> None:
+        """Test no candidate is screened when the filters cannot nest."""
+        service = PartnerMatchService(mock_session)
+        request = PartnerMatchRequest(
+            seeker_person_id=uuid.uuid4(),
+            target_gender_code="MALE",
+            include_religion_ids=[taxonomy_ids["other"]],
+            include_sub_category_ids=[taxonomy_ids["sub"]],
+        )
 
-        assert result is True
+        with patch.object(
+            partner_match_service, "get_religion_taxonomy", return_value=taxonomy
+        ):
+            assert service._narrow_religion_filters(request) is None
+            assert service._filter_eligible_matches([uuid.uuid4()], request) == set()
+
+        mock_session.exec.assert_not_called()
 
 
 # =============================================================================
@@ -438,50 +543,51 @@ class TestReligionFilters:
 
 @pytest.mark.unit
 class TestLivingPersonFilter:
-    """Tests for living person filter in _is_eligible_match."""
+    """Tests for living person filter in _filter_eligible_matches."""
 
     def test_living_person_passes(self, mock_session: MagicMock) -> None:
         """Test living person passes filter.
 
         Requirements: 6.1
         """
-        person_id = uuid.uuid4()
-        mock_person = create_mock_person(
-            person_id,
+        person = create_mock_person(
+            uuid.uuid4(),
             gender_id=GENDER_DATA[GenderEnum.FEMALE].id,
             death_date=None,
             marital_status=MaritalStatus.SINGLE,
         )
+        mock_session.exec.return_value.all.return_value = [
+            create_eligibility_row(person)
+        ]
 
         service = PartnerMatchService(mock_session)
         request = create_basic_request(uuid.uuid4(), target_gender="FEMALE")
 
-        with patch.object(service, "_get_person", return_value=mock_person), patch.object(
-            service, "_passes_religion_filters", return_value=True
-        ):
-            result = service._is_eligible_match(person_id, request)
+        result = service._filter_eligible_matches([person.id], request)
 
-        assert result is True
+        assert result == {person.id}
 
     def test_deceased_person_fails(self, mock_session: MagicMock) -> None:
         """Test deceased person fails filter.
 
         Requirements: 6.1
         """
-        person_id = uuid.uuid4()
-        mock_person = create_mock_person(
-            person_id,
+        person = create_mock_person(
+            uuid.uuid4(),
             gender_id=GENDER_DATA[GenderEnum.FEMALE].id,
             death_date=date(2020, 1, 1),
+            marital_status=MaritalStatus.SINGLE,
         )
+        mock_session.exec.return_value.all.return_value = [
+            create_eligibility_row(person)
+        ]
 
         service = PartnerMatchService(mock_session)
         request = create_basic_request(uuid.uuid4(), target_gender="FEMALE")
 
-        with patch.object(service, "_get_person", return_value=mock_person):
-            result = service._is_eligible_match(person_id, request)
+        result = service._filter_eligible_matches([person.id], request)
 
-        assert result is False
+        assert result == set()
 
 
 # =============================================================================
@@ -493,231 +599,197 @@ class TestLivingPersonFilter:
 class TestMaritalStatusFilter:
     """Tests for _is_ineligible_marital_status method."""
 
-    def test_single_status_returns_false(self, mock_session: MagicMock) -> None:
-        """Test SINGLE marital status returns false (eligible).
+    @pytest.mark.parametrize(
+        "marital_status",
+        [
+            MaritalStatus.SINGLE,
+            MaritalStatus.DIVORCED,
+            MaritalStatus.WIDOWED,
+            MaritalStatus.SEPARATED,
+        ],
+    )
+    def test_unmarried_statuses_are_eligible(
+        self, mock_session: MagicMock, marital_status: MaritalStatus
+    ) -> None:
+        """Test set statuses other than MARRIED are eligible, even with children.
 
         Requirements: 7.1
         """
-        person_id = uuid.uuid4()
-        mock_person = create_mock_person(
-            person_id, marital_status=MaritalStatus.SINGLE
-        )
-
         service = PartnerMatchService(mock_session)
-        result = service._is_ineligible_marital_status(mock_person)
 
-        assert result is False
+        assert service._is_ineligible_marital_status(marital_status, False) is False
+        assert service._is_ineligible_marital_status(marital_status, True) is False
 
     def test_married_status_returns_true(self, mock_session: MagicMock) -> None:
         """Test MARRIED marital status returns true (ineligible).
 
         Requirements: 7.1
         """
-        person_id = uuid.uuid4()
-        mock_person = create_mock_person(
-            person_id, marital_status=MaritalStatus.MARRIED
-        )
-
         service = PartnerMatchService(mock_session)
-        result = service._is_ineligible_marital_status(mock_person)
+        result = service._is_ineligible_marital_status(MaritalStatus.MARRIED, False)
 
         assert result is True
 
-    def test_divorced_status_returns_false(self, mock_session: MagicMock) -> None:
-        """Test DIVORCED marital status returns false (eligible).
-
-        Requirements: 7.1
-        """
-        person_id = uuid.uuid4()
-        mock_person = create_mock_person(
-            person_id, marital_status=MaritalStatus.DIVORCED
-        )
-
-        service = PartnerMatchService(mock_session)
-        result = service._is_ineligible_marital_status(mock_person)
-
-        assert result is False
-
-    def test_widowed_status_returns_false(self, mock_session: MagicMock) -> None:
-        """Test WIDOWED marital status returns false (eligible).
-
-        Requirements: 7.1
-        """
-        person_id = uuid.uuid4()
-        mock_person = create_mock_person(
-            person_id, marital_status=MaritalStatus.WIDOWED
-        )
-
-        service = PartnerMatchService(mock_session)
-        result = service._is_ineligible_marital_status(mock_person)
-
-        assert result is False
-
-    def test_separated_status_returns_false(self, mock_session: MagicMock) -> None:
-        """Test SEPARATED marital status returns false (eligible).
-
-        Requirements: 7.1
-        """
-        person_id = uuid.uuid4()
-        mock_person = create_mock_person(
-            person_id, marital_status=MaritalStatus.SEPARATED
-        )
-
-        service = PartnerMatchService(mock_session)
-        result = service._is_ineligible_marital_status(mock_person)
-
-        assert result is False
-
-    def test_unknown_status_fallback_no_relationships(
+    def test_unknown_status_falls_back_to_relationships(
         self, mock_session: MagicMock
     ) -> None:
-        """Test UNKNOWN status falls back to relationship check - no relationships.
+        """Test UNKNOWN status uses the spouse/child relationship check.
 
         Requirements: 7.1, 7.2
         """
-        person_id = uuid.uuid4()
-        mock_person = create_mock_person(
-            person_id, marital_status=MaritalStatus.UNKNOWN
-        )
-
-        mock_result = MagicMock()
-        mock_result.all.return_value = []
-        mock_session.exec.return_value = mock_result
-
         service = PartnerMatchService(mock_session)
-        result = service._is_ineligible_marital_status(mock_person)
-
-        assert result is False
-
-    def test_unknown_status_fallback_with_wife_returns_true(
-        self, mock_session: MagicMock
-    ) -> None:
-        """Test UNKNOWN status with wife relationship returns true (ineligible).
 
-        Requirements: 7.1
-        """
-        person_id = uuid.uuid4()
-        wife_id = uuid.uuid4()
-        mock_person = create_mock_person(
-            person_id, marital_status=MaritalStatus.UNKNOWN
+        assert (
+            service._is_ineligible_marital_status(MaritalStatus.UNKNOWN, False) is False
         )
-
-        wife_rel = create_mock_relationship(
-            person_id, wife_id, RelationshipType.WIFE, is_active=True
+        assert (
+            service._is_ineligible_marital_status(MaritalStatus.UNKNOWN, True) is True
         )
 
-        mock_result = MagicMock()
-        mock_result.all.return_value = [wife_rel]
-        mock_session.exec.return_value = mock_result
-
-        service = PartnerMatchService(mock_session)
-        result = service._is_ineligible_marital_status(mock_person)
-
-        assert result is True
-
-    def test_unknown_status_fallback_with_husband_returns_true(
+    def test_fallback_query_only_runs_for_unknown_status(
         self, mock_session: MagicMock
     ) -> None:
-        """Test UNKNOWN status with husband relationship returns true (ineligible).
+        """Test the relationship lookup only covers UNKNOWN status survivors.
 
-        Requirements: 7.1
-        """
-        person_id = uuid.uuid4()
-        husband_id = uuid.uuid4()
-        mock_person = create_mock_person(
-            person_id, marital_status=MaritalStatus.UNKNOWN
-        )
-
-        husband_rel = create_mock_relationship(
-            person_id, husband_id, RelationshipType.HUSBAND, is_active=True
-        )
-
-        mock_result = MagicMock()
-        mock_result.all.return_value = [husband_rel]
-        mock_session.exec.return_value = mock_result
-
-        service = PartnerMatchService(mock_session)
-        result = service._is_ineligible_marital_status(mock_person)
-
-        assert result is True
-
-    def test_unknown_status_fallback_with_son_returns_true(
-        self, mock_session: MagicMock
-    ) -> None:
-        """Test UNKNOWN status with son relationship returns true (ineligible).
-
-        Requirements: 7.2
+        Requirements: 7.1, 7.2
         """
-        person_id = uuid.uuid4()
-        son_id = uuid.uuid4()
-        mock_person = create_mock_person(
-            person_id, marital_status=MaritalStatus.UNKNOWN
-        )
-
-        son_rel = create_mock_relationship(
-            person_id, son_id, RelationshipType.SON, is_active=True
-        )
-
-        mock_result = MagicMock()
-        mock_result.all.return_value = [son_rel]
-        mock_session.exec.return_value = mock_result
+        single = create_mock_person(uuid.uuid4(), marital_status=MaritalStatus.SINGLE)
+        unknown = create_mock_person(uuid.uuid4(), marital_status=MaritalStatus.UNKNOWN)
+        married = create_mock_person(uuid.uuid4(), marital_status=MaritalStatus.MARRIED)
+        mock_session.exec.return_value.all.return_value = [
+            create_eligibility_row(person) for person in (single, unknown, married)
+        ]
 
         service = PartnerMatchService(mock_session)
-        result = service._is_ineligible_marital_status(mock_person)
+        request = create_basic_request(uuid.uuid4())
 
-        assert result is True
+        with patch.object(
+            service, "_get_persons_with_spouse_or_children", return_value=set()
+        ) as lookup:
+            result = service._filter_eligible_matches(
+                [single.id, unknown.id, married.id], request
+            )
 
-    def test_unknown_status_fallback_with_daughter_returns_true(
-        self, mock_session: MagicMock
+        assert result == {single.id, unknown.id}
+        lookup.assert_called_once_with({unknown.id})
+
+
+@pytest.mark.integration
+class TestMaritalStatusFallbackIntegration:
+    """Tests for the relationship-based marital status fallback."""
+
+    @pytest.mark.parametrize(
+        ("relationship_type", "is_active", "expected_ineligible"),
+        [
+            (RelationshipType.WIFE, True, True),
+            (RelationshipType.HUSBAND, True, True),
+            (RelationshipType.SPOUSE, True, True),
+            (RelationshipType.SON, True, True),
+            (RelationshipType.DAUGHTER, True, True),
+            (RelationshipType.FATHER, True, False),
+            (RelationshipType.MOTHER, True, False),
+            (RelationshipType.WIFE, False, False),
+        ],
+    )
+    def test_spouse_or_child_relationship(
+        self,
+        db: Session,
+        test_user: User,
+        relationship_type: RelationshipType,
+        is_active: bool,
+        expected_ineligible: bool,
     ) -> None:
-        """Test UNKNOWN status with daughter relationship returns true (ineligible).
+        """Test which relationships make an UNKNOWN status person ineligible.
 
-        Requirements: 7.2
+        Requirements: 7.1, 7.2
         """
-        person_id = uuid.uuid4()
-        daughter_id = uuid.uuid4()
-        mock_person = create_mock_person(
-            person_id, marital_status=MaritalStatus.UNKNOWN
+        person = PersonFactory.create(db, created_by_user=test_user)
+        related = PersonFactory.create(db, created_by_user=test_user)
+        RelationshipFactory.create(
+            db,
+            person=person,
+            related_person=related,
+            relationship_type=relationship_type,
+            is_active=is_active,
         )
 
-        daughter_rel = create_mock_relationship(
-            person_id, daughter_id, RelationshipType.DAUGHTER, is_active=True
-        )
+        service = PartnerMatchService(db)
+        result = service._get_persons_with_spouse_or_children({person.id, related.id})
 
-        mock_result = MagicMock()
-        mock_result.all.return_value = [daughter_rel]
-        mock_session.exec.return_value = mock_result
+        assert (person.id in result) is expected_ineligible
+        assert related.id not in result
 
-        service = PartnerMatchService(mock_session)
-        result = service._is_ineligible_marital_status(mock_person)
 
-        assert result is True
+@pytest.mark.integration
+class TestFilterEligibleMatchesIntegration:
+    """Tests for bulk eligibility screening against the database."""
 
-    def test_unknown_status_fallback_parent_relationship_does_not_count(
-        self, mock_session: MagicMock
-    ) -> None:
-        """Test UNKNOWN status with parent relationships doesn't count as ineligible.
+    def test_applies_all_filters_in_bulk(self, db: Session, test_user: User) -> None:
+        """Test every filter on one batch of candidates.
 
-        Requirements: 7.1, 7.2
+        Requirements: 2.1, 3.1, 3.2, 4.1, 5.1, 6.1, 7.1, 7.2
         """
-        person_id = uuid.uuid4()
-        father_id = uuid.uuid4()
-        mock_person = create_mock_person(
-            person_id, marital_status=MaritalStatus.UNKNOWN
+        religions = db.exec(select(Religion).limit(2)).all()
+        if len(religions) < 2:
+            pytest.skip("Religion metadata is not seeded")
+        included, other = religions
+
+        def create(
+            gender: GenderEnum = GenderEnum.FEMALE,
+            date_of_birth: date = date(1995, 6, 1),
+            date_of_death: date | None = None,
+            marital_status: MaritalStatus = MaritalStatus.SINGLE,
+            religion_id: uuid.UUID | None = included.id,
+        ) -> uuid.UUID:
+            person = PersonFactory.create(
+                db,
+                created_by_user=test_user,
+                gender=gender,
+                date_of_birth=date_of_birth,
+                date_of_death=date_of_death,
+            )
+            person.marital_status = marital_status
+            db.add(person)
+            if religion_id is not None:
+                db.add(PersonReligion(person_id=person.id, religion_id=religion_id))
+            db.commit()
+            return person.id
+
+        eligible = create()
+        unknown_single = create(marital_status=MaritalStatus.UNKNOWN)
+        unknown_parent = create(marital_status=MaritalStatus.UNKNOWN)
+        RelationshipFactory.create(
+            db,
+            person=db.get(Person, unknown_parent),
+            related_person=PersonFactory.create(db, created_by_user=test_user),
+            relationship_type=RelationshipType.SON,
         )
+        ineligible = [
+            create(gender=GenderEnum.MALE),
+            create(date_of_death=date(2020, 1, 1)),
+            create(date_of_birth=date(1989, 12, 31)),
+            create(date_of_birth=date(2001, 1, 1)),
+            create(religion_id=other.id),
+            create(religion_id=None),
+            create(marital_status=MaritalStatus.MARRIED),
+            unknown_parent,
+        ]
 
-        father_rel = create_mock_relationship(
-            person_id, father_id, RelationshipType.FATHER, is_active=True
+        request = PartnerMatchRequest(
+            seeker_person_id=uuid.uuid4(),
+            target_gender_code="female",
+            birth_year_min=1990,
+            birth_year_max=2000,
+            include_religion_ids=[included.id],
         )
+        service = PartnerMatchService(db)
 
-        mock_result = MagicMock()
-        mock_result.all.return_value = [father_rel]
-        mock_session.exec.return_value = mock_result
-
-        service = PartnerMatchService(mock_session)
-        result = service._is_ineligible_marital_status(mock_person)
+        with patch.object(partner_match_service, "ELIGIBILITY_CHUNK_SIZE", 4):
+            result = service._filter_eligible_matches(
+                [eligible, unknown_single, *ineligible, uuid.uuid4()], request
+            )
 
-        assert result is False
+        assert result == {eligible, unknown_single}
 
 
 # =============================================================================
@@ -751,7 +823,9 @@ class TestGraphStructure:
             depth=0,
         )
 
-        with patch.object(service, "_enrich_node_data", return_value=mock_node):
+        with patch.object(
+            service, "_enrich_nodes", return_value={seeker_id: mock_node}
+        ):
             result = service._build_exploration_tree(
                 parent_map, depth_map, matches, seeker_id
             )
@@ -785,7 +859,9 @@ class TestGraphStructure:
             )
 
         with patch.object(
-            service, "_enrich_node_data", side_effect=mock_enrich
+            service,
+            "_enrich_nodes",
+            side_effect=lambda pids: {pid: mock_enrich(pid) for pid in pids},
         ), patch.object(service, "_get_relationship_type", return_value="Father"):
             result = service._build_exploration_tree(
                 parent_map, depth_map, matches, seeker_id
@@ -820,7 +896,9 @@ class TestGraphStructure:
             )
 
         with patch.object(
-            service, "_enrich_node_data", side_effect=mock_enrich
+            service,
+            "_enrich_nodes",
+            side_effect=lambda pids: {pid: mock_enrich(pid) for pid in pids},
         ), patch.object(service, "_get_relationship_type", return_value="Son"):
             result = service._build_exploration_tree(
                 parent_map, depth_map, matches, seeker_id
@@ -856,8 +934,12 @@ class TestGraphStructure:
             )
 
         with patch.object(
-            service, "_enrich_node_data", side_effect=mock_enrich
-        ), patch.object(service, "_get_relationship_type", return_value="Related"):
+            service,
+            "_enrich_nodes",
+            side_effect=lambda pids: {pid: mock_enrich(pid) for pid in pids},
+        ) as mock_enrich_nodes, patch.object(
+            service, "_get_relationship_type", return_value="Related"
+        ):
             result = service._build_exploration_tree(
                 parent_map, depth_map, matches, seeker_id
             )
@@ -865,6 +947,10 @@ class TestGraphStructure:
         assert result[match_id].is_match is True
         assert result[non_match_id].is_match is False
         assert result[seeker_id].is_match is False
+        # All nodes are enriched with one batched call
+        mock_enrich_nodes.assert_called_once_with(
+            [seeker_id, match_id, non_match_id]
+        )
 
 
 # =============================================================================
@@ -896,12 +982,16 @@ class TestBFSExploration:
         service = PartnerMatchService(mock_session)
         request = create_basic_request(seeker_id, max_depth=2)
 
-        def mock_get_relationships(pid: uuid.UUID) -> list[uuid.UUID]:
-            return relationships_map.get(pid, [])
+        def mock_get_relationships_batch(
+            pids: list[uuid.UUID],
+        ) -> dict[uuid.UUID, list[uuid.UUID]]:
+            return {pid: relationships_map.get(pid, []) for pid in pids}
 
         with patch.object(
-            service, "_get_relationships", side_effect=mock_get_relationships
-        ), patch.object(service, "_is_eligible_match", return_value=False):
+            service.graph_traversal,
+            "get_relationships_batch",
+            side_effect=mock_get_relationships_batch,
+        ), patch.object(service, "_filter_eligible_matches", return_value=set()):
             parent_map, depth_map, matches = service._bfs_explore(
                 seeker_id, max_depth=2, request=request
             )
@@ -929,15 +1019,23 @@ class TestBFSExploration:
         service = PartnerMatchService(mock_session)
         request = create_basic_request(seeker_id)
 
-        def mock_get_relationships(pid: uuid.UUID) -> list[uuid.UUID]:
-            return relationships_map.get(pid, [])
+        def mock_get_relationships_batch(
+            pids: list[uuid.UUID],
+        ) -> dict[uuid.UUID, list[uuid.UUID]]:
+            return {pid: relationships_map.get(pid, []) for pid in pids}
 
-        def mock_is_eligible(pid: uuid.UUID, req: PartnerMatchRequest) -> bool:
-            return pid == match_id
+        def mock_filter_eligible(
+            pids: list[uuid.UUID], req: PartnerMatchRequest
+        ) -> set[uuid.UUID]:
+            return {pid for pid in pids if pid == match_id}
 
         with patch.object(
-            service, "_get_relationships", side_effect=mock_get_relationships
-        ), patch.object(service, "_is_eligible_match", side_effect=mock_is_eligible):
+            service.graph_traversal,
+            "get_relationships_batch",
+            side_effect=mock_get_relationships_batch,
+        ), patch.object(
+            service, "_filter_eligible_matches", side_effect=mock_filter_eligible
+        ):
             parent_map, depth_map, matches = service._bfs_explore(
                 seeker_id, max_depth=5, request=request
             )
@@ -963,12 +1061,16 @@ class TestBFSExploration:
         service = PartnerMatchService(mock_session)
         request = create_basic_request(seeker_id)
 
-        def mock_get_relationships(pid: uuid.UUID) -> list[uuid.UUID]:
-            return relationships_map.get(pid, [])
+        def mock_get_relationships_batch(
+            pids: list[uuid.UUID],
+        ) -> dict[uuid.UUID, list[uuid.UUID]]:
+            return {pid: relationships_map.get(pid, []) for pid in pids}
 
         with patch.object(
-            service, "_get_relationships", side_effect=mock_get_relationships
-        ), patch.object(service, "_is_eligible_match", return_value=False):
+            service.graph_traversal,
+            "get_relationships_batch",
+            side_effect=mock_get_relationships_batch,
+        ), patch.object(service, "_filter_eligible_matches", return_value=set()):
             parent_map, depth_map, matches = service._bfs_explore(
                 seeker_id, max_depth=5, request=request
             )
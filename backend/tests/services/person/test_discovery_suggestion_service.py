@@ -0,0 +1,349 @@
+"""Tests for precomputed discovery suggestions.
+
+Tests cover:
+- Storing and reading suggestions, including computed-empty results
+- Invalidation of persons whose discovery reads changed relationships
+- Falling back to live discovery and queueing a refresh on a miss
+- The background worker and the bulk backfill
+"""
+
+import time
+import uuid
+from collections.abc import Generator
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlmodel import Session, delete, select
+
+from app.db_models.person.discovery_suggestion import (
+    DiscoverySuggestion,
+    DiscoverySuggestionState,
+)
+from app.db_models.person.person import Person
+from app.enums import GenderEnum, RelationshipType
+from app.models import User
+from app.schemas.person import PersonRelationshipCreate
+from app.services.person import discovery_suggestion_service
+from app.services.person.discovery_suggestion_service import (
+    DiscoverySuggestionService,
+    DiscoverySuggestionWorker,
+    invalidate_discovery_suggestions,
+)
+from app.services.person.person_discovery_service import PersonDiscoveryService
+from app.services.person.person_relationship_service import PersonRelationshipService
+from tests.factories import PersonFactory, RelationshipFactory
+from tests.test_db import test_engine
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+
+@pytest.fixture(autouse=True)
+def clear_suggestions(db: Session) -> Generator[None, None, None]:
+    """Remove suggestions of persons that outlive the test, e.g. from backfill."""
+    yield
+    db.rollback()
+    db.execute(delete(DiscoverySuggestion))
+    db.execute(delete(DiscoverySuggestionState))
+    db.commit()
+
+
+@pytest.fixture
+def suggestions_enabled() -> Generator[None, None, None]:
+    """Enable the precomputed discovery suggestion store."""
+    with patch.object(
+        discovery_suggestion_service.settings, "DISCOVERY_SUGGESTIONS_ENABLED", True
+    ):
+        yield
+
+
+@pytest.fixture
+def worker() -> Generator[DiscoverySuggestionWorker, None, None]:
+    """Install a stopped worker on the test database as the global worker."""
+    test_worker = DiscoverySuggestionWorker(test_engine)
+    with patch.object(discovery_suggestion_service, "_worker", test_worker):
+        yield test_worker
+    test_worker.stop()
+
+
+@pytest.fixture
+def family(db: Session, test_user: User) -> dict[str, Person]:
+    """Create a person whose spouse has a child the person is not linked to."""
+    person = PersonFactory.create(db, created_by_user=test_user)
+    spouse = PersonFactory.create(
+        db, created_by_user=test_user, gender=GenderEnum.FEMALE
+    )
+    child = PersonFactory.create(db, created_by_user=test_user, first_name="Kid")
+    RelationshipFactory.create_bidirectional(
+        db,
+        person=person,
+        related_person=spouse,
+        relationship_type=RelationshipType.WIFE,
+        inverse_relationship_type=RelationshipType.HUSBAND,
+    )
+    RelationshipFactory.create_bidirectional(
+        db,
+        person=spouse,
+        related_person=child,
+        relationship_type=RelationshipType.SON,
+        inverse_relationship_type=RelationshipType.MOTHER,
+    )
+    return {"person": person, "spouse": spouse, "child": child}
+
+
+def state_person_ids(db: Session) -> set[uuid.UUID]:
+    """Get the persons whose suggestions are up to date."""
+    db.expire_all()
+    return set(db.exec(select(DiscoverySuggestionState.person_id)).all())
+
+
+# =============================================================================
+# Test Classes
+# =============================================================================
+
+
+@pytest.mark.integration
+class TestStoredSuggestions:
+    """Tests for refresh_persons and get_stored_suggestions."""
+
+    def test_missing_person_is_not_served(
+        self, db: Session, family: dict[str, Person]
+    ) -> None:
+        """Test that persons without a refresh have no stored suggestions."""
+        service = DiscoverySuggestionService(db)
+
+        assert service.get_stored_suggestions(family["person"].id) is None
+
+    def test_refresh_stores_discovery_results(
+        self, db: Session, family: dict[str, Person]
+    ) -> None:
+        """Test that stored suggestions equal the live discovery results."""
+        person = family["person"]
+        service = DiscoverySuggestionService(db)
+
+        assert service.refresh_persons([person.id]) == 1
+
+        expected = PersonDiscoveryService(db).discover_for_person(person)
+        stored = service.get_stored_suggestions(person.id)
+        assert stored == expected
+        assert [d.person_id for d in stored] == [family["child"].id]
+        assert stored[0].inferred_relationship_label == "Son"
+
+    def test_empty_result_is_stored(self, db: Session, test_user: User) -> None:
+        """Test that a person without suggestions reads as an empty list."""
+        person = PersonFactory.create(db, created_by_user=test_user)
+        service = DiscoverySuggestionService(db)
+
+        service.refresh_persons([person.id])
+
+        assert service.get_stored_suggestions(person.id) == []
+
+    def test_refresh_replaces_previous_rows(
+        self, db: Session, family: dict[str, Person]
+    ) -> None:
+        """Test that refreshing twice does not duplicate suggestions."""
+        person = family["person"]
+        service = DiscoverySuggestionService(db)
+
+        service.refresh_persons([person.id])
+        service.refresh_persons([person.id])
+
+        assert len(service.get_stored_suggestions(person.id) or []) == 1
+
+    def test_deactivated_person_is_not_served(
+        self, db: Session, family: dict[str, Person]
+    ) -> None:
+        """Test that suggested persons deactivated later are filtered out."""
+        person = family["person"]
+        service = DiscoverySuggestionService(db)
+        service.refresh_persons([person.id])
+
+        family["child"].is_active = False
+        db.add(family["child"])
+        db.commit()
+
+        assert service.get_stored_suggestions(person.id) == []
+
+
+@pytest.mark.integration
+class TestInvalidation:
+    """Tests for invalidating suggestions after relationship writes."""
+
+    def test_invalidates_changed_and_related_persons(
+        self, db: Session, test_user: User, family: dict[str, Person]
+    ) -> None:
+        """Test that persons related to a changed person are invalidated."""
+        stranger = PersonFactory.create(db, created_by_user=test_user)
+        service = DiscoverySuggestionService(db)
+        service.refresh_persons([*(p.id for p in family.values()), stranger.id])
+
+        affected = service.invalidate_persons([family["child"].id])
+
+        assert set(affected) == {family["child"].id, family["spouse"].id}
+        up_to_date = state_person_ids(db)
+        assert {family["person"].id, stranger.id} <= up_to_date
+        assert up_to_date.isdisjoint(affected)
+
+    def test_relationship_write_invalidates_and_queues(
+        self,
+        db: Session,
+        test_user: User,
+        family: dict[str, Person],
+        suggestions_enabled: None,
+        worker: DiscoverySuggestionWorker,
+    ) -> None:
+        """Test that a new child of the spouse reaches the person's suggestions."""
+        person = family["person"]
+        new_child = PersonFactory.create(db, created_by_user=test_user)
+        service = DiscoverySuggestionService(db)
+        service.refresh_persons([person.id])
+
+        PersonRelationshipService(db).create_relationship(
+            family["spouse"].id,
+            PersonRelationshipCreate(
+                related_person_id=new_child.id,
+                relationship_type=RelationshipType.SON,
+            ),
+        )
+
+        assert service.get_stored_suggestions(person.id) is None
+        assert worker.pending_count > 0
+
+        worker.run_pending()
+
+        stored = service.get_stored_suggestions(person.id)
+        assert {d.person_id for d in stored or []} == {
+            family["child"].id,
+            new_child.id,
+        }
+
+    def test_disabled_store_is_not_touched(self, mock_session: MagicMock) -> None:
+        """Test that invalidation is a no-op unless the store is enabled."""
+        assert invalidate_discovery_suggestions(mock_session, [uuid.uuid4()]) == []
+
+        mock_session.exec.assert_not_called()
+        mock_session.execute.assert_not_called()
+
+
+@pytest.mark.integration
+class TestGetSuggestions:
+    """Tests for get_suggestions."""
+
+    def test_miss_falls_back_and_queues_refresh(
+        self,
+        db: Session,
+        family: dict[str, Person],
+        suggestions_enabled: None,
+        worker: DiscoverySuggestionWorker,
+    ) -> None:
+        """Test that a miss computes live results and queues the person."""
+        person = family["person"]
+        service = DiscoverySuggestionService(db)
+
+        result = service.get_suggestions(uuid.uuid4(), person_id=person.id)
+
+        assert [d.person_id for d in result] == [family["child"].id]
+        assert worker.pending_count == 1
+
+    def test_hit_is_served_from_store(
+        self,
+        db: Session,
+        family: dict[str, Person],
+        suggestions_enabled: None,
+    ) -> None:
+        """Test that up-to-date persons skip live discovery."""
+        person = family["person"]
+        service = DiscoverySuggestionService(db)
+        service.refresh_persons([person.id])
+
+        with patch.object(
+            service.discovery_service, "discover_family_members"
+        ) as discover:
+            result = service.get_suggestions(uuid.uuid4(), person_id=person.id)
+
+        discover.assert_not_called()
+        assert [d.person_id for d in result] == [family["child"].id]
+
+    def test_disabled_store_uses_live_discovery(self, db: Session) -> None:
+        """Test that the store is not read when disabled."""
+        service = DiscoverySuggestionService(db)
+        user_id = uuid.uuid4()
+
+        with patch.object(
+            service.discovery_service, "discover_family_members", return_value=[]
+        ) as discover:
+            assert service.get_suggestions(user_id) == []
+
+        discover.assert_called_once_with(user_id, person_id=None)
+
+
+@pytest.mark.integration
+class TestDiscoverySuggestionWorker:
+    """Tests for DiscoverySuggestionWorker."""
+
+    def test_queue_is_coalesced_and_batched(self, db: Session, test_user: User) -> None:
+        """Test that repeated persons are refreshed once, in batches."""
+        persons = [
+            PersonFactory.create(db, created_by_user=test_user) for _ in range(3)
+        ]
+        test_worker = DiscoverySuggestionWorker(test_engine, batch_size=2)
+
+        test_worker.enqueue(p.id for p in persons)
+        test_worker.enqueue([persons[0].id])
+
+        assert test_worker.pending_count == 3
+        assert test_worker.run_pending() == 3
+        assert test_worker.pending_count == 0
+        assert state_person_ids(db) == {p.id for p in persons}
+
+    def test_thread_refreshes_queued_persons(
+        self, db: Session, family: dict[str, Person]
+    ) -> None:
+        """Test that the started worker refreshes in the background."""
+        person = family["person"]
+        test_worker = DiscoverySuggestionWorker(test_engine)
+        test_worker.start()
+        try:
+            test_worker.enqueue([person.id])
+            deadline = time.monotonic() + 5
+            while person.id not in state_person_ids(db):
+                assert time.monotonic() < deadline, "worker did not refresh"
+                time.sleep(0.05)
+        finally:
+            test_worker.stop()
+
+        stored = DiscoverySuggestionService(db).get_stored_suggestions(person.id)
+        assert [d.person_id for d in stored or []] == [family["child"].id]
+
+
+@pytest.mark.integration
+class TestBackfill:
+    """Tests for the bulk backfill."""
+
+    def test_backfills_active_persons(
+        self, db: Session, family: dict[str, Person]
+    ) -> None:
+        """Test that every active person gets suggestions."""
+        refreshed = DiscoverySuggestionService(db).backfill(batch_size=2)
+
+        person_ids = {p.id for p in family.values()}
+        assert refreshed >= len(person_ids)
+        assert person_ids <= state_person_ids(db)
+
+    def test_missing_only_skips_up_to_date_persons(
+        self, db: Session, family: dict[str, Person]
+    ) -> None:
+        """Test that a resumed backfill only refreshes missing persons."""
+        service = DiscoverySuggestionService(db)
+        service.backfill()
+
+        service.invalidate_persons([family["person"].id])
+
+        with patch.object(
+            service, "refresh_persons", wraps=service.refresh_persons
+        ) as refresh:
+            service.backfill(missing_only=True)
+
+        refreshed_ids = {pid for call in refresh.call_args_list for pid in call.args[0]}
+        assert refreshed_ids == {family["person"].id, family["spouse"].id}
@@ -0,0 +1,168 @@
+"""Tests for NameMatchScorer.
+
+Tests cover:
+- Scores identical to the pairwise weighted rapidfuzz formula
+- Batch scoring with process.cdist and the pure Python fallback
+- Threshold, ranking with stable ties and pagination
+"""
+
+import random
+import string
+from collections.abc import Generator
+from unittest.mock import patch
+
+import pytest
+from rapidfuzz import fuzz
+
+from app.services.person import name_match_scorer
+from app.services.person.name_match_scorer import NameMatchScorer
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request: pytest.FixtureRequest) -> Generator[str, None, None]:
+    """Run a test with NumPy batch scoring and with the Python fallback."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+        yield request.param
+    else:
+        with patch.object(name_match_scorer, "np", None):
+            yield request.param
+
+
+def pairwise_score(
+    search_first: str,
+    search_last: str,
+    person_first: str,
+    person_last: str,
+    first_name_weight: float,
+    last_name_weight: float,
+) -> float:
+    """Reference implementation of the original per-pair score."""
+    first_name_score = fuzz.ratio(
+        search_first.lower().strip(), person_first.lower().strip()
+    )
+    last_name_score = fuzz.ratio(
+        search_last.lower().strip(), person_last.lower().strip()
+    )
+    match_score = (first_name_score * first_name_weight) + (
+        last_name_score * last_name_weight
+    )
+    return round(match_score, 2)
+
+
+def random_names(count: int, seed: int = 7) -> list[tuple[str, str]]:
+    """Generate short names that often share characters."""
+    rng = random.Random(seed)
+    alphabet = string.ascii_letters[:8] + " "
+    return [
+        (
+            "".join(rng.choices(alphabet, k=rng.randint(0, 8))),
+            "".join(rng.choices(alphabet, k=rng.randint(0, 8))),
+        )
+        for _ in range(count)
+    ]
+
+
+# =============================================================================
+# Test Classes
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestScoreBatch:
+    """Tests for score and score_batch."""
+
+    @pytest.mark.parametrize("weights", [(0.6, 0.4), (0.4, 0.6)])
+    def test_batch_scores_match_pairwise_scores(
+        self, backend: str, weights: tuple[float, float]
+    ) -> None:
+        """Test that batch scores equal the original formula exactly."""
+        scorer = NameMatchScorer(*weights)
+        candidates = random_names(500)
+
+        scores = scorer.score_batch(" Abc ", "DEF", candidates)
+
+        expected = [
+            pairwise_score(" Abc ", "DEF", first, last, *weights)
+            for first, last in candidates
+        ]
+        assert list(scores) == expected
+        assert [
+            scorer.score(" Abc ", "DEF", first, last) for first, last in candidates
+        ] == expected
+
+    def test_empty_candidates(self, backend: str) -> None:
+        """Test that no candidates produce no scores."""
+        assert len(NameMatchScorer(0.6, 0.4).score_batch("John", "Doe", [])) == 0
+
+    def test_uses_cdist_on_all_cores(self) -> None:
+        """Test that batch scoring runs one cdist call per name part."""
+        pytest.importorskip("numpy")
+        calls = []
+        cdist = name_match_scorer.process.cdist
+
+        def record_cdist(*args: object, **kwargs: object) -> object:
+            calls.append(kwargs)
+            return cdist(*args, **kwargs)
+
+        with patch.object(name_match_scorer.process, "cdist", record_cdist):
+            scores = NameMatchScorer(0.6, 0.4).score_batch(
+                "John", "Doe", [("John", "Doe"), ("Jane", "Roe")]
+            )
+
+        assert scores == [100.0, 56.67]
+        assert len(calls) == 2
+        assert all(call["workers"] == -1 for call in calls)
+
+
+@pytest.mark.unit
+class TestRank:
+    """Tests for rank."""
+
+    def test_filters_and_sorts_by_score(self, backend: str) -> None:
+        """Test that matches below the threshold are dropped."""
+        candidates = [("Xyz", "Abc"), ("Jon", "Smith"), ("John", "Smith")]
+
+        page, total = NameMatchScorer(0.6, 0.4).rank(
+            "John", "Smith", candidates, threshold=40.0
+        )
+
+        assert total == 2
+        assert [index for index, _ in page] == [2, 1]
+        assert page[0][1] == 100.0
+
+    def test_equal_scores_keep_input_order_across_pages(self, backend: str) -> None:
+        """Test that ties at a page boundary are resolved by input order."""
+        candidates = [("John", "Smith")] * 7 + [("Jon", "Smith")] * 3
+        scorer = NameMatchScorer(0.6, 0.4)
+
+        pages = [
+            scorer.rank("John", "Smith", candidates, 40.0, skip=skip, limit=3)
+            for skip in (0, 3, 6, 9)
+        ]
+
+        assert [total for _, total in pages] == [10] * 4
+        assert [index for page, _ in pages for index, _ in page] == list(range(10))
+
+    @pytest.mark.parametrize(("skip", "limit"), [(0, 5), (5, 20), (40, 20), (0, 500)])
+    def test_pages_match_full_stable_sort(
+        self, backend: str, skip: int, limit: int
+    ) -> None:
+        """Test that partial ranking returns the same page as a full sort."""
+        candidates = random_names(300, seed=11)
+        scorer = NameMatchScorer(0.6, 0.4)
+        scores = [scorer.score("abc", "de", first, last) for first, last in candidates]
+        expected = sorted(
+            ((index, score) for index, score in enumerate(scores) if score >= 20.0),
+            key=lambda match: match[1],
+            reverse=True,
+        )
+
+        page, total = scorer.rank("abc", "de", candidates, 20.0, skip=skip, limit=limit)
+
+        assert total == len(expected)
+        assert page == expected[skip : skip + limit]
@@ -0,0 +1,196 @@
+"""Tests for trigram pre-ranking of fuzzy person name search.
+
+Tests cover:
+- Opt-in mode and per-process extension detection
+- The % filter, weighted similarity ranking and top-K limit
+- Search and matching services narrowing candidates when enabled
+- Fallback to Python scoring when pg_trgm is not installed
+"""
+
+import uuid
+from collections.abc import Generator
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlmodel import Session, select, text
+
+from app.db_models.person.person import Person
+from app.schemas.person.person_search import PersonSearchFilterRequest
+from app.services.person import name_trigram_search
+from app.services.person.name_trigram_search import (
+    is_trigram_search_enabled,
+    prerank_name_candidates,
+    reset_trigram_availability,
+)
+from app.services.person.person_search_service import PersonSearchService
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+
+@pytest.fixture(autouse=True)
+def reset_detection() -> Generator[None, None, None]:
+    """Detect the extension afresh in every test."""
+    reset_trigram_availability()
+    yield
+    reset_trigram_availability()
+
+
+@pytest.fixture
+def trigram_mode() -> Generator[None, None, None]:
+    """Enable trigram name search mode."""
+    with patch.object(
+        name_trigram_search.settings, "PERSON_NAME_SEARCH_MODE", "trigram"
+    ):
+        yield
+
+
+def compile_sql(statement: object) -> str:
+    """Compile a statement for PostgreSQL with literal parameters.
+
+    The psycopg paramstyle escapes the % operator as %%.
+    """
+    return str(
+        statement.compile(  # type: ignore[attr-defined]
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+# =============================================================================
+# Test Classes
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestIsTrigramSearchEnabled:
+    """Tests for is_trigram_search_enabled."""
+
+    def test_disabled_by_default(self, mock_session: MagicMock) -> None:
+        """Test that python mode never queries for the extension."""
+        assert is_trigram_search_enabled(mock_session) is False
+        mock_session.execute.assert_not_called()
+
+    def test_detects_extension_once(
+        self, mock_session: MagicMock, trigram_mode: None
+    ) -> None:
+        """Test that the extension lookup runs once per process."""
+        mock_session.get_bind.return_value.dialect.name = "postgresql"
+        mock_session.execute.return_value.first.return_value = (1,)
+
+        assert is_trigram_search_enabled(mock_session) is True
+        assert is_trigram_search_enabled(mock_session) is True
+        mock_session.execute.assert_called_once()
+
+    def test_other_databases_fall_back(
+        self, mock_session: MagicMock, trigram_mode: None
+    ) -> None:
+        """Test that non-PostgreSQL databases use Python scoring."""
+        mock_session.get_bind.return_value.dialect.name = "sqlite"
+
+        assert is_trigram_search_enabled(mock_session) is False
+        mock_session.execute.assert_not_called()
+
+
+@pytest.mark.unit
+class TestPrerankNameCandidates:
+    """Tests for prerank_name_candidates."""
+
+    def test_filters_ranks_and_limits(self, mock_session: MagicMock) -> None:
+        """Test the indexed filter, weighted ranking and top-K limit."""
+        with (
+            patch.object(name_trigram_search.settings, "PERSON_NAME_TRIGRAM_TOP_K", 50),
+            patch.object(
+                name_trigram_search.settings, "PERSON_NAME_TRIGRAM_THRESHOLD", 0.25
+            ),
+        ):
+            query = prerank_name_candidates(
+                mock_session, select(Person.id), " John ", "SMITH", 0.6, 0.4
+            )
+
+        sql = compile_sql(query)
+        assert "lower(person.first_name) %% 'john'" in sql
+        assert "lower(person.last_name) %% 'smith'" in sql
+        assert (
+            "ORDER BY 0.0 + similarity(lower(person.first_name), 'john') * 0.6 "
+            "+ similarity(lower(person.last_name), 'smith') * 0.4 DESC, person.id"
+        ) in sql
+        assert "LIMIT 50" in sql
+
+        threshold_sql = compile_sql(mock_session.execute.call_args.args[0])
+        assert (
+            "set_config('pg_trgm.similarity_threshold', '0.25', true)" in threshold_sql
+        )
+
+    def test_empty_terms_are_ignored(self, mock_session: MagicMock) -> None:
+        """Test that only the provided name is used."""
+        query = prerank_name_candidates(
+            mock_session, select(Person.id), "", "Smith", 0.6, 0.4
+        )
+
+        sql = compile_sql(query)
+        assert "first_name" not in sql
+        assert "lower(person.last_name) %% 'smith'" in sql
+
+    def test_no_terms_leave_query_unchanged(self, mock_session: MagicMock) -> None:
+        """Test that a query without name terms is returned as is."""
+        query = select(Person.id)
+
+        assert prerank_name_candidates(mock_session, query, "", " ", 0.6, 0.4) is query
+        mock_session.execute.assert_not_called()
+
+
+@pytest.mark.unit
+class TestSearchServiceUsesTrigrams:
+    """Tests for PersonSearchService with trigram mode."""
+
+    def test_name_search_is_preranked(self, mock_session: MagicMock) -> None:
+        """Test that only the top-K pre-ranked rows are fetched and scored."""
+        service = PersonSearchService(mock_session)
+        mock_session.exec.return_value.all.return_value = []
+        request = PersonSearchFilterRequest(
+            first_name="John",
+            country_id=uuid.uuid4(),
+            state_id=uuid.uuid4(),
+            district_id=uuid.uuid4(),
+            sub_district_id=uuid.uuid4(),
+            religion_id=uuid.uuid4(),
+            religion_category_id=uuid.uuid4(),
+        )
+
+        with patch(
+            "app.services.person.person_search_service.is_trigram_search_enabled",
+            return_value=True,
+        ):
+            service.search_persons(request)
+
+        sql = compile_sql(mock_session.exec.call_args.args[0])
+        assert "lower(person.first_name) %% 'john'" in sql
+        assert "similarity(lower(person.first_name), 'john') * 0.6" in sql
+        assert "LIMIT 200" in sql
+
+
+@pytest.mark.integration
+class TestTrigramSearchAgainstDatabase:
+    """Tests for trigram mode against the test database."""
+
+    def test_matches_installed_extension(self, db: Session, trigram_mode: None) -> None:
+        """Test that trigram mode is only enabled when pg_trgm is installed."""
+        installed = db.execute(
+            text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        ).first()
+
+        assert is_trigram_search_enabled(db) is (installed is not None)
+
+    def test_preranked_query_runs(self, db: Session, trigram_mode: None) -> None:
+        """Test that the pre-ranked query is valid SQL when pg_trgm is installed."""
+        if not is_trigram_search_enabled(db):
+            pytest.skip("pg_trgm is not installed")
+
+        query = prerank_name_candidates(
+            db, select(Person.id), "John", "Smith", 0.6, 0.4
+        )
+
+        assert isinstance(db.exec(query).all(), list)
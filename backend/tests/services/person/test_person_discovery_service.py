@@ -2,11 +2,18 @@
 
 import uuid
 from datetime import date
+from unittest.mock import patch
 
 import pytest
+from sqlmodel import Session
 
+from app.enums import GenderEnum, RelationshipType
+from app.models import User
+from app.schemas.person import PersonRelationshipCreate
 from app.schemas.person.person_discovery import PersonDiscoveryResult
 from app.services.person.person_discovery_service import PersonDiscoveryService
+from app.services.person.person_relationship_service import PersonRelationshipService
+from tests.factories import PersonFactory, RelationshipFactory
 
 
 @pytest.mark.unit
@@ -811,510 +818,304 @@ class TestPersonDiscoveryServicePaginationEdgeCases:
         assert sorted_discoveries[0].connection_path == "Path 0"
 
 
-@pytest.mark.unit
+@pytest.mark.integration
 class TestPersonDiscoveryServiceSpousesChildren:
     """Tests for discovering spouse's children pattern."""
 
-    def test_discover_spouses_children_with_spouse_having_children(self):
-        """Test discovering children from spouse who has children."""
-        from unittest.mock import MagicMock
-        from app.db_models.person.person import Person
-        from app.db_models.person.person_relationship import PersonRelationship
-        from app.enums.relationship_type import RelationshipType
-
-        mock_session = MagicMock()
-        service = PersonDiscoveryService(mock_session)
-
-        person_id = uuid.uuid4()
-        spouse_id = uuid.uuid4()
-        child_id = uuid.uuid4()
-        male_gender_id = uuid.UUID("4eb743f7-0a50-4da2-a20d-3473b3b3db83")
-
-        # Create spouse relationship
-        spouse_rel = MagicMock(spec=PersonRelationship)
-        spouse_rel.related_person_id = spouse_id
-        spouse_rel.relationship_type = RelationshipType.WIFE
-
-        # Create spouse person
-        spouse_person = MagicMock(spec=Person)
-        spouse_person.id = spouse_id
-        spouse_person.first_name = "Jane"
-        spouse_person.last_name = "Doe"
+    def test_discover_spouses_children_with_spouse_having_children(
+        self, db: Session, test_user: User
+    ) -> None:
+        """Test discovering children of every spouse in one query."""
+        person = PersonFactory.create(db, created_by_user=test_user)
+        spouse = PersonFactory.create(
+            db,
+            created_by_user=test_user,
+            first_name="Jane",
+            last_name="Doe",
+            gender=GenderEnum.FEMALE,
+        )
+        son = PersonFactory.create(db, created_by_user=test_user, first_name="Johnny")
+        daughter = PersonFactory.create(
+            db, created_by_user=test_user, first_name="Sarah", gender=GenderEnum.FEMALE
+        )
+        spouse_rel, _ = RelationshipFactory.create_bidirectional(
+            db,
+            person=person,
+            related_person=spouse,
+            relationship_type=RelationshipType.WIFE,
+            inverse_relationship_type=RelationshipType.HUSBAND,
+        )
+        for child in (son, daughter):
+            RelationshipFactory.create(
+                db,
+                person=spouse,
+                related_person=child,
+                relationship_type=RelationshipType.SON,
+            )
+        service = PersonDiscoveryService(db)
 
-        # Create child relationship (spouse's child)
-        child_rel = MagicMock(spec=PersonRelationship)
-        child_rel.related_person_id = child_id
-        child_rel.relationship_type = RelationshipType.SON
-        child_rel.is_active = True
-
-        # Create child person
-        child_person = MagicMock(spec=Person)
-        child_person.id = child_id
-        child_person.first_name = "Johnny"
-        child_person.middle_name = None
-        child_person.last_name = "Doe"
-        child_person.date_of_birth = date(2010, 5, 15)
-        child_person.date_of_death = None
-        child_person.gender_id = male_gender_id
-
-        # Mock repository methods
-        service.person_repo.get_by_id = MagicMock(side_effect=lambda id: {
-            spouse_id: spouse_person,
-            child_id: child_person,
-        }.get(id))
-        service.relationship_repo.get_by_relationship_types = MagicMock(return_value=[child_rel])
-
-        user_relationships = [spouse_rel]
-        connected_person_ids = {person_id}  # Only self is connected
+        with patch.object(db, "exec", wraps=db.exec) as exec_mock:
+            result = service._discover_spouses_children(
+                person.id, [spouse_rel], {person.id, spouse.id}
+            )
 
-        result = service._discover_spouses_children(
-            person_id, user_relationships, connected_person_ids
+        exec_mock.assert_called_once()
+        by_id = {d.person_id: d for d in result}
+        assert set(by_id) == {son.id, daughter.id}
+        assert by_id[son.id].inferred_relationship_type == RelationshipType.SON.value
+        assert (
+            by_id[daughter.id].inferred_relationship_type
+            == RelationshipType.DAUGHTER.value
         )
+        assert "Jane Doe" in by_id[son.id].connection_path
 
-        assert len(result) == 1
-        assert result[0].person_id == child_id
-        assert result[0].first_name == "Johnny"
-        assert result[0].inferred_relationship_type == RelationshipType.SON.value
-        assert "Jane Doe" in result[0].connection_path
-
-    def test_discover_spouses_children_skips_already_connected(self):
+    def test_discover_spouses_children_skips_already_connected(
+        self, db: Session, test_user: User
+    ) -> None:
         """Test that already connected children are skipped."""
-        from unittest.mock import MagicMock
-        from app.db_models.person.person import Person
-        from app.db_models.person.person_relationship import PersonRelationship
-        from app.enums.relationship_type import RelationshipType
-
-        mock_session = MagicMock()
-        service = PersonDiscoveryService(mock_session)
-
-        person_id = uuid.uuid4()
-        spouse_id = uuid.uuid4()
-        child_id = uuid.uuid4()
-
-        # Create spouse relationship
-        spouse_rel = MagicMock(spec=PersonRelationship)
-        spouse_rel.related_person_id = spouse_id
-        spouse_rel.relationship_type = RelationshipType.HUSBAND
-
-        # Create spouse person
-        spouse_person = MagicMock(spec=Person)
-        spouse_person.id = spouse_id
-        spouse_person.first_name = "John"
-        spouse_person.last_name = "Doe"
-
-        # Create child relationship
-        child_rel = MagicMock(spec=PersonRelationship)
-        child_rel.related_person_id = child_id
-        child_rel.relationship_type = RelationshipType.DAUGHTER
-        child_rel.is_active = True
-
-        service.person_repo.get_by_id = MagicMock(return_value=spouse_person)
-        service.relationship_repo.get_by_relationship_types = MagicMock(return_value=[child_rel])
-
-        user_relationships = [spouse_rel]
-        # Child is already connected
-        connected_person_ids = {person_id, child_id}
+        person = PersonFactory.create(db, created_by_user=test_user)
+        spouse = PersonFactory.create(db, created_by_user=test_user)
+        child = PersonFactory.create(db, created_by_user=test_user)
+        spouse_rel = RelationshipFactory.create(
+            db,
+            person=person,
+            related_person=spouse,
+            relationship_type=RelationshipType.HUSBAND,
+        )
+        RelationshipFactory.create(
+            db,
+            person=spouse,
+            related_person=child,
+            relationship_type=RelationshipType.DAUGHTER,
+        )
+        service = PersonDiscoveryService(db)
 
         result = service._discover_spouses_children(
-            person_id, user_relationships, connected_person_ids
+            person.id, [spouse_rel], {person.id, spouse.id, child.id}
         )
 
-        assert len(result) == 0
-
-    def test_discover_spouses_children_infers_daughter_for_female(self):
-        """Test that female child is inferred as Daughter."""
-        from unittest.mock import MagicMock
-        from app.db_models.person.person import Person
-        from app.db_models.person.person_relationship import PersonRelationship
-        from app.enums.relationship_type import RelationshipType
-
-        mock_session = MagicMock()
-        service = PersonDiscoveryService(mock_session)
-
-        person_id = uuid.uuid4()
-        spouse_id = uuid.uuid4()
-        child_id = uuid.uuid4()
-        female_gender_id = uuid.UUID("691fde27-f82c-4a84-832f-4243acef4b95")
-
-        spouse_rel = MagicMock(spec=PersonRelationship)
-        spouse_rel.related_person_id = spouse_id
-        spouse_rel.relationship_type = RelationshipType.SPOUSE
-
-        spouse_person = MagicMock(spec=Person)
-        spouse_person.id = spouse_id
-        spouse_person.first_name = "Partner"
-        spouse_person.last_name = "Smith"
+        assert result == []
 
-        child_rel = MagicMock(spec=PersonRelationship)
-        child_rel.related_person_id = child_id
-        child_rel.relationship_type = RelationshipType.DAUGHTER
-        child_rel.is_active = True
-
-        child_person = MagicMock(spec=Person)
-        child_person.id = child_id
-        child_person.first_name = "Sarah"
-        child_person.middle_name = None
-        child_person.last_name = "Smith"
-        child_person.date_of_birth = date(2012, 3, 20)
-        child_person.date_of_death = None
-        child_person.gender_id = female_gender_id
-
-        service.person_repo.get_by_id = MagicMock(side_effect=lambda id: {
-            spouse_id: spouse_person,
-            child_id: child_person,
-        }.get(id))
-        service.relationship_repo.get_by_relationship_types = MagicMock(return_value=[child_rel])
-
-        user_relationships = [spouse_rel]
-        connected_person_ids = {person_id}
+    def test_discover_spouses_children_ignores_inactive_relationships(
+        self, db: Session, test_user: User
+    ) -> None:
+        """Test that inactive spouse and child relationships are not followed."""
+        person = PersonFactory.create(db, created_by_user=test_user)
+        spouse = PersonFactory.create(db, created_by_user=test_user)
+        former_spouse = PersonFactory.create(db, created_by_user=test_user)
+        child = PersonFactory.create(db, created_by_user=test_user)
+        former_child = PersonFactory.create(db, created_by_user=test_user)
+        spouse_rel = RelationshipFactory.create(
+            db,
+            person=person,
+            related_person=spouse,
+            relationship_type=RelationshipType.SPOUSE,
+        )
+        RelationshipFactory.create(
+            db,
+            person=person,
+            related_person=former_spouse,
+            relationship_type=RelationshipType.SPOUSE,
+            is_active=False,
+        )
+        RelationshipFactory.create(
+            db,
+            person=spouse,
+            related_person=former_child,
+            relationship_type=RelationshipType.SON,
+            is_active=False,
+        )
+        RelationshipFactory.create(
+            db,
+            person=former_spouse,
+            related_person=child,
+            relationship_type=RelationshipType.SON,
+        )
+        service = PersonDiscoveryService(db)
 
         result = service._discover_spouses_children(
-            person_id, user_relationships, connected_person_ids
+            person.id, [spouse_rel], {person.id, spouse.id}
         )
 
-        assert len(result) == 1
-        assert result[0].inferred_relationship_type == RelationshipType.DAUGHTER.value
+        assert result == []
 
 
-@pytest.mark.unit
+@pytest.mark.integration
 class TestPersonDiscoveryServiceParentsSpouse:
     """Tests for discovering parent's spouse pattern."""
 
-    def test_discover_parents_spouse_with_parent_having_spouse(self):
-        """Test discovering spouse from parent who has a spouse."""
-        from unittest.mock import MagicMock
-        from app.db_models.person.person import Person
-        from app.db_models.person.person_relationship import PersonRelationship
-        from app.enums.relationship_type import RelationshipType
-
-        mock_session = MagicMock()
-        service = PersonDiscoveryService(mock_session)
-
-        person_id = uuid.uuid4()
-        parent_id = uuid.uuid4()
-        parent_spouse_id = uuid.uuid4()
-        female_gender_id = uuid.UUID("691fde27-f82c-4a84-832f-4243acef4b95")
-
-        # Create parent relationship (Father)
-        parent_rel = MagicMock(spec=PersonRelationship)
-        parent_rel.related_person_id = parent_id
-        parent_rel.relationship_type = RelationshipType.FATHER
-
-        # Create parent person
-        parent_person = MagicMock(spec=Person)
-        parent_person.id = parent_id
-        parent_person.first_name = "Robert"
-        parent_person.last_name = "Doe"
-
-        # Create parent's spouse relationship
-        spouse_rel = MagicMock(spec=PersonRelationship)
-        spouse_rel.related_person_id = parent_spouse_id
-        spouse_rel.relationship_type = RelationshipType.WIFE
-        spouse_rel.is_active = True
-
-        # Create parent's spouse person (potential Mother)
-        spouse_person = MagicMock(spec=Person)
-        spouse_person.id = parent_spouse_id
-        spouse_person.first_name = "Mary"
-        spouse_person.middle_name = None
-        spouse_person.last_name = "Doe"
-        spouse_person.date_of_birth = date(1965, 8, 10)
-        spouse_person.date_of_death = None
-        spouse_person.gender_id = female_gender_id
-
-        service.person_repo.get_by_id = MagicMock(side_effect=lambda id: {
-            parent_id: parent_person,
-            parent_spouse_id: spouse_person,
-        }.get(id))
-        service.relationship_repo.get_by_relationship_types = MagicMock(return_value=[spouse_rel])
-
-        user_relationships = [parent_rel]
-        connected_person_ids = {person_id}
-
-        result = service._discover_parents_spouse(
-            person_id, user_relationships, connected_person_ids
+    def test_discover_parents_spouse_with_parent_having_spouse(
+        self, db: Session, test_user: User
+    ) -> None:
+        """Test discovering spouses of both parents in one query."""
+        person = PersonFactory.create(db, created_by_user=test_user)
+        father = PersonFactory.create(
+            db, created_by_user=test_user, first_name="John", last_name="Doe"
         )
-
-        assert len(result) == 1
-        assert result[0].person_id == parent_spouse_id
-        assert result[0].first_name == "Mary"
-        assert result[0].inferred_relationship_type == RelationshipType.MOTHER.value
-        assert "Robert Doe" in result[0].connection_path
-
-    def test_discover_parents_spouse_infers_father_for_male(self):
-        """Test that male parent's spouse is inferred as Father."""
-        from unittest.mock import MagicMock
-        from app.db_models.person.person import Person
-        from app.db_models.person.person_relationship import PersonRelationship
-        from app.enums.relationship_type import RelationshipType
-
-        mock_session = MagicMock()
-        service = PersonDiscoveryService(mock_session)
-
-        person_id = uuid.uuid4()
-        parent_id = uuid.uuid4()
-        parent_spouse_id = uuid.uuid4()
-        male_gender_id = uuid.UUID("4eb743f7-0a50-4da2-a20d-3473b3b3db83")
-
-        parent_rel = MagicMock(spec=PersonRelationship)
-        parent_rel.related_person_id = parent_id
-        parent_rel.relationship_type = RelationshipType.MOTHER
-
-        parent_person = MagicMock(spec=Person)
-        parent_person.id = parent_id
-        parent_person.first_name = "Susan"
-        parent_person.last_name = "Smith"
-
-        spouse_rel = MagicMock(spec=PersonRelationship)
-        spouse_rel.related_person_id = parent_spouse_id
-        spouse_rel.relationship_type = RelationshipType.HUSBAND
-        spouse_rel.is_active = True
-
-        spouse_person = MagicMock(spec=Person)
-        spouse_person.id = parent_spouse_id
-        spouse_person.first_name = "David"
-        spouse_person.middle_name = None
-        spouse_person.last_name = "Smith"
-        spouse_person.date_of_birth = date(1960, 4, 5)
-        spouse_person.date_of_death = None
-        spouse_person.gender_id = male_gender_id
-
-        service.person_repo.get_by_id = MagicMock(side_effect=lambda id: {
-            parent_id: parent_person,
-            parent_spouse_id: spouse_person,
-        }.get(id))
-        service.relationship_repo.get_by_relationship_types = MagicMock(return_value=[spouse_rel])
-
-        user_relationships = [parent_rel]
-        connected_person_ids = {person_id}
-
-        result = service._discover_parents_spouse(
-            person_id, user_relationships, connected_person_ids
+        mother = PersonFactory.create(
+            db, created_by_user=test_user, gender=GenderEnum.FEMALE
         )
+        stepmother = PersonFactory.create(
+            db, created_by_user=test_user, gender=GenderEnum.FEMALE
+        )
+        stepfather = PersonFactory.create(db, created_by_user=test_user)
+        father_rel = RelationshipFactory.create(
+            db,
+            person=person,
+            related_person=father,
+            relationship_type=RelationshipType.FATHER,
+        )
+        mother_rel = RelationshipFactory.create(
+            db,
+            person=person,
+            related_person=mother,
+            relationship_type=RelationshipType.MOTHER,
+        )
+        RelationshipFactory.create(
+            db,
+            person=father,
+            related_person=stepmother,
+            relationship_type=RelationshipType.WIFE,
+        )
+        RelationshipFactory.create(
+            db,
+            person=mother,
+            related_person=stepfather,
+            relationship_type=RelationshipType.HUSBAND,
+        )
+        service = PersonDiscoveryService(db)
 
-        assert len(result) == 1
-        assert result[0].inferred_relationship_type == RelationshipType.FATHER.value
-
-    def test_discover_parents_spouse_skips_already_connected(self):
-        """Test that already connected parent's spouse is skipped."""
-        from unittest.mock import MagicMock
-        from app.db_models.person.person import Person
-        from app.db_models.person.person_relationship import PersonRelationship
-        from app.enums.relationship_type import RelationshipType
-
-        mock_session = MagicMock()
-        service = PersonDiscoveryService(mock_session)
-
-        person_id = uuid.uuid4()
-        parent_id = uuid.uuid4()
-        parent_spouse_id = uuid.uuid4()
-
-        parent_rel = MagicMock(spec=PersonRelationship)
-        parent_rel.related_person_id = parent_id
-        parent_rel.relationship_type = RelationshipType.FATHER
-
-        parent_person = MagicMock(spec=Person)
-        parent_person.id = parent_id
-        parent_person.first_name = "Robert"
-        parent_person.last_name = "Doe"
-
-        spouse_rel = MagicMock(spec=PersonRelationship)
-        spouse_rel.related_person_id = parent_spouse_id
-        spouse_rel.relationship_type = RelationshipType.WIFE
-        spouse_rel.is_active = True
-
-        service.person_repo.get_by_id = MagicMock(return_value=parent_person)
-        service.relationship_repo.get_by_relationship_types = MagicMock(return_value=[spouse_rel])
+        with patch.object(db, "exec", wraps=db.exec) as exec_mock:
+            result = service._discover_parents_spouse(
+                person.id,
+                [father_rel, mother_rel],
+                {person.id, father.id, mother.id},
+            )
 
-        user_relationships = [parent_rel]
-        # Parent's spouse is already connected
-        connected_person_ids = {person_id, parent_spouse_id}
+        exec_mock.assert_called_once()
+        by_id = {d.person_id: d for d in result}
+        assert set(by_id) == {stepmother.id, stepfather.id}
+        assert (
+            by_id[stepmother.id].inferred_relationship_type
+            == RelationshipType.MOTHER.value
+        )
+        assert (
+            by_id[stepfather.id].inferred_relationship_type
+            == RelationshipType.FATHER.value
+        )
+        assert "John Doe" in by_id[stepmother.id].connection_path
+
+    def test_discover_parents_spouse_skips_already_connected(
+        self, db: Session, test_user: User
+    ) -> None:
+        """Test that a parent's spouse who is already connected is skipped."""
+        person = PersonFactory.create(db, created_by_user=test_user)
+        father = PersonFactory.create(db, created_by_user=test_user)
+        mother = PersonFactory.create(
+            db, created_by_user=test_user, gender=GenderEnum.FEMALE
+        )
+        father_rel = RelationshipFactory.create(
+            db,
+            person=person,
+            related_person=father,
+            relationship_type=RelationshipType.FATHER,
+        )
+        RelationshipFactory.create(
+            db,
+            person=father,
+            related_person=mother,
+            relationship_type=RelationshipType.WIFE,
+        )
+        service = PersonDiscoveryService(db)
 
         result = service._discover_parents_spouse(
-            person_id, user_relationships, connected_person_ids
+            person.id, [father_rel], {person.id, father.id, mother.id}
         )
 
-        assert len(result) == 0
+        assert result == []
 
 
-@pytest.mark.unit
+@pytest.mark.integration
 class TestPersonDiscoveryServiceChildsParent:
     """Tests for discovering child's other parent pattern."""
 
-    def test_discover_childs_parent_with_child_having_other_parent(self):
-        """Test discovering other parent from child."""
-        from unittest.mock import MagicMock
-        from app.db_models.person.person import Person
-        from app.db_models.person.person_relationship import PersonRelationship
-        from app.enums.relationship_type import RelationshipType
-
-        mock_session = MagicMock()
-        service = PersonDiscoveryService(mock_session)
-
-        person_id = uuid.uuid4()
-        child_id = uuid.uuid4()
-        other_parent_id = uuid.uuid4()
-        female_gender_id = uuid.UUID("691fde27-f82c-4a84-832f-4243acef4b95")
-
-        # Create child relationship
-        child_rel = MagicMock(spec=PersonRelationship)
-        child_rel.related_person_id = child_id
-        child_rel.relationship_type = RelationshipType.SON
-
-        # Create child person
-        child_person = MagicMock(spec=Person)
-        child_person.id = child_id
-        child_person.first_name = "Tommy"
-        child_person.last_name = "Doe"
-
-        # Create child's other parent relationship
-        parent_rel = MagicMock(spec=PersonRelationship)
-        parent_rel.related_person_id = other_parent_id
-        parent_rel.relationship_type = RelationshipType.MOTHER
-        parent_rel.is_active = True
-
-        # Create other parent person (potential Spouse)
-        other_parent_person = MagicMock(spec=Person)
-        other_parent_person.id = other_parent_id
-        other_parent_person.first_name = "Lisa"
-        other_parent_person.middle_name = None
-        other_parent_person.last_name = "Johnson"
-        other_parent_person.date_of_birth = date(1985, 11, 25)
-        other_parent_person.date_of_death = None
-        other_parent_person.gender_id = female_gender_id
-
-        service.person_repo.get_by_id = MagicMock(side_effect=lambda id: {
-            child_id: child_person,
-            other_parent_id: other_parent_person,
-        }.get(id))
-        service.relationship_repo.get_by_relationship_types = MagicMock(return_value=[parent_rel])
-
-        user_relationships = [child_rel]
-        connected_person_ids = {person_id}
-
-        result = service._discover_childs_parent(
-            person_id, user_relationships, connected_person_ids
+    def test_discover_childs_parent_with_multiple_children(
+        self, db: Session, test_user: User
+    ) -> None:
+        """Test that a parent shared by several children is found per child."""
+        person = PersonFactory.create(db, created_by_user=test_user)
+        other_parent = PersonFactory.create(
+            db, created_by_user=test_user, gender=GenderEnum.FEMALE
         )
+        children = [
+            PersonFactory.create(db, created_by_user=test_user) for _ in range(2)
+        ]
+        child_rels = [
+            RelationshipFactory.create(
+                db,
+                person=person,
+                related_person=child,
+                relationship_type=RelationshipType.SON,
+            )
+            for child in children
+        ]
+        for child in children:
+            RelationshipFactory.create(
+                db,
+                person=child,
+                related_person=person,
+                relationship_type=RelationshipType.FATHER,
+            )
+            RelationshipFactory.create(
+                db,
+                person=child,
+                related_person=other_parent,
+                relationship_type=RelationshipType.MOTHER,
+            )
+        service = PersonDiscoveryService(db)
 
-        assert len(result) == 1
-        assert result[0].person_id == other_parent_id
-        assert result[0].first_name == "Lisa"
-        # Child's other parent is always inferred as Spouse (gender-neutral)
-        assert result[0].inferred_relationship_type == RelationshipType.SPOUSE.value
-        assert "Tommy Doe" in result[0].connection_path
-
-    def test_discover_childs_parent_skips_already_connected(self):
-        """Test that already connected child's parent is skipped."""
-        from unittest.mock import MagicMock
-        from app.db_models.person.person import Person
-        from app.db_models.person.person_relationship import PersonRelationship
-        from app.enums.relationship_type import RelationshipType
-
-        mock_session = MagicMock()
-        service = PersonDiscoveryService(mock_session)
-
-        person_id = uuid.uuid4()
-        child_id = uuid.uuid4()
-        other_parent_id = uuid.uuid4()
-
-        child_rel = MagicMock(spec=PersonRelationship)
-        child_rel.related_person_id = child_id
-        child_rel.relationship_type = RelationshipType.DAUGHTER
-
-        child_person = MagicMock(spec=Person)
-        child_person.id = child_id
-        child_person.first_name = "Emma"
-        child_person.last_name = "Doe"
-
-        parent_rel = MagicMock(spec=PersonRelationship)
-        parent_rel.related_person_id = other_parent_id
-        parent_rel.relationship_type = RelationshipType.FATHER
-        parent_rel.is_active = True
-
-        service.person_repo.get_by_id = MagicMock(return_value=child_person)
-        service.relationship_repo.get_by_relationship_types = MagicMock(return_value=[parent_rel])
-
-        user_relationships = [child_rel]
-        # Other parent is already connected
-        connected_person_ids = {person_id, other_parent_id}
+        with patch.object(db, "exec", wraps=db.exec) as exec_mock:
+            result = service._discover_childs_parent(
+                person.id, child_rels, {person.id, *(c.id for c in children)}
+            )
 
-        result = service._discover_childs_parent(
-            person_id, user_relationships, connected_person_ids
+        exec_mock.assert_called_once()
+        assert [d.person_id for d in result] == [other_parent.id, other_parent.id]
+        assert all(
+            d.inferred_relationship_type == RelationshipType.SPOUSE.value
+            for d in result
         )
-
-        assert len(result) == 0
-
-    def test_discover_childs_parent_with_multiple_children(self):
-        """Test discovering parents from multiple children."""
-        from unittest.mock import MagicMock
-        from app.db_models.person.person import Person
-        from app.db_models.person.person_relationship import PersonRelationship
-        from app.enums.relationship_type import RelationshipType
-
-        mock_session = MagicMock()
-        service = PersonDiscoveryService(mock_session)
-
-        person_id = uuid.uuid4()
-        child1_id = uuid.uuid4()
-        child2_id = uuid.uuid4()
-        other_parent_id = uuid.uuid4()
-        male_gender_id = uuid.UUID("4eb743f7-0a50-4da2-a20d-3473b3b3db83")
-
-        # Create child relationships
-        child1_rel = MagicMock(spec=PersonRelationship)
-        child1_rel.related_person_id = child1_id
-        child1_rel.relationship_type = RelationshipType.SON
-
-        child2_rel = MagicMock(spec=PersonRelationship)
-        child2_rel.related_person_id = child2_id
-        child2_rel.relationship_type = RelationshipType.DAUGHTER
-
-        # Create child persons
-        child1_person = MagicMock(spec=Person)
-        child1_person.id = child1_id
-        child1_person.first_name = "Tom"
-        child1_person.last_name = "Doe"
-
-        child2_person = MagicMock(spec=Person)
-        child2_person.id = child2_id
-        child2_person.first_name = "Amy"
-        child2_person.last_name = "Doe"
-
-        # Create other parent relationship (same parent for both children)
-        parent_rel = MagicMock(spec=PersonRelationship)
-        parent_rel.related_person_id = other_parent_id
-        parent_rel.relationship_type = RelationshipType.FATHER
-        parent_rel.is_active = True
-
-        # Create other parent person
-        other_parent_person = MagicMock(spec=Person)
-        other_parent_person.id = other_parent_id
-        other_parent_person.first_name = "Mike"
-        other_parent_person.middle_name = None
-        other_parent_person.last_name = "Johnson"
-        other_parent_person.date_of_birth = date(1980, 6, 15)
-        other_parent_person.date_of_death = None
-        other_parent_person.gender_id = male_gender_id
-
-        service.person_repo.get_by_id = MagicMock(side_effect=lambda id: {
-            child1_id: child1_person,
-            child2_id: child2_person,
-            other_parent_id: other_parent_person,
-        }.get(id))
-        # Both children have the same other parent
-        service.relationship_repo.get_by_relationship_types = MagicMock(return_value=[parent_rel])
-
-        user_relationships = [child1_rel, child2_rel]
-        connected_person_ids = {person_id}
+        assert len(service._sort_and_limit_discoveries(result)) == 1
+
+    def test_discover_childs_parent_skips_inactive_person(
+        self, db: Session, test_user: User
+    ) -> None:
+        """Test that inactive candidates are not suggested."""
+        person = PersonFactory.create(db, created_by_user=test_user)
+        child = PersonFactory.create(db, created_by_user=test_user)
+        other_parent = PersonFactory.create(db, created_by_user=test_user)
+        other_parent.is_active = False
+        db.add(other_parent)
+        db.commit()
+        child_rel = RelationshipFactory.create(
+            db,
+            person=person,
+            related_person=child,
+            relationship_type=RelationshipType.DAUGHTER,
+        )
+        RelationshipFactory.create(
+            db,
+            person=child,
+            related_person=other_parent,
+            relationship_type=RelationshipType.MOTHER,
+        )
+        service = PersonDiscoveryService(db)
 
         result = service._discover_childs_parent(
-            person_id, user_relationships, connected_person_ids
+            person.id, [child_rel], {person.id, child.id}
         )
 
-        # Same parent discovered through both children, but should appear twice
-        # (deduplication happens in _sort_and_limit_discoveries)
-        assert len(result) == 2
-        assert all(r.person_id == other_parent_id for r in result)
+        assert result == []
 
 
 @pytest.mark.unit
@@ -1474,3 +1275,72 @@ class TestPersonDiscoveryServiceFullDiscovery:
         # Should still return results from working patterns
         assert len(result) == 1
         assert result[0].first_name == "Found"
+
+
+@pytest.mark.integration
+class TestPersonDiscoveryServiceCacheInvalidation:
+    """Tests for relationship writes invalidating cached discoveries."""
+
+    def test_new_child_of_spouse_is_discovered_after_write(
+        self, db: Session, test_user: User
+    ) -> None:
+        """Test that a write on a connected person drops the cached result."""
+        person = PersonFactory.create(db, created_by_user=test_user)
+        spouse = PersonFactory.create(
+            db, created_by_user=test_user, gender=GenderEnum.FEMALE
+        )
+        child = PersonFactory.create(db, created_by_user=test_user)
+        RelationshipFactory.create_bidirectional(
+            db,
+            person=person,
+            related_person=spouse,
+            relationship_type=RelationshipType.WIFE,
+            inverse_relationship_type=RelationshipType.HUSBAND,
+        )
+        service = PersonDiscoveryService(db)
+
+        before = service.discover_family_members(
+            current_user_id=test_user.id, person_id=person.id
+        )
+        assert child.id not in {d.person_id for d in before}
+
+        # The write touches the spouse and the child, not the person itself
+        PersonRelationshipService(db).create_relationship(
+            spouse.id,
+            PersonRelationshipCreate(
+                related_person_id=child.id, relationship_type=RelationshipType.SON
+            ),
+        )
+
+        after = service.discover_family_members(
+            current_user_id=test_user.id, person_id=person.id
+        )
+        assert child.id in {d.person_id for d in after}
+
+    def test_unrelated_write_keeps_cached_result(
+        self, db: Session, test_user: User
+    ) -> None:
+        """Test that writes between unconnected persons do not invalidate."""
+        person = PersonFactory.create(db, created_by_user=test_user)
+        stranger = PersonFactory.create(db, created_by_user=test_user)
+        stranger_child = PersonFactory.create(db, created_by_user=test_user)
+        service = PersonDiscoveryService(db)
+
+        service.discover_family_members(
+            current_user_id=test_user.id, person_id=person.id
+        )
+        with patch.object(
+            service.relationship_repo, "get_active_relationships"
+        ) as get_active_relationships:
+            PersonRelationshipService(db).create_relationship(
+                stranger.id,
+                PersonRelationshipCreate(
+                    related_person_id=stranger_child.id,
+                    relationship_type=RelationshipType.SON,
+                ),
+            )
+            service.discover_family_members(
+                current_user_id=test_user.id, person_id=person.id
+            )
+
+        get_active_relationships.assert_not_called()
@@ -0,0 +1,261 @@
+"""Tests for PersonEnrichmentService.
+
+Tests cover:
+- Display records built from person rows
+- Address and religion strings from the joined name columns
+- Fixed number of queries per chunk of person ids
+- End-to-end loading against the database
+"""
+
+import uuid
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlmodel import Session, select
+
+from app.db_models.address.country import Country
+from app.db_models.address.district import District
+from app.db_models.address.locality import Locality
+from app.db_models.address.state import State
+from app.db_models.address.sub_district import SubDistrict
+from app.db_models.person.person import Person
+from app.db_models.person.person_address import PersonAddress
+from app.db_models.person.person_religion import PersonReligion
+from app.db_models.religion.religion import Religion
+from app.models import User
+from app.services.person import person_enrichment_service
+from app.services.person.person_enrichment_service import (
+    PersonDisplayRecord,
+    PersonEnrichmentService,
+)
+from tests.factories import PersonFactory
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def service(mock_session: MagicMock) -> PersonEnrichmentService:
+    """Create a PersonEnrichmentService instance with mock session."""
+    return PersonEnrichmentService(mock_session)
+
+
+def create_person(
+    first_name: str = "Test",
+    date_of_birth: date | None = date(1990, 1, 1),
+    date_of_death: date | None = None,
+) -> Person:
+    """Create an unsaved Person."""
+    return Person(
+        id=uuid.uuid4(),
+        user_id=None,
+        created_by_user_id=uuid.uuid4(),
+        first_name=first_name,
+        last_name="Person",
+        gender_id=uuid.uuid4(),
+        date_of_birth=date_of_birth,
+        date_of_death=date_of_death,
+        profile_image_key="person/image.jpg",
+    )
+
+
+def mock_query_results(
+    mock_session: MagicMock,
+    persons: list[Person],
+    address_rows: list[tuple],
+    religion_rows: list[tuple],
+) -> None:
+    """Make the session return persons, address rows and religion rows in turn."""
+    mock_session.exec.return_value.all.side_effect = [
+        persons,
+        address_rows,
+        religion_rows,
+    ]
+
+
+# =============================================================================
+# Test Classes
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestGetDisplayRecords:
+    """Tests for get_display_records."""
+
+    def test_builds_records_with_address_and_religion(
+        self, service: PersonEnrichmentService, mock_session: MagicMock
+    ) -> None:
+        """Test that names from the joined rows are formatted in order."""
+        person = create_person(date_of_death=date(2020, 6, 1))
+        mock_query_results(
+            mock_session,
+            [person],
+            [(person.id, "Village", "Tehsil", "District", "State", "India")],
+            [(person.id, "Hinduism", "Vaishnavism", "Iskcon")],
+        )
+
+        result = service.get_display_records([person.id])
+
+        assert result == {
+            person.id: PersonDisplayRecord(
+                person_id=person.id,
+                first_name="Test",
+                last_name="Person",
+                gender_id=person.gender_id,
+                birth_year=1990,
+                death_year=2020,
+                profile_image_key="person/image.jpg",
+                address="Village, Tehsil, District, State, India",
+                religion="Hinduism, Vaishnavism, Iskcon",
+                district_name="District",
+                locality_name="Village",
+            )
+        }
+
+    def test_skips_missing_address_and_religion_parts(
+        self, service: PersonEnrichmentService, mock_session: MagicMock
+    ) -> None:
+        """Test that unset hierarchy levels are left out of the strings."""
+        person = create_person()
+        mock_query_results(
+            mock_session,
+            [person],
+            [(person.id, None, None, "District", None, "India")],
+            [(person.id, "Christianity", None, None)],
+        )
+
+        record = service.get_display_records([person.id])[person.id]
+
+        assert record.address == "District, India"
+        assert record.religion == "Christianity"
+        assert record.locality_name is None
+
+    def test_person_without_address_or_religion(
+        self, service: PersonEnrichmentService, mock_session: MagicMock
+    ) -> None:
+        """Test defaults when a person has no current address or religion."""
+        person = create_person(date_of_birth=None)
+        mock_query_results(mock_session, [person], [], [])
+
+        record = service.get_display_records([person.id])[person.id]
+
+        assert record.birth_year is None
+        assert record.address == ""
+        assert record.religion == ""
+        assert record.district_name is None
+
+    def test_keeps_first_current_address(
+        self, service: PersonEnrichmentService, mock_session: MagicMock
+    ) -> None:
+        """Test that a duplicate current address does not override the first."""
+        person = create_person()
+        mock_query_results(
+            mock_session,
+            [person],
+            [
+                (person.id, None, None, "First", None, "India"),
+                (person.id, None, None, "Second", None, "India"),
+            ],
+            [],
+        )
+
+        record = service.get_display_records([person.id])[person.id]
+
+        assert record.district_name == "First"
+
+    def test_unknown_persons_are_omitted(
+        self, service: PersonEnrichmentService, mock_session: MagicMock
+    ) -> None:
+        """Test that only the person query runs when no person exists."""
+        mock_session.exec.return_value.all.return_value = []
+
+        result = service.get_display_records([uuid.uuid4()])
+
+        assert result == {}
+        assert mock_session.exec.call_count == 1
+
+    def test_runs_three_queries_for_many_persons(
+        self, service: PersonEnrichmentService, mock_session: MagicMock
+    ) -> None:
+        """Test that the query count does not grow with the number of persons."""
+        persons = [create_person(first_name=f"P{i}") for i in range(25)]
+        mock_query_results(mock_session, persons, [], [])
+
+        result = service.get_display_records(p.id for p in persons)
+
+        assert len(result) == 25
+        assert mock_session.exec.call_count == 3
+
+    def test_chunks_large_id_lists(
+        self, service: PersonEnrichmentService, mock_session: MagicMock
+    ) -> None:
+        """Test that huge id lists are split into several IN queries."""
+        first, second = create_person(), create_person()
+        mock_session.exec.return_value.all.side_effect = [
+            [first],
+            [],
+            [],
+            [second],
+            [],
+            [],
+        ]
+
+        with patch.object(person_enrichment_service, "ENRICHMENT_CHUNK_SIZE", 1):
+            result = service.get_display_records([first.id, second.id])
+
+        assert set(result) == {first.id, second.id}
+        assert mock_session.exec.call_count == 6
+
+
+@pytest.mark.integration
+class TestGetDisplayRecordsIntegration:
+    """Tests for get_display_records against the database."""
+
+    def test_loads_address_and_religion_names(
+        self, db: Session, test_user: User
+    ) -> None:
+        """Test that the joined queries produce the formatted strings."""
+        row = db.exec(
+            select(Locality, SubDistrict, District, State, Country)
+            .join(SubDistrict, SubDistrict.id == Locality.sub_district_id)
+            .join(District, District.id == SubDistrict.district_id)
+            .join(State, State.id == District.state_id)
+            .join(Country, Country.id == State.country_id)
+        ).first()
+        religion = db.exec(select(Religion)).first()
+        if row is None or religion is None:
+            pytest.skip("Address and religion metadata are not seeded")
+        locality, sub_district, district, state, country = row
+
+        person = PersonFactory.create(db, created_by_user=test_user)
+        bare_person = PersonFactory.create(db, created_by_user=test_user)
+        db.add(
+            PersonAddress(
+                person_id=person.id,
+                country_id=country.id,
+                state_id=state.id,
+                district_id=district.id,
+                sub_district_id=sub_district.id,
+                locality_id=locality.id,
+                start_date=date(2020, 1, 1),
+                is_current=True,
+            )
+        )
+        db.add(PersonReligion(person_id=person.id, religion_id=religion.id))
+        db.commit()
+
+        result = PersonEnrichmentService(db).get_display_records(
+            [person.id, bare_person.id, uuid.uuid4()]
+        )
+
+        assert set(result) == {person.id, bare_person.id}
+        assert result[person.id].address == ", ".join(
+            [locality.name, sub_district.name, district.name, state.name, country.name]
+        )
+        assert result[person.id].religion == religion.name
+        assert result[person.id].district_name == district.name
+        assert result[person.id].locality_name == locality.name
+        assert result[bare_person.id].address == ""
+        assert result[bare_person.id].religion == ""
@@ -271,6 +271,71 @@ class TestPersonRelationshipServiceUpdate:
                     assert inverse_relationship.start_date == date(2020, 1, 1)
                     assert inverse_relationship.end_date == date(2023, 12, 31)
 
+    def test_update_relationship_invalidates_suggestions_before_commit(
+        self, mock_session: MagicMock
+    ) -> None:
+        """Test that stored suggestions are deleted in the write's transaction."""
+        relationship = PersonRelationship(
+            id=uuid.uuid4(),
+            person_id=uuid.uuid4(),
+            related_person_id=uuid.uuid4(),
+            relationship_type=RelationshipType.FATHER,
+            is_active=True,
+        )
+        service = PersonRelationshipService(mock_session)
+        calls = MagicMock()
+        calls.attach_mock(mock_session.commit, "commit")
+
+        with patch.object(
+            service.relationship_repo, "update", return_value=relationship
+        ), patch.object(
+            service.relationship_repo,
+            "find_inverse_including_inactive",
+            return_value=None,
+        ), patch(
+            "app.services.person.person_relationship_service."
+            "invalidate_discovery_suggestions",
+            side_effect=lambda session, ids: calls.invalidate(ids),
+        ):
+            service.update_relationship(
+                relationship, PersonRelationshipUpdate(is_active=False)
+            )
+
+        names = [name for name, _, _ in calls.mock_calls]
+        assert names[-2:] == ["invalidate", "commit"]
+
+    def test_update_relationship_survives_cache_errors_after_commit(
+        self, mock_session: MagicMock
+    ) -> None:
+        """Test that a failing cache refresh does not fail a committed write."""
+        relationship = PersonRelationship(
+            id=uuid.uuid4(),
+            person_id=uuid.uuid4(),
+            related_person_id=uuid.uuid4(),
+            relationship_type=RelationshipType.FATHER,
+            is_active=True,
+        )
+        service = PersonRelationshipService(mock_session)
+
+        with patch.object(
+            service.relationship_repo, "update", return_value=relationship
+        ), patch.object(
+            service.relationship_repo,
+            "find_inverse_including_inactive",
+            return_value=None,
+        ), patch(
+            "app.services.person.person_relationship_service.refresh_adjacency_index",
+            side_effect=RuntimeError("connection lost"),
+        ):
+            result = service.update_relationship(
+                relationship, PersonRelationshipUpdate(is_active=False)
+            )
+
+        assert result is relationship
+        mock_session.commit.assert_called_once()
+        # Only the session is reset; the committed write stays
+        mock_session.rollback.assert_called_once()
+
 
 @pytest.mark.unit
 class TestPersonRelationshipServiceDelete:
@@ -1,27 +1,49 @@
 """Unit tests for PersonSearchService.
 
 Tests cover:
+- Single filter query with EXISTS semi-joins and COUNT(*) OVER()
 - Address filtering (Requirements 2.1, 2.2)
 - Religion filtering (Requirements 2.3, 2.4)
 - Demographic filtering (Requirements 2.5, 2.6)
 - Name matching (Requirements 2.7, 2.8)
 - Pagination and empty results (Requirements 2.9, 2.10)
+- Keyset cursors and fuzzy result snapshots
 """
 
+import base64
 import uuid
+from collections.abc import Generator
 from datetime import date
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
-from sqlmodel import Session
-
+from sqlalchemy.dialects import postgresql
+from sqlmodel import Session, delete
+
+from app.db_models.address.country import Country
+from app.db_models.address.district import District
+from app.db_models.address.locality import Locality
+from app.db_models.address.state import State
+from app.db_models.address.sub_district import SubDistrict
 from app.db_models.person.person import Person
 from app.db_models.person.person_address import PersonAddress
 from app.db_models.person.person_religion import PersonReligion
+from app.db_models.religion.religion import Religion
+from app.db_models.religion.religion_category import ReligionCategory
 from app.db_models.user import User
 from app.enums import GenderEnum
-from app.schemas.person.person_search import PersonSearchFilterRequest
-from app.services.person.person_search_service import PersonSearchService
+from app.schemas.person.person_search import (
+    PersonSearchFilterRequest,
+    PersonSearchResponse,
+)
+from app.services.person.person_search_service import (
+    PersonSearchService,
+    SearchCursor,
+    decode_search_cursor,
+    encode_search_cursor,
+)
+from app.utils.cache import CacheManager
 from tests.factories import PersonFactory, UserFactory
 
 
@@ -141,25 +163,125 @@ def test_user_for_search(db: Session) -> User:
 
 
 @pytest.fixture
-def address_ids() -> dict[str, uuid.UUID]:
-    """Generate consistent address IDs for testing."""
-    return {
-        "country_id": uuid.uuid4(),
-        "state_id": uuid.uuid4(),
-        "district_id": uuid.uuid4(),
-        "sub_district_id": uuid.uuid4(),
-        "locality_id": uuid.uuid4(),
+def address_ids(db: Session) -> Generator[dict[str, uuid.UUID], None, None]:
+    """Create an address hierarchy and return its IDs."""
+    suffix = uuid.uuid4().hex[:6]
+    country = Country(name=f"Search Country {suffix}", code=suffix[:3])
+    db.add(country)
+    db.flush()
+    state = State(name=f"Search State {suffix}", country_id=country.id)
+    db.add(state)
+    db.flush()
+    district = District(name=f"Search District {suffix}", state_id=state.id)
+    db.add(district)
+    db.flush()
+    sub_district = SubDistrict(
+        name=f"Search Sub District {suffix}", district_id=district.id
+    )
+    db.add(sub_district)
+    db.flush()
+    locality = Locality(
+        name=f"Search Locality {suffix}", sub_district_id=sub_district.id
+    )
+    other_locality = Locality(
+        name=f"Other Locality {suffix}", sub_district_id=sub_district.id
+    )
+    db.add(locality)
+    db.add(other_locality)
+    db.commit()
+
+    yield {
+        "country_id": country.id,
+        "state_id": state.id,
+        "district_id": district.id,
+        "sub_district_id": sub_district.id,
+        "locality_id": locality.id,
+        "other_locality_id": other_locality.id,
     }
 
+    db.execute(delete(PersonAddress).where(PersonAddress.country_id == country.id))
+    for model, model_id in [
+        (Locality, locality.id),
+        (Locality, other_locality.id),
+        (SubDistrict, sub_district.id),
+        (District, district.id),
+        (State, state.id),
+        (Country, country.id),
+    ]:
+        db.execute(delete(model).where(model.id == model_id))
+    db.commit()
+
 
 @pytest.fixture
-def religion_ids() -> dict[str, uuid.UUID]:
-    """Generate consistent religion IDs for testing."""
-    return {
+def religion_ids(db: Session) -> Generator[dict[str, uuid.UUID], None, None]:
+    """Create a religion with two categories and return their IDs."""
+    suffix = uuid.uuid4().hex[:6]
+    religion = Religion(name=f"Search Religion {suffix}", code=f"R{suffix}")
+    db.add(religion)
+    db.flush()
+    category = ReligionCategory(
+        name=f"Search Category {suffix}", religion_id=religion.id
+    )
+    other_category = ReligionCategory(
+        name=f"Other Category {suffix}", religion_id=religion.id
+    )
+    db.add(category)
+    db.add(other_category)
+    db.commit()
+
+    yield {
+        "religion_id": religion.id,
+        "religion_category_id": category.id,
+        "other_religion_category_id": other_category.id,
+    }
+
+    db.execute(delete(PersonReligion).where(PersonReligion.religion_id == religion.id))
+    db.execute(
+        delete(ReligionCategory).where(ReligionCategory.religion_id == religion.id)
+    )
+    db.execute(delete(Religion).where(Religion.id == religion.id))
+    db.commit()
+
+
+def create_search_request(**kwargs: Any) -> PersonSearchFilterRequest:
+    """Create a search request with random required address and religion IDs."""
+    filters: dict[str, Any] = {
+        "country_id": uuid.uuid4(),
+        "state_id": uuid.uuid4(),
+        "district_id": uuid.uuid4(),
+        "sub_district_id": uuid.uuid4(),
         "religion_id": uuid.uuid4(),
         "religion_category_id": uuid.uuid4(),
-        "religion_sub_category_id": uuid.uuid4(),
     }
+    filters.update(kwargs)
+    return PersonSearchFilterRequest(**filters)
+
+
+def create_search_row(
+    first_name: str = "John",
+    last_name: str = "Doe",
+    total: int | None = None,
+) -> MagicMock:
+    """Create a mock row with the columns selected by the search query."""
+    row = MagicMock()
+    row.id = uuid.uuid4()
+    row.first_name = first_name
+    row.middle_name = None
+    row.last_name = last_name
+    row.date_of_birth = date(1990, 1, 1)
+    row.gender_id = None
+    row.profile_image_key = None
+    row.total = total
+    return row
+
+
+def compile_sql(statement: Any) -> str:
+    """Compile a statement for PostgreSQL with literal parameters."""
+    return str(
+        statement.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
 
 
 # =============================================================================
@@ -245,456 +367,129 @@ class TestCalculateNameMatchScore:
 
 
 @pytest.mark.unit
-class TestFindPersonsByAddress:
-    """Tests for _find_persons_by_address method.
-    
-    Validates: Requirements 2.1, 2.2
-    """
+class TestBuildSearchQuery:
+    """Tests for the single query built from the search filters.
 
-    def test_find_persons_by_address_required_fields(self) -> None:
-        """Test finding persons with required address fields."""
-        mock_session = MagicMock()
-        service = PersonSearchService(mock_session)
+    Validates: Requirements 2.1, 2.2, 2.3, 2.4, 2.5, 2.6
+    """
 
-        country_id = uuid.uuid4()
-        state_id = uuid.uuid4()
-        district_id = uuid.uuid4()
-        sub_district_id = uuid.uuid4()
-        person_id = uuid.uuid4()
+    def test_address_and_religion_are_semi_joins(self) -> None:
+        """Test that address and religion filters never use an id list."""
+        service = PersonSearchService(MagicMock())
+        request = create_search_request()
 
-        mock_session.exec.return_value.all.return_value = [person_id]
+        sql = compile_sql(service._build_search_query(request, Person.id))
 
-        result = service._find_persons_by_address(
-            country_id=country_id,
-            state_id=state_id,
-            district_id=district_id,
-            sub_district_id=sub_district_id,
+        assert sql.count("EXISTS") == 2
+        assert " IN (" not in sql
+        assert "person_address.person_id = person.id" in sql
+        assert "person_religion.person_id = person.id" in sql
+        assert f"person_address.sub_district_id = '{request.sub_district_id}'" in sql
+        assert (
+            f"person_religion.religion_category_id = '{request.religion_category_id}'"
+            in sql
         )
+        assert "person.is_active = true" in sql
 
-        assert len(result) == 1
-        assert result[0] == person_id
-        mock_session.exec.assert_called_once()
-
-    def test_find_persons_by_address_with_locality(self) -> None:
-        """Test finding persons with optional locality filter."""
-        mock_session = MagicMock()
-        service = PersonSearchService(mock_session)
+    def test_optional_filters_only_when_provided(self) -> None:
+        """Test that locality, sub-category, gender and years are optional."""
+        service = PersonSearchService(MagicMock())
 
-        country_id = uuid.uuid4()
-        state_id = uuid.uuid4()
-        district_id = uuid.uuid4()
-        sub_district_id = uuid.uuid4()
-        locality_id = uuid.uuid4()
-        person_ids = [uuid.uuid4(), uuid.uuid4()]
-
-        mock_session.exec.return_value.all.return_value = person_ids
-
-        result = service._find_persons_by_address(
-            country_id=country_id,
-            state_id=state_id,
-            district_id=district_id,
-            sub_district_id=sub_district_id,
-            locality_id=locality_id,
+        sql = compile_sql(
+            service._build_search_query(create_search_request(), Person.id)
         )
 
-        assert len(result) == 2
-        assert result == person_ids
-
-    def test_find_persons_by_address_no_matches(self) -> None:
-        """Test finding persons when no matches exist."""
-        mock_session = MagicMock()
-        service = PersonSearchService(mock_session)
-
-        mock_session.exec.return_value.all.return_value = []
-
-        result = service._find_persons_by_address(
-            country_id=uuid.uuid4(),
-            state_id=uuid.uuid4(),
-            district_id=uuid.uuid4(),
-            sub_district_id=uuid.uuid4(),
+        assert "locality_id" not in sql
+        assert "religion_sub_category_id" not in sql
+        assert "gender_id" not in sql
+        assert "EXTRACT" not in sql
+
+    def test_optional_filters_are_applied(self) -> None:
+        """Test that provided optional filters become predicates."""
+        service = PersonSearchService(MagicMock())
+        request = create_search_request(
+            locality_id=uuid.uuid4(),
+            religion_sub_category_id=uuid.uuid4(),
+            gender_id=uuid.uuid4(),
+            birth_year_from=1980,
+            birth_year_to=1990,
         )
 
-        assert len(result) == 0
+        sql = compile_sql(service._build_search_query(request, Person.id))
 
-    def test_find_persons_by_address_multiple_matches(self) -> None:
-        """Test finding multiple persons matching address criteria."""
-        mock_session = MagicMock()
-        service = PersonSearchService(mock_session)
-
-        person_ids = [uuid.uuid4() for _ in range(5)]
-        mock_session.exec.return_value.all.return_value = person_ids
-
-        result = service._find_persons_by_address(
-            country_id=uuid.uuid4(),
-            state_id=uuid.uuid4(),
-            district_id=uuid.uuid4(),
-            sub_district_id=uuid.uuid4(),
+        assert f"person_address.locality_id = '{request.locality_id}'" in sql
+        assert (
+            "person_religion.religion_sub_category_id = "
+            f"'{request.religion_sub_category_id}'" in sql
         )
-
-        assert len(result) == 5
-        assert result == person_ids
+        assert f"person.gender_id = '{request.gender_id}'" in sql
+        assert "EXTRACT(year FROM person.date_of_birth) >= 1980" in sql
+        assert "EXTRACT(year FROM person.date_of_birth) <= 1990" in sql
 
 
 @pytest.mark.unit
-class TestFindPersonsByReligion:
-    """Tests for _find_persons_by_religion method.
-    
-    Validates: Requirements 2.3, 2.4
-    """
-
-    def test_find_persons_by_religion_required_fields(self) -> None:
-        """Test finding persons with required religion fields."""
-        mock_session = MagicMock()
-        service = PersonSearchService(mock_session)
-
-        religion_id = uuid.uuid4()
-        religion_category_id = uuid.uuid4()
-        person_id = uuid.uuid4()
-
-        mock_session.exec.return_value.all.return_value = [person_id]
-
-        result = service._find_persons_by_religion(
-            religion_id=religion_id,
-            religion_category_id=religion_category_id,
-        )
-
-        assert len(result) == 1
-        assert result[0] == person_id
-
-    def test_find_persons_by_religion_with_sub_category(self) -> None:
-        """Test finding persons with optional sub-category filter."""
-        mock_session = MagicMock()
-        service = PersonSearchService(mock_session)
-
-        religion_id = uuid.uuid4()
-        religion_category_id = uuid.uuid4()
-        religion_sub_category_id = uuid.uuid4()
-        person_ids = [uuid.uuid4(), uuid.uuid4(), uuid.uuid4()]
-
-        mock_session.exec.return_value.all.return_value = person_ids
-
-        result = service._find_persons_by_religion(
-            religion_id=religion_id,
-            religion_category_id=religion_category_id,
-            religion_sub_category_id=religion_sub_category_id,
-        )
-
-        assert len(result) == 3
-        assert result == person_ids
-
-    def test_find_persons_by_religion_no_matches(self) -> None:
-        """Test finding persons when no matches exist."""
-        mock_session = MagicMock()
-        service = PersonSearchService(mock_session)
-
-        mock_session.exec.return_value.all.return_value = []
-
-        result = service._find_persons_by_religion(
-            religion_id=uuid.uuid4(),
-            religion_category_id=uuid.uuid4(),
-        )
-
-        assert len(result) == 0
+class TestSearchPersonsWithoutNameFilter:
+    """Tests for database-side sorting, pagination and total count.
 
-
-
-@pytest.mark.unit
-class TestSearchPersonsAddressAndReligionIntersection:
-    """Tests for address and religion filter intersection.
-    
-    Validates: Requirements 2.1, 2.2, 2.3, 2.4
+    Validates: Requirements 2.9, 2.10
     """
 
-    def test_search_returns_empty_when_no_address_matches(self) -> None:
-        """Test search returns empty when no address matches."""
+    def test_page_and_total_come_from_one_query(self) -> None:
+        """Test that the total is read from the window count of the page."""
         mock_session = MagicMock()
         service = PersonSearchService(mock_session)
+        rows = [create_search_row(last_name=f"Last{i}", total=12) for i in range(5)]
+        mock_session.exec.return_value.all.return_value = rows
 
-        request = PersonSearchFilterRequest(
-            country_id=uuid.uuid4(),
-            state_id=uuid.uuid4(),
-            district_id=uuid.uuid4(),
-            sub_district_id=uuid.uuid4(),
-            religion_id=uuid.uuid4(),
-            religion_category_id=uuid.uuid4(),
-        )
-
-        with patch.object(service, "_find_persons_by_address", return_value=[]):
-            with patch.object(
-                service, "_find_persons_by_religion", return_value=[uuid.uuid4()]
-            ):
-                result = service.search_persons(request)
-
-        assert result.total == 0
-        assert len(result.results) == 0
+        result = service.search_persons(create_search_request(skip=5, limit=5))
 
-    def test_search_returns_empty_when_no_religion_matches(self) -> None:
-        """Test search returns empty when no religion matches."""
-        mock_session = MagicMock()
-        service = PersonSearchService(mock_session)
+        assert result.total == 12
+        assert [r.person_id for r in result.results] == [row.id for row in rows]
+        assert all(r.name_match_score is None for r in result.results)
+        mock_session.exec.assert_called_once()
 
-        request = PersonSearchFilterRequest(
-            country_id=uuid.uuid4(),
-            state_id=uuid.uuid4(),
-            district_id=uuid.uuid4(),
-            sub_district_id=uuid.uuid4(),
-            religion_id=uuid.uuid4(),
-            religion_category_id=uuid.uuid4(),
+        sql = compile_sql(mock_session.exec.call_args.args[0])
+        assert "count(*) OVER () AS total" in sql
+        assert (
+            "ORDER BY lower(person.last_name), lower(person.first_name), person.id"
+            in sql
         )
+        assert "LIMIT 5 OFFSET 5" in sql
 
-        with patch.object(
-            service, "_find_persons_by_address", return_value=[uuid.uuid4()]
-        ):
-            with patch.object(service, "_find_persons_by_religion", return_value=[]):
-                result = service.search_persons(request)
-
-        assert result.total == 0
-        assert len(result.results) == 0
-
-    def test_search_returns_empty_when_no_intersection(self) -> None:
-        """Test search returns empty when address and religion don't intersect."""
+    def test_empty_first_page_returns_zero_total(self) -> None:
+        """Test that no rows on the first page means no matches."""
         mock_session = MagicMock()
         service = PersonSearchService(mock_session)
+        mock_session.exec.return_value.all.return_value = []
 
-        request = PersonSearchFilterRequest(
-            country_id=uuid.uuid4(),
-            state_id=uuid.uuid4(),
-            district_id=uuid.uuid4(),
-            sub_district_id=uuid.uuid4(),
-            religion_id=uuid.uuid4(),
-            religion_category_id=uuid.uuid4(),
-        )
-
-        # Different person IDs from address and religion queries
-        address_person_id = uuid.uuid4()
-        religion_person_id = uuid.uuid4()
-
-        with patch.object(
-            service, "_find_persons_by_address", return_value=[address_person_id]
-        ):
-            with patch.object(
-                service, "_find_persons_by_religion", return_value=[religion_person_id]
-            ):
-                result = service.search_persons(request)
+        result = service.search_persons(create_search_request())
 
         assert result.total == 0
-        assert len(result.results) == 0
-
-    def test_search_returns_intersection_of_address_and_religion(self) -> None:
-        """Test search returns only persons matching both address and religion."""
-        mock_session = MagicMock()
-        service = PersonSearchService(mock_session)
-
-        # Common person ID in both queries
-        common_person_id = uuid.uuid4()
-        address_only_id = uuid.uuid4()
-        religion_only_id = uuid.uuid4()
-
-        request = PersonSearchFilterRequest(
-            country_id=uuid.uuid4(),
-            state_id=uuid.uuid4(),
-            district_id=uuid.uuid4(),
-            sub_district_id=uuid.uuid4(),
-            religion_id=uuid.uuid4(),
-            religion_category_id=uuid.uuid4(),
-        )
-
-        # Mock person
-        mock_person = MagicMock(spec=Person)
-        mock_person.id = common_person_id
-        mock_person.first_name = "John"
-        mock_person.middle_name = None
-        mock_person.last_name = "Doe"
-        mock_person.date_of_birth = date(1990, 1, 1)
-        mock_person.gender_id = None
-        mock_person.profile_image_key = None
-
-        mock_session.exec.return_value.all.return_value = [mock_person]
-
-        with patch.object(
-            service,
-            "_find_persons_by_address",
-            return_value=[common_person_id, address_only_id],
-        ):
-            with patch.object(
-                service,
-                "_find_persons_by_religion",
-                return_value=[common_person_id, religion_only_id],
-            ):
-                result = service.search_persons(request)
-
-        # Should only return the common person
-        assert result.total == 1
-
-
-@pytest.mark.unit
-class TestSearchPersonsDemographicFilters:
-    """Tests for demographic filtering (gender and birth year).
-    
-    Validates: Requirements 2.5, 2.6
-    """
-
-    def test_search_with_gender_filter(self) -> None:
-        """Test search applies gender filter when provided."""
-        mock_session = MagicMock()
-        service = PersonSearchService(mock_session)
-
-        person_id = uuid.uuid4()
-        gender_id = uuid.uuid4()
-
-        request = PersonSearchFilterRequest(
-            country_id=uuid.uuid4(),
-            state_id=uuid.uuid4(),
-            district_id=uuid.uuid4(),
-            sub_district_id=uuid.uuid4(),
-            religion_id=uuid.uuid4(),
-            religion_category_id=uuid.uuid4(),
-            gender_id=gender_id,
-        )
-
-        mock_person = MagicMock(spec=Person)
-        mock_person.id = person_id
-        mock_person.first_name = "John"
-        mock_person.middle_name = None
-        mock_person.last_name = "Doe"
-        mock_person.date_of_birth = date(1990, 1, 1)
-        mock_person.gender_id = gender_id
-        mock_person.profile_image_key = None
-
-        mock_session.exec.return_value.all.return_value = [mock_person]
-
-        with patch.object(
-            service, "_find_persons_by_address", return_value=[person_id]
-        ):
-            with patch.object(
-                service, "_find_persons_by_religion", return_value=[person_id]
-            ):
-                result = service.search_persons(request)
-
-        assert result.total == 1
-        assert result.results[0].first_name == "John"
-
-    def test_search_with_birth_year_from_filter(self) -> None:
-        """Test search applies birth_year_from filter."""
-        mock_session = MagicMock()
-        service = PersonSearchService(mock_session)
-
-        person_id = uuid.uuid4()
-
-        request = PersonSearchFilterRequest(
-            country_id=uuid.uuid4(),
-            state_id=uuid.uuid4(),
-            district_id=uuid.uuid4(),
-            sub_district_id=uuid.uuid4(),
-            religion_id=uuid.uuid4(),
-            religion_category_id=uuid.uuid4(),
-            birth_year_from=1985,
-        )
-
-        mock_person = MagicMock(spec=Person)
-        mock_person.id = person_id
-        mock_person.first_name = "John"
-        mock_person.middle_name = None
-        mock_person.last_name = "Doe"
-        mock_person.date_of_birth = date(1990, 1, 1)
-        mock_person.gender_id = None
-        mock_person.profile_image_key = None
-
-        mock_session.exec.return_value.all.return_value = [mock_person]
-
-        with patch.object(
-            service, "_find_persons_by_address", return_value=[person_id]
-        ):
-            with patch.object(
-                service, "_find_persons_by_religion", return_value=[person_id]
-            ):
-                result = service.search_persons(request)
-
-        assert result.total == 1
-
-    def test_search_with_birth_year_to_filter(self) -> None:
-        """Test search applies birth_year_to filter."""
-        mock_session = MagicMock()
-        service = PersonSearchService(mock_session)
-
-        person_id = uuid.uuid4()
-
-        request = PersonSearchFilterRequest(
-            country_id=uuid.uuid4(),
-            state_id=uuid.uuid4(),
-            district_id=uuid.uuid4(),
-            sub_district_id=uuid.uuid4(),
-            religion_id=uuid.uuid4(),
-            religion_category_id=uuid.uuid4(),
-            birth_year_to=1995,
-        )
-
-        mock_person = MagicMock(spec=Person)
-        mock_person.id = person_id
-        mock_person.first_name = "John"
-        mock_person.middle_name = None
-        mock_person.last_name = "Doe"
-        mock_person.date_of_birth = date(1990, 1, 1)
-        mock_person.gender_id = None
-        mock_person.profile_image_key = None
-
-        mock_session.exec.return_value.all.return_value = [mock_person]
-
-        with patch.object(
-            service, "_find_persons_by_address", return_value=[person_id]
-        ):
-            with patch.object(
-                service, "_find_persons_by_religion", return_value=[person_id]
-            ):
-                result = service.search_persons(request)
-
-        assert result.total == 1
+        assert result.results == []
+        assert result.skip == 0
+        assert result.limit == 20  # Default limit
+        mock_session.exec.assert_called_once()
 
-    def test_search_with_birth_year_range_filter(self) -> None:
-        """Test search applies both birth_year_from and birth_year_to filters."""
+    def test_page_past_the_end_counts_separately(self) -> None:
+        """Test that the total is still reported when skip is past the end."""
         mock_session = MagicMock()
         service = PersonSearchService(mock_session)
+        mock_session.exec.return_value.all.return_value = []
+        mock_session.exec.return_value.one.return_value = (1,)
 
-        person_id = uuid.uuid4()
-
-        request = PersonSearchFilterRequest(
-            country_id=uuid.uuid4(),
-            state_id=uuid.uuid4(),
-            district_id=uuid.uuid4(),
-            sub_district_id=uuid.uuid4(),
-            religion_id=uuid.uuid4(),
-            religion_category_id=uuid.uuid4(),
-            birth_year_from=1985,
-            birth_year_to=1995,
-        )
-
-        mock_person = MagicMock(spec=Person)
-        mock_person.id = person_id
-        mock_person.first_name = "John"
-        mock_person.middle_name = None
-        mock_person.last_name = "Doe"
-        mock_person.date_of_birth = date(1990, 1, 1)
-        mock_person.gender_id = None
-        mock_person.profile_image_key = None
-
-        mock_session.exec.return_value.all.return_value = [mock_person]
-
-        with patch.object(
-            service, "_find_persons_by_address", return_value=[person_id]
-        ):
-            with patch.object(
-                service, "_find_persons_by_religion", return_value=[person_id]
-            ):
-                result = service.search_persons(request)
+        result = service.search_persons(create_search_request(skip=5, limit=10))
 
         assert result.total == 1
-
+        assert result.results == []
+        assert result.skip == 5
+        assert result.limit == 10
+        assert mock_session.exec.call_count == 2
 
 
 @pytest.mark.unit
 class TestSearchPersonsNameMatching:
     """Tests for name fuzzy matching functionality.
-    
+
     Validates: Requirements 2.7, 2.8
     """
 
@@ -702,79 +497,26 @@ class TestSearchPersonsNameMatching:
         """Test search with exact name match returns high score."""
         mock_session = MagicMock()
         service = PersonSearchService(mock_session)
+        mock_session.exec.return_value.all.return_value = [create_search_row()]
 
-        person_id = uuid.uuid4()
-
-        request = PersonSearchFilterRequest(
-            first_name="John",
-            last_name="Doe",
-            country_id=uuid.uuid4(),
-            state_id=uuid.uuid4(),
-            district_id=uuid.uuid4(),
-            sub_district_id=uuid.uuid4(),
-            religion_id=uuid.uuid4(),
-            religion_category_id=uuid.uuid4(),
+        result = service.search_persons(
+            create_search_request(first_name="John", last_name="Doe")
         )
 
-        mock_person = MagicMock(spec=Person)
-        mock_person.id = person_id
-        mock_person.first_name = "John"
-        mock_person.middle_name = None
-        mock_person.last_name = "Doe"
-        mock_person.date_of_birth = date(1990, 1, 1)
-        mock_person.gender_id = None
-        mock_person.profile_image_key = None
-
-        mock_session.exec.return_value.all.return_value = [mock_person]
-
-        with patch.object(
-            service, "_find_persons_by_address", return_value=[person_id]
-        ):
-            with patch.object(
-                service, "_find_persons_by_religion", return_value=[person_id]
-            ):
-                result = service.search_persons(request)
-
         assert result.total == 1
         assert result.results[0].name_match_score == 100.0
+        mock_session.exec.assert_called_once()
 
     def test_search_with_name_filter_fuzzy_match(self) -> None:
         """Test search with fuzzy name match returns appropriate score."""
         mock_session = MagicMock()
         service = PersonSearchService(mock_session)
+        mock_session.exec.return_value.all.return_value = [create_search_row()]
 
-        person_id = uuid.uuid4()
-
-        request = PersonSearchFilterRequest(
-            first_name="Jon",  # Similar to John
-            last_name="Doe",
-            country_id=uuid.uuid4(),
-            state_id=uuid.uuid4(),
-            district_id=uuid.uuid4(),
-            sub_district_id=uuid.uuid4(),
-            religion_id=uuid.uuid4(),
-            religion_category_id=uuid.uuid4(),
+        result = service.search_persons(
+            create_search_request(first_name="Jon", last_name="Doe")
         )
 
-        mock_person = MagicMock(spec=Person)
-        mock_person.id = person_id
-        mock_person.first_name = "John"
-        mock_person.middle_name = None
-        mock_person.last_name = "Doe"
-        mock_person.date_of_birth = date(1990, 1, 1)
-        mock_person.gender_id = None
-        mock_person.profile_image_key = None
-
-        mock_session.exec.return_value.all.return_value = [mock_person]
-
-        with patch.object(
-            service, "_find_persons_by_address", return_value=[person_id]
-        ):
-            with patch.object(
-                service, "_find_persons_by_religion", return_value=[person_id]
-            ):
-                result = service.search_persons(request)
-
         assert result.total == 1
         # Score should be above threshold (40%) but less than 100
         assert result.results[0].name_match_score is not None
@@ -784,39 +526,14 @@ class TestSearchPersonsNameMatching:
         """Test search filters out persons with name score below 40%."""
         mock_session = MagicMock()
         service = PersonSearchService(mock_session)
+        mock_session.exec.return_value.all.return_value = [
+            create_search_row(first_name="John", last_name="Smith")
+        ]
 
-        person_id = uuid.uuid4()
-
-        request = PersonSearchFilterRequest(
-            first_name="Xyz",  # Completely different
-            last_name="Abc",
-            country_id=uuid.uuid4(),
-            state_id=uuid.uuid4(),
-            district_id=uuid.uuid4(),
-            sub_district_id=uuid.uuid4(),
-            religion_id=uuid.uuid4(),
-            religion_category_id=uuid.uuid4(),
+        result = service.search_persons(
+            create_search_request(first_name="Xyz", last_name="Abc")
         )
 
-        mock_person = MagicMock(spec=Person)
-        mock_person.id = person_id
-        mock_person.first_name = "John"
-        mock_person.middle_name = None
-        mock_person.last_name = "Smith"
-        mock_person.date_of_birth = date(1990, 1, 1)
-        mock_person.gender_id = None
-        mock_person.profile_image_key = None
-
-        mock_session.exec.return_value.all.return_value = [mock_person]
-
-        with patch.object(
-            service, "_find_persons_by_address", return_value=[person_id]
-        ):
-            with patch.object(
-                service, "_find_persons_by_religion", return_value=[person_id]
-            ):
-                result = service.search_persons(request)
-
         # Should be empty because name score is below 40%
         assert result.total == 0
         assert len(result.results) == 0
@@ -825,328 +542,458 @@ class TestSearchPersonsNameMatching:
         """Test search results are sorted by name match score descending."""
         mock_session = MagicMock()
         service = PersonSearchService(mock_session)
+        exact = create_search_row(first_name="John", last_name="Smith")
+        partial = create_search_row(first_name="Jon", last_name="Smith")
+        mock_session.exec.return_value.all.return_value = [partial, exact]
 
-        person_id_1 = uuid.uuid4()
-        person_id_2 = uuid.uuid4()
-
-        request = PersonSearchFilterRequest(
-            first_name="John",
-            last_name="Smith",
-            country_id=uuid.uuid4(),
-            state_id=uuid.uuid4(),
-            district_id=uuid.uuid4(),
-            sub_district_id=uuid.uuid4(),
-            religion_id=uuid.uuid4(),
-            religion_category_id=uuid.uuid4(),
+        result = service.search_persons(
+            create_search_request(first_name="John", last_name="Smith")
         )
 
-        # Person with exact match
-        mock_person_1 = MagicMock(spec=Person)
-        mock_person_1.id = person_id_1
-        mock_person_1.first_name = "John"
-        mock_person_1.middle_name = None
-        mock_person_1.last_name = "Smith"
-        mock_person_1.date_of_birth = date(1990, 1, 1)
-        mock_person_1.gender_id = None
-        mock_person_1.profile_image_key = None
-
-        # Person with partial match
-        mock_person_2 = MagicMock(spec=Person)
-        mock_person_2.id = person_id_2
-        mock_person_2.first_name = "Jon"  # Similar but not exact
-        mock_person_2.middle_name = None
-        mock_person_2.last_name = "Smith"
-        mock_person_2.date_of_birth = date(1985, 1, 1)
-        mock_person_2.gender_id = None
-        mock_person_2.profile_image_key = None
-
-        mock_session.exec.return_value.all.return_value = [
-            mock_person_2,
-            mock_person_1,
-        ]
-
-        with patch.object(
-            service,
-            "_find_persons_by_address",
-            return_value=[person_id_1, person_id_2],
-        ):
-            with patch.object(
-                service,
-                "_find_persons_by_religion",
-                return_value=[person_id_1, person_id_2],
-            ):
-                result = service.search_persons(request)
-
         assert result.total == 2
-        # First result should have higher score (exact match)
-        assert result.results[0].name_match_score >= result.results[1].name_match_score
+        assert [r.person_id for r in result.results] == [exact.id, partial.id]
 
-    def test_search_without_name_filter_returns_no_score(self) -> None:
-        """Test search without name filter returns results without name_match_score."""
+    def test_name_matches_are_paginated_after_scoring(self) -> None:
+        """Test that skip and limit apply to the scored matches."""
         mock_session = MagicMock()
         service = PersonSearchService(mock_session)
+        rows = [create_search_row(first_name="John") for _ in range(5)]
+        mock_session.exec.return_value.all.return_value = rows
 
-        person_id = uuid.uuid4()
-
-        request = PersonSearchFilterRequest(
-            country_id=uuid.uuid4(),
-            state_id=uuid.uuid4(),
-            district_id=uuid.uuid4(),
-            sub_district_id=uuid.uuid4(),
-            religion_id=uuid.uuid4(),
-            religion_category_id=uuid.uuid4(),
+        result = service.search_persons(
+            create_search_request(first_name="John", skip=2, limit=2)
         )
 
-        mock_person = MagicMock(spec=Person)
-        mock_person.id = person_id
-        mock_person.first_name = "John"
-        mock_person.middle_name = None
-        mock_person.last_name = "Doe"
-        mock_person.date_of_birth = date(1990, 1, 1)
-        mock_person.gender_id = None
-        mock_person.profile_image_key = None
+        assert result.total == 5
+        assert [r.person_id for r in result.results] == [rows[2].id, rows[3].id]
 
-        mock_session.exec.return_value.all.return_value = [mock_person]
+        # The fuzzy path scores every candidate, so it has no window count
+        sql = compile_sql(mock_session.exec.call_args.args[0])
+        assert "OVER" not in sql
+        assert "LIMIT" not in sql
 
-        with patch.object(
-            service, "_find_persons_by_address", return_value=[person_id]
-        ):
-            with patch.object(
-                service, "_find_persons_by_religion", return_value=[person_id]
-            ):
-                result = service.search_persons(request)
-
-        assert result.total == 1
-        assert result.results[0].name_match_score is None
 
+@pytest.mark.integration
+class TestSearchPersonsIntegration:
+    """Tests for search_persons against the database.
 
-@pytest.mark.unit
-class TestSearchPersonsPagination:
-    """Tests for pagination functionality.
-    
-    Validates: Requirements 2.9, 2.10
+    Validates: Requirements 2.1 - 2.10
     """
 
-    def test_search_with_skip_parameter(self) -> None:
-        """Test search applies skip parameter correctly."""
-        mock_session = MagicMock()
-        service = PersonSearchService(mock_session)
+    @pytest.fixture
+    def create_person(
+        self,
+        db: Session,
+        test_user_for_search: User,
+        address_ids: dict[str, uuid.UUID],
+        religion_ids: dict[str, uuid.UUID],
+    ) -> Any:
+        """Return a helper that creates a person in the search area."""
+
+        def create(first_name: str, last_name: str, **kwargs: Any) -> Person:
+            return create_person_with_address_and_religion(
+                db,
+                test_user_for_search,
+                first_name,
+                last_name,
+                address_ids["country_id"],
+                address_ids["state_id"],
+                address_ids["district_id"],
+                address_ids["sub_district_id"],
+                religion_ids["religion_id"],
+                religion_ids["religion_category_id"],
+                **kwargs,
+            )
+
+        return create
 
-        person_ids = [uuid.uuid4() for _ in range(5)]
-
-        request = PersonSearchFilterRequest(
-            country_id=uuid.uuid4(),
-            state_id=uuid.uuid4(),
-            district_id=uuid.uuid4(),
-            sub_district_id=uuid.uuid4(),
-            religion_id=uuid.uuid4(),
-            religion_category_id=uuid.uuid4(),
-            skip=2,
-            limit=10,
+    @pytest.fixture
+    def request_filters(
+        self,
+        address_ids: dict[str, uuid.UUID],
+        religion_ids: dict[str, uuid.UUID],
+    ) -> dict[str, uuid.UUID]:
+        """Required search filters for the search area."""
+        return {
+            "country_id": address_ids["country_id"],
+            "state_id": address_ids["state_id"],
+            "district_id": address_ids["district_id"],
+            "sub_district_id": address_ids["sub_district_id"],
+            "religion_id": religion_ids["religion_id"],
+            "religion_category_id": religion_ids["religion_category_id"],
+        }
+
+    def test_returns_persons_matching_address_and_religion(
+        self,
+        db: Session,
+        service: PersonSearchService,
+        create_person: Any,
+        request_filters: dict[str, uuid.UUID],
+        religion_ids: dict[str, uuid.UUID],
+        test_user_for_search: User,
+    ) -> None:
+        """Test that only persons matching both address and religion are found."""
+        match = create_person("John", "Doe")
+        other_religion = create_person("Jane", "Doe")
+        db.execute(
+            delete(PersonReligion).where(PersonReligion.person_id == other_religion.id)
+        )
+        create_test_religion(
+            db,
+            other_religion.id,
+            religion_ids["religion_id"],
+            religion_ids["other_religion_category_id"],
+        )
+        no_address = PersonFactory.create(db, created_by_user=test_user_for_search)
+        create_test_religion(
+            db,
+            no_address.id,
+            religion_ids["religion_id"],
+            religion_ids["religion_category_id"],
         )
 
-        mock_persons = []
-        for i, pid in enumerate(person_ids):
-            mock_person = MagicMock(spec=Person)
-            mock_person.id = pid
-            mock_person.first_name = f"Person{i}"
-            mock_person.middle_name = None
-            mock_person.last_name = f"Last{i}"
-            mock_person.date_of_birth = date(1990, 1, 1)
-            mock_person.gender_id = None
-            mock_person.profile_image_key = None
-            mock_persons.append(mock_person)
-
-        mock_session.exec.return_value.all.return_value = mock_persons
-
-        with patch.object(
-            service, "_find_persons_by_address", return_value=person_ids
-        ):
-            with patch.object(
-                service, "_find_persons_by_religion", return_value=person_ids
-            ):
-                result = service.search_persons(request)
+        result = service.search_persons(PersonSearchFilterRequest(**request_filters))
 
-        assert result.total == 5
-        assert result.skip == 2
-        assert len(result.results) == 3  # 5 - 2 = 3 remaining
+        assert result.total == 1
+        assert [r.person_id for r in result.results] == [match.id]
+
+    def test_person_with_several_matching_addresses_is_counted_once(
+        self,
+        db: Session,
+        service: PersonSearchService,
+        create_person: Any,
+        request_filters: dict[str, uuid.UUID],
+        address_ids: dict[str, uuid.UUID],
+    ) -> None:
+        """Test that the address semi-join does not duplicate persons."""
+        person = create_person("John", "Doe")
+        create_test_address(
+            db,
+            person.id,
+            address_ids["country_id"],
+            address_ids["state_id"],
+            address_ids["district_id"],
+            address_ids["sub_district_id"],
+        )
 
-    def test_search_with_limit_parameter(self) -> None:
-        """Test search applies limit parameter correctly."""
-        mock_session = MagicMock()
-        service = PersonSearchService(mock_session)
+        result = service.search_persons(PersonSearchFilterRequest(**request_filters))
 
-        person_ids = [uuid.uuid4() for _ in range(10)]
-
-        request = PersonSearchFilterRequest(
-            country_id=uuid.uuid4(),
-            state_id=uuid.uuid4(),
-            district_id=uuid.uuid4(),
-            sub_district_id=uuid.uuid4(),
-            religion_id=uuid.uuid4(),
-            religion_category_id=uuid.uuid4(),
-            skip=0,
-            limit=5,
+        assert result.total == 1
+        assert len(result.results) == 1
+
+    def test_optional_filters(
+        self,
+        db: Session,
+        service: PersonSearchService,
+        create_person: Any,
+        request_filters: dict[str, uuid.UUID],
+        address_ids: dict[str, uuid.UUID],
+    ) -> None:
+        """Test locality, gender, birth year and inactive filters together."""
+        match = create_person(
+            "John",
+            "Doe",
+            locality_id=address_ids["locality_id"],
+            date_of_birth=date(1990, 5, 1),
+        )
+        create_person(
+            "Other",
+            "Locality",
+            locality_id=address_ids["other_locality_id"],
+            date_of_birth=date(1990, 5, 1),
+        )
+        create_person(
+            "Jane",
+            "Female",
+            locality_id=address_ids["locality_id"],
+            gender=GenderEnum.FEMALE,
+            date_of_birth=date(1990, 5, 1),
+        )
+        create_person(
+            "Old",
+            "Person",
+            locality_id=address_ids["locality_id"],
+            date_of_birth=date(1950, 5, 1),
+        )
+        inactive = create_person(
+            "Inactive",
+            "Person",
+            locality_id=address_ids["locality_id"],
+            date_of_birth=date(1990, 5, 1),
+        )
+        inactive.is_active = False
+        db.add(inactive)
+        db.commit()
+
+        result = service.search_persons(
+            PersonSearchFilterRequest(
+                **request_filters,
+                locality_id=address_ids["locality_id"],
+                gender_id=match.gender_id,
+                birth_year_from=1985,
+                birth_year_to=1995,
+            )
         )
 
-        mock_persons = []
-        for i, pid in enumerate(person_ids):
-            mock_person = MagicMock(spec=Person)
-            mock_person.id = pid
-            mock_person.first_name = f"Person{i}"
-            mock_person.middle_name = None
-            mock_person.last_name = f"Last{i}"
-            mock_person.date_of_birth = date(1990, 1, 1)
-            mock_person.gender_id = None
-            mock_person.profile_image_key = None
-            mock_persons.append(mock_person)
+        assert result.total == 1
+        assert [r.person_id for r in result.results] == [match.id]
 
-        mock_session.exec.return_value.all.return_value = mock_persons
+    def test_sorted_by_name_and_paginated_in_database(
+        self,
+        service: PersonSearchService,
+        create_person: Any,
+        request_filters: dict[str, uuid.UUID],
+    ) -> None:
+        """Test sorting by last then first name, pagination and total."""
+        create_person("John", "zebra")
+        create_person("Bob", "Middle")
+        create_person("Jane", "Apple")
+        create_person("Adam", "Apple")
+
+        first_page = service.search_persons(
+            PersonSearchFilterRequest(**request_filters, skip=0, limit=3)
+        )
+        second_page = service.search_persons(
+            PersonSearchFilterRequest(**request_filters, skip=3, limit=3)
+        )
+        past_end = service.search_persons(
+            PersonSearchFilterRequest(**request_filters, skip=10, limit=3)
+        )
 
-        with patch.object(
-            service, "_find_persons_by_address", return_value=person_ids
-        ):
-            with patch.object(
-                service, "_find_persons_by_religion", return_value=person_ids
-            ):
-                result = service.search_persons(request)
+        assert [(r.first_name, r.last_name) for r in first_page.results] == [
+            ("Adam", "Apple"),
+            ("Jane", "Apple"),
+            ("Bob", "Middle"),
+        ]
+        assert [r.last_name for r in second_page.results] == ["zebra"]
+        assert first_page.total == second_page.total == past_end.total == 4
+        assert past_end.results == []
+
+    def test_name_filter_scores_filtered_persons(
+        self,
+        service: PersonSearchService,
+        create_person: Any,
+        request_filters: dict[str, uuid.UUID],
+    ) -> None:
+        """Test fuzzy name matching on the persons returned by the query."""
+        exact = create_person("John", "Smith")
+        partial = create_person("Jon", "Smith")
+        create_person("Xyz", "Abc")
+
+        result = service.search_persons(
+            PersonSearchFilterRequest(
+                **request_filters, first_name="John", last_name="Smith"
+            )
+        )
 
-        assert result.total == 10
-        assert result.limit == 5
-        assert len(result.results) == 5
+        assert result.total == 2
+        assert [r.person_id for r in result.results] == [exact.id, partial.id]
+        assert result.results[0].name_match_score == 100.0
 
-    def test_search_empty_results_returns_zero_total(self) -> None:
-        """Test search returns total=0 when no matches found."""
-        mock_session = MagicMock()
-        service = PersonSearchService(mock_session)
 
-        request = PersonSearchFilterRequest(
-            country_id=uuid.uuid4(),
-            state_id=uuid.uuid4(),
-            district_id=uuid.uuid4(),
-            sub_district_id=uuid.uuid4(),
-            religion_id=uuid.uuid4(),
-            religion_category_id=uuid.uuid4(),
+@pytest.mark.unit
+class TestSearchCursor:
+    """Tests for encoding and decoding search cursors."""
+
+    def test_round_trip(self) -> None:
+        """Test that a cursor decodes to the position it was encoded with."""
+        request = create_search_request(first_name="John")
+        cursor = SearchCursor(
+            total=42, offset=20, sort_key=("doe", "john", str(uuid.uuid4()))
         )
 
-        with patch.object(service, "_find_persons_by_address", return_value=[]):
-            with patch.object(service, "_find_persons_by_religion", return_value=[]):
-                result = service.search_persons(request)
+        encoded = encode_search_cursor(request, cursor)
 
-        assert result.total == 0
-        assert len(result.results) == 0
-        assert result.skip == 0
-        assert result.limit == 20  # Default limit
+        decoded = decode_search_cursor(
+            request.model_copy(update={"cursor": encoded, "skip": 5})
+        )
 
-    def test_search_pagination_response_includes_metadata(self) -> None:
-        """Test search response includes correct pagination metadata."""
-        mock_session = MagicMock()
-        service = PersonSearchService(mock_session)
+        assert decoded == cursor
 
-        person_id = uuid.uuid4()
-
-        request = PersonSearchFilterRequest(
-            country_id=uuid.uuid4(),
-            state_id=uuid.uuid4(),
-            district_id=uuid.uuid4(),
-            sub_district_id=uuid.uuid4(),
-            religion_id=uuid.uuid4(),
-            religion_category_id=uuid.uuid4(),
-            skip=5,
-            limit=10,
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "not-a-cursor",
+            base64.urlsafe_b64encode(b"[1, 2]").decode(),
+            base64.urlsafe_b64encode(b'{"f": "x"}').decode(),
+        ],
+    )
+    def test_malformed_cursor_is_rejected(self, value: str) -> None:
+        """Test that malformed cursors raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid search cursor"):
+            decode_search_cursor(create_search_request(cursor=value))
+
+    def test_cursor_from_other_filters_is_rejected(self) -> None:
+        """Test that a cursor cannot be reused with different filters."""
+        request = create_search_request()
+        encoded = encode_search_cursor(request, SearchCursor(total=1, offset=1))
+
+        other = request.model_copy(
+            update={"cursor": encoded, "gender_id": uuid.uuid4()}
         )
 
-        mock_person = MagicMock(spec=Person)
-        mock_person.id = person_id
-        mock_person.first_name = "John"
-        mock_person.middle_name = None
-        mock_person.last_name = "Doe"
-        mock_person.date_of_birth = date(1990, 1, 1)
-        mock_person.gender_id = None
-        mock_person.profile_image_key = None
+        with pytest.raises(ValueError, match="does not match"):
+            decode_search_cursor(other)
 
-        mock_session.exec.return_value.all.return_value = [mock_person]
 
-        with patch.object(
-            service, "_find_persons_by_address", return_value=[person_id]
-        ):
-            with patch.object(
-                service, "_find_persons_by_religion", return_value=[person_id]
-            ):
-                result = service.search_persons(request)
+@pytest.mark.integration
+class TestSearchPersonsCursorPagination:
+    """Tests for cursor pagination against the database."""
 
-        assert result.skip == 5
-        assert result.limit == 10
-        # Total is 1, but skip is 5, so no results returned
-        assert result.total == 1
-        assert len(result.results) == 0  # Skipped past the only result
+    @pytest.fixture
+    def filters(
+        self,
+        db: Session,
+        test_user_for_search: User,
+        address_ids: dict[str, uuid.UUID],
+        religion_ids: dict[str, uuid.UUID],
+    ) -> dict[str, Any]:
+        """Create persons with repeated names and return the search filters."""
+        names = [
+            ("John", "Smith"),
+            ("Jon", "Smith"),
+            ("John", "Smyth"),
+            ("Jane", "apple"),
+            ("Adam", "Apple"),
+            ("John", "Smith"),
+            ("Bob", "Middle"),
+        ]
+        for first_name, last_name in names:
+            create_person_with_address_and_religion(
+                db,
+                test_user_for_search,
+                first_name,
+                last_name,
+                address_ids["country_id"],
+                address_ids["state_id"],
+                address_ids["district_id"],
+                address_ids["sub_district_id"],
+                religion_ids["religion_id"],
+                religion_ids["religion_category_id"],
+            )
+        return {
+            "country_id": address_ids["country_id"],
+            "state_id": address_ids["state_id"],
+            "district_id": address_ids["district_id"],
+            "sub_district_id": address_ids["sub_district_id"],
+            "religion_id": religion_ids["religion_id"],
+            "religion_category_id": religion_ids["religion_category_id"],
+        }
+
+    def walk_pages(
+        self, service: PersonSearchService, **filters: Any
+    ) -> list[PersonSearchResponse]:
+        """Follow next_cursor from the first page to the last."""
+        pages = [
+            service.search_persons(
+                PersonSearchFilterRequest(**filters, use_cursor=True, limit=2)
+            )
+        ]
+        while pages[-1].next_cursor is not None:
+            pages.append(
+                service.search_persons(
+                    PersonSearchFilterRequest(
+                        **filters, cursor=pages[-1].next_cursor, limit=2
+                    )
+                )
+            )
+        return pages
+
+    def test_keyset_pages_match_offset_order(
+        self, service: PersonSearchService, filters: dict[str, Any]
+    ) -> None:
+        """Test that cursor pages return every person once, in sort order."""
+        pages = self.walk_pages(service, **filters)
+        offset_page = service.search_persons(
+            PersonSearchFilterRequest(**filters, limit=100)
+        )
 
-    def test_search_without_name_sorts_by_last_name(self) -> None:
-        """Test search without name filter sorts results by last name."""
-        mock_session = MagicMock()
-        service = PersonSearchService(mock_session)
+        assert [len(page.results) for page in pages] == [2, 2, 2, 1]
+        assert [page.skip for page in pages] == [0, 2, 4, 6]
+        assert all(page.total == 7 for page in pages)
+        assert [r.person_id for page in pages for r in page.results] == [
+            r.person_id for r in offset_page.results
+        ]
 
-        person_id_1 = uuid.uuid4()
-        person_id_2 = uuid.uuid4()
-        person_id_3 = uuid.uuid4()
-
-        request = PersonSearchFilterRequest(
-            country_id=uuid.uuid4(),
-            state_id=uuid.uuid4(),
-            district_id=uuid.uuid4(),
-            sub_district_id=uuid.uuid4(),
-            religion_id=uuid.uuid4(),
-            religion_category_id=uuid.uuid4(),
+    def test_keyset_page_skips_no_rows(
+        self, service: PersonSearchService, filters: dict[str, Any]
+    ) -> None:
+        """Test that cursor pages seek past the cursor instead of using OFFSET."""
+        first = service.search_persons(
+            PersonSearchFilterRequest(**filters, use_cursor=True, limit=2)
         )
 
-        # Create persons with different last names
-        mock_person_1 = MagicMock(spec=Person)
-        mock_person_1.id = person_id_1
-        mock_person_1.first_name = "John"
-        mock_person_1.middle_name = None
-        mock_person_1.last_name = "Zebra"  # Should be last
-        mock_person_1.date_of_birth = date(1990, 1, 1)
-        mock_person_1.gender_id = None
-        mock_person_1.profile_image_key = None
-
-        mock_person_2 = MagicMock(spec=Person)
-        mock_person_2.id = person_id_2
-        mock_person_2.first_name = "Jane"
-        mock_person_2.middle_name = None
-        mock_person_2.last_name = "Apple"  # Should be first
-        mock_person_2.date_of_birth = date(1985, 1, 1)
-        mock_person_2.gender_id = None
-        mock_person_2.profile_image_key = None
-
-        mock_person_3 = MagicMock(spec=Person)
-        mock_person_3.id = person_id_3
-        mock_person_3.first_name = "Bob"
-        mock_person_3.middle_name = None
-        mock_person_3.last_name = "Middle"  # Should be second
-        mock_person_3.date_of_birth = date(1995, 1, 1)
-        mock_person_3.gender_id = None
-        mock_person_3.profile_image_key = None
+        with patch.object(
+            service.session, "exec", wraps=service.session.exec
+        ) as exec_spy:
+            service.search_persons(
+                PersonSearchFilterRequest(**filters, cursor=first.next_cursor, limit=2)
+            )
+
+        sql = compile_sql(exec_spy.call_args.args[0])
+        assert "OFFSET" not in sql
+        assert "OVER" not in sql
+        assert "LIMIT 3" in sql
+        exec_spy.assert_called_once()
+
+    def test_fuzzy_pages_come_from_snapshot(
+        self, service: PersonSearchService, filters: dict[str, Any]
+    ) -> None:
+        """Test that later fuzzy pages slice the snapshot without queries."""
+        cache = CacheManager()
+        name_filters = {**filters, "first_name": "John", "last_name": "Smith"}
+        full = service.search_persons(
+            PersonSearchFilterRequest(**name_filters, limit=100)
+        )
 
-        mock_session.exec.return_value.all.return_value = [
-            mock_person_1,
-            mock_person_2,
-            mock_person_3,
+        with (
+            patch(
+                "app.services.person.person_search_service.get_cache_manager",
+                return_value=cache,
+            ),
+            patch.object(
+                service,
+                "_fetch_name_candidates",
+                wraps=service._fetch_name_candidates,
+            ) as fetch_spy,
+        ):
+            pages = self.walk_pages(service, **name_filters)
+
+        assert len(pages) > 1
+        assert fetch_spy.call_count == 1
+        assert [r.person_id for page in pages for r in page.results] == [
+            r.person_id for r in full.results
+        ]
+        assert [r.name_match_score for page in pages for r in page.results] == [
+            r.name_match_score for r in full.results
         ]
+        assert all(page.total == full.total for page in pages)
 
-        with patch.object(
-            service,
-            "_find_persons_by_address",
-            return_value=[person_id_1, person_id_2, person_id_3],
+    def test_expired_snapshot_is_rebuilt(
+        self, service: PersonSearchService, filters: dict[str, Any]
+    ) -> None:
+        """Test that a cursor still works after its snapshot expired."""
+        cache = CacheManager()
+        name_filters = {**filters, "first_name": "John", "last_name": "Smith"}
+
+        with patch(
+            "app.services.person.person_search_service.get_cache_manager",
+            return_value=cache,
         ):
-            with patch.object(
-                service,
-                "_find_persons_by_religion",
-                return_value=[person_id_1, person_id_2, person_id_3],
-            ):
-                result = service.search_persons(request)
-
-        assert result.total == 3
-        # Results should be sorted by last name alphabetically
-        assert result.results[0].last_name == "Apple"
-        assert result.results[1].last_name == "Middle"
-        assert result.results[2].last_name == "Zebra"
+            first = service.search_persons(
+                PersonSearchFilterRequest(**name_filters, use_cursor=True, limit=2)
+            )
+            cache.clear()
+            second = service.search_persons(
+                PersonSearchFilterRequest(
+                    **name_filters, cursor=first.next_cursor, limit=2
+                )
+            )
+
+        full = service.search_persons(
+            PersonSearchFilterRequest(**name_filters, limit=100)
+        )
+        assert second.skip == 2
+        assert [r.person_id for r in first.results + second.results] == [
+            r.person_id for r in full.results[:4]
+        ]
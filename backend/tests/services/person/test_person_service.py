@@ -20,7 +20,9 @@ from app.db_models.person.person import Person
 from app.db_models.person.person_address import PersonAddress
 from app.enums import GENDER_DATA, GenderEnum
 from app.schemas.person import PersonCreate, PersonUpdate
+from app.services.address.address_gazetteer import AddressNames
 from app.services.person.person_service import PersonService
+from app.services.religion.religion_taxonomy import ReligionNames
 
 
 @pytest.mark.unit
@@ -315,7 +317,9 @@ class TestGetMyContributions:
         user_id = uuid.uuid4()
 
         # Mock repository to return empty list
-        with patch.object(service.person_repo, "get_by_creator", return_value=[]):
+        with patch.object(
+            service.person_repo, "get_by_creator_with_views", return_value=[]
+        ):
             result = service.get_my_contributions(user_id)
 
             # Verify empty list returned
@@ -374,12 +378,8 @@ class TestGetMyContributions:
 
         persons = [person1, person2, person3]
 
-        # Mock view counts (person2 has most views, person3 has none)
-        view_counts = {
-            person1_id: 5,
-            person2_id: 10,
-            person3_id: 0,
-        }
+        # Persons as returned by the database, sorted by view count
+        persons_with_views = [(person2, 10), (person1, 5), (person3, 0)]
 
         # Mock addresses
         address1 = PersonAddress(
@@ -400,31 +400,20 @@ class TestGetMyContributions:
 
         # person3 has no addresses
 
-        # Mock repository and service methods
+        # Mock repository methods
         with patch.object(
-            service.person_repo, "get_by_creator", return_value=persons
-        ), patch(
-            "app.services.person.person_service.ProfileViewTrackingService"
-        ) as mock_view_service_class, patch(
+            service.person_repo,
+            "get_by_creator_with_views",
+            return_value=persons_with_views,
+        ) as mock_get_by_creator, patch(
             "app.services.person.person_service.PersonAddressRepository"
         ) as mock_address_repo_class:
-            # Setup mock view tracking service
-            mock_view_service = MagicMock()
-            mock_view_service.get_total_views_bulk.return_value = view_counts
-            mock_view_service_class.return_value = mock_view_service
-
             # Setup mock address repository
             mock_address_repo = MagicMock()
-
-            def get_addresses_side_effect(person_id):
-                if person_id == person1_id:
-                    return [address1]
-                elif person_id == person2_id:
-                    return [address2]
-                else:
-                    return []
-
-            mock_address_repo.get_by_person_id.side_effect = get_addresses_side_effect
+            mock_address_repo.get_by_person_ids_with_names.return_value = [
+                (address1, None, None, None),
+                (address2, None, None, None),
+            ]
             mock_address_repo_class.return_value = mock_address_repo
 
             # Call the method
@@ -456,6 +445,55 @@ class TestGetMyContributions:
             assert result[2]["last_name"] == "Johnson"
             assert result[2]["address"] == ""  # No addresses
 
+            # Addresses are loaded in one query for all persons
+            mock_get_by_creator.assert_called_once_with(
+                user_id, sort_by="views", skip=0, limit=None
+            )
+            mock_address_repo.get_by_person_ids_with_names.assert_called_once_with(
+                [person2_id, person1_id, person3_id]
+            )
+
+    def test_get_my_contributions_uses_location_names(self, db: Session) -> None:
+        """Test that addresses without address_line show their location names."""
+        service = PersonService(db)
+        user_id = uuid.uuid4()
+        person = Person(
+            id=uuid.uuid4(),
+            first_name="John",
+            last_name="Doe",
+            date_of_birth=date(1980, 1, 1),
+            gender_id=uuid.uuid4(),
+            created_by_user_id=user_id,
+        )
+        address = PersonAddress(
+            id=uuid.uuid4(),
+            person_id=person.id,
+            country_id=uuid.uuid4(),
+            start_date=date(2000, 1, 1),
+        )
+
+        with patch.object(
+            service.person_repo,
+            "get_by_creator_with_views",
+            return_value=[(person, 0)],
+        ) as mock_get_by_creator, patch(
+            "app.services.person.person_service.PersonAddressRepository"
+        ) as mock_address_repo_class:
+            mock_address_repo = MagicMock()
+            mock_address_repo.get_by_person_ids_with_names.return_value = [
+                (address, "Koramangala", None, "Karnataka"),
+            ]
+            mock_address_repo_class.return_value = mock_address_repo
+
+            result = service.get_my_contributions(
+                user_id, sort_by="created_at", skip=10, limit=5
+            )
+
+            assert result[0]["address"] == "Koramangala, Karnataka"
+            mock_get_by_creator.assert_called_once_with(
+                user_id, sort_by="created_at", skip=10, limit=5
+            )
+
 
 @pytest.mark.unit
 class TestFormatAddresses:
@@ -773,69 +811,26 @@ class TestResolveAddressDetails:
             is_current=True,
         )
 
-        # Mock country
-        mock_country = MagicMock()
-        mock_country.name = "USA"
-
-        # Mock state
-        mock_state = MagicMock()
-        mock_state.name = "California"
-
-        # Mock district
-        mock_district = MagicMock()
-        mock_district.name = "Los Angeles"
-
-        # Mock sub-district
-        mock_sub_district = MagicMock()
-        mock_sub_district.name = "Downtown"
-
-        # Mock locality
-        mock_locality = MagicMock()
-        mock_locality.name = "Central"
+        mock_gazetteer = MagicMock()
+        mock_gazetteer.get_names.return_value = AddressNames(
+            locality="Central",
+            sub_district="Downtown",
+            district="Los Angeles",
+            state="California",
+            country="USA",
+        )
 
         with patch(
             "app.services.person.person_service.PersonAddressRepository"
         ) as mock_addr_repo_class, patch(
-            "app.services.person.person_service.CountryRepository"
-        ) as mock_country_repo_class, patch(
-            "app.services.person.person_service.StateRepository"
-        ) as mock_state_repo_class, patch(
-            "app.services.person.person_service.DistrictRepository"
-        ) as mock_district_repo_class, patch(
-            "app.services.person.person_service.SubDistrictRepository"
-        ) as mock_sub_district_repo_class, patch(
-            "app.services.person.person_service.LocalityRepository"
-        ) as mock_locality_repo_class:
+            "app.services.person.person_service.get_address_gazetteer",
+            return_value=mock_gazetteer,
+        ):
             # Setup address repo
             mock_addr_repo = MagicMock()
             mock_addr_repo.get_current_address.return_value = mock_address
             mock_addr_repo_class.return_value = mock_addr_repo
 
-            # Setup country repo
-            mock_country_repo = MagicMock()
-            mock_country_repo.get_by_id.return_value = mock_country
-            mock_country_repo_class.return_value = mock_country_repo
-
-            # Setup state repo
-            mock_state_repo = MagicMock()
-            mock_state_repo.get_by_id.return_value = mock_state
-            mock_state_repo_class.return_value = mock_state_repo
-
-            # Setup district repo
-            mock_district_repo = MagicMock()
-            mock_district_repo.get_by_id.return_value = mock_district
-            mock_district_repo_class.return_value = mock_district_repo
-
-            # Setup sub-district repo
-            mock_sub_district_repo = MagicMock()
-            mock_sub_district_repo.get_by_id.return_value = mock_sub_district
-            mock_sub_district_repo_class.return_value = mock_sub_district_repo
-
-            # Setup locality repo
-            mock_locality_repo = MagicMock()
-            mock_locality_repo.get_by_id.return_value = mock_locality
-            mock_locality_repo_class.return_value = mock_locality_repo
-
             result = service._resolve_address_details(person_id)
 
         assert result is not None
@@ -867,30 +862,25 @@ class TestResolveAddressDetails:
             is_current=True,
         )
 
-        mock_country = MagicMock()
-        mock_country.name = "India"
+        mock_gazetteer = MagicMock()
+        mock_gazetteer.get_names.return_value = AddressNames(
+            locality=None,
+            sub_district=None,
+            district=None,
+            state=None,
+            country="India",
+        )
 
         with patch(
             "app.services.person.person_service.PersonAddressRepository"
         ) as mock_addr_repo_class, patch(
-            "app.services.person.person_service.CountryRepository"
-        ) as mock_country_repo_class, patch(
-            "app.services.person.person_service.StateRepository"
-        ), patch(
-            "app.services.person.person_service.DistrictRepository"
-        ), patch(
-            "app.services.person.person_service.SubDistrictRepository"
-        ), patch(
-            "app.services.person.person_service.LocalityRepository"
+            "app.services.person.person_service.get_address_gazetteer",
+            return_value=mock_gazetteer,
         ):
             mock_addr_repo = MagicMock()
             mock_addr_repo.get_current_address.return_value = mock_address
             mock_addr_repo_class.return_value = mock_addr_repo
 
-            mock_country_repo = MagicMock()
-            mock_country_repo.get_by_id.return_value = mock_country
-            mock_country_repo_class.return_value = mock_country_repo
-
             result = service._resolve_address_details(person_id)
 
         assert result is not None
@@ -939,40 +929,21 @@ class TestResolveReligionDetails:
         mock_person_religion.religion_category_id = category_id
         mock_person_religion.religion_sub_category_id = sub_category_id
 
-        mock_religion = MagicMock()
-        mock_religion.name = "Christianity"
-
-        mock_category = MagicMock()
-        mock_category.name = "Protestant"
-
-        mock_sub_category = MagicMock()
-        mock_sub_category.name = "Baptist"
+        mock_taxonomy = MagicMock()
+        mock_taxonomy.get_names.return_value = ReligionNames(
+            religion="Christianity", category="Protestant", sub_category="Baptist"
+        )
 
         with patch(
             "app.services.person.person_service.PersonReligionRepository"
         ) as mock_person_religion_repo_class, patch(
-            "app.services.person.person_service.ReligionRepository"
-        ) as mock_religion_repo_class, patch(
-            "app.services.person.person_service.ReligionCategoryRepository"
-        ) as mock_category_repo_class, patch(
-            "app.services.person.person_service.ReligionSubCategoryRepository"
-        ) as mock_sub_category_repo_class:
+            "app.services.person.person_service.get_religion_taxonomy",
+            return_value=mock_taxonomy,
+        ):
             mock_person_religion_repo = MagicMock()
             mock_person_religion_repo.get_by_person_id.return_value = mock_person_religion
             mock_person_religion_repo_class.return_value = mock_person_religion_repo
 
-            mock_religion_repo = MagicMock()
-            mock_religion_repo.get_by_id.return_value = mock_religion
-            mock_religion_repo_class.return_value = mock_religion_repo
-
-            mock_category_repo = MagicMock()
-            mock_category_repo.get_by_id.return_value = mock_category
-            mock_category_repo_class.return_value = mock_category_repo
-
-            mock_sub_category_repo = MagicMock()
-            mock_sub_category_repo.get_by_id.return_value = mock_sub_category
-            mock_sub_category_repo_class.return_value = mock_sub_category_repo
-
             result = service._resolve_religion_details(person_id)
 
         assert result is not None
@@ -993,26 +964,21 @@ class TestResolveReligionDetails:
         mock_person_religion.religion_category_id = None
         mock_person_religion.religion_sub_category_id = None
 
-        mock_religion = MagicMock()
-        mock_religion.name = "Hinduism"
+        mock_taxonomy = MagicMock()
+        mock_taxonomy.get_names.return_value = ReligionNames(
+            religion="Hinduism", category=None, sub_category=None
+        )
 
         with patch(
             "app.services.person.person_service.PersonReligionRepository"
         ) as mock_person_religion_repo_class, patch(
-            "app.services.person.person_service.ReligionRepository"
-        ) as mock_religion_repo_class, patch(
-            "app.services.person.person_service.ReligionCategoryRepository"
-        ), patch(
-            "app.services.person.person_service.ReligionSubCategoryRepository"
+            "app.services.person.person_service.get_religion_taxonomy",
+            return_value=mock_taxonomy,
         ):
             mock_person_religion_repo = MagicMock()
             mock_person_religion_repo.get_by_person_id.return_value = mock_person_religion
             mock_person_religion_repo_class.return_value = mock_person_religion_repo
 
-            mock_religion_repo = MagicMock()
-            mock_religion_repo.get_by_id.return_value = mock_religion
-            mock_religion_repo_class.return_value = mock_religion_repo
-
             result = service._resolve_religion_details(person_id)
 
         assert result is not None
@@ -1033,23 +999,21 @@ class TestResolveReligionDetails:
         mock_person_religion.religion_category_id = None
         mock_person_religion.religion_sub_category_id = None
 
+        mock_taxonomy = MagicMock()
+        mock_taxonomy.get_names.return_value = ReligionNames(
+            religion=None, category=None, sub_category=None
+        )
+
         with patch(
             "app.services.person.person_service.PersonReligionRepository"
         ) as mock_person_religion_repo_class, patch(
-            "app.services.person.person_service.ReligionRepository"
-        ) as mock_religion_repo_class, patch(
-            "app.services.person.person_service.ReligionCategoryRepository"
-        ), patch(
-            "app.services.person.person_service.ReligionSubCategoryRepository"
+            "app.services.person.person_service.get_religion_taxonomy",
+            return_value=mock_taxonomy,
         ):
             mock_person_religion_repo = MagicMock()
             mock_person_religion_repo.get_by_person_id.return_value = mock_person_religion
             mock_person_religion_repo_class.return_value = mock_person_religion_repo
 
-            mock_religion_repo = MagicMock()
-            mock_religion_repo.get_by_id.return_value = None  # Religion not found
-            mock_religion_repo_class.return_value = mock_religion_repo
-
             result = service._resolve_religion_details(person_id)
 
         assert result is not None
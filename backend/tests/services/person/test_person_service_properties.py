@@ -66,19 +66,15 @@ class TestNameDisplayFormat:
 
         # Mock dependencies
         with patch.object(
-            service.person_repo, "get_by_creator", return_value=[person]
+            service.person_repo,
+            "get_by_creator_with_views",
+            return_value=[(person, 0)],
         ), patch(
-            "app.services.person.person_service.ProfileViewTrackingService"
-        ) as mock_view_service_class, patch(
             "app.services.person.person_service.PersonAddressRepository"
         ) as mock_address_repo_class:
             # Setup mocks
-            mock_view_service = MagicMock()
-            mock_view_service.get_total_views_bulk.return_value = {}
-            mock_view_service_class.return_value = mock_view_service
-
             mock_address_repo = MagicMock()
-            mock_address_repo.get_by_person_id.return_value = []
+            mock_address_repo.get_by_person_ids_with_names.return_value = []
             mock_address_repo_class.return_value = mock_address_repo
 
             # Get contributions
@@ -186,19 +182,15 @@ class TestDateRangeFormattingLiving:
 
         # Mock dependencies
         with patch.object(
-            service.person_repo, "get_by_creator", return_value=[person]
+            service.person_repo,
+            "get_by_creator_with_views",
+            return_value=[(person, 0)],
         ), patch(
-            "app.services.person.person_service.ProfileViewTrackingService"
-        ) as mock_view_service_class, patch(
             "app.services.person.person_service.PersonAddressRepository"
         ) as mock_address_repo_class:
             # Setup mocks
-            mock_view_service = MagicMock()
-            mock_view_service.get_total_views_bulk.return_value = {}
-            mock_view_service_class.return_value = mock_view_service
-
             mock_address_repo = MagicMock()
-            mock_address_repo.get_by_person_id.return_value = []
+            mock_address_repo.get_by_person_ids_with_names.return_value = []
             mock_address_repo_class.return_value = mock_address_repo
 
             # Get contributions
@@ -257,19 +249,15 @@ class TestDateRangeFormattingDeceased:
 
         # Mock dependencies
         with patch.object(
-            service.person_repo, "get_by_creator", return_value=[person]
+            service.person_repo,
+            "get_by_creator_with_views",
+            return_value=[(person, 0)],
         ), patch(
-            "app.services.person.person_service.ProfileViewTrackingService"
-        ) as mock_view_service_class, patch(
             "app.services.person.person_service.PersonAddressRepository"
         ) as mock_address_repo_class:
             # Setup mocks
-            mock_view_service = MagicMock()
-            mock_view_service.get_total_views_bulk.return_value = {}
-            mock_view_service_class.return_value = mock_view_service
-
             mock_address_repo = MagicMock()
-            mock_address_repo.get_by_person_id.return_value = []
+            mock_address_repo.get_by_person_ids_with_names.return_value = []
             mock_address_repo_class.return_value = mock_address_repo
 
             # Get contributions
@@ -331,21 +319,24 @@ class TestContributionsSorting:
             persons.append(person)
             view_count_map[person_id] = view_count
 
+        # The repository returns persons sorted by views, as the database does
+        persons_with_views = sorted(
+            ((p, view_count_map[p.id]) for p in persons),
+            key=lambda pair: pair[1],
+            reverse=True,
+        )
+
         # Mock dependencies
         with patch.object(
-            service.person_repo, "get_by_creator", return_value=persons
+            service.person_repo,
+            "get_by_creator_with_views",
+            return_value=persons_with_views,
         ), patch(
-            "app.services.person.person_service.ProfileViewTrackingService"
-        ) as mock_view_service_class, patch(
             "app.services.person.person_service.PersonAddressRepository"
         ) as mock_address_repo_class:
             # Setup mocks
-            mock_view_service = MagicMock()
-            mock_view_service.get_total_views_bulk.return_value = view_count_map
-            mock_view_service_class.return_value = mock_view_service
-
             mock_address_repo = MagicMock()
-            mock_address_repo.get_by_person_id.return_value = []
+            mock_address_repo.get_by_person_ids_with_names.return_value = []
             mock_address_repo_class.return_value = mock_address_repo
 
             # Get contributions
@@ -8,26 +8,34 @@ Tests cover:
 """
 
 import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import date
 from unittest.mock import MagicMock, patch
 
 import pytest
 from fastapi import HTTPException
-from sqlmodel import Session
+from sqlmodel import Session, select
 
+from app.db_models.address.district import District
+from app.db_models.address.locality import Locality
+from app.db_models.address.state import State
+from app.db_models.address.sub_district import SubDistrict
 from app.db_models.person.person import Person
 from app.db_models.person.person_address import PersonAddress
 from app.db_models.person.person_relationship import PersonRelationship
+from app.enums import GenderEnum
+from app.models import User
 from app.schemas.relatives_network import (
-    RelativeInfo,
     RelativesNetworkRequest,
     RelativesNetworkResponse,
 )
+from app.services.person.person_enrichment_service import PersonDisplayRecord
 from app.services.relatives_network.relatives_network_service import (
     MAX_RESULTS,
     RelativesNetworkService,
 )
-
+from tests.factories import PersonFactory
 
 # =============================================================================
 # Helper Functions for Test Data Setup
@@ -54,25 +62,22 @@ def create_mock_person(
     return mock_person
 
 
-def create_mock_address(
-    person_id: uuid.UUID,
-    country_id: uuid.UUID | None = None,
-    state_id: uuid.UUID | None = None,
-    district_id: uuid.UUID | None = None,
-    sub_district_id: uuid.UUID | None = None,
-    locality_id: uuid.UUID | None = None,
-    is_current: bool = True,
-) -> MagicMock:
-    """Create a mock PersonAddress object for testing."""
-    mock_address = MagicMock(spec=PersonAddress)
-    mock_address.person_id = person_id
-    mock_address.country_id = country_id or uuid.uuid4()
-    mock_address.state_id = state_id or uuid.uuid4()
-    mock_address.district_id = district_id or uuid.uuid4()
-    mock_address.sub_district_id = sub_district_id or uuid.uuid4()
-    mock_address.locality_id = locality_id
-    mock_address.is_current = is_current
-    return mock_address
+def create_display_record(
+    person: MagicMock,
+    district_name: str | None = None,
+    locality_name: str | None = None,
+) -> PersonDisplayRecord:
+    """Create the display record the enrichment service returns for a person."""
+    return PersonDisplayRecord(
+        person_id=person.id,
+        first_name=person.first_name,
+        last_name=person.last_name,
+        gender_id=person.gender_id,
+        birth_year=person.date_of_birth.year,
+        death_year=person.date_of_death.year if person.date_of_death else None,
+        district_name=district_name,
+        locality_name=locality_name,
+    )
 
 
 def create_mock_relationship(
@@ -88,11 +93,77 @@ def create_mock_relationship(
     return mock_rel
 
 
+def as_batch(
+    get_relationships: Callable[[uuid.UUID], list[uuid.UUID]],
+) -> Callable[[list[uuid.UUID]], dict[uuid.UUID, list[uuid.UUID]]]:
+    """Adapt a per-person relationship lookup to the batched frontier lookup."""
+
+    def get_relationships_batch(
+        person_ids: list[uuid.UUID],
+    ) -> dict[uuid.UUID, list[uuid.UUID]]:
+        return {pid: get_relationships(pid) for pid in person_ids}
+
+    return get_relationships_batch
+
+
+@dataclass
+class SeededAddress:
+    """IDs of one complete address hierarchy from the seeded metadata."""
+
+    country_id: uuid.UUID
+    state_id: uuid.UUID
+    district_id: uuid.UUID
+    sub_district_id: uuid.UUID
+    locality_id: uuid.UUID
+
+
+def add_current_address(
+    db: Session,
+    person_id: uuid.UUID,
+    address: SeededAddress,
+    is_current: bool = True,
+) -> None:
+    """Save an address for a person using a seeded address hierarchy."""
+    db.add(
+        PersonAddress(
+            person_id=person_id,
+            country_id=address.country_id,
+            state_id=address.state_id,
+            district_id=address.district_id,
+            sub_district_id=address.sub_district_id,
+            locality_id=address.locality_id,
+            start_date=date(2020, 1, 1),
+            is_current=is_current,
+        )
+    )
+    db.commit()
+
+
 # =============================================================================
 # Test Fixtures
 # =============================================================================
 
 
+@pytest.fixture
+def seeded_address(db: Session) -> SeededAddress:
+    """Pick a locality and its parents from the seeded address metadata."""
+    row = db.exec(
+        select(
+            State.country_id,
+            State.id,
+            District.id,
+            SubDistrict.id,
+            Locality.id,
+        )
+        .join(SubDistrict, SubDistrict.id == Locality.sub_district_id)
+        .join(District, District.id == SubDistrict.district_id)
+        .join(State, State.id == District.state_id)
+    ).first()
+    if row is None:
+        pytest.skip("Address metadata is not seeded")
+    return SeededAddress(*row)
+
+
 @pytest.fixture
 def mock_session() -> MagicMock:
     """Create a mock database session."""
@@ -145,7 +216,9 @@ class TestBFSTraversal:
         """Test that BFS returns starting person at depth 0."""
         person_id = uuid.uuid4()
 
-        with patch.object(service, "_get_relationships", return_value=[]):
+        with patch.object(
+            service.graph_traversal, "get_relationships_batch", return_value={}
+        ):
             result = service._bfs_traverse(person_id, max_depth=3)
 
         assert person_id in result
@@ -164,7 +237,9 @@ class TestBFSTraversal:
             return []
 
         with patch.object(
-            service, "_get_relationships", side_effect=mock_get_relationships
+            service.graph_traversal,
+            "get_relationships_batch",
+            side_effect=as_batch(mock_get_relationships),
         ):
             result = service._bfs_traverse(person_id, max_depth=3)
 
@@ -190,7 +265,9 @@ class TestBFSTraversal:
             return []
 
         with patch.object(
-            service, "_get_relationships", side_effect=mock_get_relationships
+            service.graph_traversal,
+            "get_relationships_batch",
+            side_effect=as_batch(mock_get_relationships),
         ):
             result = service._bfs_traverse(person_id, max_depth=3)
 
@@ -218,7 +295,9 @@ class TestBFSTraversal:
             return []
 
         with patch.object(
-            service, "_get_relationships", side_effect=mock_get_relationships
+            service.graph_traversal,
+            "get_relationships_batch",
+            side_effect=as_batch(mock_get_relationships),
         ):
             result = service._bfs_traverse(person_id, max_depth=2)
 
@@ -243,7 +322,9 @@ class TestBFSTraversal:
             return []
 
         with patch.object(
-            service, "_get_relationships", side_effect=mock_get_relationships
+            service.graph_traversal,
+            "get_relationships_batch",
+            side_effect=as_batch(mock_get_relationships),
         ):
             result = service._bfs_traverse(person_id, max_depth=5)
 
@@ -253,6 +334,36 @@ class TestBFSTraversal:
         assert result[relative_id] == 1
 
 
+    def test_bfs_traverse_expands_each_level_in_one_batch(
+        self, service: RelativesNetworkService
+    ) -> None:
+        """Test that BFS issues one batched lookup per depth level."""
+        person_id = uuid.uuid4()
+        children = [uuid.uuid4() for _ in range(3)]
+        grandchildren = [uuid.uuid4() for _ in range(6)]
+
+        def mock_get_relationships(pid: uuid.UUID) -> list[uuid.UUID]:
+            if pid == person_id:
+                return children
+            if pid in children:
+                index = children.index(pid)
+                return [person_id, *grandchildren[index * 2 : index * 2 + 2]]
+            return []
+
+        with patch.object(
+            service.graph_traversal,
+            "get_relationships_batch",
+            side_effect=as_batch(mock_get_relationships),
+        ) as mock_batch:
+            result = service._bfs_traverse(person_id, max_depth=3)
+
+        assert mock_batch.call_count == 3
+        assert mock_batch.call_args_list[0].args[0] == [person_id]
+        assert mock_batch.call_args_list[1].args[0] == children
+        assert mock_batch.call_args_list[2].args[0] == grandchildren
+        assert list(result) == [person_id, *children, *grandchildren]
+        assert all(result[gid] == 2 for gid in grandchildren)
+
 
 @pytest.mark.unit
 class TestDepthCapping:
@@ -359,23 +470,20 @@ class TestDepthModes:
         assert len(result) == 0
 
 
-@pytest.mark.unit
+@pytest.mark.integration
 class TestLivingOnlyFilter:
     """Tests for living_only filter.
-    
+
     Validates: Requirements 3.6
     """
 
     def test_living_only_excludes_deceased(
-        self, service: RelativesNetworkService
+        self, db: Session, test_user: User
     ) -> None:
         """Test living_only filter excludes persons with date_of_death."""
-        living_id = uuid.uuid4()
-        deceased_id = uuid.uuid4()
-
-        living_person = create_mock_person(living_id, date_of_death=None)
-        deceased_person = create_mock_person(
-            deceased_id, date_of_death=date(2020, 1, 1)
+        living = PersonFactory.create(db, created_by_user=test_user)
+        deceased = PersonFactory.create(
+            db, created_by_user=test_user, date_of_death=date(2020, 1, 1)
         )
 
         request = RelativesNetworkRequest(
@@ -383,30 +491,19 @@ class TestLivingOnlyFilter:
             living_only=True,
         )
 
-        def mock_get_person(pid: uuid.UUID) -> MagicMock | None:
-            if pid == living_id:
-                return living_person
-            elif pid == deceased_id:
-                return deceased_person
-            return None
-
-        with patch.object(service, "_get_person", side_effect=mock_get_person):
-            with patch.object(service, "_matches_address_filters", return_value=True):
-                result = service._apply_filters([living_id, deceased_id], request)
+        result = RelativesNetworkService(db)._apply_filters(
+            [living.id, deceased.id], request
+        )
 
-        assert living_id in result
-        assert deceased_id not in result
+        assert result == [living.id]
 
     def test_living_only_false_includes_deceased(
-        self, service: RelativesNetworkService
+        self, db: Session, test_user: User
     ) -> None:
         """Test living_only=False includes deceased persons."""
-        living_id = uuid.uuid4()
-        deceased_id = uuid.uuid4()
-
-        living_person = create_mock_person(living_id, date_of_death=None)
-        deceased_person = create_mock_person(
-            deceased_id, date_of_death=date(2020, 1, 1)
+        living = PersonFactory.create(db, created_by_user=test_user)
+        deceased = PersonFactory.create(
+            db, created_by_user=test_user, date_of_death=date(2020, 1, 1)
         )
 
         request = RelativesNetworkRequest(
@@ -414,70 +511,53 @@ class TestLivingOnlyFilter:
             living_only=False,
         )
 
-        def mock_get_person(pid: uuid.UUID) -> MagicMock | None:
-            if pid == living_id:
-                return living_person
-            elif pid == deceased_id:
-                return deceased_person
-            return None
-
-        with patch.object(service, "_get_person", side_effect=mock_get_person):
-            with patch.object(service, "_matches_address_filters", return_value=True):
-                result = service._apply_filters([living_id, deceased_id], request)
+        result = RelativesNetworkService(db)._apply_filters(
+            [living.id, deceased.id], request
+        )
 
-        assert living_id in result
-        assert deceased_id in result
+        assert result == [living.id, deceased.id]
 
 
-@pytest.mark.unit
+@pytest.mark.integration
 class TestGenderFilter:
     """Tests for gender filter.
-    
+
     Validates: Requirements 3.7
     """
 
     def test_gender_filter_matches_gender_id(
-        self, service: RelativesNetworkService
+        self, db: Session, test_user: User
     ) -> None:
         """Test gender filter only returns matching gender."""
-        male_gender_id = uuid.uuid4()
-        female_gender_id = uuid.uuid4()
-
-        male_id = uuid.uuid4()
-        female_id = uuid.uuid4()
-
-        male_person = create_mock_person(male_id, gender_id=male_gender_id)
-        female_person = create_mock_person(female_id, gender_id=female_gender_id)
+        male = PersonFactory.create(
+            db, created_by_user=test_user, gender=GenderEnum.MALE
+        )
+        female = PersonFactory.create(
+            db, created_by_user=test_user, gender=GenderEnum.FEMALE
+        )
 
         request = RelativesNetworkRequest(
             person_id=uuid.uuid4(),
-            gender_id=male_gender_id,
+            gender_id=male.gender_id,
             living_only=False,
         )
 
-        def mock_get_person(pid: uuid.UUID) -> MagicMock | None:
-            if pid == male_id:
-                return male_person
-            elif pid == female_id:
-                return female_person
-            return None
-
-        with patch.object(service, "_get_person", side_effect=mock_get_person):
-            with patch.object(service, "_matches_address_filters", return_value=True):
-                result = service._apply_filters([male_id, female_id], request)
+        result = RelativesNetworkService(db)._apply_filters(
+            [male.id, female.id], request
+        )
 
-        assert male_id in result
-        assert female_id not in result
+        assert result == [male.id]
 
     def test_no_gender_filter_returns_all(
-        self, service: RelativesNetworkService
+        self, db: Session, test_user: User
     ) -> None:
         """Test no gender filter returns all genders."""
-        male_id = uuid.uuid4()
-        female_id = uuid.uuid4()
-
-        male_person = create_mock_person(male_id, gender_id=uuid.uuid4())
-        female_person = create_mock_person(female_id, gender_id=uuid.uuid4())
+        male = PersonFactory.create(
+            db, created_by_user=test_user, gender=GenderEnum.MALE
+        )
+        female = PersonFactory.create(
+            db, created_by_user=test_user, gender=GenderEnum.FEMALE
+        )
 
         request = RelativesNetworkRequest(
             person_id=uuid.uuid4(),
@@ -485,148 +565,105 @@ class TestGenderFilter:
             living_only=False,
         )
 
-        def mock_get_person(pid: uuid.UUID) -> MagicMock | None:
-            if pid == male_id:
-                return male_person
-            elif pid == female_id:
-                return female_person
-            return None
-
-        with patch.object(service, "_get_person", side_effect=mock_get_person):
-            with patch.object(service, "_matches_address_filters", return_value=True):
-                result = service._apply_filters([male_id, female_id], request)
-
-        assert male_id in result
-        assert female_id in result
+        result = RelativesNetworkService(db)._apply_filters(
+            [male.id, female.id], request
+        )
 
+        assert result == [male.id, female.id]
 
 
-@pytest.mark.unit
+@pytest.mark.integration
 class TestAddressFilters:
     """Tests for address hierarchy filters.
-    
+
     Validates: Requirements 3.8
     """
 
-    def test_matches_address_filters_no_filters_returns_true(
-        self, service: RelativesNetworkService
-    ) -> None:
-        """Test that no address filters matches all persons."""
-        person_id = uuid.uuid4()
-        request = RelativesNetworkRequest(
-            person_id=uuid.uuid4(),
-            country_id=None,
-            state_id=None,
-            district_id=None,
-            sub_district_id=None,
-            locality_id=None,
-        )
-
-        result = service._matches_address_filters(person_id, request)
-
-        assert result is True
-
-    def test_matches_address_filters_country_match(
-        self, service: RelativesNetworkService, mock_session: MagicMock
+    def test_no_address_filters_returns_all(
+        self, db: Session, test_user: User, seeded_address: SeededAddress
     ) -> None:
-        """Test country filter matches correctly."""
-        person_id = uuid.uuid4()
-        country_id = uuid.uuid4()
+        """Test that no address filters matches persons without an address."""
+        with_address = PersonFactory.create(db, created_by_user=test_user)
+        without_address = PersonFactory.create(db, created_by_user=test_user)
+        add_current_address(db, with_address.id, seeded_address)
 
-        mock_address = create_mock_address(person_id, country_id=country_id)
-        mock_session.exec.return_value.first.return_value = mock_address
+        request = RelativesNetworkRequest(person_id=uuid.uuid4())
 
-        request = RelativesNetworkRequest(
-            person_id=uuid.uuid4(),
-            country_id=country_id,
+        result = RelativesNetworkService(db)._apply_filters(
+            [with_address.id, without_address.id], request
         )
 
-        result = service._matches_address_filters(person_id, request)
-
-        assert result is True
+        assert result == [with_address.id, without_address.id]
 
-    def test_matches_address_filters_country_mismatch(
-        self, service: RelativesNetworkService, mock_session: MagicMock
+    def test_country_filter_match_and_mismatch(
+        self, db: Session, test_user: User, seeded_address: SeededAddress
     ) -> None:
-        """Test country filter rejects mismatched country."""
-        person_id = uuid.uuid4()
-        person_country_id = uuid.uuid4()
-        filter_country_id = uuid.uuid4()
-
-        mock_address = create_mock_address(person_id, country_id=person_country_id)
-        mock_session.exec.return_value.first.return_value = mock_address
+        """Test country filter keeps matches and rejects other countries."""
+        person = PersonFactory.create(db, created_by_user=test_user)
+        add_current_address(db, person.id, seeded_address)
+        service = RelativesNetworkService(db)
 
-        request = RelativesNetworkRequest(
-            person_id=uuid.uuid4(),
-            country_id=filter_country_id,
+        matching = RelativesNetworkRequest(
+            person_id=uuid.uuid4(), country_id=seeded_address.country_id
+        )
+        mismatched = RelativesNetworkRequest(
+            person_id=uuid.uuid4(), country_id=uuid.uuid4()
         )
 
-        result = service._matches_address_filters(person_id, request)
-
-        assert result is False
+        assert service._apply_filters([person.id], matching) == [person.id]
+        assert service._apply_filters([person.id], mismatched) == []
 
-    def test_matches_address_filters_no_address_returns_false(
-        self, service: RelativesNetworkService, mock_session: MagicMock
+    def test_no_current_address_fails_address_filter(
+        self, db: Session, test_user: User, seeded_address: SeededAddress
     ) -> None:
-        """Test that person without address fails address filter."""
-        person_id = uuid.uuid4()
-        mock_session.exec.return_value.first.return_value = None
+        """Test that persons without a current address fail address filters."""
+        no_address = PersonFactory.create(db, created_by_user=test_user)
+        past_address = PersonFactory.create(db, created_by_user=test_user)
+        add_current_address(db, past_address.id, seeded_address, is_current=False)
 
         request = RelativesNetworkRequest(
-            person_id=uuid.uuid4(),
-            country_id=uuid.uuid4(),
+            person_id=uuid.uuid4(), country_id=seeded_address.country_id
         )
 
-        result = service._matches_address_filters(person_id, request)
+        result = RelativesNetworkService(db)._apply_filters(
+            [no_address.id, past_address.id], request
+        )
 
-        assert result is False
+        assert result == []
 
-    def test_matches_address_filters_all_levels(
-        self, service: RelativesNetworkService, mock_session: MagicMock
+    def test_all_levels_must_match(
+        self, db: Session, test_user: User, seeded_address: SeededAddress
     ) -> None:
         """Test all address hierarchy levels match."""
-        person_id = uuid.uuid4()
-        country_id = uuid.uuid4()
-        state_id = uuid.uuid4()
-        district_id = uuid.uuid4()
-        sub_district_id = uuid.uuid4()
-        locality_id = uuid.uuid4()
-
-        mock_address = create_mock_address(
-            person_id,
-            country_id=country_id,
-            state_id=state_id,
-            district_id=district_id,
-            sub_district_id=sub_district_id,
-            locality_id=locality_id,
-        )
-        mock_session.exec.return_value.first.return_value = mock_address
+        person = PersonFactory.create(db, created_by_user=test_user)
+        add_current_address(db, person.id, seeded_address)
+        service = RelativesNetworkService(db)
 
         request = RelativesNetworkRequest(
             person_id=uuid.uuid4(),
-            country_id=country_id,
-            state_id=state_id,
-            district_id=district_id,
-            sub_district_id=sub_district_id,
-            locality_id=locality_id,
+            country_id=seeded_address.country_id,
+            state_id=seeded_address.state_id,
+            district_id=seeded_address.district_id,
+            sub_district_id=seeded_address.sub_district_id,
+            locality_id=seeded_address.locality_id,
         )
+        other_locality = request.model_copy(update={"locality_id": uuid.uuid4()})
 
-        result = service._matches_address_filters(person_id, request)
-
-        assert result is True
+        assert service._apply_filters([person.id], request) == [person.id]
+        assert service._apply_filters([person.id], other_locality) == []
 
 
 @pytest.mark.unit
 class TestResultLimiting:
     """Tests for MAX_RESULTS limiting.
-    
+
     Validates: Requirements 3.9
     """
 
-    def test_results_limited_to_max_results(
+    def test_find_relatives_limits_filter_query(
         self, mock_session: MagicMock
     ) -> None:
-        """Test that results are limited to MAX_RESULTS."""
+        """Test that find_relatives leaves the limit to the filter query."""
         service = RelativesNetworkService(mock_session)
         person_id = uuid.uuid4()
         mock_person = create_mock_person(person_id)
@@ -642,23 +679,58 @@ class TestResultLimiting:
         with patch.object(service, "_get_person", return_value=mock_person):
             with patch.object(service, "_bfs_traverse", return_value=depth_map):
                 with patch.object(
-                    service, "_apply_filters", return_value=relative_ids
-                ):
-                    with patch.object(
-                        service,
-                        "_enrich_relative_info",
-                        side_effect=lambda pid, d: RelativeInfo(
-                            person_id=pid,
-                            first_name="Test",
-                            last_name="Person",
-                            gender_id=uuid.uuid4(),
-                            depth=d,
-                        ),
-                    ):
-                        result = service.find_relatives(request)
+                    service,
+                    "_apply_filters",
+                    return_value=relative_ids[:MAX_RESULTS],
+                ) as mock_apply_filters:
+                    result = service.find_relatives(request)
 
-        assert len(result.relatives) <= MAX_RESULTS
-        assert result.total_count <= MAX_RESULTS
+        mock_apply_filters.assert_called_once_with(relative_ids, request)
+        assert len(result.relatives) == MAX_RESULTS
+        assert result.total_count == MAX_RESULTS
+
+    def test_filter_stops_querying_once_limit_reached(
+        self, service: RelativesNetworkService, mock_session: MagicMock
+    ) -> None:
+        """Test that later candidate chunks are not queried after the limit."""
+        candidate_ids = [uuid.uuid4() for _ in range(5)]
+        mock_session.exec.return_value.all.side_effect = [
+            [candidate_ids[0]],
+            [candidate_ids[1]],
+        ]
+
+        with patch(
+            "app.services.relatives_network.relatives_network_service."
+            "FILTER_CHUNK_SIZE",
+            1,
+        ):
+            result = service._apply_filters(
+                candidate_ids, RelativesNetworkRequest(person_id=uuid.uuid4()), 2
+            )
+
+        assert result == candidate_ids[:2]
+        assert mock_session.exec.call_count == 2
+
+    @pytest.mark.integration
+    def test_limit_applied_in_candidate_order(
+        self, db: Session, test_user: User
+    ) -> None:
+        """Test that the database limit keeps the first matches in BFS order."""
+        persons = [
+            PersonFactory.create(db, created_by_user=test_user) for _ in range(4)
+        ]
+        deceased = PersonFactory.create(
+            db, created_by_user=test_user, date_of_death=date(2020, 1, 1)
+        )
+        candidate_ids = [persons[3].id, deceased.id, persons[1].id, persons[0].id]
+
+        result = RelativesNetworkService(db)._apply_filters(
+            candidate_ids,
+            RelativesNetworkRequest(person_id=uuid.uuid4(), living_only=True),
+            limit=2,
+        )
+
+        assert result == [persons[3].id, persons[1].id]
 
 
 @pytest.mark.unit
@@ -683,11 +755,9 @@ class TestRelativeInfoEnrichment:
             date_of_death=None,
         )
 
-        with patch.object(service, "_get_person", return_value=mock_person):
-            with patch.object(
-                service, "_get_address_names", return_value=(None, None)
-            ):
-                result = service._enrich_relative_info(person_id, depth=2)
+        result = service._enrich_relative_info(
+            person_id, depth=2, record=create_display_record(mock_person)
+        )
 
         assert result.person_id == person_id
         assert result.first_name == "John"
@@ -708,11 +778,9 @@ class TestRelativeInfoEnrichment:
             date_of_death=date(2020, 6, 15),
         )
 
-        with patch.object(service, "_get_person", return_value=mock_person):
-            with patch.object(
-                service, "_get_address_names", return_value=(None, None)
-            ):
-                result = service._enrich_relative_info(person_id, depth=1)
+        result = service._enrich_relative_info(
+            person_id, depth=1, record=create_display_record(mock_person)
+        )
 
         assert result.birth_year == 1950
         assert result.death_year == 2020
@@ -724,13 +792,11 @@ class TestRelativeInfoEnrichment:
         person_id = uuid.uuid4()
         mock_person = create_mock_person(person_id)
 
-        with patch.object(service, "_get_person", return_value=mock_person):
-            with patch.object(
-                service,
-                "_get_address_names",
-                return_value=("Test District", "Test Locality"),
-            ):
-                result = service._enrich_relative_info(person_id, depth=1)
+        record = create_display_record(
+            mock_person, district_name="Test District", locality_name="Test Locality"
+        )
+
+        result = service._enrich_relative_info(person_id, depth=1, record=record)
 
         assert result.district_name == "Test District"
         assert result.locality_name == "Test Locality"
@@ -741,8 +807,7 @@ class TestRelativeInfoEnrichment:
         """Test that enrichment handles missing person gracefully."""
         person_id = uuid.uuid4()
 
-        with patch.object(service, "_get_person", return_value=None):
-            result = service._enrich_relative_info(person_id, depth=1)
+        result = service._enrich_relative_info(person_id, depth=1, record=None)
 
         assert result.person_id == person_id
         assert result.first_name == "Unknown"
@@ -751,50 +816,33 @@ class TestRelativeInfoEnrichment:
 
 
 @pytest.mark.unit
-class TestGetAddressNames:
-    """Tests for _get_address_names helper method."""
-
-    def test_get_address_names_returns_district_and_locality(
-        self, service: RelativesNetworkService, mock_session: MagicMock
-    ) -> None:
-        """Test that address names are retrieved correctly."""
-        person_id = uuid.uuid4()
-        district_id = uuid.uuid4()
-        locality_id = uuid.uuid4()
-
-        mock_address = create_mock_address(
-            person_id, district_id=district_id, locality_id=locality_id
-        )
-
-        mock_district = MagicMock()
-        mock_district.name = "Test District"
-
-        mock_locality = MagicMock()
-        mock_locality.name = "Test Locality"
+class TestEnrichRelatives:
+    """Tests for batched enrichment of the result list."""
 
-        # Setup mock session to return address, then district, then locality
-        mock_session.exec.return_value.first.side_effect = [
-            mock_address,
-            mock_district,
-            mock_locality,
-        ]
-
-        district_name, locality_name = service._get_address_names(person_id)
-
-        assert district_name == "Test District"
-        assert locality_name == "Test Locality"
-
-    def test_get_address_names_no_address_returns_none(
-        self, service: RelativesNetworkService, mock_session: MagicMock
+    def test_enrich_relatives_uses_one_batch_and_keeps_order(
+        self, service: RelativesNetworkService
     ) -> None:
-        """Test that missing address returns None for both names."""
-        person_id = uuid.uuid4()
-        mock_session.exec.return_value.first.return_value = None
+        """Test that all relatives are enriched with a single batched call."""
+        first = create_mock_person(uuid.uuid4(), first_name="First")
+        second = create_mock_person(uuid.uuid4(), first_name="Second")
+        missing_id = uuid.uuid4()
+        records = {
+            first.id: create_display_record(first, district_name="District"),
+            second.id: create_display_record(second),
+        }
+        depth_map = {second.id: 2, first.id: 1, missing_id: 1}
 
-        district_name, locality_name = service._get_address_names(person_id)
+        with patch.object(
+            service.person_enrichment, "get_display_records", return_value=records
+        ) as mock_get_records:
+            result = service._enrich_relatives(
+                [second.id, first.id, missing_id], depth_map
+            )
 
-        assert district_name is None
-        assert locality_name is None
+        mock_get_records.assert_called_once_with([second.id, first.id, missing_id])
+        assert [r.first_name for r in result] == ["Second", "First", "Unknown"]
+        assert [r.depth for r in result] == [2, 1, 1]
+        assert result[1].district_name == "District"
 
 
 @pytest.mark.unit
@@ -826,10 +874,16 @@ class TestFindRelativesIntegration:
         with patch.object(service, "_get_person", side_effect=mock_get_person):
             with patch.object(service, "_bfs_traverse", return_value=depth_map):
                 with patch.object(
-                    service, "_matches_address_filters", return_value=True
+                    service,
+                    "_apply_filters",
+                    side_effect=lambda ids, request: ids,
                 ):
                     with patch.object(
-                        service, "_get_address_names", return_value=(None, None)
+                        service.person_enrichment,
+                        "get_display_records",
+                        return_value={
+                            relative_id: create_display_record(mock_relative)
+                        },
                     ):
                         result = service.find_relatives(request)
 
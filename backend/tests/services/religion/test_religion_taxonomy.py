@@ -0,0 +1,187 @@
+"""Tests for the in-memory ReligionTaxonomy.
+
+Tests cover:
+- Loading the taxonomy and resolving names without queries
+- Precomputed descendant sets
+- Invalidation
+- Invalidation from religion metadata writes
+"""
+
+import uuid
+from collections.abc import Generator
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlmodel import Session
+
+from app.db_models.religion.religion import Religion
+from app.schemas.religion import ReligionUpdate
+from app.services import reference_snapshot as snapshot_module
+from app.services.religion import ReligionService
+from app.services.religion import religion_taxonomy as taxonomy_module
+from app.services.religion.religion_taxonomy import ReligionNames, ReligionTaxonomy
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+
+@pytest.fixture(autouse=True)
+def table_versions() -> Generator[dict[str, int], None, None]:
+    """Reference table change counters, served without the database."""
+    versions: dict[str, int] = {}
+    with patch.object(
+        snapshot_module.get_reference_data_cache(),
+        "get_versions",
+        return_value=versions,
+    ):
+        yield versions
+
+
+@pytest.fixture
+def ids() -> dict[str, uuid.UUID]:
+    """IDs of two religions, three categories and three sub-categories."""
+    return {
+        key: uuid.uuid4()
+        for key in (
+            "hinduism",
+            "islam",
+            "shaiva",
+            "vaishnava",
+            "sunni",
+            "kashyap",
+            "bharadwaj",
+            "hanafi",
+        )
+    }
+
+
+@pytest.fixture
+def loaded_session(ids: dict[str, uuid.UUID]) -> MagicMock:
+    """A session returning the taxonomy rows, in load order."""
+    session = MagicMock(spec=Session)
+    level_rows = [
+        [(ids["hinduism"], "Hinduism"), (ids["islam"], "Islam")],
+        [
+            (ids["shaiva"], "Shaiva", ids["hinduism"]),
+            (ids["vaishnava"], "Vaishnava", ids["hinduism"]),
+            (ids["sunni"], "Sunni", ids["islam"]),
+        ],
+        [
+            (ids["kashyap"], "Kashyap", ids["shaiva"]),
+            (ids["bharadwaj"], "Bharadwaj", ids["vaishnava"]),
+            (ids["hanafi"], "Hanafi", ids["sunni"]),
+        ],
+    ]
+    # Enough rows for two loads
+    session.exec.return_value.all.side_effect = level_rows * 2
+    return session
+
+
+@pytest.fixture
+def taxonomy(loaded_session: MagicMock) -> ReligionTaxonomy:
+    """A taxonomy loaded from the fixture rows."""
+    taxonomy = ReligionTaxonomy()
+    taxonomy.load(loaded_session)
+    return taxonomy
+
+
+# =============================================================================
+# Lookups
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestReligionTaxonomyLookups:
+    """Tests for names, formatting and descendant sets."""
+
+    def test_get_names_resolves_every_level(
+        self, taxonomy: ReligionTaxonomy, ids: dict[str, uuid.UUID]
+    ) -> None:
+        """All three levels are resolved from one load."""
+        names = taxonomy.get_names(ids["hinduism"], ids["shaiva"], ids["kashyap"])
+
+        assert names == ReligionNames(
+            religion="Hinduism", category="Shaiva", sub_category="Kashyap"
+        )
+
+    def test_format_religion_skips_unset_and_unknown_levels(
+        self, taxonomy: ReligionTaxonomy, ids: dict[str, uuid.UUID]
+    ) -> None:
+        """Formatting joins the known levels with ' - '."""
+        assert taxonomy.format_religion(ids["islam"]) == "Islam"
+        assert (
+            taxonomy.format_religion(ids["islam"], ids["sunni"], uuid.uuid4())
+            == "Islam - Sunni"
+        )
+        assert taxonomy.format_religion(uuid.uuid4()) is None
+
+    def test_descendant_sets(
+        self, taxonomy: ReligionTaxonomy, ids: dict[str, uuid.UUID]
+    ) -> None:
+        """Descendant sets cover categories and sub-categories per parent."""
+        assert taxonomy.category_ids_of([ids["hinduism"]]) == {
+            ids["shaiva"],
+            ids["vaishnava"],
+        }
+        assert taxonomy.sub_category_ids_of([ids["shaiva"], ids["sunni"]]) == {
+            ids["kashyap"],
+            ids["hanafi"],
+        }
+        assert taxonomy.sub_category_ids_of_religions([ids["hinduism"]]) == {
+            ids["kashyap"],
+            ids["bharadwaj"],
+        }
+        assert taxonomy.category_ids_of([uuid.uuid4()]) == set()
+
+
+# =============================================================================
+# Staleness and write hooks
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestReligionTaxonomyStaleness:
+    """Tests for invalidation, table changes and the write hooks."""
+
+    def test_invalidate_reloads_on_next_use(self, loaded_session: MagicMock) -> None:
+        """Invalidation triggers one reload on next use."""
+        taxonomy = ReligionTaxonomy()
+        taxonomy.ensure_loaded(loaded_session)
+        taxonomy.ensure_loaded(loaded_session)
+        assert loaded_session.exec.call_count == 3
+
+        taxonomy.invalidate()
+        taxonomy.ensure_loaded(loaded_session)
+
+        assert loaded_session.exec.call_count == 6
+
+    def test_table_change_reloads_on_next_use(
+        self, loaded_session: MagicMock, table_versions: dict[str, int]
+    ) -> None:
+        """A moved change counter, e.g. from another worker, triggers a reload."""
+        taxonomy = ReligionTaxonomy()
+        taxonomy.ensure_loaded(loaded_session)
+
+        table_versions["address_state"] = 1
+        assert not taxonomy.is_stale(loaded_session)
+        table_versions["religion_category"] = 1
+        assert taxonomy.is_stale(loaded_session)
+        taxonomy.ensure_loaded(loaded_session)
+
+        assert loaded_session.exec.call_count == 6
+        assert not taxonomy.is_stale(loaded_session)
+
+    def test_update_religion_invalidates_global_taxonomy(
+        self, taxonomy: ReligionTaxonomy
+    ) -> None:
+        """Updating a religion marks the global taxonomy stale."""
+        religion = Religion(id=uuid.uuid4(), name="Old", code="OLD")
+        service = ReligionService(MagicMock(spec=Session))
+
+        with patch.object(
+            taxonomy_module, "_religion_taxonomy", taxonomy
+        ), patch.object(service.religion_repo, "update", return_value=religion):
+            service.update_religion(religion, ReligionUpdate(name="New"))
+
+        assert taxonomy.is_stale(MagicMock(spec=Session))
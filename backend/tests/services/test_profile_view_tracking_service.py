@@ -1,14 +1,22 @@
 """Unit tests for ProfileViewTrackingService."""
 
+import threading
 import uuid
-from datetime import datetime
-from unittest.mock import MagicMock, patch
+from collections.abc import Generator
+from datetime import datetime, timedelta
+from unittest.mock import patch
 
 import pytest
 from sqlmodel import Session
 
-from app.db_models.profile_view_tracking import ProfileViewTracking
-from app.services.profile_view_tracking_service import ProfileViewTrackingService
+from app.models import User
+from app.services import profile_view_tracking_service
+from app.services.profile_view_tracking_service import (
+    ProfileViewBuffer,
+    ProfileViewTrackingService,
+)
+from tests.factories import PersonFactory
+from tests.test_db import test_engine
 
 
 @pytest.mark.unit
@@ -24,73 +32,29 @@ class TestRecordView:
         person_id = uuid.uuid4()
 
         # Mock the repository to track if it was called
-        with patch.object(service.repo, "get_non_aggregated_view") as mock_get:
+        with patch.object(service.repo, "increment_views") as mock_increment:
             # Record a self-view
             service.record_view(person_id, person_id)
 
             # Verify repository was not called (early return)
-            mock_get.assert_not_called()
+            mock_increment.assert_not_called()
 
-    def test_record_view_first_view_creates_new_record(self, db: Session) -> None:
-        """Test that first view creates a new record with view_count=1.
-        
-        Requirements: 3.6
-        """
-        service = ProfileViewTrackingService(db)
-        viewer_id = uuid.uuid4()
-        viewed_id = uuid.uuid4()
-
-        # Mock repository methods
-        with patch.object(
-            service.repo, "get_non_aggregated_view", return_value=None
-        ) as mock_get, patch.object(service.repo, "create") as mock_create:
-            # Record first view
-            service.record_view(viewer_id, viewed_id)
-
-            # Verify get was called
-            mock_get.assert_called_once_with(viewer_id, viewed_id)
+    def test_record_view_adds_one_view_with_an_upsert(self, db: Session) -> None:
+        """Test that a view is written as a single-view increment of the pair.
 
-            # Verify create was called
-            mock_create.assert_called_once()
-            created_record = mock_create.call_args[0][0]
-            assert created_record.viewer_person_id == viewer_id
-            assert created_record.viewed_person_id == viewed_id
-            assert created_record.view_count == 1
-            assert created_record.is_aggregated is False
-
-    def test_record_view_subsequent_view_increments_count(self, db: Session) -> None:
-        """Test that subsequent views increment the view_count.
-        
-        Requirements: 3.7
+        Requirements: 3.6, 3.7
         """
         service = ProfileViewTrackingService(db)
         viewer_id = uuid.uuid4()
         viewed_id = uuid.uuid4()
 
-        # Create a mock existing record
-        existing_record = ProfileViewTracking(
-            viewer_person_id=viewer_id,
-            viewed_person_id=viewed_id,
-            view_count=1,
-            is_aggregated=False,
-        )
-
-        # Mock repository methods
-        with patch.object(
-            service.repo, "get_non_aggregated_view", return_value=existing_record
-        ) as mock_get, patch.object(service.repo, "update") as mock_update:
-            # Record second view
+        with patch.object(service.repo, "increment_views") as mock_increment:
             service.record_view(viewer_id, viewed_id)
 
-            # Verify get was called
-            mock_get.assert_called_once_with(viewer_id, viewed_id)
-
-            # Verify update was called
-            mock_update.assert_called_once()
-            updated_record = mock_update.call_args[0][0]
-            assert updated_record.view_count == 2
-            assert updated_record.last_viewed_at is not None
-            assert updated_record.updated_at is not None
+            mock_increment.assert_called_once()
+            [(viewer, viewed, views, last_viewed_at)] = mock_increment.call_args[0][0]
+            assert (viewer, viewed, views) == (viewer_id, viewed_id, 1)
+            assert isinstance(last_viewed_at, datetime)
 
     def test_record_view_with_database_error_should_not_raise(
         self, db: Session
@@ -106,15 +70,77 @@ class TestRecordView:
         # Mock the repository to raise an exception
         with patch.object(
             service.repo,
-            "get_non_aggregated_view",
+            "increment_views",
             side_effect=Exception("Database error"),
-        ):
+        ), patch.object(db, "rollback") as mock_rollback:
             # This should not raise an exception
             try:
                 service.record_view(viewer_id, viewed_id)
             except Exception as e:
                 pytest.fail(f"record_view should not raise exception, but raised: {e}")
 
+            # The session is left usable for the rest of the request
+            mock_rollback.assert_called_once()
+
+
+@pytest.mark.integration
+class TestRecordViewConcurrency:
+    """Tests for record_view against the database."""
+
+    def test_repeated_views_increment_one_record(
+        self, db: Session, test_user: User
+    ) -> None:
+        """Test that each view of a pair adds one to the same record."""
+        viewer = PersonFactory.create(db, created_by_user=test_user)
+        viewed = PersonFactory.create(db, created_by_user=test_user)
+        service = ProfileViewTrackingService(db)
+
+        service.record_view(viewer.id, viewed.id)
+        service.record_view(viewer.id, viewed.id)
+
+        record = service.repo.get_non_aggregated_view(viewer.id, viewed.id)
+        assert record is not None
+        db.refresh(record)
+        assert record.view_count == 2
+
+    def test_concurrent_first_views_are_all_counted(
+        self, db: Session, test_user: User
+    ) -> None:
+        """Test that simultaneous first views of a pair neither fail nor get lost."""
+        viewer = PersonFactory.create(db, created_by_user=test_user)
+        viewed = PersonFactory.create(db, created_by_user=test_user)
+        workers = 4
+        views_per_worker = 5
+        barrier = threading.Barrier(workers)
+        errors: list[BaseException] = []
+
+        def record_views() -> None:
+            try:
+                with Session(test_engine) as session:
+                    service = ProfileViewTrackingService(session)
+                    barrier.wait()
+                    for _ in range(views_per_worker):
+                        service.record_view(viewer.id, viewed.id)
+                    # The session must still be usable after the views
+                    session.refresh(session.merge(viewed))
+            except BaseException as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=record_views) for _ in range(workers)]
+        with patch.object(
+            profile_view_tracking_service.logger, "error"
+        ) as mock_error:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert errors == []
+        mock_error.assert_not_called()
+        assert ProfileViewTrackingService(db).get_total_views(viewed.id) == (
+            workers * views_per_worker
+        )
+
 
 @pytest.mark.unit
 class TestGetTotalViews:
@@ -175,3 +201,137 @@ class TestGetTotalViewsBulk:
             assert result == mock_result
             assert result[viewed_id_1] == 2
             assert result[viewed_id_2] == 1
+
+
+@pytest.mark.unit
+class TestRollUpViews:
+    """Tests for roll_up_views method."""
+
+    def test_roll_up_views_runs_batches_until_done(self, db: Session) -> None:
+        """Test that batches are rolled up until one is not full."""
+        service = ProfileViewTrackingService(db)
+
+        with patch.object(
+            service.repo, "roll_up_views", side_effect=[10, 10, 3]
+        ) as mock_roll_up:
+            rolled_up = service.roll_up_views(older_than_days=7, batch_size=10)
+
+        assert rolled_up == 23
+        assert mock_roll_up.call_count == 3
+        older_than, batch_size = mock_roll_up.call_args.args
+        assert batch_size == 10
+        assert datetime.utcnow() - older_than >= timedelta(days=7)
+
+    @pytest.mark.parametrize("batch_size", [0, -1])
+    def test_roll_up_views_rejects_non_positive_batch_size(
+        self, db: Session, batch_size: int
+    ) -> None:
+        """Test that a batch size below one is rejected instead of looping."""
+        service = ProfileViewTrackingService(db)
+
+        with patch.object(service.repo, "roll_up_views") as mock_roll_up:
+            with pytest.raises(ValueError, match="batch_size must be positive"):
+                service.roll_up_views(older_than_days=7, batch_size=batch_size)
+
+        mock_roll_up.assert_not_called()
+
+
+@pytest.fixture
+def view_buffer() -> Generator[ProfileViewBuffer, None, None]:
+    """Install a stopped buffer on the test database as the global buffer."""
+    buffer = ProfileViewBuffer(test_engine, max_pairs=2)
+    with patch.object(profile_view_tracking_service, "_buffer", buffer):
+        yield buffer
+
+
+@pytest.mark.unit
+class TestBufferedRecordView:
+    """Tests for record_view and view totals while the buffer is running."""
+
+    def test_record_view_is_buffered(
+        self, db: Session, view_buffer: ProfileViewBuffer
+    ) -> None:
+        """Test that buffered views skip the database and coalesce per pair."""
+        service = ProfileViewTrackingService(db)
+        viewer_id = uuid.uuid4()
+        viewed_id = uuid.uuid4()
+
+        with patch.object(service.repo, "increment_views") as mock_increment:
+            service.record_view(viewer_id, viewed_id)
+            service.record_view(viewer_id, viewed_id)
+            service.record_view(viewed_id, viewed_id)
+
+            mock_increment.assert_not_called()
+        assert view_buffer.pending_count == 1
+        assert view_buffer.pending_views(viewed_id) == 2
+
+    def test_totals_include_buffered_views(
+        self, db: Session, view_buffer: ProfileViewBuffer
+    ) -> None:
+        """Test that view totals add views not yet flushed."""
+        service = ProfileViewTrackingService(db)
+        viewed_id_1 = uuid.uuid4()
+        viewed_id_2 = uuid.uuid4()
+        view_buffer.add(uuid.uuid4(), viewed_id_1)
+        view_buffer.add(uuid.uuid4(), viewed_id_2)
+
+        with patch.object(
+            service.repo, "get_total_views_for_person", return_value=4
+        ), patch.object(
+            service.repo, "get_total_views_for_persons", return_value={viewed_id_1: 4}
+        ):
+            assert service.get_total_views(viewed_id_1) == 5
+            assert service.get_total_views_bulk([viewed_id_1, viewed_id_2]) == {
+                viewed_id_1: 5,
+                viewed_id_2: 1,
+            }
+
+
+@pytest.mark.integration
+class TestProfileViewBuffer:
+    """Tests for ProfileViewBuffer."""
+
+    def test_flush_writes_coalesced_views(self, db: Session, test_user: User) -> None:
+        """Test that a flush writes each pair once with its view count."""
+        viewer = PersonFactory.create(db, created_by_user=test_user)
+        viewed = PersonFactory.create(db, created_by_user=test_user)
+        buffer = ProfileViewBuffer(test_engine)
+        for _ in range(3):
+            buffer.add(viewer.id, viewed.id)
+
+        assert buffer.flush() == 1
+        assert buffer.pending_count == 0
+        assert buffer.pending_views(viewed.id) == 0
+        assert ProfileViewTrackingService(db).get_total_views(viewed.id) == 3
+
+        buffer.add(viewer.id, viewed.id)
+        buffer.stop()
+
+        assert ProfileViewTrackingService(db).get_total_views(viewed.id) == 4
+
+    def test_failed_flush_keeps_views(self) -> None:
+        """Test that views of a failed flush stay buffered for the next one."""
+        buffer = ProfileViewBuffer(test_engine)
+        viewed_id = uuid.uuid4()
+        buffer.add(uuid.uuid4(), viewed_id)
+
+        with patch(
+            "app.services.profile_view_tracking_service.ProfileViewTrackingRepository"
+        ) as mock_repo_class:
+            mock_repo_class.return_value.increment_views.side_effect = Exception(
+                "Database error"
+            )
+            assert buffer.flush() == 0
+
+        assert buffer.pending_count == 1
+        assert buffer.pending_views(viewed_id) == 1
+
+    def test_full_buffer_wakes_flush_thread(self) -> None:
+        """Test that reaching max_pairs triggers an early flush."""
+        buffer = ProfileViewBuffer(test_engine, max_pairs=2)
+
+        buffer.add(uuid.uuid4(), uuid.uuid4())
+        assert not buffer._wakeup.is_set()
+
+        buffer.add(uuid.uuid4(), uuid.uuid4())
+        assert buffer._wakeup.is_set()
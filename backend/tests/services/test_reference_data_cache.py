@@ -0,0 +1,240 @@
+"""Tests for the ReferenceDataCache and conditional GET responses.
+
+Tests cover:
+- Cache hits without calling the loader
+- Rebuilding after a table change counter moves
+- Version check interval and expiry
+- LRU eviction
+- ETag matching and 304 responses
+- Gzip-compressed bodies
+"""
+
+import gzip
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlmodel import Session
+
+from app.services import reference_data_cache as cache_module
+from app.services.reference_data_cache import ReferenceDataCache
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def mock_session() -> MagicMock:
+    """A session returning the change counters of two tables."""
+    session = MagicMock(spec=Session)
+    session.exec.return_value.all.return_value = [
+        ("address_country", 1),
+        ("address_state", 4),
+    ]
+    return session
+
+
+def make_request(
+    if_none_match: str | None = None, accept_encoding: str | None = None
+) -> MagicMock:
+    """Create a request with optional If-None-Match and Accept-Encoding."""
+    request = MagicMock()
+    request.headers = {}
+    if if_none_match:
+        request.headers["if-none-match"] = if_none_match
+    if accept_encoding:
+        request.headers["accept-encoding"] = accept_encoding
+    return request
+
+
+# =============================================================================
+# ReferenceDataCache
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestReferenceDataCache:
+    """Tests for cache keys, version checks and eviction."""
+
+    def test_hit_does_not_call_loader(self, mock_session: MagicMock) -> None:
+        """The second request for a collection is served from the cache."""
+        cache = ReferenceDataCache()
+        loader = MagicMock(return_value=[{"name": "India"}])
+
+        first = cache.get_response(
+            mock_session, "address:countries", ("address_country",), loader
+        )
+        second = cache.get_response(
+            mock_session, "address:countries", ("address_country",), loader
+        )
+
+        assert first is second
+        assert first.body == b'[{"name":"India"}]'
+        assert first.etag.startswith('"1-')
+        loader.assert_called_once()
+
+    def test_version_change_rebuilds(self, mock_session: MagicMock) -> None:
+        """A moved change counter gives a new key and a new ETag."""
+        cache = ReferenceDataCache()
+        loader = MagicMock(return_value=[])
+        tables = ("address_country", "address_state")
+
+        first = cache.get_response(mock_session, "address:states:x", tables, loader)
+        mock_session.exec.return_value.all.return_value = [
+            ("address_country", 1),
+            ("address_state", 5),
+        ]
+        cache.expire_versions()
+        second = cache.get_response(mock_session, "address:states:x", tables, loader)
+
+        assert first.etag != second.etag
+        assert second.etag.startswith('"1.5-')
+        assert loader.call_count == 2
+
+    def test_versions_are_reread_only_after_interval(
+        self, mock_session: MagicMock
+    ) -> None:
+        """Within the check interval the counters are not re-read."""
+        cache = ReferenceDataCache()
+
+        with patch.object(
+            cache_module.settings, "REFERENCE_DATA_VERSION_CHECK_SECONDS", 60
+        ):
+            cache.get_versions(mock_session)
+            cache.get_versions(mock_session)
+            assert mock_session.exec.call_count == 1
+
+            cache.expire_versions()
+            cache.get_versions(mock_session)
+            assert mock_session.exec.call_count == 2
+
+    def test_evicts_least_recently_used(self, mock_session: MagicMock) -> None:
+        """Only max_entries responses are kept."""
+        cache = ReferenceDataCache(max_entries=2)
+        loader = MagicMock(return_value=[])
+
+        for collection in ("a", "b", "a", "c"):
+            cache.get_response(mock_session, collection, (), loader)
+
+        assert list(cache._responses) == ["a@", "c@"]
+
+
+# =============================================================================
+# Conditional GET
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestReferenceDataResponse:
+    """Tests for ETag matching and 304 responses."""
+
+    @pytest.mark.parametrize(
+        ("if_none_match", "expected"),
+        [
+            (None, False),
+            ('"1-abc"', True),
+            ('W/"1-abc"', True),
+            ('"0-old", "1-abc"', True),
+            ("*", True),
+            ('"0-old"', False),
+        ],
+    )
+    def test_etag_matches(self, if_none_match: str | None, expected: bool) -> None:
+        """If-None-Match uses weak comparison and supports lists and '*'."""
+        assert cache_module._etag_matches(if_none_match, '"1-abc"') is expected
+
+    def test_not_modified_when_etag_matches(self, mock_session: MagicMock) -> None:
+        """A matching If-None-Match gives an empty 304 with the same ETag."""
+        cache = ReferenceDataCache()
+        loader = MagicMock(return_value=[{"name": "India"}])
+
+        with patch.object(cache_module, "_reference_data_cache", cache):
+            full = cache_module.reference_data_response(
+                make_request(), mock_session, "countries", ("address_country",), loader
+            )
+            not_modified = cache_module.reference_data_response(
+                make_request(full.headers["etag"]),
+                mock_session,
+                "countries",
+                ("address_country",),
+                loader,
+            )
+
+        assert full.status_code == 200
+        assert full.body == b'[{"name":"India"}]'
+        assert "must-revalidate" in full.headers["cache-control"]
+        assert not_modified.status_code == 304
+        assert not_modified.body == b""
+        assert not_modified.headers["etag"] == full.headers["etag"]
+        loader.assert_called_once()
+
+
+# =============================================================================
+# Compression
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestReferenceDataCompression:
+    """Tests for gzip-compressed reference data responses."""
+
+    @pytest.fixture
+    def loader(self) -> MagicMock:
+        """A loader returning a body well above the compression threshold."""
+        return MagicMock(return_value=[{"name": f"Locality {i}"} for i in range(200)])
+
+    @pytest.mark.parametrize(
+        ("accept_encoding", "expected"),
+        [
+            (None, False),
+            ("gzip, deflate, br", True),
+            ("br;q=1.0, gzip;q=0.8", True),
+            ("gzip;q=0", False),
+            ("*", True),
+            ("identity", False),
+        ],
+    )
+    def test_accepts_gzip(self, accept_encoding: str | None, expected: bool) -> None:
+        """Accept-Encoding allows gzip unless its quality is zero."""
+        assert cache_module._accepts_gzip(accept_encoding) is expected
+
+    def test_large_body_is_compressed_once(
+        self, mock_session: MagicMock, loader: MagicMock
+    ) -> None:
+        """Large bodies are kept compressed; small ones are not."""
+        cache = ReferenceDataCache()
+
+        large = cache.get_response(mock_session, "large", (), loader)
+        small = cache.get_response(mock_session, "small", (), lambda: [])
+
+        assert large.gzip_body is not None
+        assert gzip.decompress(large.gzip_body) == large.body
+        assert small.gzip_body is None
+
+    def test_gzip_served_only_when_accepted(
+        self, mock_session: MagicMock, loader: MagicMock
+    ) -> None:
+        """The gzip representation has its own ETag and revalidates to 304."""
+        cache = ReferenceDataCache()
+
+        with patch.object(cache_module, "_reference_data_cache", cache):
+            plain = cache_module.reference_data_response(
+                make_request(), mock_session, "large", (), loader
+            )
+            compressed = cache_module.reference_data_response(
+                make_request(accept_encoding="gzip"), mock_session, "large", (), loader
+            )
+            not_modified = cache_module.reference_data_response(
+                make_request(compressed.headers["etag"], "gzip"),
+                mock_session,
+                "large",
+                (),
+                loader,
+            )
+
+        assert "content-encoding" not in plain.headers
+        assert compressed.headers["content-encoding"] == "gzip"
+        assert compressed.headers["vary"] == "Accept-Encoding"
+        assert gzip.decompress(compressed.body) == plain.body
+        assert compressed.headers["etag"] != plain.headers["etag"]
+        assert not_modified.status_code == 304
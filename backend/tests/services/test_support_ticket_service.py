@@ -468,6 +468,55 @@ class TestSupportTicketServiceQueries:
             assert len(tickets) == 1
             assert count == 1
 
+    def test_get_all_support_tickets_admin_includes_user_details(
+        self, mock_session: MagicMock
+    ) -> None:
+        """Test admin listing maps joined creator and resolver details."""
+        # Arrange
+        open_ticket = SupportTicket(
+            id=uuid.uuid4(),
+            user_id=uuid.uuid4(),
+            issue_type=IssueType.BUG.value,
+            title="Open",
+            description="Desc",
+            status=IssueStatus.OPEN.value,
+        )
+        closed_ticket = SupportTicket(
+            id=uuid.uuid4(),
+            user_id=uuid.uuid4(),
+            issue_type=IssueType.BUG.value,
+            title="Closed",
+            description="Desc",
+            status=IssueStatus.CLOSED.value,
+            resolved_by_user_id=uuid.uuid4(),
+        )
+        rows = [
+            (open_ticket, "user@example.com", "User Name", None, None),
+            (closed_ticket, None, None, "admin@example.com", "Admin Name"),
+        ]
+
+        service = SupportTicketService(mock_session)
+        with patch.object(
+            service.support_ticket_repo, "get_all_with_users", return_value=(rows, 42)
+        ) as mock_get_all:
+            # Act
+            tickets, count = service.get_all_support_tickets_admin(
+                status=IssueStatus.OPEN, skip=20, limit=10
+            )
+
+            # Assert
+            mock_get_all.assert_called_once_with(
+                status=IssueStatus.OPEN, issue_type=None, skip=20, limit=10
+            )
+            assert count == 42
+            assert tickets[0].id == open_ticket.id
+            assert tickets[0].user_email == "user@example.com"
+            assert tickets[0].user_full_name == "User Name"
+            assert tickets[0].resolved_by_email is None
+            assert tickets[1].user_email == "Unknown"
+            assert tickets[1].resolved_by_email == "admin@example.com"
+            assert tickets[1].resolved_by_full_name == "Admin Name"
+
 
 @pytest.mark.unit
 class TestSupportTicketServiceUpdate:
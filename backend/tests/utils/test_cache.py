@@ -1,11 +1,24 @@
 """Tests for caching utilities."""
 
+import threading
 import time
 import uuid
+from unittest.mock import patch
 
 import pytest
 
-from app.utils.cache import CacheManager, cached, get_cache_manager, invalidate_discovery_cache
+from app.utils import cache as cache_module
+from app.utils.cache import (
+    CacheManager,
+    add_cache_tags,
+    cached,
+    estimate_size,
+    get_cache_manager,
+    invalidate_discovery_cache,
+    invalidate_person_cache,
+    person_cache_tag,
+    skip_result_caching,
+)
 
 
 class TestCacheManager:
@@ -90,6 +103,167 @@ class TestCacheManager:
         assert cache.get("other:key") == "value3"
 
 
+class TestCacheBounds:
+    """Test LRU eviction, size limits and expiry sweeping."""
+
+    def test_evicts_least_recently_used_entry(self) -> None:
+        """Test that the oldest unused entry is evicted when full."""
+        cache = CacheManager(max_entries=2)
+        cache.set("key1", "value1", ttl_seconds=60)
+        cache.set("key2", "value2", ttl_seconds=60)
+
+        # Reading key1 makes key2 the least recently used
+        cache.get("key1")
+        cache.set("key3", "value3", ttl_seconds=60)
+
+        assert cache.get("key1") == "value1"
+        assert cache.get("key2") is None
+        assert cache.get("key3") == "value3"
+        assert cache.stats()["evictions"] == 1
+
+    def test_evicts_to_stay_within_max_bytes(self) -> None:
+        """Test that the estimated size of all values stays under max_bytes."""
+        value_size = estimate_size("x" * 1000)
+        cache = CacheManager(max_entries=0, max_bytes=value_size * 2)
+
+        for index in range(5):
+            cache.set(f"key{index}", "x" * 1000, ttl_seconds=60)
+
+        assert len(cache) == 2
+        assert cache.stats()["bytes"] <= value_size * 2
+        assert cache.get("key4") is not None
+
+    def test_value_larger_than_max_bytes_is_not_cached(self) -> None:
+        """Test that a single oversized value does not flush the cache."""
+        cache = CacheManager(max_bytes=estimate_size("small") * 2)
+        cache.set("small", "small", ttl_seconds=60)
+
+        cache.set("large", "x" * 10000, ttl_seconds=60)
+
+        assert cache.get("large") is None
+        assert cache.get("small") == "small"
+
+    def test_sweep_removes_expired_entries_that_are_never_read(self) -> None:
+        """Test that writes periodically sweep expired entries."""
+        cache = CacheManager(sweep_interval_seconds=10)
+        with patch.object(cache_module.time, "monotonic", return_value=1000.0):
+            cache._next_sweep_at = 1010.0
+            for index in range(10):
+                cache.set(f"old{index}", "value", ttl_seconds=5)
+
+        with patch.object(cache_module.time, "monotonic", return_value=1011.0):
+            cache.set("new", "value", ttl_seconds=60)
+
+        assert len(cache) == 1
+        assert cache.stats()["expirations"] == 10
+
+    def test_sweep_skips_overwritten_entries(self) -> None:
+        """Test that a key refreshed with a longer TTL survives the sweep."""
+        cache = CacheManager()
+        with patch.object(cache_module.time, "monotonic", return_value=1000.0):
+            cache.set("key", "old", ttl_seconds=5)
+            cache.set("key", "new", ttl_seconds=60)
+
+        with patch.object(cache_module.time, "monotonic", return_value=1010.0):
+            assert cache.sweep_expired() == 0
+            assert cache.get("key") == "new"
+
+
+class TestCacheIndexes:
+    """Test prefix and tag invalidation."""
+
+    def test_invalidate_pattern_within_a_segment(self) -> None:
+        """Test that patterns not ending at a delimiter still match by prefix."""
+        cache = CacheManager()
+        cache.set("discovery:user1", "value1", ttl_seconds=60)
+        cache.set("discovery:user2", "value2", ttl_seconds=60)
+        cache.set("discovery:other", "value3", ttl_seconds=60)
+
+        assert cache.invalidate_pattern("discovery:user") == 2
+        assert cache.get("discovery:other") == "value3"
+
+    def test_invalidate_pattern_without_delimiter(self) -> None:
+        """Test that a pattern without a delimiter matches any key prefix."""
+        cache = CacheManager()
+        cache.set("discovery:user1", "value1", ttl_seconds=60)
+        cache.set("disk", "value2", ttl_seconds=60)
+        cache.set("other:key", "value3", ttl_seconds=60)
+
+        assert cache.invalidate_pattern("dis") == 2
+        assert cache.get("other:key") == "value3"
+
+    def test_invalidate_tags(self) -> None:
+        """Test that only entries carrying the given tags are dropped."""
+        cache = CacheManager()
+        cache.set("key1", "value1", ttl_seconds=60, tags=["person:a"])
+        cache.set("key2", "value2", ttl_seconds=60, tags=["person:a", "person:b"])
+        cache.set("key3", "value3", ttl_seconds=60, tags=["person:c"])
+
+        assert cache.invalidate_tags(["person:b", "person:a"]) == 2
+        assert cache.get("key3") == "value3"
+        assert cache._keys_by_tag == {"person:c": {"key3"}}
+
+    def test_set_skips_values_older_than_an_invalidation(self) -> None:
+        """Test that set drops a value whose tags were invalidated since."""
+        cache = CacheManager()
+        generation = cache.generation()
+        cache.invalidate_tags(["person:a"])
+
+        cache.set("key1", "value1", 60, tags=["person:a"], generation=generation)
+        cache.set("key2", "value2", 60, tags=["person:b"], generation=generation)
+
+        assert cache.get("key1") is None
+        assert cache.get("key2") == "value2"
+
+    def test_removed_entries_leave_no_index_references(self) -> None:
+        """Test that deleted and evicted keys are removed from the indexes."""
+        cache = CacheManager(max_entries=1)
+        cache.set("a:b:c", "value1", ttl_seconds=60, tags=["tag"])
+        cache.set("x:y", "value2", ttl_seconds=60)
+        cache.delete("x:y")
+
+        assert cache._keys_by_prefix == {}
+        assert cache._keys_by_tag == {}
+
+
+class TestCacheStats:
+    """Test cache counters and thread safety."""
+
+    def test_counts_hits_and_misses(self) -> None:
+        """Test hit and miss counters."""
+        cache = CacheManager()
+        cache.set("key", "value", ttl_seconds=60)
+
+        cache.get("key")
+        cache.get("key")
+        cache.get("missing")
+
+        stats = cache.stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+
+    def test_concurrent_access_keeps_bounds(self) -> None:
+        """Test that concurrent writers never exceed max_entries."""
+        cache = CacheManager(max_entries=50)
+
+        def worker(worker_id: int) -> None:
+            for index in range(500):
+                cache.set(f"w{worker_id}:{index}", index, ttl_seconds=60)
+                cache.get(f"w{worker_id}:{index - 1}")
+                cache.invalidate_pattern(f"w{worker_id}:1")
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(cache) <= 50
+        prefix_keys = set().union(*cache._keys_by_prefix.values())
+        assert prefix_keys == set(cache._cache)
+
+
 class TestCachedDecorator:
     """Test the @cached decorator."""
 
@@ -162,6 +336,91 @@ class TestCachedDecorator:
         assert result2 == 10
         assert call_count == 2
 
+    def test_positional_and_keyword_calls_share_a_key(self) -> None:
+        """Test that keys come from bound arguments, not the call style."""
+        call_count = 0
+        test_uuid = uuid.uuid4()
+
+        class Service:
+            @cached(ttl_seconds=60, key_prefix="test")
+            def lookup(self, user_id: uuid.UUID, person_id: uuid.UUID | None = None) -> int:
+                nonlocal call_count
+                call_count += 1
+                return 1
+
+        Service().lookup(test_uuid)
+        Service().lookup(user_id=test_uuid)
+        Service().lookup(test_uuid, person_id=None)
+        assert call_count == 1
+
+        Service().lookup(test_uuid, uuid.uuid4())
+        assert call_count == 2
+
+    def test_declared_tags_invalidate_result(self) -> None:
+        """Test that add_cache_tags ties the result to the given tags."""
+        call_count = 0
+        person_id = uuid.uuid4()
+
+        @cached(ttl_seconds=60, key_prefix="test")
+        def tagged_function(x: int) -> int:
+            nonlocal call_count
+            call_count += 1
+            add_cache_tags(person_cache_tag(person_id))
+            return x * 2
+
+        tagged_function(5)
+        tagged_function(5)
+        assert call_count == 1
+
+        invalidate_person_cache([uuid.uuid4()])
+        tagged_function(5)
+        assert call_count == 1
+
+        invalidate_person_cache([person_id])
+        tagged_function(5)
+        assert call_count == 2
+
+    def test_result_invalidated_during_call_is_not_stored(self) -> None:
+        """Test that a result made stale while it was computed is not cached."""
+        call_count = 0
+        person_id = uuid.uuid4()
+
+        @cached(ttl_seconds=60, key_prefix="test")
+        def stale_function(x: int) -> int:
+            nonlocal call_count
+            call_count += 1
+            add_cache_tags(person_cache_tag(person_id))
+            # Stands in for a relationship write committed during the call
+            invalidate_person_cache([uuid.uuid4()])
+            if call_count == 1:
+                invalidate_person_cache([person_id])
+            return x * 2
+
+        stale_function(5)
+        stale_function(5)
+        stale_function(5)
+        assert call_count == 2
+
+    def test_skip_result_caching(self) -> None:
+        """Test that skip_result_caching keeps the result out of the cache."""
+        call_count = 0
+
+        @cached(ttl_seconds=60, key_prefix="test")
+        def uncacheable_function(x: int) -> int:
+            nonlocal call_count
+            call_count += 1
+            skip_result_caching()
+            return x * 2
+
+        uncacheable_function(5)
+        uncacheable_function(5)
+        assert call_count == 2
+
+    def test_tag_helpers_outside_cached_call_do_nothing(self) -> None:
+        """Test that the helpers are safe to call without @cached."""
+        add_cache_tags("tag")
+        skip_result_caching()
+
 
 class TestInvalidateDiscoveryCache:
     """Test discovery cache invalidation."""
@@ -183,3 +442,19 @@ class TestInvalidateDiscoveryCache:
         
         # Should be gone
         assert cache.get(cache_key) is None
+
+    def test_invalidates_entries_for_requested_persons(self) -> None:
+        """Test that discoveries requested with person_id are invalidated too."""
+        cache = get_cache_manager()
+        user_id = uuid.uuid4()
+        own_key = f"discovery:discover_family_members:{user_id}:None"
+        person_key = f"discovery:discover_family_members:{user_id}:{uuid.uuid4()}"
+        other_key = f"discovery:discover_family_members:{uuid.uuid4()}:None"
+        for key in (own_key, person_key, other_key):
+            cache.set(key, ["result"], ttl_seconds=60)
+
+        invalidate_discovery_cache(user_id)
+
+        assert cache.get(own_key) is None
+        assert cache.get(person_key) is None
+        assert cache.get(other_key) is not None
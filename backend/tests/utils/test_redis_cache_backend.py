@@ -0,0 +1,442 @@
+"""Tests for the Redis cache backend.
+
+Tests run against a small in-process stand-in that implements the Redis
+commands the backend uses, with Redis semantics for TTLs and SCAN MATCH.
+"""
+
+import re
+import time
+import uuid
+from datetime import date
+from typing import Any
+
+import pytest
+
+from app.schemas.person.person_discovery import PersonDiscoveryResult
+from app.utils import cache as cache_module
+from app.utils.cache import (
+    CacheBackend,
+    CacheManager,
+    RedisCacheBackend,
+    add_cache_tags,
+    cached,
+    deserialize_value,
+    person_cache_tag,
+    serialize_value,
+)
+
+# =============================================================================
+# In-process Redis stand-in
+# =============================================================================
+
+# InMemoryRedis.set shadows the builtin inside the class body
+Members = set[bytes]
+
+
+def _glob_to_regex(pattern: str) -> re.Pattern[bytes]:
+    """Translate a Redis glob pattern, honouring backslash escapes."""
+    parts = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == "\\" and index + 1 < len(pattern):
+            index += 1
+            parts.append(re.escape(pattern[index]))
+        elif char == "*":
+            parts.append(".*")
+        elif char == "?":
+            parts.append(".")
+        else:
+            parts.append(re.escape(char))
+        index += 1
+    return re.compile(f"^{''.join(parts)}$".encode(), re.DOTALL)
+
+
+class InMemoryRedis:
+    """Subset of the redis.Redis client API backed by dictionaries."""
+
+    def __init__(self) -> None:
+        self.values: dict[bytes, bytes] = {}
+        self.sets: dict[bytes, set[bytes]] = {}
+        self.expires_at: dict[bytes, float] = {}
+        self.fail = False
+
+    def get(self, name: str) -> bytes | None:
+        self._check()
+        key = self._live(name)
+        return self.values.get(key) if key is not None else None
+
+    def set(self, name: str, value: bytes | int, ex: int | None = None) -> bool:
+        self._check()
+        key = name.encode()
+        self.sets.pop(key, None)
+        self.values[key] = str(value).encode() if isinstance(value, int) else value
+        self.expires_at.pop(key, None)
+        if ex is not None:
+            self.expires_at[key] = time.monotonic() + ex
+        return True
+
+    def mget(self, names: list[str]) -> list[bytes | None]:
+        return [self.get(name) for name in names]
+
+    def incr(self, name: str) -> int:
+        value = int(self.get(name) or 0) + 1
+        key = name.encode()
+        self.values[key] = str(value).encode()
+        return value
+
+    def delete(self, *names: str | bytes) -> int:
+        self._check()
+        deleted = 0
+        for name in names:
+            key = self._live(name)
+            if key is None:
+                continue
+            self.values.pop(key, None)
+            self.sets.pop(key, None)
+            self.expires_at.pop(key, None)
+            deleted += 1
+        return deleted
+
+    def sadd(self, name: str, *values: str) -> int:
+        self._check()
+        key = self._live(name) or name.encode()
+        members = self.sets.setdefault(key, set())
+        before = len(members)
+        members.update(value.encode() for value in values)
+        return len(members) - before
+
+    def smembers(self, name: str) -> Members:
+        self._check()
+        key = self._live(name)
+        return set(self.sets.get(key, set())) if key is not None else set()
+
+    def srem(self, name: str, *values: bytes) -> int:
+        self._check()
+        key = self._live(name)
+        members = self.sets.get(key, set()) if key is not None else set()
+        before = len(members)
+        members.difference_update(values)
+        if key is not None and not members:
+            self.sets.pop(key, None)
+            self.expires_at.pop(key, None)
+        return before - len(members)
+
+    def expire(
+        self, name: str, time_seconds: int, nx: bool = False, gt: bool = False
+    ) -> bool:
+        self._check()
+        key = self._live(name)
+        if key is None:
+            return False
+        current = self.expires_at.get(key)
+        new = time.monotonic() + time_seconds
+        if nx and current is not None:
+            return False
+        # A key without TTL counts as an infinite TTL for GT
+        if gt and (current is None or new <= current):
+            return False
+        self.expires_at[key] = new
+        return True
+
+    def scan_iter(self, match: str, count: int = 10) -> list[bytes]:
+        self._check()
+        regex = _glob_to_regex(match)
+        keys = [key.decode() for key in [*self.values, *self.sets]]
+        return [
+            key
+            for key in (self._live(k) for k in keys)
+            if key is not None and regex.match(key)
+        ]
+
+    def pipeline(self, transaction: bool = True) -> "InMemoryPipeline":
+        return InMemoryPipeline(self)
+
+    def ttl(self, name: str) -> float | None:
+        key = name.encode()
+        if key not in self.expires_at:
+            return None
+        return self.expires_at[key] - time.monotonic()
+
+    def _live(self, name: str | bytes) -> bytes | None:
+        """Return the key if it exists and has not expired."""
+        key = name.encode() if isinstance(name, str) else name
+        expires_at = self.expires_at.get(key)
+        if expires_at is not None and time.monotonic() >= expires_at:
+            self.values.pop(key, None)
+            self.sets.pop(key, None)
+            del self.expires_at[key]
+        if key in self.values or key in self.sets:
+            return key
+        return None
+
+    def _check(self) -> None:
+        if self.fail:
+            raise ConnectionError("Redis unavailable")
+
+
+class InMemoryPipeline:
+    """Pipeline that queues commands and runs them on execute()."""
+
+    def __init__(self, client: InMemoryRedis) -> None:
+        self.client = client
+        self.commands: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    def __getattr__(self, command: str) -> Any:
+        def queue(*args: Any, **kwargs: Any) -> "InMemoryPipeline":
+            self.commands.append((command, args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self) -> list[Any]:
+        return [
+            getattr(self.client, command)(*args, **kwargs)
+            for command, args, kwargs in self.commands
+        ]
+
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def redis_client() -> InMemoryRedis:
+    """Create an empty in-process Redis stand-in."""
+    return InMemoryRedis()
+
+
+@pytest.fixture
+def backend(redis_client: InMemoryRedis) -> RedisCacheBackend:
+    """Create a Redis cache backend on the stand-in."""
+    return RedisCacheBackend(redis_client, namespace="test:")
+
+
+# =============================================================================
+# Test Classes
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestSerialization:
+    """Tests for serialize_value and deserialize_value."""
+
+    def test_round_trips_discovery_results(self) -> None:
+        """Test that pydantic results survive serialization."""
+        results = [
+            PersonDiscoveryResult(
+                person_id=uuid.uuid4(),
+                first_name="Test",
+                last_name="Person",
+                date_of_birth=date(1990, 1, 1),
+                gender_id=uuid.uuid4(),
+                address_display=None,
+                religion_display=None,
+                inferred_relationship_type="son",
+                inferred_relationship_label="Son",
+                connection_path="Spouse's child",
+                proximity_score=1,
+                relationship_priority=1,
+            )
+        ]
+
+        assert deserialize_value(serialize_value(results)) == results
+
+    def test_compresses_large_values(self) -> None:
+        """Test that large payloads are compressed."""
+        value = ["same text"] * 1000
+
+        data = serialize_value(value)
+
+        assert data[:1] == b"z"
+        assert len(data) < cache_module.COMPRESS_MIN_BYTES
+        assert deserialize_value(data) == value
+
+    def test_small_values_are_not_compressed(self) -> None:
+        """Test that small payloads skip compression."""
+        assert serialize_value({"a": 1})[:1] == b"p"
+
+
+@pytest.mark.unit
+class TestRedisCacheBackend:
+    """Tests for RedisCacheBackend."""
+
+    def test_implements_cache_backend(self, backend: RedisCacheBackend) -> None:
+        """Test that both backends share the interface."""
+        assert isinstance(backend, CacheBackend)
+        assert isinstance(CacheManager(), CacheBackend)
+
+    def test_set_get_and_delete(
+        self, backend: RedisCacheBackend, redis_client: InMemoryRedis
+    ) -> None:
+        """Test basic operations and the namespaced Redis key."""
+        backend.set("key", {"value": 1}, ttl_seconds=60)
+
+        assert backend.get("key") == {"value": 1}
+        assert b"test:key" in redis_client.values
+        assert 0 < (redis_client.ttl("test:key") or 0) <= 60
+
+        backend.delete("key")
+        assert backend.get("key") is None
+
+    def test_values_are_shared_between_backends(
+        self, redis_client: InMemoryRedis
+    ) -> None:
+        """Test that another worker's backend sees the same values."""
+        worker_a = RedisCacheBackend(redis_client, namespace="test:")
+        worker_b = RedisCacheBackend(redis_client, namespace="test:")
+
+        worker_a.set("shared", [1, 2, 3], ttl_seconds=60)
+
+        assert worker_b.get("shared") == [1, 2, 3]
+
+    def test_invalidate_pattern_escapes_glob_characters(
+        self, backend: RedisCacheBackend
+    ) -> None:
+        """Test that prefix invalidation treats the pattern literally."""
+        backend.set("discovery:user1", "value1", ttl_seconds=60)
+        backend.set("discovery:user2", "value2", ttl_seconds=60)
+        backend.set("disc*:other", "value3", ttl_seconds=60)
+        backend.set("other:key", "value4", ttl_seconds=60)
+
+        assert backend.invalidate_pattern("discovery:") == 2
+        assert backend.invalidate_pattern("disc*") == 1
+        assert backend.get("other:key") == "value4"
+
+    def test_invalidate_tags(self, backend: RedisCacheBackend) -> None:
+        """Test that only entries carrying the given tags are dropped."""
+        backend.set("key1", "value1", ttl_seconds=60, tags=["person:a"])
+        backend.set("key2", "value2", ttl_seconds=60, tags=["person:a", "person:b"])
+        backend.set("key3", "value3", ttl_seconds=60, tags=["person:c"])
+
+        assert backend.invalidate_tags(["person:a", "person:b"]) == 2
+        assert backend.get("key1") is None
+        assert backend.get("key3") == "value3"
+
+    def test_invalidate_tags_keeps_entries_tagged_meanwhile(
+        self,
+        backend: RedisCacheBackend,
+        redis_client: InMemoryRedis,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that an entry tagged after SMEMBERS can still be invalidated."""
+        backend.set("key1", "value1", ttl_seconds=60, tags=["tag"])
+        smembers = redis_client.smembers
+
+        def smembers_then_set(name: str) -> Members:
+            members = smembers(name)
+            backend.set("key2", "value2", ttl_seconds=60, tags=["tag"])
+            return members
+
+        monkeypatch.setattr(redis_client, "smembers", smembers_then_set)
+        assert backend.invalidate_tags(["tag"]) == 1
+        monkeypatch.undo()
+
+        assert backend.get("key2") == "value2"
+        assert backend.invalidate_tags(["tag"]) == 1
+        assert backend.get("key2") is None
+
+    def test_tag_set_lives_as_long_as_longest_entry(
+        self, backend: RedisCacheBackend, redis_client: InMemoryRedis
+    ) -> None:
+        """Test that a short-lived entry does not shorten the tag's TTL."""
+        backend.set("long", "value", ttl_seconds=600, tags=["tag"])
+        backend.set("short", "value", ttl_seconds=5, tags=["tag"])
+
+        assert (redis_client.ttl("test:tag:tag") or 0) > 500
+
+    def test_clear_only_touches_namespace(
+        self, backend: RedisCacheBackend, redis_client: InMemoryRedis
+    ) -> None:
+        """Test that clear leaves keys of other applications alone."""
+        redis_client.set("other-app:key", b"value")
+        backend.set("key", "value", ttl_seconds=60, tags=["tag"])
+
+        backend.clear()
+
+        assert set(redis_client.values) == {b"other-app:key"}
+        assert redis_client.sets == {}
+
+    def test_errors_are_treated_as_misses(
+        self, backend: RedisCacheBackend, redis_client: InMemoryRedis
+    ) -> None:
+        """Test that an unavailable Redis never fails the caller."""
+        redis_client.fail = True
+
+        backend.set("key", "value", ttl_seconds=60)
+        assert backend.get("key") is None
+        assert backend.invalidate_tags(["tag"]) == 0
+        assert backend.invalidate_pattern("key") == 0
+
+        assert backend.stats()["errors"] == 4
+
+    def test_unreadable_value_is_dropped(
+        self, backend: RedisCacheBackend, redis_client: InMemoryRedis
+    ) -> None:
+        """Test that a value that fails to deserialize is a miss and deleted."""
+        redis_client.set("test:key", b"p-not-a-pickle")
+
+        assert backend.get("key") is None
+        assert b"test:key" not in redis_client.values
+        assert backend.stats() == {"hits": 0, "misses": 1, "errors": 1}
+
+    def test_stats_count_hits_and_misses(self, backend: RedisCacheBackend) -> None:
+        """Test hit and miss counters."""
+        backend.set("key", "value", ttl_seconds=60)
+        backend.get("key")
+        backend.get("missing")
+
+        assert backend.stats() == {"hits": 1, "misses": 1, "errors": 0}
+
+
+@pytest.mark.unit
+class TestCachedDecoratorWithRedis:
+    """Tests for the @cached decorator on the Redis backend."""
+
+    def test_result_is_shared_across_workers(
+        self, redis_client: InMemoryRedis, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a second worker reuses the first worker's result."""
+        call_count = 0
+
+        @cached(ttl_seconds=60, key_prefix="test")
+        def expensive_function(x: int) -> int:
+            nonlocal call_count
+            call_count += 1
+            return x * 2
+
+        for _ in range(2):
+            worker_backend = RedisCacheBackend(redis_client, namespace="test:")
+            monkeypatch.setattr(cache_module, "_cache_manager", worker_backend)
+            assert expensive_function(5) == 10
+
+        assert call_count == 1
+
+    def test_result_invalidated_by_another_worker_is_not_stored(
+        self, redis_client: InMemoryRedis, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a tag invalidated during the call keeps the result out."""
+        person_id = uuid.uuid4()
+        other_worker = RedisCacheBackend(redis_client, namespace="test:")
+        monkeypatch.setattr(
+            cache_module,
+            "_cache_manager",
+            RedisCacheBackend(redis_client, namespace="test:"),
+        )
+        call_count = 0
+
+        @cached(ttl_seconds=60, key_prefix="test")
+        def tagged_function(x: int) -> int:
+            nonlocal call_count
+            call_count += 1
+            add_cache_tags(person_cache_tag(person_id))
+            if call_count == 1:
+                other_worker.invalidate_tags([person_cache_tag(person_id)])
+            return x * 2
+
+        tagged_function(5)
+        tagged_function(5)
+        tagged_function(5)
+
+        assert call_count == 2